@@ -0,0 +1,89 @@
+#!/usr/bin/env python
+"""DuplicateCleaner 삭제 후보 탐색 벤치마크
+
+합성 NAS 파일 목록(제목 + 크기)에 대해 크기순 윈도우를 끈 경우와 켠 경우의
+삭제 후보 탐색 시간을 측정하고, 윈도우를 끈 경우와 비교해 빠진(missing)
+삭제 후보와 추가된(extra) 삭제 후보 수를 확인합니다. 윈도우는 그룹을 크기
+범위별로 나누므로 extra는 0이 아닐 수 있습니다 (윈도우를 켜면 달라지는 동작).
+같은 핵심 제목의 복사본은 원본과 비슷한 크기를 갖고, 일부는 재인코딩처럼
+크기가 크게 달라집니다.
+
+Usage:
+    python benchmarks/bench_duplicate_cleaner.py                  # 2k / 20k / 100k
+    python benchmarks/bench_duplicate_cleaner.py --sizes 2000 5000
+    python benchmarks/bench_duplicate_cleaner.py --variance 0.15
+"""
+
+import argparse
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from benchmarks.bench_duplicate_detector import build_files
+from src.sync.matching import DuplicateCleaner, FilenameNormalizer
+
+# 크기가 크게 달라지는 복사본 비율 (재인코딩 등)
+REENCODE_RATE = 0.2
+
+
+def build_sizes(files, seed: int = 0):
+    """{원본 파일명: 크기} 합성 (같은 핵심 제목은 비슷한 크기)"""
+    rng = random.Random(seed)
+    core_sizes = {}
+    sizes = {}
+    for title, _, _, _ in files.values():
+        core = FilenameNormalizer.normalize_aggressive(title)
+        if core not in core_sizes:
+            # 50 MB - 5 GB 로그 균등 분포
+            core_sizes[core] = int(50 * 1024 ** 2 * 100 ** rng.random())
+            sizes[title] = core_sizes[core]
+        elif rng.random() < REENCODE_RATE:
+            sizes[title] = int(core_sizes[core] * rng.uniform(0.3, 0.8))
+        else:
+            sizes[title] = int(core_sizes[core] * rng.uniform(0.97, 1.03))
+    return sizes
+
+
+def main():
+    parser = argparse.ArgumentParser(description="DuplicateCleaner 벤치마크")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[2000, 20000, 100000], help="파일 수 목록")
+    parser.add_argument("--threshold", type=float, default=0.85, help="파일명 유사도 임계값 (기본: 0.85)")
+    parser.add_argument("--variance", type=float, default=0.10, help="크기 차이 허용 비율 (기본: 0.10)")
+    args = parser.parse_args()
+
+    print(f"{'files':>8} {'window':>8} {'scored':>12} {'deletions':>10} {'missing':>8} {'extra':>8} {'elapsed':>10}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for size in args.sizes:
+            files = build_files(size)
+            file_sizes = build_sizes(files)
+            baseline = None
+            for size_window in (False, True):
+                cleaner = DuplicateCleaner(
+                    similarity_threshold=args.threshold,
+                    size_variance_threshold=args.variance,
+                    audit_log_path=str(Path(tmp) / "audit.json"),
+                    size_window=size_window,
+                )
+
+                start = time.perf_counter()
+                candidates, _ = cleaner.find_cleanup_candidates(files, file_sizes)
+                elapsed = time.perf_counter() - start
+
+                deletions = {c.full_path for c in candidates}
+                if baseline is None:
+                    baseline = deletions
+                print(
+                    f"{size:>8} {'on' if size_window else 'off':>8} {cleaner.detector.prune_stats.scored:>12}"
+                    f" {len(deletions):>10} {len(baseline - deletions):>8} {len(deletions - baseline):>8}"
+                    f" {elapsed:>9.2f}s"
+                )
+
+
+if __name__ == "__main__":
+    main()
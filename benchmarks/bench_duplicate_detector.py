@@ -0,0 +1,94 @@
+#!/usr/bin/env python
+"""DuplicateDetector 벤치마크
+
+합성 NAS 파일 목록에 대해 중복 감지 시간을 측정합니다.
+공통 접사(@HustlerCasinoLive) 제거를 끈 경우와 켠 경우를 함께 측정하고,
+작은 규모에서는 모든 쌍을 비교하는 기준 구현과 결과가 같은지도 확인합니다.
+
+Usage:
+    python benchmarks/bench_duplicate_detector.py                  # 2k / 20k / 100k
+    python benchmarks/bench_duplicate_detector.py --sizes 2000 5000
+    python benchmarks/bench_duplicate_detector.py --threshold 0.9
+"""
+
+import argparse
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from benchmarks.corpus import generate_titles
+from src.sync.matching import CommonAffixes, DuplicateDetector, FilenameNormalizer
+
+# 모든 쌍을 비교하는 기준 구현은 이 크기까지만 실행
+REFERENCE_MAX_FILES = 2000
+
+
+def build_files(count: int, seed: int = 0):
+    """NASClient.get_files_with_dates() 형식의 합성 파일 목록 생성"""
+    rng = random.Random(seed)
+    base = datetime(2024, 1, 1)
+    files = {}
+    for title in generate_titles(count, seed):
+        mtime = base + timedelta(minutes=rng.randint(0, 500_000))
+        files[FilenameNormalizer.normalize_basic(title)] = (title, mtime, "", f"/nas/{title}.mp4")
+    return files
+
+
+def reference_groups(files, threshold: float, affixes: CommonAffixes):
+    """모든 쌍을 비교하는 기준 구현 (파일 순서대로 기준 파일이 유사 파일을 가져감)"""
+    matcher = DuplicateDetector(threshold).matcher
+    file_list = list(files.values())
+    cores = [affixes.strip(FilenameNormalizer.normalize_aggressive(orig)) for orig, _, _, _ in file_list]
+    processed = set()
+    groups = []
+    for i in range(len(file_list)):
+        if i in processed:
+            continue
+        members = [file_list[i][0]]
+        for j in range(i + 1, len(file_list)):
+            if j not in processed and matcher._get_similarity(cores[i], cores[j]) >= threshold:
+                members.append(file_list[j][0])
+                processed.add(j)
+        if len(members) > 1:
+            groups.append(members)
+    return groups
+
+
+def main():
+    parser = argparse.ArgumentParser(description="DuplicateDetector 벤치마크")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[2000, 20000, 100000], help="파일 수 목록")
+    parser.add_argument("--threshold", type=float, default=0.95, help="중복 임계값 (기본: 0.95)")
+    args = parser.parse_args()
+
+    print(f"{'files':>8} {'affixes':>8} {'groups':>8} {'grouped':>8} {'detect':>10} {'reference':>10}")
+    for size in args.sizes:
+        files = build_files(size)
+        for strip_affixes in (False, True):
+            detector = DuplicateDetector(threshold=args.threshold, strip_affixes=strip_affixes)
+
+            start = time.perf_counter()
+            groups = detector.find_duplicates(files)
+            elapsed = time.perf_counter() - start
+
+            reference = "-"
+            if size <= REFERENCE_MAX_FILES:
+                start = time.perf_counter()
+                expected = reference_groups(files, args.threshold, detector.affixes)
+                reference = f"{time.perf_counter() - start:.2f}s"
+                assert [[f[0] for f in g.files] for g in groups] == expected, "기준 구현과 결과가 다릅니다"
+
+            grouped = sum(len(g) for g in groups)
+            print(
+                f"{size:>8} {'on' if strip_affixes else 'off':>8} {len(groups):>8} {grouped:>8}"
+                f" {elapsed:>9.2f}s {reference:>10}"
+            )
+
+
+if __name__ == "__main__":
+    main()
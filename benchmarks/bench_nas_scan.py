@@ -0,0 +1,88 @@
+#!/usr/bin/env python
+"""NAS 스캔 벤치마크
+
+합성 폴더 트리(연도/월 폴더, 비디오 + 썸네일/메타데이터 파일)를 만들고
+호출당 지연을 주입한 상태에서 NASClient.get_files와 기존 rglob 방식의
+스캔 시간 및 scandir/stat 호출 수를 비교합니다.
+--workers로 병렬 탐색 스레드 수별 처리량(파일/초)도 측정합니다.
+
+Usage:
+    python benchmarks/bench_nas_scan.py                        # 100k 파일, 호출당 0.1ms
+    python benchmarks/bench_nas_scan.py --files 20000 --latency-ms 0.5
+    python benchmarks/bench_nas_scan.py --skip-reference --workers 1,2,4,8,16
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from benchmarks.slow_fs import build_tree, slow_io
+from src.sync.nas_client import FileInfo, NASClient
+
+
+def rglob_scan(folder: Path):
+    """기존 방식: rglob + is_file() + stat()"""
+    files = []
+    for path in folder.rglob("*"):
+        if not path.is_file():
+            continue
+        if path.suffix.lower() not in NASClient.VIDEO_EXTENSIONS:
+            continue
+        stat = path.stat()
+        subfolder = path.relative_to(folder).parent.as_posix()
+        files.append(
+            FileInfo(
+                name=path.name,
+                stem=path.stem,
+                suffix=path.suffix,
+                size=stat.st_size,
+                mtime=datetime.fromtimestamp(stat.st_mtime),
+                subfolder="" if subfolder == "." else subfolder,
+                full_path=str(path),
+            )
+        )
+    return files
+
+
+def main():
+    parser = argparse.ArgumentParser(description="NAS 스캔 벤치마크")
+    parser.add_argument("--files", type=int, default=100_000, help="비디오 파일 수 (기본: 100000)")
+    parser.add_argument("--latency-ms", type=float, default=0.1, help="호출당 지연 (ms, 기본: 0.1)")
+    parser.add_argument("--skip-reference", action="store_true", help="rglob 기준 측정 생략")
+    parser.add_argument("--workers", default="1", help="측정할 스캔 스레드 수 목록 (쉼표 구분, 기본: 1)")
+    args = parser.parse_args()
+    worker_counts = [int(w) for w in args.workers.split(",")]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        folders = build_tree(root, args.files)
+        print(f"트리: 비디오 {args.files}개, 폴더 {folders}개, 지연 {args.latency_ms}ms/호출")
+
+        runs = [
+            (f"scandir/{workers}", lambda workers=workers: NASClient(str(root), scan_workers=workers).get_files())
+            for workers in worker_counts
+        ]
+        if not args.skip_reference:
+            runs.append(("rglob", lambda: rglob_scan(root)))
+
+        print(f"{'method':>10} {'files':>8} {'scandir':>8} {'stat':>8} {'time':>9} {'files/s':>9}")
+        for label, scan in runs:
+            with slow_io(args.latency_ms / 1000.0) as fs:
+                start = time.perf_counter()
+                files = scan()
+                elapsed = time.perf_counter() - start
+            print(
+                f"{label:>10} {len(files):>8} {fs.calls['scandir']:>8} {fs.calls['stat']:>8} "
+                f"{elapsed:>8.2f}s {len(files) / elapsed:>9.0f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
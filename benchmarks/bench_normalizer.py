@@ -0,0 +1,96 @@
+#!/usr/bin/env python
+"""FilenameNormalizer 벤치마크
+
+합성 제목에 대해 표준/공격적 정규화 처리 시간을 측정하고, 패턴을 매번 re.sub로
+적용하던 기존 구현(기준 구현)과 결과가 같은지 확인합니다.
+콜드는 LRU 캐시를 비운 상태, 웜은 같은 제목을 한 번 더 정규화한 시간입니다.
+
+Usage:
+    python benchmarks/bench_normalizer.py                  # 100k
+    python benchmarks/bench_normalizer.py --sizes 10000 100000
+"""
+
+import argparse
+import re
+import sys
+import time
+import unicodedata
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from benchmarks.corpus import generate_titles
+from src.sync.matching import FilenameNormalizer
+
+
+class ReferenceNormalizer:
+    """기준 구현 (패턴 목록을 호출마다 re.sub로 적용, 캐시 없음)"""
+
+    @staticmethod
+    def normalize_standard(text: str) -> str:
+        text = re.sub(FilenameNormalizer.YOUTUBE_ID_PATTERN, '', text)
+        text = re.sub(FilenameNormalizer.FORMAT_CODE_PATTERN, '', text).strip()
+        text = unicodedata.normalize('NFKC', text)
+        text = re.sub(FilenameNormalizer.SPECIAL_CHARS, '', text)
+        text = re.sub(r'\s+', '', text)
+        return text.lower().strip()
+
+    @classmethod
+    def normalize_aggressive(cls, text: str) -> str:
+        for pattern in FilenameNormalizer.COPY_PATTERNS:
+            text = re.sub(pattern, '', text, flags=re.IGNORECASE)
+        return cls.normalize_standard(text)
+
+
+LEVELS = ("normalize_standard", "normalize_aggressive")
+
+
+def timed(func, titles) -> float:
+    started = time.perf_counter()
+    for title in titles:
+        func(title)
+    return time.perf_counter() - started
+
+
+def run(count: int):
+    titles = generate_titles(count)
+
+    for level in LEVELS:
+        reference = getattr(ReferenceNormalizer, level)
+        compiled = getattr(FilenameNormalizer, level)
+
+        FilenameNormalizer.cache_clear()
+        mismatches = sum(1 for t in titles if compiled(t) != reference(t))
+
+        reference_time = timed(reference, titles)
+        FilenameNormalizer.cache_clear()
+        cold_time = timed(compiled, titles)
+        warm_time = timed(compiled, titles)
+
+        print(
+            f"{count:>8,} {level:<22} 기준 {reference_time:7.3f}s"
+            f"  콜드 {cold_time:7.3f}s ({reference_time / cold_time:4.1f}x)"
+            f"  웜 {warm_time:7.3f}s ({reference_time / warm_time:5.1f}x)"
+            f"  불일치 {mismatches}"
+        )
+
+    FilenameNormalizer.cache_clear()
+    started = time.perf_counter()
+    for title in titles:
+        FilenameNormalizer.get_all_normalizations(title)
+    print(f"{count:>8,} {'get_all_normalizations':<22} 콜드 {time.perf_counter() - started:7.3f}s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="FilenameNormalizer 벤치마크")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100_000])
+    args = parser.parse_args()
+
+    for count in args.sizes:
+        run(count)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""벤치마크용 합성 제목 생성
+
+HCL 클립 제목과 비슷한 분포(공통 단어 + 선수 이름 + 금액 + 드문 단어,
+대부분 @HustlerCasinoLive 접미사)의 제목을 재현 가능하게 생성합니다.
+일부는 기존 제목의 복사본 접미사(" (1)", ".f399" 등)를 붙인 중복입니다.
+"""
+
+import itertools
+import random
+import string
+from typing import List
+
+NAMES = [
+    "Nik Airball", "Wesley", "Mariano", "Britney", "Luda Chris", "Garrett Adelstein",
+    "Martin Kabrhel", "Rampage", "Alan Keating", "Tom Dwan", "Phil Ivey", "Andy",
+    "Eric Persson", "Ryusuke", "Bill Klein", "Rob Yong", "Brandon Steven", "Lawyer",
+    "Poker Coach", "Doug Polk",
+]
+
+COMMON_WORDS = [
+    "He", "She", "The", "In", "With", "A", "His", "Her", "Is", "Can", "This", "vs",
+    "On", "Of", "To", "Pot", "Hand", "River", "BLUFF", "All-In", "Aces", "Kings",
+    "HUGE", "Call", "Fold", "Night", "Game", "Flop", "Turn", "Raise",
+]
+
+COPY_SUFFIXES = [" (1)", " (2)", ".f399", "_1", " - Copy"]
+
+
+def generate_titles(count: int, seed: int = 0, duplicate_rate: float = 0.1) -> List[str]:
+    """합성 제목 목록 생성
+
+    Args:
+        count: 생성할 제목 수 (중복 없이)
+        seed: 난수 시드
+        duplicate_rate: 기존 제목의 복사본으로 만들 비율
+
+    Returns:
+        List[str]: 제목 목록
+    """
+    rng = random.Random(seed)
+
+    vocabulary = set()
+    while len(vocabulary) < 4000:
+        length = rng.randint(3, 9)
+        vocabulary.add("".join(rng.choice(string.ascii_lowercase) for _ in range(length)).capitalize())
+    vocabulary = sorted(vocabulary)
+    # 지프 분포 (드문 단어일수록 낮은 빈도)
+    cum_weights = list(itertools.accumulate(1.0 / (i + 1) for i in range(len(vocabulary))))
+
+    titles: List[str] = []
+    seen = set()
+    while len(titles) < count:
+        if titles and rng.random() < duplicate_rate:
+            title = rng.choice(titles) + rng.choice(COPY_SUFFIXES)
+        else:
+            words = []
+            for _ in range(rng.randint(4, 10)):
+                roll = rng.random()
+                if roll < 0.4:
+                    words.append(rng.choice(COMMON_WORDS))
+                elif roll < 0.5:
+                    words.append(rng.choice(NAMES))
+                elif roll < 0.55:
+                    words.append(f"${rng.randint(10, 999)},000")
+                else:
+                    words.append(rng.choices(vocabulary, cum_weights=cum_weights)[0])
+            title = " ".join(words)
+            if rng.random() < 0.8:
+                title += " @HustlerCasinoLive"
+
+        if title not in seen:
+            seen.add(title)
+            titles.append(title)
+
+    return titles
@@ -0,0 +1,144 @@
+"""네트워크 지연을 흉내 내는 파일 시스템 shim
+
+SMB 마운트처럼 폴더 목록 조회(os.scandir)와 stat 호출마다 왕복 지연이
+생기도록 os.scandir / os.stat을 감쌉니다. DirEntry의 종류 정보(is_dir /
+is_file)는 폴더 목록과 함께 오므로 지연 없이 통과시킵니다.
+"""
+
+import os
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterator
+
+
+class SlowFS:
+    """지연 주입 및 호출 횟수 집계"""
+
+    def __init__(self, latency: float):
+        """SlowFS 초기화
+
+        Args:
+            latency: 호출당 지연 (초)
+        """
+        self.latency = latency
+        self.calls: Dict[str, int] = {"scandir": 0, "stat": 0}
+        self._lock = threading.Lock()
+
+    def wait(self, kind: str):
+        """호출 1회 집계 후 지연"""
+        with self._lock:
+            self.calls[kind] += 1
+        if self.latency > 0:
+            time.sleep(self.latency)
+
+    def reset(self):
+        """집계 초기화"""
+        for kind in self.calls:
+            self.calls[kind] = 0
+
+
+class _SlowEntry:
+    """stat()에 지연이 있는 DirEntry 래퍼"""
+
+    def __init__(self, entry: os.DirEntry, fs: SlowFS):
+        self._entry = entry
+        self._fs = fs
+        self.name = entry.name
+        self.path = entry.path
+
+    def is_dir(self, follow_symlinks: bool = True) -> bool:
+        return self._entry.is_dir(follow_symlinks=follow_symlinks)
+
+    def is_file(self, follow_symlinks: bool = True) -> bool:
+        return self._entry.is_file(follow_symlinks=follow_symlinks)
+
+    def is_symlink(self) -> bool:
+        return self._entry.is_symlink()
+
+    def stat(self, follow_symlinks: bool = True) -> os.stat_result:
+        self._fs.wait("stat")
+        return self._entry.stat(follow_symlinks=follow_symlinks)
+
+    def __fspath__(self) -> str:
+        return self.path
+
+
+class _SlowScandir:
+    """지연이 있는 os.scandir 이터레이터"""
+
+    def __init__(self, iterator, fs: SlowFS):
+        self._iterator = iterator
+        self._fs = fs
+
+    def __iter__(self):
+        return (_SlowEntry(entry, self._fs) for entry in self._iterator)
+
+    def __next__(self):
+        return _SlowEntry(next(self._iterator), self._fs)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        self._iterator.close()
+
+
+@contextmanager
+def slow_io(latency: float) -> Iterator[SlowFS]:
+    """os.scandir / os.stat 호출에 지연 주입
+
+    Args:
+        latency: 호출당 지연 (초)
+
+    Yields:
+        SlowFS: 호출 횟수 집계 객체
+    """
+    fs = SlowFS(latency)
+    real_scandir = os.scandir
+    real_stat = os.stat
+
+    def scandir(path="."):
+        fs.wait("scandir")
+        return _SlowScandir(real_scandir(path), fs)
+
+    def stat(path, *args, **kwargs):
+        fs.wait("stat")
+        return real_stat(path, *args, **kwargs)
+
+    os.scandir = scandir
+    os.stat = stat
+    try:
+        yield fs
+    finally:
+        os.scandir = real_scandir
+        os.stat = real_stat
+
+
+def build_tree(root: Path, file_count: int, other_ratio: float = 0.2) -> int:
+    """연도/월 폴더 아래에 빈 비디오 파일과 비디오 아닌 파일 생성
+
+    Args:
+        root: 트리를 만들 폴더
+        file_count: 비디오 파일 수
+        other_ratio: 비디오 파일 대비 비디오 아닌 파일(.jpg, .json) 비율
+
+    Returns:
+        int: 생성한 폴더 수
+    """
+    years = [str(year) for year in range(2018, 2026)]
+    folders = [root / year / f"{month:02d}" for year in years for month in range(1, 13)]
+    for folder in folders:
+        folder.mkdir(parents=True, exist_ok=True)
+
+    for i in range(file_count):
+        folder = folders[i % len(folders)]
+        (folder / f"Clip {i} @HustlerCasinoLive.mp4").touch()
+        if i < file_count * other_ratio:
+            (folder / f"Clip {i}.{'jpg' if i % 2 else 'json'}").touch()
+
+    return len(folders)
@@ -10,6 +10,8 @@ Usage:
     python run_nas_sync.py --verbose    # 상세 로그 출력
     python run_nas_sync.py --status     # 현재 상태 확인
     python run_nas_sync.py --reset      # P열/Q열 전체 초기화 후 동기화
+    python run_nas_sync.py --offline    # 로컬 시트 미러로 dry-run (API 호출 없음)
+    python run_nas_sync.py --full       # 지난 매칭 결과를 무시하고 전체 매칭
 """
 
 import argparse
@@ -56,6 +58,8 @@ Examples:
   python run_nas_sync.py --verbose    # 상세 로그 출력
   python run_nas_sync.py --status     # 현재 상태 확인
   python run_nas_sync.py --reset      # P열/Q열 전체 초기화 후 동기화
+  python run_nas_sync.py --offline    # 로컬 시트 미러로 dry-run (API 호출 없음)
+  python run_nas_sync.py --full       # 지난 매칭 결과를 무시하고 전체 매칭
 
 열 매핑:
   B열: Title (매칭 기준)
@@ -95,6 +99,35 @@ Examples:
         help="P열/Q열 전체 초기화 후 동기화 (기존 체크 모두 해제)",
     )
 
+    # 시트 미러 옵션
+    parser.add_argument(
+        "--offline",
+        action="store_true",
+        help="로컬 시트 미러만 사용하여 dry-run (Sheets API 호출 없음)",
+    )
+
+    parser.add_argument(
+        "--refresh-sheet",
+        action="store_true",
+        help="시트 미러를 검증하지 않고 전체 시트를 다시 로드",
+    )
+
+    # 증분 동기화 옵션
+    incremental = parser.add_mutually_exclusive_group()
+    incremental.add_argument(
+        "--incremental",
+        dest="incremental",
+        action="store_true",
+        default=None,
+        help="바뀌지 않은 파일은 지난 매칭 결과 재사용 (기본: config.ini INCREMENTAL_SYNC)",
+    )
+    incremental.add_argument(
+        "--full",
+        dest="incremental",
+        action="store_false",
+        help="지난 매칭 결과를 무시하고 모든 파일을 전체 매칭",
+    )
+
     # 유사도 매칭 옵션
     parser.add_argument(
         "--no-fuzzy",
@@ -162,6 +195,61 @@ Examples:
         help="삭제용 크기 차이 허용 비율 (0.0-1.0, 기본: 0.10 = 10%%)",
     )
 
+    fingerprint_group = parser.add_mutually_exclusive_group()
+    fingerprint_group.add_argument(
+        "--fingerprint",
+        action="store_true",
+        help="크기 차이 허용 범위 대신 내용 지문(크기 + 표본 블록 해시)으로 검증 (기본: config.ini CLEANUP_CONTENT_FINGERPRINT)",
+    )
+    fingerprint_group.add_argument(
+        "--no-fingerprint",
+        action="store_true",
+        help="내용 지문 검증 대신 크기 차이 허용 범위로만 검증",
+    )
+
+    parser.add_argument(
+        "--duration-tolerance",
+        type=float,
+        default=None,
+        help="삭제용 재생 시간 허용 차이 (초, 기본: config.ini CLEANUP_DURATION_TOLERANCE)",
+    )
+
+    parser.add_argument(
+        "--no-duration-check",
+        action="store_true",
+        help="미디어 헤더의 재생 시간 비교 안함",
+    )
+
+    parser.add_argument(
+        "--dedupe-mode",
+        choices=["delete", "quarantine", "hardlink", "reflink"],
+        default=None,
+        help="중복 정리 방식 (quarantine: NAS 폴더/.quarantine/<실행 ID>/로 이동, "
+             "hardlink/reflink: 전체 해시가 같으면 경로를 유지한 채 링크로 교체, "
+             "기본: config.ini CLEANUP_DEDUPE_MODE)",
+    )
+
+    parser.add_argument(
+        "--restore-quarantine",
+        nargs="?",
+        const="latest",
+        default=None,
+        metavar="RUN_ID",
+        help="격리한 파일을 감사 로그를 따라 원래 경로로 복원 (RUN_ID 생략 시 가장 최근 실행)",
+    )
+
+    size_window_group = parser.add_mutually_exclusive_group()
+    size_window_group.add_argument(
+        "--size-window",
+        action="store_true",
+        help="삭제될 수 있는 크기 범위 안의 파일끼리만 파일명 비교 (그룹이 크기별로 나뉨, 기본: config.ini CLEANUP_SIZE_WINDOW)",
+    )
+    size_window_group.add_argument(
+        "--no-size-window",
+        action="store_true",
+        help="크기순 윈도우 없이 모든 파일의 파일명을 비교",
+    )
+
     parser.add_argument(
         "--audit-log",
         action="store_true",
@@ -195,10 +283,21 @@ Examples:
         if args.threshold is not None:
             config.similarity_threshold = args.threshold
 
+        # 증분 동기화 설정 오버라이드
+        if args.incremental is not None:
+            config.incremental_sync = args.incremental
+
         # 중복 감지 설정 오버라이드
         if args.no_duplicates:
             config.duplicate_detection = False
 
+        # 시트 미러 설정 오버라이드
+        if args.offline:
+            config.sheet_offline = True
+            args.dry_run = True
+        if args.refresh_sheet:
+            config.sheet_mirror_validation = "full"
+
         # 설정 유효성 검사
         config.validate()
 
@@ -217,6 +316,12 @@ Examples:
             print("=" * 60)
             print(f"총 항목 수: {stats['total_entries']}")
             print(f"삭제된 파일: {stats['files_deleted']}")
+            print(f"격리된 파일: {stats['files_quarantined']} (복원: {stats['files_restored']})")
+            print(
+                f"격리 폴더 정리: 실행 {stats['quarantine_runs_purged']}개 "
+                f"({stats['quarantine_bytes_purged'] / (1024 ** 3):.2f} GB)"
+            )
+            print(f"링크 교체된 파일: {stats['files_linked']}")
             print(f"건너뛴 파일: {stats['files_skipped']}")
             print(f"에러: {stats['errors']}")
             print(f"Dry-run 삭제: {stats['dry_run_deletions']}")
@@ -231,7 +336,7 @@ Examples:
                 print("\n최근 10개 항목:")
                 for entry in recent:
                     dry_str = "[DRY-RUN]" if entry.dry_run else ""
-                    print(f"  {entry.timestamp[:19]} {entry.action:6} {dry_str} {entry.filename[:40]}")
+                    print(f"  {entry.timestamp[:19]} {entry.action:10} {dry_str} {entry.filename[:40]}")
 
             return 0
 
@@ -244,43 +349,134 @@ Examples:
             print(f"감사 로그 CSV 내보내기 완료: {args.export_audit}")
             return 0
 
+        # 격리 파일 복원 모드
+        if args.restore_quarantine:
+            from src.sync.matching import DeletionAuditLog, Quarantine
+
+            quarantine = Quarantine(config.nas_folder, config.cleanup_quarantine_retention_days)
+            run_id = args.restore_quarantine
+            if run_id == "latest":
+                runs = quarantine.runs()
+                if not runs:
+                    print(f"복원할 격리 실행이 없습니다: {quarantine.path}")
+                    return 0
+                run_id = runs[-1]
+
+            print(f"격리 파일 복원: {quarantine.path / run_id}")
+            with DeletionAuditLog(log_path=config.cleanup_audit_log) as audit:
+                restored = quarantine.restore(audit, run_id)
+
+            print(f"복원된 파일: {len(restored.restored)}")
+            for path, reason in restored.skipped:
+                print(f"  [SKIP] {path}: {reason}")
+            for path, error in restored.errors:
+                print(f"  [ERROR] {path}: {error}")
+            return 1 if restored.errors else 0
+
         # 중복 파일 삭제 모드
         if args.delete_duplicates or args.cleanup_only:
             from src.sync.nas_client import NASClient
-            from src.sync.matching import DuplicateCleaner
+            from src.sync.matching import ContentFingerprinter, DuplicateCleaner, MediaProbe, Quarantine
 
             print("=" * 70)
             print("중복 파일 삭제 모드")
             print("=" * 70)
 
             # 설정 오버라이드
-            similarity = args.cleanup_similarity or config.cleanup_similarity_threshold
-            size_variance = args.cleanup_size_variance or config.cleanup_size_variance
+            similarity = (
+                args.cleanup_similarity if args.cleanup_similarity is not None else config.cleanup_similarity_threshold
+            )
+            size_variance = (
+                args.cleanup_size_variance if args.cleanup_size_variance is not None else config.cleanup_size_variance
+            )
+            dedupe_mode = args.dedupe_mode or config.cleanup_dedupe_mode
+
+            quarantine = None
+            if dedupe_mode == "quarantine":
+                quarantine = Quarantine(config.nas_folder, config.cleanup_quarantine_retention_days)
+
+            fingerprinter = None
+            if args.fingerprint or (config.cleanup_content_fingerprint and not args.no_fingerprint):
+                fingerprinter = ContentFingerprinter(
+                    cache_path=config.cleanup_fingerprint_cache or None,
+                    workers=config.cleanup_fingerprint_workers,
+                )
+
+            duration_tolerance = None
+            media_probe = None
+            if not args.no_duration_check:
+                duration_tolerance = (
+                    args.duration_tolerance
+                    if args.duration_tolerance is not None
+                    else config.cleanup_duration_tolerance
+                )
+            if duration_tolerance is not None:
+                media_probe = MediaProbe(
+                    cache_path=config.cleanup_media_probe_cache or None,
+                    workers=config.cleanup_fingerprint_workers,
+                )
 
             print(f"파일명 유사도 임계값: {similarity:.0%}")
-            print(f"크기 차이 허용 범위: {size_variance:.0%}")
+            if quarantine is not None:
+                print(f"정리 방식: quarantine ({quarantine.path}, 보관 {quarantine.retention_days:g}일)")
+            elif dedupe_mode != "delete":
+                print(f"정리 방식: {dedupe_mode} (크기와 전체 해시가 같은 파일만 링크로 교체)")
+            if fingerprinter:
+                print(
+                    f"내용 지문 검증: {fingerprinter.algorithm}, "
+                    f"표본 {fingerprinter.sample_blocks}블록 x {fingerprinter.block_size // 1024} KB"
+                )
+            if duration_tolerance is not None:
+                print(f"재생 시간 허용 차이: {duration_tolerance:.1f}초")
+            if fingerprinter:
+                print("크기 차이 허용 범위: 사용 안함 (내용 지문이 같은 파일만 삭제)")
+            else:
+                print(f"크기 차이 허용 범위: {size_variance:.0%}")
             print()
 
-            # NAS 클라이언트
-            nas = NASClient(config.nas_folder)
+            # NAS 클라이언트 (스캔 스냅샷을 이후 동기화에서도 재사용)
+            nas = NASClient(
+                config.nas_folder,
+                cache_ttl=config.nas_cache_ttl or None,
+                manifest_path=config.nas_manifest_path or None,
+                scan_workers=config.nas_scan_workers,
+            )
             if not nas.is_accessible():
                 print(f"[ERROR] NAS 폴더에 접근할 수 없습니다: {config.nas_folder}")
                 return 1
+            sync.nas = nas
 
-            # 파일 정보 수집
-            nas_files = nas.get_files_with_dates()
-            file_sizes = nas.get_file_sizes()
+            # 파일 정보 수집 (한 번의 스캔으로 두 조회 모두 처리)
+            # 삭제 판정은 크기/수정 시간에 의존하므로 매니페스트를 재사용하지 않는 전체 스캔
+            snapshot = nas.scan(full=True)
+            nas_files = nas.get_files_with_dates(snapshot=snapshot)
+            file_sizes = nas.get_file_sizes(snapshot=snapshot)
             print(f"NAS 파일 수: {len(nas_files)}")
 
-            # Cleaner 초기화
+            # Cleaner 초기화 (삭제 시 스냅샷 갱신)
             cleaner = DuplicateCleaner(
                 similarity_threshold=similarity,
                 size_variance_threshold=size_variance,
                 audit_log_path=config.cleanup_audit_log,
+                nas_client=nas,
+                fingerprinter=fingerprinter,
+                duration_tolerance=duration_tolerance,
+                media_probe=media_probe,
+                size_window=args.size_window or (config.cleanup_size_window and not args.no_size_window),
+                dedupe_mode=dedupe_mode,
+                quarantine=quarantine,
             )
+            if cleaner.window_variance is not None:
+                print(f"크기순 윈도우: 크기 차이 {cleaner.window_variance:.0%} 이내 파일끼리만 파일명 비교")
+            elif cleaner.size_window:
+                print("크기순 윈도우: 재생 시간 비교를 사용하므로 적용 안함")
 
             # 삭제 후보 찾기
             candidates, groups = cleaner.find_cleanup_candidates(nas_files, file_sizes)
+            if fingerprinter:
+                print(fingerprinter.stats)
+            if media_probe:
+                print(media_probe.stats)
 
             if not candidates:
                 print("\n삭제할 중복 파일이 없습니다.")
@@ -297,19 +493,30 @@ Examples:
                 print("\n[DRY-RUN 모드] 실제 삭제는 수행되지 않습니다.")
                 print("실제로 삭제하려면 --force 옵션을 추가하세요.")
             else:
-                # 확인 프롬프트
-                if config.cleanup_require_confirmation:
+                # 확인 프롬프트 (격리는 복원 가능하고 링크 교체는 경로와 내용이 유지되므로 확인 안함)
+                if config.cleanup_require_confirmation and dedupe_mode == "delete":
                     confirm = input("\n'DELETE'를 입력하여 삭제를 확인하세요: ")
                     if confirm != "DELETE":
                         print("삭제가 취소되었습니다.")
                         return 0
 
+            # 격리 모드 (--force): 보관 기간이 지난 격리 폴더는 정리와 동시에 백그라운드에서 삭제
+            purge_thread = None
+            if quarantine is not None and not is_dry_run:
+                purge_thread = quarantine.purge_in_background()
+
             # 삭제 실행
-            result = cleaner.cleanup(
-                files=nas_files,
-                file_sizes=file_sizes,
-                dry_run=is_dry_run,
-            )
+            try:
+                result = cleaner.cleanup(
+                    files=nas_files,
+                    file_sizes=file_sizes,
+                    dry_run=is_dry_run,
+                )
+            finally:
+                if purge_thread is not None:
+                    purge_thread.join()
+                    if quarantine.last_purge is not None:
+                        cleaner.log_purge(quarantine.last_purge)
 
             # 결과 출력
             print("\n" + "=" * 70)
@@ -317,7 +524,10 @@ Examples:
             print("=" * 70)
             print(f"분석된 파일: {result.files_analyzed}")
             print(f"중복 그룹: {result.total_groups}")
-            print(f"삭제된 파일: {result.files_deleted}")
+            done_label = {"delete": "삭제된 파일", "quarantine": "격리된 파일"}.get(dedupe_mode, f"{dedupe_mode} 교체된 파일")
+            print(f"{done_label}: {result.files_deleted}")
+            if cleaner.run_id:
+                print(f"격리 실행 ID: {cleaner.run_id} (복원: --restore-quarantine {cleaner.run_id})")
             print(f"건너뛴 파일: {result.files_skipped}")
             print(f"절약된 용량: {result.gb_freed} GB")
             print(f"에러: {len(result.errors)}")
@@ -328,6 +538,8 @@ Examples:
                 print("\n에러 목록:")
                 for filename, error in result.errors:
                     print(f"  - {filename}: {error}")
+            if purge_thread is not None and quarantine.last_purge is not None:
+                print(quarantine.last_purge)
 
             # cleanup_only가 아니면 동기화도 실행
             if not args.cleanup_only:
@@ -347,7 +559,11 @@ Examples:
             print("중복 파일 감지 실행")
             print("=" * 60)
 
-            nas = NASClient(config.nas_folder)
+            nas = NASClient(
+                config.nas_folder,
+                manifest_path=config.nas_manifest_path or None,
+                scan_workers=config.nas_scan_workers,
+            )
             if not nas.is_accessible():
                 print(f"[ERROR] NAS 폴더에 접근할 수 없습니다: {config.nas_folder}")
                 return 1
@@ -382,6 +598,8 @@ Examples:
             print(f"NAS 접근: {'가능' if status['nas_accessible'] else '불가'}")
             print(f"NAS 파일 수: {status['nas_file_count']}")
             print(f"시트 행 수: {status['sheet_row_count']}")
+            print(f"시트 Title 수: {status['sheet_title_count']}")
+            print(f"체크된 행: {status['sheet_checked_count']} (중복 표시: {status['sheet_duplicate_count']})")
             print("\n설정:")
             print(status["config"])
             print("=" * 50)
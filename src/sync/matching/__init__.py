@@ -4,17 +4,36 @@
 """
 
 from .normalizer import FilenameNormalizer
-from .fuzzy_matcher import FuzzyMatcher, MatchResult
+from .affixes import CommonAffixes
+from .candidate_index import CandidateIndex
+from .fuzzy_matcher import FuzzyMatcher, MatchResult, PruneStats
+from .match_cache import MatchCache, MatchCacheStats
 from .duplicate_detector import DuplicateDetector, DuplicateGroup
+from .content_fingerprint import ContentFingerprinter, FingerprintStats
+from .media_probe import MediaInfo, MediaProbe, MediaProbeStats
+from .quarantine import Quarantine, PurgeResult, RestoreResult
 from .duplicate_cleaner import DuplicateCleaner, DeletionCandidate, CleanupResult
 from .deletion_audit import DeletionAuditLog, AuditEntry
 
 __all__ = [
     "FilenameNormalizer",
+    "CommonAffixes",
+    "CandidateIndex",
     "FuzzyMatcher",
     "MatchResult",
+    "PruneStats",
+    "MatchCache",
+    "MatchCacheStats",
     "DuplicateDetector",
     "DuplicateGroup",
+    "ContentFingerprinter",
+    "FingerprintStats",
+    "MediaInfo",
+    "MediaProbe",
+    "MediaProbeStats",
+    "Quarantine",
+    "PurgeResult",
+    "RestoreResult",
     "DuplicateCleaner",
     "DeletionCandidate",
     "CleanupResult",
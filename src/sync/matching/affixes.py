@@ -0,0 +1,141 @@
+"""공통 접두사/접미사 학습 모듈
+
+제목과 파일명 대부분에 붙는 채널명(@HustlerCasinoLive 등) 같은 공통 접사는
+서로 다른 클립의 유사도를 부풀리고 점수 계산 문자열을 길게 만듭니다.
+현재 코퍼스(정규화된 제목/파일명)에서 출현 비율이 높은 접사를 학습하여
+유사도 점수 계산 전에 한 번 제거합니다.
+"""
+
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Iterable, List
+
+
+@dataclass
+class CommonAffixes:
+    """코퍼스에서 학습한 공통 접두사/접미사
+
+    정규화된 키(공백/특수문자 제거, 소문자)를 대상으로 하며,
+    제거 결과가 빈 문자열이 되는 경우에는 제거하지 않습니다.
+    """
+
+    prefixes: List[str] = field(default_factory=list)  # 긴 것부터
+    suffixes: List[str] = field(default_factory=list)  # 긴 것부터
+
+    # 학습에 필요한 최소 문자열 수 (작은 코퍼스는 우연한 공통 부분이 많음)
+    MIN_CORPUS = 50
+
+    # 접사로 인정할 최소 출현 비율 (코퍼스 전체 대비)
+    MIN_SHARE = 0.5
+
+    # 접사 최소/최대 길이 (글자)
+    MIN_LENGTH = 4
+    MAX_LENGTH = 64
+
+    # 방향별 최대 접사 수
+    MAX_AFFIXES = 3
+
+    @classmethod
+    def learn(
+        cls,
+        keys: Iterable[str],
+        min_corpus: int = MIN_CORPUS,
+        min_share: float = MIN_SHARE,
+        min_length: int = MIN_LENGTH,
+    ) -> "CommonAffixes":
+        """정규화된 키 목록에서 공통 접사 학습
+
+        Args:
+            keys: 정규화된 제목/파일명 (예: normalize_aggressive 결과)
+            min_corpus: 학습에 필요한 최소 키 수 (미만이면 접사 없음)
+            min_share: 접사로 인정할 최소 출현 비율 (0.0 - 1.0)
+            min_length: 접사 최소 길이
+
+        Returns:
+            CommonAffixes: 학습 결과 (접사가 없을 수 있음)
+        """
+        keys = [key for key in keys if key]
+        if len(keys) < max(1, min_corpus):
+            return cls()
+
+        min_count = max(1, int(min_share * len(keys) + 0.5))
+        suffixes = cls._learn_suffixes(keys, min_count, min_length)
+        prefixes = [
+            prefix[::-1]
+            for prefix in cls._learn_suffixes([key[::-1] for key in keys], min_count, min_length)
+        ]
+        return cls(prefixes=prefixes, suffixes=suffixes)
+
+    @classmethod
+    def _learn_suffixes(cls, keys: List[str], min_count: int, min_length: int) -> List[str]:
+        """min_count개 이상의 키가 공유하는 가장 긴 접미사들
+
+        가장 흔한 min_length 글자 접미사에서 시작하여, 그 앞 글자가 여전히
+        min_count개 이상에서 같으면 한 글자씩 늘립니다. 접사를 제거해도
+        한 글자 이상 남는 키만 셉니다.
+
+        Args:
+            keys: 정규화된 키 목록
+            min_count: 최소 출현 수
+            min_length: 접미사 최소 길이
+
+        Returns:
+            List[str]: 접미사 목록 (긴 것부터)
+        """
+        found: List[str] = []
+        remaining = [key for key in keys if len(key) > min_length]
+
+        while remaining and len(found) < cls.MAX_AFFIXES:
+            seed, count = Counter(key[-min_length:] for key in remaining).most_common(1)[0]
+            if count < min_count:
+                break
+
+            affix = seed
+            members = [key for key in remaining if key.endswith(seed)]
+            while len(affix) < cls.MAX_LENGTH:
+                before = Counter(key[-len(affix) - 1] for key in members if len(key) > len(affix) + 1)
+                if not before:
+                    break
+                ch, count = before.most_common(1)[0]
+                if count < min_count:
+                    break
+                affix = ch + affix
+                members = [key for key in members if len(key) > len(affix) and key.endswith(affix)]
+
+            found.append(affix)
+            remaining = [key for key in remaining if not key.endswith(affix)]
+
+        found.sort(key=len, reverse=True)
+        return found
+
+    def __bool__(self) -> bool:
+        return bool(self.prefixes or self.suffixes)
+
+    def strip(self, key: str) -> str:
+        """키에서 공통 접미사와 접두사를 하나씩 제거 (빈 문자열이 되면 제거하지 않음)
+
+        Args:
+            key: 정규화된 키
+
+        Returns:
+            str: 접사가 제거된 키
+        """
+        for suffix in self.suffixes:
+            if len(key) > len(suffix) and key.endswith(suffix):
+                key = key[:-len(suffix)]
+                break
+        for prefix in self.prefixes:
+            if len(key) > len(prefix) and key.startswith(prefix):
+                key = key[len(prefix):]
+                break
+        return key
+
+    def __str__(self) -> str:
+        if not self:
+            return "공통 접사 없음"
+        parts = []
+        if self.prefixes:
+            parts.append("접두사 " + ", ".join(self.prefixes))
+        if self.suffixes:
+            parts.append("접미사 " + ", ".join(self.suffixes))
+        return "공통 접사: " + " / ".join(parts)
@@ -0,0 +1,140 @@
+"""매칭 후보 인덱스 모듈
+
+시트 제목의 정규화 키를 한 번만 계산해 두고 재사용합니다.
+"""
+
+import hashlib
+import math
+from bisect import bisect_left, bisect_right
+from typing import Dict, List, Optional, Tuple
+
+from .affixes import CommonAffixes
+from .normalizer import FilenameNormalizer
+
+
+def indel_length_window(length: int, cutoff: float) -> Tuple[int, int]:
+    """Indel 기반 ratio가 cutoff 이상일 수 있는 상대 문자열 길이 범위
+
+    ratio = 2 * LCS / (la + lb) <= 2 * min(la, lb) / (la + lb) 이므로
+    길이 차이만으로 점수 상한이 정해집니다 (부동소수 오차는 범위를 넓히는 쪽으로).
+
+    Args:
+        length: 기준 문자열 길이
+        cutoff: 점수 하한 (0.0 - 1.0)
+
+    Returns:
+        Tuple[int, int]: (최소 길이, 최대 길이)
+    """
+    if cutoff <= 0:
+        return 0, math.inf
+    return (
+        math.ceil(length * cutoff / (2.0 - cutoff) - 1e-9),
+        math.floor(length * (2.0 - cutoff) / cutoff + 1e-9),
+    )
+
+
+class CandidateIndex:
+    """시트 제목 후보 인덱스
+
+    각 제목의 기본/표준/공격적 정규화 키를 딕셔너리로 보관하여
+    FuzzyMatcher의 정확 일치·정규화 일치 단계를 해시 조회로 처리합니다.
+    동기화 한 번에 한 번만 생성하여 모든 파일 매칭에 재사용합니다.
+    """
+
+    def __init__(
+        self,
+        candidates: Dict[str, int],  # {normalized_title: row_num}
+        original_titles: Optional[Dict[str, str]] = None,  # {normalized: original}
+        affixes: Optional[CommonAffixes] = None,
+    ):
+        """CandidateIndex 초기화
+
+        Args:
+            candidates: {정규화된 제목: 행 번호} 딕셔너리
+            original_titles: {정규화된 제목: 원본 제목} 딕셔너리 (선택)
+            affixes: 유사도 점수 계산 전에 제거할 공통 접사 (선택, 해시 조회 단계에는 미적용)
+        """
+        self.candidates = candidates
+        self.original_titles = original_titles or {}
+        self.affixes = affixes or CommonAffixes()
+
+        # {표준/공격적 키: (정규화된 제목, 행 번호)} - 삽입 순서상 첫 항목 유지
+        self.standard: Dict[str, Tuple[str, int]] = {}
+        self.aggressive: Dict[str, Tuple[str, int]] = {}
+
+        # 유사도 단계용 [(정규화된 제목, 행 번호, 원본 제목, 점수 계산 키), ...]
+        # (점수 계산 키 = 공통 접사를 제거한 공격적 키)
+        self.entries: List[Tuple[str, int, str, str]] = []
+
+        # 유사도 단계 후보 필터용 n-gram 역색인 (필요할 때 생성)
+        self._ngram_index = None
+        self._fingerprint: Optional[str] = None
+
+        # 길이순 entry 인덱스 (NumPy가 없을 때 길이 창 조회용, 필요할 때 생성)
+        self._by_length: Optional[List[int]] = None
+        self._sorted_lengths: List[int] = []
+
+        for title_norm, row in candidates.items():
+            original = self.original_titles.get(title_norm, title_norm)
+            title_standard = FilenameNormalizer.normalize_standard(original)
+            title_aggressive = FilenameNormalizer.normalize_aggressive(original)
+
+            self.standard.setdefault(title_standard, (title_norm, row))
+            self.aggressive.setdefault(title_aggressive, (title_norm, row))
+            self.entries.append((title_norm, row, original, self.scoring_key(title_aggressive)))
+
+    @property
+    def ngram_index(self):
+        """점수 계산 키의 NGramIndex (entries 순서, NumPy 필요)"""
+        if self._ngram_index is None:
+            from .ngram_index import NGramIndex
+
+            self._ngram_index = NGramIndex([entry[3] for entry in self.entries])
+        return self._ngram_index
+
+    def length_window(self, length: int, cutoff: float) -> List[int]:
+        """점수 계산 키 길이가 Indel 길이 창 안에 있는 entry 인덱스 (오름차순)
+
+        Args:
+            length: 쿼리 길이
+            cutoff: 점수 하한 (0.0 - 1.0)
+
+        Returns:
+            List[int]: entry 인덱스 목록
+        """
+        if self._by_length is None:
+            self._by_length = sorted(range(len(self.entries)), key=lambda i: len(self.entries[i][3]))
+            self._sorted_lengths = [len(self.entries[i][3]) for i in self._by_length]
+
+        min_length, max_length = indel_length_window(length, cutoff)
+        lo = bisect_left(self._sorted_lengths, min_length)
+        hi = bisect_right(self._sorted_lengths, max_length)
+        return sorted(self._by_length[lo:hi])
+
+    @property
+    def fingerprint(self) -> str:
+        """제목 집합 지문 (행 번호, 원본 제목, 점수 계산 키 기준, MatchCache 키로 사용)"""
+        if self._fingerprint is None:
+            digest = hashlib.blake2b(digest_size=16)
+            for _, row, original, scoring_key in self.entries:
+                digest.update(f"{row}\x1f{original}\x1f{scoring_key}\x1e".encode("utf-8"))
+            self._fingerprint = digest.hexdigest()
+        return self._fingerprint
+
+    def scoring_key(self, aggressive_key: str) -> str:
+        """공격적 정규화 키를 유사도 점수 계산 키로 변환 (공통 접사 제거)"""
+        return self.affixes.strip(aggressive_key) if self.affixes else aggressive_key
+
+    def get_original(self, title_norm: str) -> str:
+        """정규화된 제목의 원본 제목 반환
+
+        Args:
+            title_norm: 정규화된 제목
+
+        Returns:
+            원본 제목 (없으면 정규화된 제목)
+        """
+        return self.original_titles.get(title_norm, title_norm)
+
+    def __len__(self) -> int:
+        return len(self.entries)
@@ -0,0 +1,260 @@
+"""내용 지문 모듈
+
+파일 크기와 고정 오프셋 표본 블록 몇 개의 해시로 내용 지문을 만듭니다.
+수 GB 영상 전체를 읽지 않고도 파일명이 비슷한 두 파일이 같은 내용인지 확인합니다.
+표본 밖의 바이트만 다른 파일은 구분하지 못하므로 완전한 동일성 검증은 아닙니다.
+"""
+
+import hashlib
+import json
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+try:
+    import xxhash
+    XXHASH_AVAILABLE = True
+except ImportError:
+    XXHASH_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+
+def read_at(fd: int, offset: int, length: int) -> bytes:
+    """오프셋에서 length 바이트 읽기 (pread가 없는 Windows는 lseek + read)
+
+    Args:
+        fd: 파일 디스크립터
+        offset: 읽기 시작 위치
+        length: 읽을 바이트 수
+
+    Returns:
+        bytes: 읽은 데이터 (파일 끝에서는 length보다 짧을 수 있음)
+    """
+    chunks = []
+    while length > 0:
+        if hasattr(os, "pread"):
+            chunk = os.pread(fd, length, offset)
+        else:
+            os.lseek(fd, offset, os.SEEK_SET)
+            chunk = os.read(fd, length)
+        if not chunk:
+            break  # 스캔 이후 파일이 줄어든 경우
+        chunks.append(chunk)
+        offset += len(chunk)
+        length -= len(chunk)
+    return b"".join(chunks)
+
+
+@dataclass
+class FingerprintStats:
+    """내용 지문 통계"""
+
+    cached: int = 0  # 캐시에서 가져온 파일 수
+    computed: int = 0  # 표본 블록을 읽어 계산한 파일 수
+    errors: int = 0  # 읽기 실패 파일 수
+    bytes_read: int = 0  # 읽은 바이트 합계
+
+    def __str__(self) -> str:
+        return (
+            f"내용 지문: 계산 {self.computed}개 ({self.bytes_read / (1024 ** 2):.1f} MB 읽음), "
+            f"캐시 {self.cached}개, 실패 {self.errors}개"
+        )
+
+
+class ContentFingerprinter:
+    """표본 블록 기반 내용 지문 계산기
+
+    지문 = hash(파일 크기 + 고정 오프셋 블록들). 오프셋은 크기만으로 정해지므로
+    크기가 같은 파일은 같은 위치를 비교합니다 (첫 블록과 마지막 블록 포함).
+    SAMPLE_BLOCKS * BLOCK_SIZE 이하인 파일은 전체를 해시합니다.
+
+    결과는 (경로, 크기, 수정 시간)이 같을 때만 재사용하며, cache_path가 주어지면
+    JSON 파일에 저장하여 다음 실행에서도 재사용합니다.
+    """
+
+    VERSION = 1
+
+    # 표본 블록 수 / 블록 크기
+    SAMPLE_BLOCKS = 5
+    BLOCK_SIZE = 64 * 1024
+
+    def __init__(
+        self,
+        cache_path: Optional[str] = None,
+        workers: int = 4,
+        sample_blocks: int = SAMPLE_BLOCKS,
+        block_size: int = BLOCK_SIZE,
+    ):
+        """ContentFingerprinter 초기화
+
+        Args:
+            cache_path: 지문 캐시 파일 경로 (None이면 실행 중 메모리에만 보관)
+            workers: 동시에 읽을 스레드 수 (NAS 지연을 겹치기 위함)
+            sample_blocks: 표본 블록 수 (2 이상)
+            block_size: 블록 크기 (bytes)
+        """
+        self.cache_path = Path(cache_path) if cache_path else None
+        self.workers = max(1, workers)
+        self.sample_blocks = max(2, sample_blocks)
+        self.block_size = block_size
+        self.stats = FingerprintStats()
+        self._entries: Optional[Dict[str, Tuple[int, float, str]]] = None  # {경로: (크기, 수정 시간, 지문)}
+        self._dirty = False
+
+    @property
+    def algorithm(self) -> str:
+        """해시 알고리즘 이름 (xxhash가 없으면 BLAKE2b)"""
+        return "xxh3_128" if XXHASH_AVAILABLE else "blake2b-128"
+
+    @property
+    def settings(self) -> Dict:
+        """지문 값에 영향을 주는 설정 (캐시 무효화 기준)"""
+        return {
+            "algorithm": self.algorithm,
+            "sample_blocks": self.sample_blocks,
+            "block_size": self.block_size,
+        }
+
+    def fingerprint(self, path: str, size: int, mtime: float) -> Optional[str]:
+        """파일 한 개의 내용 지문
+
+        Args:
+            path: 파일 경로
+            size: 스캔 시 파일 크기 (bytes)
+            mtime: 스캔 시 수정 시간 (epoch 초)
+
+        Returns:
+            Optional[str]: 16진 지문 (읽기 실패 시 None)
+        """
+        return self.fingerprint_many([(path, size, mtime)]).get(path)
+
+    def fingerprint_many(self, files: Iterable[Tuple[str, int, float]]) -> Dict[str, Optional[str]]:
+        """여러 파일의 내용 지문 (캐시에 없는 파일만 스레드 풀에서 읽음)
+
+        Args:
+            files: [(경로, 크기, 수정 시간), ...]
+
+        Returns:
+            Dict[str, Optional[str]]: {경로: 지문 또는 None}
+        """
+        entries = self._load()
+        result: Dict[str, Optional[str]] = {}
+        pending: List[Tuple[str, int, float]] = []
+
+        for path, size, mtime in dict.fromkeys(files):
+            cached = entries.get(path)
+            if cached is not None and cached[0] == size and cached[1] == mtime:
+                result[path] = cached[2]
+                self.stats.cached += 1
+            else:
+                pending.append((path, size, mtime))
+
+        if not pending:
+            return result
+
+        with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="fingerprint") as pool:
+            computed = list(pool.map(lambda item: self._compute(item[0], item[1]), pending))
+
+        for (path, size, mtime), (digest, bytes_read) in zip(pending, computed):
+            result[path] = digest
+            self.stats.bytes_read += bytes_read
+            if digest is None:
+                self.stats.errors += 1
+                continue
+            self.stats.computed += 1
+            entries[path] = (size, mtime, digest)
+            self._dirty = True
+
+        return result
+
+    def _offsets(self, size: int) -> List[Tuple[int, int]]:
+        """읽을 (오프셋, 길이) 목록 (크기만으로 결정)"""
+        if size <= self.sample_blocks * self.block_size:
+            return [(0, size)] if size > 0 else []
+        span = size - self.block_size
+        last = self.sample_blocks - 1
+        return [(span * i // last, self.block_size) for i in range(self.sample_blocks)]
+
+    def _compute(self, path: str, size: int) -> Tuple[Optional[str], int]:
+        """표본 블록을 읽어 지문 계산 (스레드 풀에서 실행)
+
+        Returns:
+            Tuple[Optional[str], int]: (지문 또는 None, 읽은 바이트 수)
+        """
+        digest = xxhash.xxh3_128() if XXHASH_AVAILABLE else hashlib.blake2b(digest_size=16)
+        digest.update(size.to_bytes(8, "little"))
+
+        try:
+            fd = os.open(path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+        except OSError as e:
+            logger.warning(f"내용 지문 계산 실패: {path} - {e}")
+            return None, 0
+
+        bytes_read = 0
+        try:
+            for offset, length in self._offsets(size):
+                block = read_at(fd, offset, length)
+                bytes_read += len(block)
+                digest.update(block)
+        except OSError as e:
+            logger.warning(f"내용 지문 계산 실패: {path} - {e}")
+            return None, bytes_read
+        finally:
+            os.close(fd)
+
+        return digest.hexdigest(), bytes_read
+
+    def _load(self) -> Dict[str, Tuple[int, float, str]]:
+        """캐시 파일 로드 (처음 한 번만, 설정이 다르면 빈 캐시)"""
+        if self._entries is not None:
+            return self._entries
+
+        self._entries = {}
+        if self.cache_path is None or not self.cache_path.exists():
+            return self._entries
+
+        try:
+            with open(self.cache_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (json.JSONDecodeError, OSError) as e:
+            logger.warning(f"내용 지문 캐시 로드 실패: {e}")
+            return self._entries
+
+        if data.get("version") != self.VERSION or data.get("settings") != self.settings:
+            logger.info("내용 지문 캐시가 현재 설정과 달라 사용하지 않습니다.")
+            return self._entries
+
+        try:
+            self._entries = {
+                path: (int(size), float(mtime), str(digest))
+                for path, (size, mtime, digest) in data.get("entries", {}).items()
+            }
+        except (TypeError, ValueError) as e:
+            logger.warning(f"내용 지문 캐시 형식 오류: {e}")
+            self._entries = {}
+        return self._entries
+
+    def save(self):
+        """캐시 저장 (바뀐 내용이 있을 때만, 임시 파일에 쓴 뒤 교체)"""
+        if self.cache_path is None or not self._dirty:
+            return
+
+        data = {
+            "version": self.VERSION,
+            "settings": self.settings,
+            "entries": {path: list(entry) for path, entry in self._entries.items()},
+        }
+
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.cache_path.with_name(self.cache_path.name + ".tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False)
+            os.replace(tmp_path, self.cache_path)
+            self._dirty = False
+        except OSError as e:
+            logger.warning(f"내용 지문 캐시 저장 실패: {e}")
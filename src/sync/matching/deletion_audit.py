@@ -5,10 +5,13 @@
 
 import json
 import logging
-from dataclasses import asdict, dataclass, field
+import os
+import re
+from collections import deque
+from dataclasses import asdict, dataclass, fields
 from datetime import datetime
 from pathlib import Path
-from typing import List, Optional
+from typing import IO, Dict, Iterator, List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -18,7 +21,7 @@ class AuditEntry:
     """단일 감사 로그 항목"""
 
     timestamp: str  # ISO format
-    action: str  # "DELETE", "SKIP", "ERROR"
+    action: str  # "DELETE", "HARDLINK", "REFLINK", "QUARANTINE", "RESTORE", "PURGE", "SKIP", "ERROR"
     filename: str
     full_path: str
     size: int  # bytes
@@ -28,104 +31,283 @@ class AuditEntry:
     size_variance: float  # 0.0 ~ 1.0 (예: 0.05 = 5%)
     kept_file: str  # 유지된 파일명
     dry_run: bool = False
+    target_path: str = ""  # 링크 원본 경로 (HARDLINK/REFLINK), 격리 경로 (QUARANTINE/RESTORE)
 
 
 @dataclass
 class AuditLog:
     """감사 로그 메타데이터"""
 
-    version: str = "1.0"
+    version: str = "2.0"
     created: str = ""
-    last_updated: str = ""
-    total_entries: int = 0
-    entries: List[AuditEntry] = field(default_factory=list)
+    migrated: bool = False  # 기존 JSON 로그의 세그먼트 변환 완료 여부
 
 
 class DeletionAuditLog:
     """삭제 감사 로그 관리 클래스
 
-    모든 파일 삭제 작업을 JSON 형식으로 기록합니다.
+    모든 파일 삭제 작업을 JSON Lines 세그먼트 파일에 추가 기록합니다.
+
+    저장 구조 (log_path = logs/deletion_audit.json 기준):
+    - logs/deletion_audit.000001.jsonl ...: 한 줄에 한 항목, 번호가 가장 큰 파일에 추가
+    - logs/deletion_audit.meta.json: 버전, 생성 시각, 기존 JSON 로그 변환 완료 여부
+
+    각 항목은 기록 즉시 파일에 쓰고(프로세스 종료 시에도 유지),
+    fsync는 fsync_batch개마다 및 flush()/close() 시 수행합니다.
+    세그먼트가 segment_entries개를 넘으면 새 세그먼트를 시작하고,
+    가장 오래된 세그먼트를 제외해도 max_entries개 이상 남으면 그 세그먼트를 삭제합니다.
+    기존 JSON 로그(log_path)는 처음 사용할 때 세그먼트로 자동 변환됩니다.
     """
 
     def __init__(
         self,
         log_path: str = "logs/deletion_audit.json",
         max_entries: int = 10000,
+        segment_entries: int = 1000,
+        fsync_batch: int = 100,
     ):
         """DeletionAuditLog 초기화
 
         Args:
-            log_path: 감사 로그 파일 경로
-            max_entries: 최대 로그 항목 수 (초과 시 오래된 항목 삭제)
+            log_path: 감사 로그 파일 경로 (세그먼트 파일 이름의 기준)
+            max_entries: 최대 로그 항목 수 (초과 시 오래된 세그먼트 삭제)
+            segment_entries: 세그먼트 파일당 항목 수
+            fsync_batch: fsync 간격 (항목 수)
         """
         self.log_path = Path(log_path)
         self.max_entries = max_entries
-        self._audit_log: Optional[AuditLog] = None
+        self.segment_entries = max(1, segment_entries)
+        self.fsync_batch = max(1, fsync_batch)
+
+        self._stem = self.log_path.stem
+        self._segment_pattern = re.compile(rf"^{re.escape(self._stem)}\.(\d+)\.jsonl$")
+        self.meta_path = self.log_path.with_name(f"{self._stem}.meta.json")
+
+        self._meta: Optional[AuditLog] = None
+        self._segment_counts: Optional[Dict[int, int]] = None  # {세그먼트 번호: 항목 수}
+        self._writer: Optional[IO[str]] = None
+        self._writer_segment = 0
+        self._unsynced = 0
 
     def _ensure_directory(self):
         """로그 디렉토리 생성"""
         self.log_path.parent.mkdir(parents=True, exist_ok=True)
 
-    def _load_log(self) -> AuditLog:
-        """기존 로그 파일 로드 또는 새로 생성"""
-        if self._audit_log is not None:
-            return self._audit_log
-
-        if self.log_path.exists():
-            try:
-                with open(self.log_path, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-
-                entries = [AuditEntry(**e) for e in data.get("entries", [])]
-                self._audit_log = AuditLog(
-                    version=data.get("version", "1.0"),
-                    created=data.get("created", ""),
-                    last_updated=data.get("last_updated", ""),
-                    total_entries=len(entries),
-                    entries=entries,
-                )
-            except (json.JSONDecodeError, KeyError, TypeError) as e:
-                logger.warning(f"감사 로그 파일 로드 실패, 새로 생성: {e}")
-                self._audit_log = AuditLog(
-                    created=datetime.now().isoformat(),
-                    last_updated=datetime.now().isoformat(),
-                )
-        else:
-            self._audit_log = AuditLog(
-                created=datetime.now().isoformat(),
-                last_updated=datetime.now().isoformat(),
+    def _segment_path(self, number: int) -> Path:
+        """세그먼트 번호의 파일 경로"""
+        return self.log_path.with_name(f"{self._stem}.{number:06d}.jsonl")
+
+    def _segment_numbers(self) -> List[int]:
+        """존재하는 세그먼트 번호 (오래된 순)"""
+        if not self.log_path.parent.exists():
+            return []
+
+        numbers = []
+        for entry in os.scandir(self.log_path.parent):
+            match = self._segment_pattern.match(entry.name)
+            if match:
+                numbers.append(int(match.group(1)))
+        return sorted(numbers)
+
+    def _load_meta(self) -> AuditLog:
+        """메타데이터 로드 또는 새로 생성 (기존 JSON 로그 변환 포함)"""
+        if self._meta is not None:
+            return self._meta
+
+        self._migrate_legacy_log()
+
+        if self._meta is None:
+            self._meta = self._read_meta()
+
+        if self._meta is None:
+            self._meta = AuditLog(created=datetime.now().isoformat())
+            self._save_meta()
+
+        return self._meta
+
+    def _read_meta(self) -> Optional[AuditLog]:
+        """meta.json 읽기 (없거나 읽을 수 없으면 None)"""
+        if not self.meta_path.exists():
+            return None
+
+        try:
+            with open(self.meta_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            return AuditLog(
+                version=data.get("version", "2.0"),
+                created=data.get("created", ""),
+                migrated=bool(data.get("migrated", False)),
             )
+        except (json.JSONDecodeError, OSError, AttributeError) as e:
+            logger.warning(f"감사 로그 메타데이터 로드 실패, 새로 생성: {e}")
+            return None
 
-        return self._audit_log
-
-    def _save_log(self):
-        """로그 파일 저장"""
+    def _save_meta(self):
+        """메타데이터 저장 (임시 파일에 쓰고 fsync 후 교체)"""
         self._ensure_directory()
-
-        log = self._load_log()
-        log.last_updated = datetime.now().isoformat()
-        log.total_entries = len(log.entries)
-
-        data = {
-            "version": log.version,
-            "created": log.created,
-            "last_updated": log.last_updated,
-            "total_entries": log.total_entries,
-            "entries": [asdict(e) for e in log.entries],
-        }
-
-        with open(self.log_path, "w", encoding="utf-8") as f:
+        data = asdict(self._meta)
+        tmp_path = self.meta_path.with_name(self.meta_path.name + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
             json.dump(data, f, indent=2, ensure_ascii=False)
+            f.flush()
+            os.fsync(f.fileno())
+        tmp_path.replace(self.meta_path)
+
+    def _migrate_legacy_log(self):
+        """기존 JSON 로그({"entries": [...]})를 세그먼트로 변환
+
+        세그먼트를 모두 쓰고 fsync한 뒤 meta.json에 완료(migrated)를 기록하고,
+        그 다음에 원본을 '<log_path>.migrated'로 이름을 바꿔 보관합니다.
+        중간에 중단되면 다음 실행에서 완료 기록이 있으면 이름만 바꾸고,
+        없으면 중단된 변환이 남긴 세그먼트를 지우고 처음부터 다시 변환하므로
+        항목이 빠지거나 두 번 기록되지 않습니다.
+        빈 파일이나 읽을 수 없는 파일은 항목이 없는 것으로 간주합니다.
+        """
+        if not self.log_path.is_file() or self.log_path.stat().st_size == 0:
+            return
+
+        meta = self._read_meta()
+        if meta is not None and meta.migrated:
+            self._meta = meta
+            self._finish_migration()
+            return
+
+        try:
+            with open(self.log_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            entries = [AuditEntry(**e) for e in data.get("entries", [])]
+        except (json.JSONDecodeError, KeyError, TypeError, AttributeError) as e:
+            logger.warning(f"기존 감사 로그 변환 실패, 무시: {e}")
+            return
+
+        # 원본이 남아 있고 완료 기록이 없으면 세그먼트는 중단된 변환의 일부
+        for number in self._segment_numbers():
+            self._segment_path(number).unlink(missing_ok=True)
+        self._segment_counts = None
+
+        self._meta = AuditLog(created=data.get("created") or datetime.now().isoformat())
+        self._save_meta()
+
+        for entry in entries[-self.max_entries:]:
+            self._append(entry)
+        self.flush()
+
+        self._meta.migrated = True
+        self._save_meta()
+        self._finish_migration()
+        logger.info(f"기존 감사 로그 변환 완료: {len(entries)}개 항목")
+
+    def _finish_migration(self):
+        """변환이 끝난 원본 JSON 로그를 '<log_path>.migrated'로 이름 변경"""
+        self.log_path.replace(self.log_path.with_name(self.log_path.name + ".migrated"))
+
+    def _load_segment_counts(self) -> Dict[int, int]:
+        """세그먼트별 항목 수 (처음 한 번만 계산)"""
+        if self._segment_counts is None:
+            self._segment_counts = {}
+            for number in self._segment_numbers():
+                with open(self._segment_path(number), "r", encoding="utf-8") as f:
+                    self._segment_counts[number] = sum(1 for line in f if line.strip())
+        return self._segment_counts
+
+    def _append(self, entry: AuditEntry):
+        """항목 한 줄 추가 (필요하면 세그먼트 교체 / 오래된 세그먼트 삭제)"""
+        counts = self._load_segment_counts()
+        current = max(counts) if counts else 0
+
+        if not counts or counts[current] >= self.segment_entries:
+            self.flush()
+            self._close_writer()
+            current += 1
+            counts[current] = 0
+            self._rotate_if_needed()
+
+        if self._writer is None or self._writer_segment != current:
+            self._close_writer()
+            self._ensure_directory()
+            self._writer = open(self._segment_path(current), "a", encoding="utf-8")
+            self._writer_segment = current
+
+        self._writer.write(json.dumps(asdict(entry), ensure_ascii=False) + "\n")
+        self._writer.flush()
+        counts[current] += 1
+
+        self._unsynced += 1
+        if self._unsynced >= self.fsync_batch:
+            self.flush()
 
     def _rotate_if_needed(self):
-        """최대 항목 수 초과 시 오래된 항목 삭제"""
-        log = self._load_log()
-
-        if len(log.entries) > self.max_entries:
-            # 오래된 항목부터 삭제 (가장 오래된 것 제거)
-            excess = len(log.entries) - self.max_entries
-            log.entries = log.entries[excess:]
-            logger.info(f"감사 로그 로테이션: {excess}개 오래된 항목 삭제")
+        """가장 오래된 세그먼트를 빼도 max_entries개 이상 남으면 세그먼트 삭제"""
+        counts = self._load_segment_counts()
+        total = sum(counts.values())
+
+        while len(counts) > 1:
+            oldest = min(counts)
+            if total - counts[oldest] < self.max_entries:
+                break
+            total -= counts.pop(oldest)
+            self._segment_path(oldest).unlink(missing_ok=True)
+            logger.info(f"감사 로그 로테이션: 세그먼트 {oldest} 삭제")
+
+    def flush(self):
+        """기록된 항목을 디스크에 동기화 (fsync)"""
+        if self._writer is not None and self._unsynced:
+            self._writer.flush()
+            os.fsync(self._writer.fileno())
+        self._unsynced = 0
+
+    def _close_writer(self):
+        """열린 세그먼트 파일 닫기"""
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+
+    def close(self):
+        """동기화 후 세그먼트 파일 닫기"""
+        self.flush()
+        self._close_writer()
+
+    def __enter__(self) -> "DeletionAuditLog":
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def _record(self, entry: AuditEntry):
+        """항목 기록"""
+        self._load_meta()
+        self._append(entry)
+
+    def iter_entries(self) -> Iterator[AuditEntry]:
+        """저장된 항목을 오래된 순으로 스트리밍
+
+        Yields:
+            AuditEntry: 감사 로그 항목
+        """
+        self._load_meta()
+        if self._writer is not None:
+            self._writer.flush()
+
+        for number in self._segment_numbers():
+            yield from self._read_segment(number)
+
+    def _read_segment(self, number: int) -> Iterator[AuditEntry]:
+        """세그먼트 한 개의 항목 읽기 (손상된 줄은 건너뜀)"""
+        known = {f.name for f in fields(AuditEntry)}
+        try:
+            f = open(self._segment_path(number), "r", encoding="utf-8")
+        except FileNotFoundError:
+            return
+
+        with f:
+            for line in f:
+                if not line.strip():
+                    continue
+                try:
+                    data = json.loads(line)
+                    yield AuditEntry(**{k: v for k, v in data.items() if k in known})
+                except (json.JSONDecodeError, TypeError) as e:
+                    logger.warning(f"손상된 감사 로그 줄 건너뜀 ({self._segment_path(number).name}): {e}")
 
     def log_deletion(
         self,
@@ -137,8 +319,10 @@ class DeletionAuditLog:
         size_variance: float,
         kept_file: str,
         dry_run: bool = False,
+        action: str = "DELETE",
+        target_path: str = "",
     ):
-        """삭제 작업 기록
+        """삭제(또는 링크 교체) 작업 기록
 
         Args:
             filename: 삭제된 파일명
@@ -149,10 +333,12 @@ class DeletionAuditLog:
             size_variance: 크기 차이 비율
             kept_file: 유지된 파일명
             dry_run: dry-run 모드 여부
+            action: "DELETE", "HARDLINK", "REFLINK", "QUARANTINE"
+            target_path: 링크 원본(유지 파일) 경로 또는 격리 경로
         """
         entry = AuditEntry(
             timestamp=datetime.now().isoformat(),
-            action="DELETE",
+            action=action,
             filename=filename,
             full_path=full_path,
             size=size,
@@ -162,15 +348,79 @@ class DeletionAuditLog:
             size_variance=size_variance,
             kept_file=kept_file,
             dry_run=dry_run,
+            target_path=target_path,
         )
 
-        log = self._load_log()
-        log.entries.append(entry)
+        self._record(entry)
 
-        self._rotate_if_needed()
-        self._save_log()
+        logger.debug(f"{action} 로그 기록: {filename} (dry_run={dry_run})")
 
-        logger.debug(f"삭제 로그 기록: {filename} (dry_run={dry_run})")
+    def log_restore(
+        self,
+        filename: str,
+        full_path: str,
+        size: int,
+        mtime: str,
+        quarantine_path: str,
+    ):
+        """격리 파일 복원 기록
+
+        Args:
+            filename: 파일명
+            full_path: 복원한 원래 경로
+            size: 파일 크기
+            mtime: 격리 시 기록한 수정 시간 (ISO format)
+            quarantine_path: 격리 경로
+        """
+        entry = AuditEntry(
+            timestamp=datetime.now().isoformat(),
+            action="RESTORE",
+            filename=filename,
+            full_path=full_path,
+            size=size,
+            mtime=mtime,
+            reason=f"restored from '{quarantine_path}'",
+            similarity_score=0.0,
+            size_variance=0.0,
+            kept_file="",
+            dry_run=False,
+            target_path=quarantine_path,
+        )
+
+        self._record(entry)
+
+        logger.debug(f"복원 로그 기록: {filename}")
+
+    def log_purge(
+        self,
+        run_path: str,
+        files: int,
+        size: int,
+    ):
+        """보관 기간이 지난 격리 실행 폴더의 영구 삭제 기록
+
+        Args:
+            run_path: 삭제한 실행 폴더 경로
+            files: 삭제한 파일 수
+            size: 해제된 바이트
+        """
+        entry = AuditEntry(
+            timestamp=datetime.now().isoformat(),
+            action="PURGE",
+            filename=os.path.basename(run_path),
+            full_path=run_path,
+            size=size,
+            mtime="",
+            reason=f"quarantine retention expired ({files} files)",
+            similarity_score=0.0,
+            size_variance=0.0,
+            kept_file="",
+            dry_run=False,
+        )
+
+        self._record(entry)
+
+        logger.debug(f"격리 폴더 삭제 로그 기록: {run_path}")
 
     def log_skip(
         self,
@@ -203,11 +453,7 @@ class DeletionAuditLog:
             dry_run=False,
         )
 
-        log = self._load_log()
-        log.entries.append(entry)
-
-        self._rotate_if_needed()
-        self._save_log()
+        self._record(entry)
 
         logger.debug(f"건너뛰기 로그 기록: {filename} - {reason}")
 
@@ -238,25 +484,48 @@ class DeletionAuditLog:
             dry_run=False,
         )
 
-        log = self._load_log()
-        log.entries.append(entry)
-
-        self._rotate_if_needed()
-        self._save_log()
+        self._record(entry)
 
         logger.error(f"에러 로그 기록: {filename} - {error_message}")
 
     def get_recent_entries(self, limit: int = 100) -> List[AuditEntry]:
         """최근 감사 로그 항목 조회
 
+        최신 세그먼트부터 필요한 만큼만 읽습니다.
+
         Args:
             limit: 반환할 최대 항목 수
 
         Returns:
             List[AuditEntry]: 최근 항목 목록 (최신순)
         """
-        log = self._load_log()
-        return log.entries[-limit:][::-1]  # 최신순 정렬
+        if limit <= 0:
+            return []
+
+        self._load_meta()
+        if self._writer is not None:
+            self._writer.flush()
+
+        recent: List[AuditEntry] = []
+        for number in reversed(self._segment_numbers()):
+            tail = deque(self._read_segment(number), maxlen=limit - len(recent))
+            recent.extend(reversed(tail))
+            if len(recent) >= limit:
+                break
+
+        return recent  # 최신순 정렬
+
+    def linked_paths(self) -> Dict[str, Tuple[str, str]]:
+        """링크로 교체된 파일 (dry-run 제외, 같은 경로는 마지막 기록)
+
+        Returns:
+            Dict[str, Tuple[str, str]]: {전체 경로: (링크 원본 경로, 기록 시 수정 시간)}
+        """
+        linked: Dict[str, Tuple[str, str]] = {}
+        for e in self.iter_entries():
+            if e.action in ("HARDLINK", "REFLINK") and not e.dry_run:
+                linked[e.full_path] = (e.target_path, e.mtime)
+        return linked
 
     def get_statistics(self) -> dict:
         """감사 로그 통계
@@ -264,27 +533,63 @@ class DeletionAuditLog:
         Returns:
             통계 딕셔너리
         """
-        log = self._load_log()
-
-        delete_count = sum(1 for e in log.entries if e.action == "DELETE" and not e.dry_run)
-        skip_count = sum(1 for e in log.entries if e.action == "SKIP")
-        error_count = sum(1 for e in log.entries if e.action == "ERROR")
-        dry_run_count = sum(1 for e in log.entries if e.action == "DELETE" and e.dry_run)
-
-        total_bytes_deleted = sum(
-            e.size for e in log.entries if e.action == "DELETE" and not e.dry_run
-        )
+        meta = self._load_meta()
+
+        total_entries = 0
+        delete_count = 0
+        link_count = 0
+        quarantine_count = 0
+        restore_count = 0
+        purge_count = 0
+        purge_bytes = 0
+        skip_count = 0
+        error_count = 0
+        dry_run_count = 0
+        total_bytes_deleted = 0
+        last_updated = meta.created
+
+        for e in self.iter_entries():
+            total_entries += 1
+            last_updated = e.timestamp
+            if e.action in ("DELETE", "HARDLINK", "REFLINK"):
+                if e.dry_run:
+                    dry_run_count += 1
+                else:
+                    if e.action == "DELETE":
+                        delete_count += 1
+                    else:
+                        link_count += 1
+                    total_bytes_deleted += e.size
+            elif e.action == "QUARANTINE":
+                if e.dry_run:
+                    dry_run_count += 1
+                else:
+                    quarantine_count += 1
+            elif e.action == "RESTORE":
+                restore_count += 1
+            elif e.action == "PURGE":
+                purge_count += 1
+                purge_bytes += e.size
+            elif e.action == "SKIP":
+                skip_count += 1
+            elif e.action == "ERROR":
+                error_count += 1
 
         return {
-            "total_entries": log.total_entries,
+            "total_entries": total_entries,
             "files_deleted": delete_count,
+            "files_linked": link_count,
+            "files_quarantined": quarantine_count,
+            "files_restored": restore_count,
+            "quarantine_runs_purged": purge_count,
+            "quarantine_bytes_purged": purge_bytes,
             "files_skipped": skip_count,
             "errors": error_count,
             "dry_run_deletions": dry_run_count,
             "total_bytes_freed": total_bytes_deleted,
             "total_gb_freed": round(total_bytes_deleted / (1024 ** 3), 2),
-            "log_created": log.created,
-            "last_updated": log.last_updated,
+            "log_created": meta.created,
+            "last_updated": last_updated,
         }
 
     def export_csv(self, output_path: str):
@@ -295,25 +600,24 @@ class DeletionAuditLog:
         """
         import csv
 
-        log = self._load_log()
-
         with open(output_path, "w", newline="", encoding="utf-8") as f:
-            writer = csv.DictWriter(f, fieldnames=[
-                "timestamp", "action", "filename", "full_path", "size",
-                "mtime", "reason", "similarity_score", "size_variance",
-                "kept_file", "dry_run"
-            ])
+            writer = csv.DictWriter(f, fieldnames=[field.name for field in fields(AuditEntry)])
             writer.writeheader()
-            for entry in log.entries:
+            for entry in self.iter_entries():
                 writer.writerow(asdict(entry))
 
         logger.info(f"감사 로그 CSV 내보내기 완료: {output_path}")
 
     def clear(self):
         """감사 로그 초기화 (주의!)"""
-        self._audit_log = AuditLog(
-            created=datetime.now().isoformat(),
-            last_updated=datetime.now().isoformat(),
-        )
-        self._save_log()
+        self._load_meta()
+        self._close_writer()
+        self._unsynced = 0
+
+        for number in self._segment_numbers():
+            self._segment_path(number).unlink(missing_ok=True)
+        self._segment_counts = {}
+
+        self._meta = AuditLog(created=datetime.now().isoformat())
+        self._save_meta()
         logger.warning("감사 로그가 초기화되었습니다.")
@@ -1,6 +1,7 @@
 """중복 파일 정리 모듈
 
-파일명 유사도 + 크기 검증을 통해 중복 파일을 감지하고 삭제합니다.
+파일명 유사도 + 크기 검증(또는 내용 지문)을 통해 중복 파일을 감지하고 삭제합니다.
+삭제 대신 격리 폴더로 옮기거나 유지 파일의 하드링크 / reflink로 교체할 수도 있습니다 (dedupe_mode).
 """
 
 import logging
@@ -8,13 +9,23 @@ import os
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Callable, Dict, List, Optional, Set, Tuple
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Set, Tuple
 
+from .content_fingerprint import ContentFingerprinter
 from .deletion_audit import DeletionAuditLog
 from .duplicate_detector import DuplicateDetector, DuplicateGroup
+from .file_linker import file_digest, link_duplicate
+from .media_probe import MediaInfo, MediaProbe
+from .quarantine import PurgeResult, Quarantine
+
+if TYPE_CHECKING:
+    from ..nas_client import NASClient
 
 logger = logging.getLogger(__name__)
 
+# 중복 정리 방식
+DEDUPE_MODES = ("delete", "quarantine", "hardlink", "reflink")
+
 
 @dataclass
 class DeletionCandidate:
@@ -28,6 +39,11 @@ class DeletionCandidate:
     similarity_score: float  # 유사도 점수
     size_variance: float  # 크기 차이 비율 (0.0 ~ 1.0)
     kept_file: str  # 유지될 파일명
+    content_verified: bool = False  # 내용 지문으로 유지 파일과 같은 내용임을 확인했는지
+    duration_delta: Optional[float] = None  # 유지 파일과의 재생 시간 차이 (초, 비교하지 않았으면 None)
+    kept_path: str = ""  # 유지될 파일 경로 (링크 교체 시 원본)
+    kept_size: int = 0  # 스캔 당시 유지 파일 크기 (bytes)
+    kept_mtime: Optional[datetime] = None  # 스캔 당시 유지 파일 수정 시간
 
 
 @dataclass
@@ -58,6 +74,21 @@ class DuplicateCleaner:
     Detection Criteria:
     1. 파일명 유사도 >= similarity_threshold (기본: 85%)
     2. 파일 크기 차이 <= size_variance_threshold (기본: 10%)
+       fingerprinter가 주어지면 크기 범위 대신 내용 지문 일치로 판정합니다
+       (크기가 다르면 읽지 않고 제외, 같으면 표본 블록 해시를 비교).
+       duration_tolerance가 주어지면 두 파일의 재생 시간을 헤더에서 읽어
+       차이가 허용 범위 이내인지로 판정합니다 (재생 시간을 알 수 없으면
+       내용 지문 또는 크기 검증으로 대체).
+
+    size_window가 켜져 있으면 크기순 슬라이딩 윈도우로 삭제될 수 있는 크기 범위
+    안의 파일끼리만 파일명을 비교합니다 (재생 시간 비교 시에는 적용 안함).
+
+    dedupe_mode가 "hardlink" / "reflink"이면 유지 파일과 크기가 같은 후보만 남기고,
+    삭제 대신 두 파일 전체의 스트리밍 해시가 같을 때만 중복 파일 경로를 유지 파일의
+    링크로 교체합니다 (경로 유지, 데이터 복사 없음).
+    "quarantine"이면 삭제 대신 quarantine 폴더의 실행 ID 폴더로 옮깁니다 (복원 가능).
+    삭제 / 격리 직전에는 두 파일을 다시 stat하여 스캔 이후 크기나 수정 시간이
+    바뀐 파일은 건너뜁니다.
 
     Keep Rule: 최신 파일 유지 (mtime 기준)
     """
@@ -67,6 +98,13 @@ class DuplicateCleaner:
         similarity_threshold: float = 0.85,
         size_variance_threshold: float = 0.10,
         audit_log_path: str = "logs/deletion_audit.json",
+        nas_client: Optional["NASClient"] = None,
+        fingerprinter: Optional[ContentFingerprinter] = None,
+        duration_tolerance: Optional[float] = None,
+        media_probe: Optional[MediaProbe] = None,
+        size_window: bool = False,
+        dedupe_mode: str = "delete",
+        quarantine: Optional[Quarantine] = None,
     ):
         """DuplicateCleaner 초기화
 
@@ -74,10 +112,34 @@ class DuplicateCleaner:
             similarity_threshold: 파일명 유사도 임계값 (0.0-1.0, 기본: 0.85)
             size_variance_threshold: 크기 차이 허용 비율 (0.0-1.0, 기본: 0.10 = 10%)
             audit_log_path: 감사 로그 파일 경로
+            nas_client: 삭제에 사용할 NASClient (있으면 스캔 스냅샷도 갱신)
+            fingerprinter: 내용 지문 계산기 (None이면 크기 범위로만 검증)
+            duration_tolerance: 재생 시간 허용 차이 (초, None이면 재생 시간 비교 안함)
+            media_probe: 미디어 헤더 탐색기 (None이면 캐시 파일 없이 새로 생성)
+            size_window: 삭제될 수 있는 크기 범위 안의 파일끼리만 파일명 비교
+                (그룹이 크기 범위별로 나뉘어 삭제 후보가 달라질 수 있음,
+                duration_tolerance가 있으면 적용 안함)
+            dedupe_mode: 중복 정리 방식 ("delete", "quarantine", "hardlink", "reflink")
+            quarantine: 격리 폴더 (dedupe_mode가 "quarantine"이면 필수)
         """
+        if dedupe_mode not in DEDUPE_MODES:
+            raise ValueError(f"지원하지 않는 중복 정리 방식: {dedupe_mode} (가능: {', '.join(DEDUPE_MODES)})")
+        if dedupe_mode == "quarantine" and quarantine is None:
+            raise ValueError("quarantine 모드에는 격리 폴더(quarantine)가 필요합니다")
+
         self.similarity_threshold = similarity_threshold
         self.size_variance_threshold = size_variance_threshold
         self.detector = DuplicateDetector(threshold=similarity_threshold)
+        self.nas_client = nas_client
+        self.fingerprinter = fingerprinter
+        self.duration_tolerance = duration_tolerance
+        self.media_probe = media_probe
+        if duration_tolerance is not None and media_probe is None:
+            self.media_probe = MediaProbe()
+        self.size_window = size_window
+        self.dedupe_mode = dedupe_mode
+        self.quarantine = quarantine
+        self.run_id: Optional[str] = None  # 마지막 cleanup의 격리 실행 ID
         self.audit = DeletionAuditLog(log_path=audit_log_path)
 
     def check_size_variance(
@@ -107,6 +169,31 @@ class DuplicateCleaner:
 
         return is_within, variance
 
+    @property
+    def linking(self) -> bool:
+        """삭제 대신 유지 파일의 링크로 교체하는지 (hardlink / reflink)"""
+        return self.dedupe_mode in ("hardlink", "reflink")
+
+    @property
+    def window_variance(self) -> Optional[float]:
+        """크기순 윈도우의 크기 차이 비율 상한 (None이면 윈도우 미적용)
+
+        _verify가 받아들일 수 있는 크기 차이만 남깁니다. 재생 시간 비교는
+        크기와 무관하게 통과할 수 있으므로 윈도우를 쓰지 않고, 내용 지문만
+        쓰면 크기가 같은 파일만 통과하므로 0입니다 (링크 교체도 크기가 같은 파일만).
+        윈도우를 쓰면 그룹이 크기 범위별로 나뉘므로 전체 비교보다 삭제 후보가
+        늘어날 수 있습니다 (크기가 다른 최신 파일이 유지 파일이던 그룹).
+        """
+        if not self.size_window:
+            return None
+        if self.linking:
+            return 0.0
+        if self.duration_tolerance is not None:
+            return None
+        if self.fingerprinter is not None:
+            return 0.0
+        return self.size_variance_threshold
+
     def find_cleanup_candidates(
         self,
         files: Dict[str, Tuple[str, datetime, str, str]],  # NASClient.get_files_with_dates() 형식
@@ -114,7 +201,7 @@ class DuplicateCleaner:
     ) -> Tuple[List[DeletionCandidate], List[DuplicateGroup]]:
         """삭제 대상 파일 찾기
 
-        파일명 유사도 검사 후 크기 검증을 추가로 수행합니다.
+        파일명 유사도 검사 후 내용 지문 / 재생 시간 / 크기 검증을 추가로 수행합니다.
 
         Args:
             files: NASClient.get_files_with_dates()의 반환값
@@ -124,44 +211,33 @@ class DuplicateCleaner:
             Tuple[List[DeletionCandidate], List[DuplicateGroup]]: (삭제 후보, 중복 그룹)
         """
         # 1. 파일명 유사도 기반 중복 그룹 찾기
-        groups = self.detector.find_duplicates(files, file_sizes)
+        groups = self.detector.find_duplicates(files, file_sizes, size_window=self.window_variance)
+        fingerprints = self._group_fingerprints(groups)
+        media = self._group_media(groups, fingerprints)
 
         candidates: List[DeletionCandidate] = []
 
         for group in groups:
-            # 2. 그룹 내 파일들의 크기 검증
-            # recommended 파일의 크기 가져오기
-            recommended_size = 0
+            # 2. 그룹 내 파일들을 유지 파일과 비교
+            kept = next((f for f in group.files if f[0] == group.recommended), None)
+            if kept is None:
+                continue
             recommended_name = group.recommended
 
-            for name, path, mtime, size in group.files:
-                if name == recommended_name:
-                    recommended_size = size
-                    break
-
             # 각 중복 파일 검증
-            for name, path, mtime, size in group.files:
+            for (name, path, mtime, size), similarity in zip(group.files, group.similarity_scores):
                 if name == recommended_name:
                     # 유지할 파일은 건너뛰기
                     continue
-
-                # 크기 검증
-                is_valid, variance = self.check_size_variance(recommended_size, size)
-
-                if not is_valid:
-                    # 크기 차이가 크면 삭제 제외
-                    logger.debug(
-                        f"크기 검증 실패 (제외): {name} "
-                        f"(차이: {variance:.1%}, 임계값: {self.size_variance_threshold:.1%})"
-                    )
+                if self.linking and size != kept[3]:
+                    # 내용이 완전히 같아야 링크로 교체 가능
+                    logger.debug(f"크기 불일치 (링크 제외): {name} (유지: {recommended_name})")
                     continue
 
-                # 유사도 점수 찾기
-                similarity = 1.0
-                for (fname, _, _, _), score in zip(group.files, group.similarity_scores):
-                    if fname == name:
-                        similarity = score
-                        break
+                verdict = self._verify(kept, (name, path, mtime, size), fingerprints, media)
+                if verdict is None:
+                    continue
+                variance, content_verified, duration_delta = verdict
 
                 candidate = DeletionCandidate(
                     filename=name,
@@ -172,11 +248,147 @@ class DuplicateCleaner:
                     similarity_score=similarity,
                     size_variance=variance,
                     kept_file=recommended_name,
+                    content_verified=content_verified,
+                    duration_delta=duration_delta,
+                    kept_path=kept[1],
+                    kept_size=kept[3],
+                    kept_mtime=kept[2],
                 )
                 candidates.append(candidate)
 
         return candidates, groups
 
+    def _verify(
+        self,
+        kept: Tuple[str, str, datetime, int],
+        duplicate: Tuple[str, str, datetime, int],
+        fingerprints: Dict[str, Optional[str]],
+        media: Dict[str, Optional[MediaInfo]],
+    ) -> Optional[Tuple[float, bool, Optional[float]]]:
+        """중복 파일 한 개를 유지 파일과 비교
+
+        순서: 내용 지문 일치 → 재생 시간 비교(둘 다 알 때) → 내용 지문 불일치면 제외
+        → 크기 차이 검증. 재생 시간이 허용 차이를 넘으면 제외하고, 허용 차이 이내라도
+        해상도와 트랙 수가 같을 때만 크기 차이와 무관하게 삭제합니다 (다르면 다음 검증으로).
+
+        Args:
+            kept: 유지 파일 (이름, 경로, 수정 시간, 크기)
+            duplicate: 중복 파일 (이름, 경로, 수정 시간, 크기)
+            fingerprints: {경로: 내용 지문}
+            media: {경로: 미디어 헤더 정보}
+
+        Returns:
+            (크기 차이 비율, 내용 지문 확인 여부, 재생 시간 차이) 또는 삭제 제외면 None
+        """
+        kept_name, kept_path, _, kept_size = kept
+        name, path, _, size = duplicate
+        variance = self.check_size_variance(kept_size, size)[1]
+
+        fingerprint = fingerprints.get(path)
+        if fingerprint is not None and fingerprint == fingerprints.get(kept_path):
+            return 0.0, True, None
+
+        duration_delta = None
+        if self.duration_tolerance is not None:
+            kept_info, info = media.get(kept_path), media.get(path)
+            if kept_info and info and kept_info.duration is not None and info.duration is not None:
+                duration_delta = abs(kept_info.duration - info.duration)
+                if duration_delta > self.duration_tolerance:
+                    logger.debug(
+                        f"재생 시간 불일치 (제외): {name} "
+                        f"(차이: {duration_delta:.1f}초, 허용: {self.duration_tolerance:.1f}초)"
+                    )
+                    return None
+                if kept_info.resolution and (kept_info.resolution, kept_info.tracks) == (info.resolution, info.tracks):
+                    return variance, False, duration_delta
+                logger.debug(
+                    f"해상도/트랙 수 불일치, 재생 시간만으로 판정 안함: {name} "
+                    f"({info.resolution or '?'} {info.tracks}트랙, 유지: {kept_info.resolution or '?'} {kept_info.tracks}트랙)"
+                )
+
+        if self.fingerprinter is not None:
+            # 크기가 다르거나 읽지 못하면 지문이 없음
+            logger.debug(f"내용 지문 불일치 (제외): {name} (유지: {kept_name})")
+            return None
+
+        # 크기 검증
+        is_valid, variance = self.check_size_variance(kept_size, size)
+        if not is_valid:
+            # 크기 차이가 크면 삭제 제외
+            logger.debug(
+                f"크기 검증 실패 (제외): {name} "
+                f"(차이: {variance:.1%}, 임계값: {self.size_variance_threshold:.1%})"
+            )
+            return None
+        return variance, False, duration_delta
+
+    def _group_fingerprints(self, groups: List[DuplicateGroup]) -> Dict[str, Optional[str]]:
+        """그룹별 유지 파일과 크기가 같은 파일들의 내용 지문
+
+        크기가 다르면 지문도 다르므로 읽지 않습니다. 크기가 0(정보 없음)인
+        파일도 검증할 수 없으므로 제외합니다.
+
+        Args:
+            groups: 중복 그룹 목록
+
+        Returns:
+            Dict[str, Optional[str]]: {경로: 지문} (fingerprinter가 없으면 빈 딕셔너리)
+        """
+        if self.fingerprinter is None:
+            return {}
+
+        targets: List[Tuple[str, int, float]] = []
+        for group in groups:
+            kept = next((f for f in group.files if f[0] == group.recommended), None)
+            if kept is None or kept[3] == 0:
+                continue
+            same_size = [f for f in group.files if f[0] != group.recommended and f[3] == kept[3]]
+            if not same_size:
+                continue
+            for name, path, mtime, size in [kept] + same_size:
+                targets.append((path, size, mtime.timestamp()))
+
+        fingerprints = self.fingerprinter.fingerprint_many(targets)
+        self.fingerprinter.save()
+        return fingerprints
+
+    def _group_media(
+        self,
+        groups: List[DuplicateGroup],
+        fingerprints: Dict[str, Optional[str]],
+    ) -> Dict[str, Optional[MediaInfo]]:
+        """그룹별 유지 파일과 아직 내용 지문으로 확인되지 않은 파일들의 헤더 정보
+
+        Args:
+            groups: 중복 그룹 목록
+            fingerprints: _group_fingerprints 결과
+
+        Returns:
+            Dict[str, Optional[MediaInfo]]: {경로: 헤더 정보} (재생 시간 비교를 안 하면 빈 딕셔너리)
+        """
+        if self.duration_tolerance is None or self.media_probe is None:
+            return {}
+
+        targets: List[Tuple[str, int, float]] = []
+        for group in groups:
+            kept = next((f for f in group.files if f[0] == group.recommended), None)
+            if kept is None:
+                continue
+            kept_fingerprint = fingerprints.get(kept[1])
+            unverified = [
+                f for f in group.files
+                if f[0] != group.recommended
+                and (kept_fingerprint is None or fingerprints.get(f[1]) != kept_fingerprint)
+            ]
+            if not unverified:
+                continue
+            for name, path, mtime, size in [kept] + unverified:
+                targets.append((path, size, mtime.timestamp()))
+
+        media = self.media_probe.probe_many(targets)
+        self.media_probe.save()
+        return media
+
     def cleanup(
         self,
         files: Dict[str, Tuple[str, datetime, str, str]],
@@ -213,10 +425,37 @@ class DuplicateCleaner:
                 logger.info("사용자가 삭제를 취소했습니다.")
                 return result
 
-        # 3. 파일 삭제 (또는 시뮬레이션)
+        # 3. 파일 삭제 / 격리 / 링크 교체 (또는 시뮬레이션)
+        action = self.dedupe_mode.upper()
+        linked = self.audit.linked_paths() if self.linking and not dry_run else {}
+        digests: Dict[str, str] = {}  # 유지 파일은 여러 후보가 공유하므로 한 번만 해시
+        if self.quarantine is not None and self.dedupe_mode == "quarantine":
+            self.run_id = Quarantine.new_run_id()
+
         for candidate in candidates:
+            target_path = candidate.kept_path if self.linking else ""
             if dry_run:
                 # Dry-run: 로그만 기록
+                success = True
+                verb = {"DELETE": "삭제", "QUARANTINE": "격리"}.get(action, f"{self.dedupe_mode} 교체")
+                logger.info(f"[DRY-RUN] {verb} 예정: {candidate.filename}")
+            elif not self.linking and self._skip_if_changed(candidate, result):
+                # 스캔 이후 덮어쓴 파일은 판정 근거가 달라졌으므로 삭제 / 격리 안함
+                continue
+            elif action == "DELETE":
+                # 실제 삭제
+                success = self._delete_file(candidate)
+                if not success:
+                    result.errors.append((candidate.filename, "삭제 실패"))
+            elif action == "QUARANTINE":
+                target_path = self._quarantine_file(candidate)
+                success = target_path is not None
+                if not success:
+                    result.errors.append((candidate.filename, "격리 실패"))
+            else:
+                success = self._link_file(candidate, result, linked, digests)
+
+            if success:
                 result.deleted_files.append(candidate)
                 result.files_deleted += 1
                 result.bytes_freed += candidate.size
@@ -229,33 +468,58 @@ class DuplicateCleaner:
                     similarity_score=candidate.similarity_score,
                     size_variance=candidate.size_variance,
                     kept_file=candidate.kept_file,
-                    dry_run=True,
+                    dry_run=dry_run,
+                    action=action,
+                    target_path=target_path,
                 )
 
-                logger.info(f"[DRY-RUN] 삭제 예정: {candidate.filename}")
-            else:
-                # 실제 삭제
-                success = self._delete_file(candidate)
+        # 감사 로그 디스크 동기화
+        self.audit.flush()
 
-                if success:
-                    result.deleted_files.append(candidate)
-                    result.files_deleted += 1
-                    result.bytes_freed += candidate.size
+        return result
 
-                    self.audit.log_deletion(
-                        filename=candidate.filename,
-                        full_path=candidate.full_path,
-                        size=candidate.size,
-                        mtime=candidate.mtime,
-                        similarity_score=candidate.similarity_score,
-                        size_variance=candidate.size_variance,
-                        kept_file=candidate.kept_file,
-                        dry_run=False,
-                    )
-                else:
-                    result.errors.append((candidate.filename, "삭제 실패"))
+    def _skip_if_changed(self, candidate: DeletionCandidate, result: CleanupResult) -> bool:
+        """삭제 / 격리 직전 두 파일을 다시 stat하여 스캔 이후 변경되었으면 건너뜀
 
-        return result
+        증분 스캔 스냅샷은 같은 이름으로 덮어쓴 파일의 크기 / 수정 시간을 반영하지
+        못할 수 있으므로, 중복 파일과 유지 파일의 크기와 수정 시간이 스캔 값과
+        같을 때만 진행합니다. 파일이 없으면 _delete_file / 격리에서 처리합니다.
+
+        Args:
+            candidate: 삭제 대상 정보
+            result: 건너뛴 파일을 기록할 정리 결과
+
+        Returns:
+            bool: 건너뛰었으면 True
+        """
+        checks = [(candidate.full_path, candidate.size, candidate.mtime, "")]
+        if candidate.kept_path:
+            checks.append((candidate.kept_path, candidate.kept_size, candidate.kept_mtime, "유지 파일 "))
+
+        reason = None
+        for path, size, mtime, label in checks:
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:
+                if label:
+                    reason = "유지 파일이 존재하지 않습니다"
+                    break
+                continue
+            except OSError as e:
+                reason = f"{label}상태 확인 실패: {e}"
+                break
+            if stat.st_size != size or (mtime is not None and datetime.fromtimestamp(stat.st_mtime) != mtime):
+                reason = f"{label}크기/수정 시간 불일치 (스캔 이후 변경됨)"
+                break
+
+        if reason is None:
+            return False
+
+        result.files_skipped += 1
+        result.skipped_files.append((candidate.filename, reason))
+        self.audit.log_skip(candidate.filename, candidate.full_path, candidate.size, candidate.mtime, reason)
+        logger.warning(f"정리 건너뜀: {candidate.filename} ({reason})")
+        return True
 
     def _delete_file(self, candidate: DeletionCandidate) -> bool:
         """단일 파일 삭제
@@ -278,8 +542,17 @@ class DuplicateCleaner:
                 )
                 return False
 
-            # 파일 삭제
-            os.remove(candidate.full_path)
+            # 파일 삭제 (NASClient가 있으면 스캔 스냅샷에서도 제거)
+            if self.nas_client is not None:
+                if not self.nas_client.delete_file(candidate.full_path):
+                    self.audit.log_error(
+                        filename=candidate.filename,
+                        full_path=candidate.full_path,
+                        error_message="파일이 아닙니다",
+                    )
+                    return False
+            else:
+                os.remove(candidate.full_path)
             logger.info(f"삭제 완료: {candidate.filename} ({candidate.size / (1024**2):.1f} MB)")
             return True
 
@@ -301,6 +574,100 @@ class DuplicateCleaner:
             )
             return False
 
+    def _quarantine_file(self, candidate: DeletionCandidate) -> Optional[str]:
+        """단일 파일을 격리 폴더로 이동 (NASClient가 있으면 스캔 스냅샷에서도 제거)
+
+        Args:
+            candidate: 격리 대상 정보
+
+        Returns:
+            Optional[str]: 격리 경로 (실패 시 None)
+        """
+        try:
+            target = self.quarantine.move(candidate.full_path, self.run_id)
+        except (OSError, ValueError) as e:
+            logger.error(f"격리 실패: {candidate.full_path} - {e}")
+            self.audit.log_error(
+                filename=candidate.filename,
+                full_path=candidate.full_path,
+                error_message=f"격리 실패: {e}",
+            )
+            return None
+
+        if self.nas_client is not None:
+            self.nas_client.discard(candidate.full_path)
+        logger.info(f"격리 완료: {candidate.filename} → {target}")
+        return target
+
+    def _link_file(
+        self,
+        candidate: DeletionCandidate,
+        result: CleanupResult,
+        linked: Dict[str, Tuple[str, str]],
+        digests: Dict[str, str],
+    ) -> bool:
+        """단일 중복 파일을 유지 파일의 링크로 교체
+
+        두 파일 전체의 스트리밍 해시가 같을 때만 교체합니다. 이미 같은 inode이거나
+        이전 실행에서 같은 원본으로 교체한 뒤 바뀌지 않은 파일은 건너뜁니다.
+
+        Args:
+            candidate: 교체 대상 정보
+            result: 건너뛴 파일 / 에러를 기록할 정리 결과
+            linked: DeletionAuditLog.linked_paths()의 반환값
+            digests: {경로: 전체 해시} (실행 중 재사용)
+
+        Returns:
+            bool: 교체 성공 여부
+        """
+        path, kept_path = candidate.full_path, candidate.kept_path
+
+        def skip(reason: str, audit: bool = True) -> bool:
+            result.files_skipped += 1
+            result.skipped_files.append((candidate.filename, reason))
+            if audit:
+                self.audit.log_skip(candidate.filename, path, candidate.size, candidate.mtime, reason)
+            logger.info(f"링크 교체 건너뜀: {candidate.filename} ({reason})")
+            return False
+
+        try:
+            if not os.path.isfile(path) or not os.path.isfile(kept_path):
+                logger.warning(f"파일이 존재하지 않습니다: {path} / {kept_path}")
+                self.audit.log_error(
+                    filename=candidate.filename,
+                    full_path=path,
+                    error_message="파일이 존재하지 않습니다",
+                )
+                result.errors.append((candidate.filename, "파일이 존재하지 않습니다"))
+                return False
+
+            if os.path.samefile(kept_path, path) or linked.get(path) == (kept_path, candidate.mtime.isoformat()):
+                return skip("이미 링크됨", audit=False)
+
+            if os.path.getsize(kept_path) != os.path.getsize(path):
+                return skip("크기 불일치 (스캔 이후 변경됨)")
+
+            for file_path in (kept_path, path):
+                if file_path not in digests:
+                    digests[file_path] = file_digest(file_path)
+            if digests[kept_path] != digests[path]:
+                return skip(f"내용 불일치 ('{candidate.kept_file}'와 전체 해시가 다름)")
+
+            link_duplicate(kept_path, path, self.dedupe_mode)
+
+        except OSError as e:
+            logger.error(f"링크 교체 실패: {path} - {e}")
+            self.audit.log_error(
+                filename=candidate.filename,
+                full_path=path,
+                error_message=f"{self.dedupe_mode} 실패: {e}",
+            )
+            result.errors.append((candidate.filename, f"{self.dedupe_mode} 실패: {e}"))
+            return False
+
+        logger.info(f"{self.dedupe_mode} 교체 완료: {candidate.filename} ({candidate.size / (1024**2):.1f} MB)")
+        return True
+
     def generate_preview(
         self,
         candidates: List[DeletionCandidate],
@@ -322,7 +689,12 @@ class DuplicateCleaner:
 
         total_bytes = sum(c.size for c in candidates)
         lines.append(f"발견된 중복 그룹: {len(groups)}개")
-        lines.append(f"삭제 예정 파일: {len(candidates)}개")
+        if self.linking:
+            lines.append(f"{self.dedupe_mode} 교체 예정 파일: {len(candidates)}개 (전체 해시 일치 시)")
+        elif self.dedupe_mode == "quarantine":
+            lines.append(f"격리 예정 파일: {len(candidates)}개")
+        else:
+            lines.append(f"삭제 예정 파일: {len(candidates)}개")
         lines.append(f"절약 예상 용량: {total_bytes / (1024**3):.2f} GB")
         lines.append("")
 
@@ -335,27 +707,52 @@ class DuplicateCleaner:
                 date_str = mtime.strftime("%Y-%m-%d")
                 size_mb = size / (1024 ** 2)
 
+                verified = ""
                 if name == group.recommended:
                     marker = "[KEEP]  "
                 else:
                     # 이 파일이 삭제 대상인지 확인
-                    is_candidate = any(c.filename == name for c in candidates)
-                    if is_candidate:
-                        marker = "[DELETE]"
+                    candidate = next((c for c in candidates if c.filename == name), None)
+                    if candidate is not None:
+                        marker = {"delete": "[DELETE]", "quarantine": "[MOVE]  "}.get(self.dedupe_mode, "[LINK]  ")
+                        if candidate.content_verified:
+                            verified = ", 내용 일치"
+                        elif candidate.duration_delta is not None:
+                            verified = f", 재생 시간 차이 {candidate.duration_delta:.1f}초"
                     else:
                         marker = "[SKIP]  "
 
                 lines.append(f"  {marker} {name[:50]}")
-                lines.append(f"          ({date_str}, {size_mb:.1f} MB)")
+                lines.append(f"          ({date_str}, {size_mb:.1f} MB{verified})")
 
             lines.append("")
 
         lines.append("=" * 70)
-        lines.append(f"WARNING: {len(candidates)}개 파일이 영구 삭제됩니다!")
+        if self.linking:
+            lines.append(f"{len(candidates)}개 파일이 유지 파일의 {self.dedupe_mode}로 교체됩니다 (경로 유지)")
+        elif self.dedupe_mode == "quarantine":
+            lines.append(
+                f"{len(candidates)}개 파일이 {self.quarantine.path}로 격리됩니다 "
+                f"({self.quarantine.retention_days:g}일 후 삭제, 그 전에는 복원 가능)"
+            )
+        else:
+            lines.append(f"WARNING: {len(candidates)}개 파일이 영구 삭제됩니다!")
         lines.append("=" * 70)
 
         return "\n".join(lines)
 
+    def log_purge(self, purge: PurgeResult):
+        """격리 폴더 정리 결과를 감사 로그에 기록 (실행 폴더별 PURGE, 실패는 ERROR)
+
+        Args:
+            purge: Quarantine.purge 결과
+        """
+        for run_path, files, size in purge.purged:
+            self.audit.log_purge(run_path, files, size)
+        for run_path, error in purge.errors:
+            self.audit.log_error(os.path.basename(run_path), run_path, f"격리 폴더 삭제 실패: {error}")
+        self.audit.flush()
+
     def get_audit_statistics(self) -> dict:
         """감사 로그 통계 반환"""
         return self.audit.get_statistics()
@@ -3,12 +3,22 @@
 NAS 파일 간의 중복을 감지하고 관리합니다.
 """
 
+from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Dict, List, Optional, Set, Tuple
+from typing import Deque, Dict, Iterator, List, Optional, Set, Tuple
 
+from .affixes import CommonAffixes
+from .candidate_index import indel_length_window
 from .normalizer import FilenameNormalizer
-from .fuzzy_matcher import FuzzyMatcher
+from .fuzzy_matcher import FuzzyMatcher, PruneStats
+
+try:
+    from rapidfuzz import process
+    import numpy as np
+    CPDIST_AVAILABLE = hasattr(process, "cpdist")
+except ImportError:
+    CPDIST_AVAILABLE = False
 
 
 @dataclass
@@ -29,90 +39,341 @@ class DuplicateDetector:
     """중복 파일 감지 클래스
 
     파일명 유사도를 기반으로 중복 파일을 감지합니다.
+    strip_affixes가 켜져 있으면 파일 목록에서 학습한 공통 접사(채널명 등)를
+    제거한 뒤 유사도를 계산합니다 (그룹의 canonical_name은 제거 전 핵심 제목).
+    점수 상한 필터로 제외/계산한 핵심 제목 쌍 수는 prune_stats에 누적됩니다.
     """
 
     def __init__(
         self,
         threshold: float = 0.95,
+        strip_affixes: bool = True,
     ):
         """DuplicateDetector 초기화
 
         Args:
             threshold: 중복 판정 유사도 임계값 (0.0 - 1.0, 기본값: 0.95)
+            strip_affixes: 유사도 계산 전 공통 접사 제거 여부
         """
         self.threshold = threshold
+        self.strip_affixes = strip_affixes
         self.matcher = FuzzyMatcher(threshold=threshold)
+        self.affixes = CommonAffixes()  # 마지막 find_duplicates에서 학습한 접사
+        self.prune_stats = PruneStats()
 
     def find_duplicates(
         self,
         files: Dict[str, Tuple[str, datetime, str, str]],  # {normalized: (original, mtime, subfolder, path)}
         file_sizes: Optional[Dict[str, int]] = None,  # {original_name: size_in_bytes}
+        size_window: Optional[float] = None,
     ) -> List[DuplicateGroup]:
         """중복 파일 그룹 찾기
 
         Args:
             files: NASClient.get_files_with_dates()의 반환값
             file_sizes: 파일 크기 매핑 (optional) - {원본_파일명: 크기(bytes)}
+            size_window: 크기 차이 비율 상한 (주어지면 크기를 아는 파일 중
+                         (큰 크기 - 작은 크기) / 큰 크기 <= size_window 인 쌍만 비교)
 
         Returns:
             List[DuplicateGroup]: 중복 그룹 목록
         """
         groups: List[DuplicateGroup] = []
-        processed: Set[str] = set()
         sizes = file_sizes or {}
 
-        file_list = list(files.items())
+        file_list = list(files.values())
+
+        # 핵심 제목(복사본 접미사 제거)은 파일당 한 번만 계산하고,
+        # 같은 핵심 제목을 가진 파일들은 한 번만 비교
+        core_ids: Dict[str, int] = {}
+        cores: List[str] = []
+        file_cores: List[int] = []
+        members: List[Deque[int]] = []  # 핵심 제목별 아직 그룹에 속하지 않은 파일 (파일 순서)
+
+        for i, (orig, _, _, _) in enumerate(file_list):
+            core = FilenameNormalizer.normalize_aggressive(orig)
+            core_id = core_ids.get(core)
+            if core_id is None:
+                core_id = core_ids[core] = len(cores)
+                cores.append(core)
+                members.append(deque())
+            file_cores.append(core_id)
+            members[core_id].append(i)
+
+        # 공통 접사는 핵심 제목별로 한 번만 제거하여 점수 계산에 사용
+        self.affixes = CommonAffixes.learn(cores) if self.strip_affixes else CommonAffixes()
+        scoring = [self.affixes.strip(core) for core in cores] if self.affixes else cores
+
+        if size_window is not None:
+            return self._find_window_groups(file_list, sizes, cores, file_cores, scoring, size_window)
+
+        similar = self._find_similar_cores(scoring)
+
+        # 파일 순서대로 기준 파일이 남은 유사 파일을 모두 가져가는 방식 유지
+        # (이전 파일은 이미 기준 파일로 처리되었으므로 남은 파일은 항상 뒤쪽)
+        for i in range(len(file_list)):
+            core_id1 = file_cores[i]
+            if not members[core_id1] or members[core_id1][0] != i:
+                continue  # 이미 다른 그룹에 포함됨
+            members[core_id1].popleft()
+
+            # 유사한 파일 찾기
+            matched: List[Tuple[int, float]] = []
+            self_score = self.matcher._get_similarity(scoring[core_id1], scoring[core_id1])
+            if self_score >= self.threshold:
+                matched.extend((j, self_score) for j in members[core_id1])
+                members[core_id1].clear()
+            for core_id2, score in similar[core_id1]:
+                matched.extend((j, score) for j in members[core_id2])
+                members[core_id2].clear()
+
+            # 2개 이상인 경우만 중복 그룹으로 처리
+            if matched:
+                matched.sort()
+                groups.append(self._build_group(cores[core_id1], i, matched, file_list, sizes))
+
+        return groups
+
+    def _find_window_groups(
+        self,
+        file_list: List[Tuple[str, datetime, str, str]],
+        sizes: Dict[str, int],
+        cores: List[str],
+        file_cores: List[int],
+        scoring: List[str],
+        size_window: float,
+    ) -> List[DuplicateGroup]:
+        """크기 차이가 size_window 이내인 파일끼리만 묶어 중복 그룹 찾기
 
-        for i, (norm1, (orig1, mtime1, subfolder1, path1)) in enumerate(file_list):
-            if norm1 in processed:
+        크기순으로 정렬한 파일에서 각 파일의 크기 창(연속 구간)에 들어오는
+        핵심 제목만 n-gram 후보 조회 대상으로 삼으므로 후보 필터 비용이
+        창 크기에 비례합니다. 그룹은 기존과 같이 파일 순서대로 기준 파일이
+        남은 유사 파일을 가져가되, 기준 파일과 크기 차이
+        (큰 크기 - 작은 크기) / 큰 크기가 size_window 이내인 파일만 가져갑니다.
+        크기를 모르는(0) 파일은 어느 그룹에도 들어가지 않습니다.
+
+        Returns:
+            List[DuplicateGroup]: 중복 그룹 목록
+        """
+        file_sizes = [sizes.get(orig, 0) for orig, _, _, _ in file_list]
+
+        def in_window(size1: int, size2: int) -> bool:
+            # DuplicateCleaner.check_size_variance와 같은 식
+            larger = max(size1, size2)
+            return size1 > 0 and size2 > 0 and (larger - min(size1, size2)) / larger <= size_window
+
+        windows = None
+        if self.matcher._use_prefilter and self.threshold > 0:
+            order = np.array(
+                sorted((i for i, size in enumerate(file_sizes) if size > 0), key=file_sizes.__getitem__),
+                dtype=np.int64,
+            )
+            sorted_sizes = np.array([file_sizes[i] for i in order], dtype=np.float64)
+            sorted_cores = np.array(file_cores, dtype=np.int64)[order] if order.size else order
+
+            # 크기 창 경계 (부동소수 오차는 창을 넓히는 쪽으로, 정확한 판정은 그룹화에서)
+            scale = 1.0 - min(size_window, 1.0)
+            lower = np.searchsorted(sorted_sizes, sorted_sizes * scale * (1 - 1e-9), side="left")
+            upper = (
+                np.searchsorted(sorted_sizes, sorted_sizes / scale * (1 + 1e-9), side="right")
+                if scale > 0 else np.full(order.size, order.size)
+            )
+
+            slices: List[List[np.ndarray]] = [[] for _ in cores]
+            for pos in range(order.size):
+                slices[sorted_cores[pos]].append(sorted_cores[lower[pos]:upper[pos]])
+            windows = [
+                np.unique(np.concatenate(parts)) if parts else np.empty(0, dtype=np.int64)
+                for parts in slices
+            ]
+
+        similar = self._find_similar_cores(scoring, windows)
+
+        members: List[List[int]] = [[] for _ in cores]
+        for i, core_id in enumerate(file_cores):
+            if file_sizes[i] > 0:
+                members[core_id].append(i)
+
+        groups: List[DuplicateGroup] = []
+        assigned = [False] * len(file_list)
+        for i in range(len(file_list)):
+            if assigned[i] or file_sizes[i] == 0:
                 continue
+            assigned[i] = True
+
+            core_id1 = file_cores[i]
+            size1 = file_sizes[i]
+
+            # 유사하고 크기 창 안에 있는 남은 파일 찾기
+            matched: List[Tuple[int, float]] = []
+            self_score = self.matcher._get_similarity(scoring[core_id1], scoring[core_id1])
+            candidates = [(core_id1, self_score)] if self_score >= self.threshold else []
+            for core_id2, score in candidates + similar[core_id1]:
+                matched.extend(
+                    (j, score) for j in members[core_id2]
+                    if not assigned[j] and in_window(size1, file_sizes[j])
+                )
 
-            # 핵심 제목 추출 (복사본 접미사 제거)
-            core1 = FilenameNormalizer.normalize_aggressive(orig1)
-            size1 = sizes.get(orig1, 0)
+            if matched:
+                for j, _ in matched:
+                    assigned[j] = True
+                matched.sort()
+                groups.append(self._build_group(cores[core_id1], i, matched, file_list, sizes))
 
-            # 유사한 파일 찾기
-            group_files: List[Tuple[str, str, datetime, int]] = [(orig1, path1, mtime1, size1)]
-            group_scores: List[float] = [1.0]
+        return groups
 
-            for j, (norm2, (orig2, mtime2, subfolder2, path2)) in enumerate(file_list[i + 1:], start=i + 1):
-                if norm2 in processed:
-                    continue
+    def _build_group(
+        self,
+        canonical_name: str,
+        anchor: int,
+        matched: List[Tuple[int, float]],
+        file_list: List[Tuple[str, datetime, str, str]],
+        sizes: Dict[str, int],
+    ) -> DuplicateGroup:
+        """기준 파일과 유사 파일들로 중복 그룹 생성 (최신 파일 유지 권장)
 
-                core2 = FilenameNormalizer.normalize_aggressive(orig2)
+        Args:
+            canonical_name: 기준 파일의 핵심 제목
+            anchor: 기준 파일 인덱스
+            matched: [(유사 파일 인덱스, 점수), ...] (인덱스 오름차순)
+            file_list: 파일 목록
+            sizes: {원본 파일명: 크기}
 
-                # 유사도 계산
-                score = self.matcher._get_similarity(core1, core2)
+        Returns:
+            DuplicateGroup: 중복 그룹
+        """
+        orig1, mtime1, _, path1 = file_list[anchor]
+        group_files: List[Tuple[str, str, datetime, int]] = [(orig1, path1, mtime1, sizes.get(orig1, 0))]
+        group_scores: List[float] = [1.0]
+        for j, score in matched:
+            orig2, mtime2, _, path2 = file_list[j]
+            group_files.append((orig2, path2, mtime2, sizes.get(orig2, 0)))
+            group_scores.append(score)
+
+        group = DuplicateGroup(
+            canonical_name=canonical_name,
+            files=group_files,
+            similarity_scores=group_scores,
+        )
+
+        # 최신 파일 결정 (유지 권장)
+        newest_idx = max(range(len(group_files)), key=lambda x: group_files[x][2])
+        group.recommended = group_files[newest_idx][0]
+
+        # 중복으로 표시할 파일 결정 (최신 제외)
+        group.duplicates_to_mark = [
+            f[0] for idx, f in enumerate(group_files)
+            if idx != newest_idx
+        ]
+
+        return group
+
+    def _find_similar_cores(
+        self,
+        cores: List[str],
+        windows: Optional[List["np.ndarray"]] = None,
+    ) -> List[List[Tuple[int, float]]]:
+        """서로 다른 핵심 제목 중 유사도가 임계값 이상인 쌍 찾기
 
-                if score >= self.threshold:
-                    size2 = sizes.get(orig2, 0)
-                    group_files.append((orig2, path2, mtime2, size2))
-                    group_scores.append(score)
-                    processed.add(norm2)
+        NumPy가 있으면 n-gram 역색인으로 임계값에 도달할 수 없는 쌍을 건너뛰고
+        (길이 창 / 드문 n-gram 공유 / 문자 수 상한), 남은 쌍은 rapidfuzz
+        process.cpdist로 한 번에 점수를 계산합니다. NumPy가 없으면 길이순으로
+        정렬하여 길이 창을 벗어나는 나머지 구간을 통째로 건너뜁니다.
 
-            # 2개 이상인 경우만 중복 그룹으로 처리
-            if len(group_files) > 1:
-                processed.add(norm1)
+        Args:
+            cores: 고유 핵심 제목 목록
+            windows: 핵심 제목별 비교 대상 핵심 제목 인덱스 배열 (n-gram 후보 조회에만
+                     적용, None이면 전체)
 
-                group = DuplicateGroup(
-                    canonical_name=core1,
-                    files=group_files,
-                    similarity_scores=group_scores,
-                )
+        Returns:
+            각 핵심 제목별 [(유사한 핵심 제목 인덱스, 점수), ...] (양방향)
+        """
+        similar: List[List[Tuple[int, float]]] = [[] for _ in cores]
+
+        def add(u: int, v: int, score: float) -> None:
+            # _get_similarity와 동일하게 빈 문자열은 0점
+            if not cores[u] or not cores[v]:
+                score = 0.0
+            if score >= self.threshold:
+                similar[u].append((v, score))
+                similar[v].append((u, score))
+
+        pairs = len(cores) * (len(cores) - 1) // 2
+
+        if not (self.matcher._use_prefilter and self.threshold > 0):
+            use_window = self.matcher._use_length_window and self.threshold > 0
+            order = sorted(range(len(cores)), key=lambda i: len(cores[i])) if use_window else range(len(cores))
+            scored = 0
+            for pos, u in enumerate(order):
+                max_length = indel_length_window(len(cores[u]), self.threshold)[1] if use_window else None
+                for v in order[pos + 1:]:
+                    if use_window and len(cores[v]) > max_length:
+                        break  # 길이순이므로 남은 구간도 모두 상한 미만
+                    add(u, v, self.matcher._get_similarity(cores[u], cores[v]))
+                    scored += 1
+
+            self.prune_stats.pruned += pairs - scored
+            self.prune_stats.scored += scored
+            return similar
+
+        from .ngram_index import NGramIndex
+
+        index = NGramIndex(cores)
+        left: List[int] = []
+        right: List[int] = []
+        for u, core in enumerate(cores):
+            within = windows[u] if windows is not None else None
+            if within is not None:
+                within = within[within > u]
+                if within.size == 0:
+                    continue
+            ids = index.candidates(core, self.threshold, within)
+            ids = ids[ids > u].tolist()
+            left.extend([u] * len(ids))
+            right.extend(ids)
 
-                # 최신 파일 결정 (유지 권장)
-                newest_idx = max(range(len(group_files)), key=lambda x: group_files[x][2])
-                group.recommended = group_files[newest_idx][0]
+        self.prune_stats.pruned += pairs - len(left)
+        self.prune_stats.scored += len(left)
 
-                # 중복으로 표시할 파일 결정 (최신 제외)
-                group.duplicates_to_mark = [
-                    f[0] for idx, f in enumerate(group_files)
-                    if idx != newest_idx
-                ]
+        for u, v, score in self._score_pairs(cores, left, right):
+            add(u, v, score)
+        return similar
 
-                groups.append(group)
+    def _score_pairs(
+        self,
+        cores: List[str],
+        left: List[int],
+        right: List[int],
+    ) -> Iterator[Tuple[int, int, float]]:
+        """핵심 제목 쌍 점수 계산 (가능하면 rapidfuzz process.cpdist로 한 번에)
 
-        return groups
+        cpdist는 score_cutoff 미만을 0으로 돌려주므로 임계값 판정에만 사용합니다.
+
+        Args:
+            cores: 고유 핵심 제목 목록
+            left: 쌍의 왼쪽 인덱스 목록
+            right: 쌍의 오른쪽 인덱스 목록
+
+        Yields:
+            (왼쪽 인덱스, 오른쪽 인덱스, 점수)
+        """
+        if not (CPDIST_AVAILABLE and self.matcher.using_vectorized):
+            for u, v in zip(left, right):
+                yield u, v, self.matcher._get_similarity(cores[u], cores[v])
+            return
+
+        for start in range(0, len(left), self.matcher.CDIST_MAX_CELLS):
+            chunk_left = left[start:start + self.matcher.CDIST_MAX_CELLS]
+            chunk_right = right[start:start + self.matcher.CDIST_MAX_CELLS]
+            scores = process.cpdist(
+                [cores[u] for u in chunk_left],
+                [cores[v] for v in chunk_right],
+                scorer=self.matcher._get_scorer(),
+                score_cutoff=self.threshold * 100.0,
+                dtype=np.float64,
+                workers=-1,
+            ) / 100.0
+            yield from zip(chunk_left, chunk_right, scores.tolist())
 
     def get_duplicates_to_mark(
         self,
@@ -0,0 +1,100 @@
+"""중복 파일 링크 모듈
+
+내용이 완전히 같은 중복 파일을 삭제하는 대신 유지 파일의 하드링크나
+reflink(FICLONE, btrfs/XFS)로 바꿔 경로는 그대로 두고 공간만 회수합니다.
+링크 전에는 두 파일 전체를 스트리밍 해시로 비교합니다.
+"""
+
+import hashlib
+import logging
+import os
+from pathlib import Path
+
+try:
+    import xxhash
+    XXHASH_AVAILABLE = True
+except ImportError:
+    XXHASH_AVAILABLE = False
+
+try:
+    import fcntl
+    FCNTL_AVAILABLE = True
+except ImportError:  # Windows
+    FCNTL_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# linux/fs.h: _IOW(0x94, 9, int)
+FICLONE = 0x40049409
+
+# 전체 해시 읽기 단위
+CHUNK_SIZE = 1024 * 1024
+
+
+def file_digest(path: str, chunk_size: int = CHUNK_SIZE) -> str:
+    """파일 전체의 스트리밍 해시 (xxhash가 없으면 BLAKE2b)
+
+    Args:
+        path: 파일 경로
+        chunk_size: 한 번에 읽을 바이트 수
+
+    Returns:
+        str: 16진 해시
+
+    Raises:
+        OSError: 읽기 실패
+    """
+    digest = xxhash.xxh3_128() if XXHASH_AVAILABLE else hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def link_duplicate(kept_path: str, duplicate_path: str, mode: str):
+    """중복 파일을 유지 파일의 하드링크 / reflink로 교체
+
+    같은 디렉토리의 임시 경로에 링크를 만든 뒤 os.replace로 원자적으로
+    교체하므로, 중간에 실패해도 중복 파일 경로는 항상 원래 파일이거나
+    완성된 링크입니다. reflink는 새 inode이므로 권한과 수정 시간을
+    중복 파일의 값으로 유지합니다 (하드링크는 유지 파일과 inode 공유).
+
+    Args:
+        kept_path: 유지 파일 경로 (링크 원본)
+        duplicate_path: 교체할 중복 파일 경로
+        mode: "hardlink" 또는 "reflink"
+
+    Raises:
+        ValueError: 지원하지 않는 mode
+        OSError: 링크 실패 (다른 볼륨, reflink 미지원 파일 시스템 등)
+    """
+    if mode not in ("hardlink", "reflink"):
+        raise ValueError(f"지원하지 않는 링크 방식: {mode}")
+
+    target = Path(duplicate_path)
+    tmp_path = target.with_name(f".{target.name}.dedupe-tmp")
+    stat = os.stat(duplicate_path)
+
+    try:
+        if mode == "hardlink":
+            os.link(kept_path, tmp_path)
+        else:
+            _reflink(kept_path, str(tmp_path))
+            os.chmod(tmp_path, stat.st_mode & 0o7777)
+            os.utime(tmp_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        os.replace(tmp_path, duplicate_path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def _reflink(source: str, destination: str):
+    """FICLONE으로 source의 데이터 블록을 공유하는 새 파일 생성"""
+    if not FCNTL_AVAILABLE:
+        raise OSError("reflink는 Linux에서만 지원됩니다")
+
+    with open(source, "rb") as src, open(destination, "xb") as dst:
+        fcntl.ioctl(dst.fileno(), FICLONE, src.fileno())
@@ -3,18 +3,29 @@
 rapidfuzz 라이브러리를 사용한 유사도 기반 파일명 매칭을 제공합니다.
 """
 
-from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Tuple
+import time
+from dataclasses import dataclass, field, replace
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
 
 try:
-    from rapidfuzz import fuzz
+    from rapidfuzz import fuzz, process
     RAPIDFUZZ_AVAILABLE = True
 except ImportError:
     from difflib import SequenceMatcher
     RAPIDFUZZ_AVAILABLE = False
 
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+from .candidate_index import CandidateIndex
 from .normalizer import FilenameNormalizer
 
+if TYPE_CHECKING:
+    from .match_cache import MatchCache
+
 
 @dataclass
 class MatchResult:
@@ -29,6 +40,22 @@ class MatchResult:
     alternatives: List[Tuple[str, float, int]] = field(default_factory=list)  # [(title, score, row), ...]
 
 
+@dataclass
+class PruneStats:
+    """점수 상한 필터 통계 (쌍 단위)"""
+
+    pruned: int = 0  # 상한이 하한 미만이라 점수 계산을 생략한 쌍
+    scored: int = 0  # 스코어러로 점수를 계산한 쌍
+
+    @property
+    def pruned_rate(self) -> float:
+        total = self.pruned + self.scored
+        return self.pruned / total if total else 0.0
+
+    def __str__(self) -> str:
+        return f"점수 상한 필터: 제외 {self.pruned:,}쌍, 계산 {self.scored:,}쌍 ({self.pruned_rate:.0%} 제외)"
+
+
 class FuzzyMatcher:
     """유사도 기반 파일명 매칭 클래스
 
@@ -36,12 +63,47 @@ class FuzzyMatcher:
     1. 정확히 일치 (기본 정규화 후)
     2. 표준 정규화 후 일치
     3. 유사도 매칭 (임계값 이상)
+
+    rapidfuzz와 NumPy가 설치되어 있으면 batch_find_matches의 유사도 단계는
+    process.cdist 한 번으로 모든 파일 x 제목 점수 행렬을 멀티코어로 계산합니다.
+
+    prefilter가 켜져 있으면 점수 상한이 대안 하한(threshold * 0.9)에 못 미치는
+    제목을 점수 계산 전에 제외합니다. Indel 기반 메트릭은 NGramIndex의 길이 창 /
+    n-gram / 문자 수 상한(NumPy가 없으면 길이 창만), partial_ratio는 문자 수
+    상한을 사용합니다. 제외/계산한 쌍 수는 prune_stats에 누적됩니다.
+
+    cache가 주어지면 유사도 단계 전에 MatchCache를 조회하고, 계산한 결과를
+    저장합니다 (정확/정규화 단계는 해시 조회이므로 캐시하지 않음).
     """
 
+    # 메트릭별 rapidfuzz 스코어러 이름
+    SCORERS = ("ratio", "partial_ratio", "token_sort_ratio", "token_set_ratio")
+
+    # 대안 추적 하한 (임계값 대비 비율)
+    ALTERNATIVE_RATIO = 0.9
+
+    # 대안 최대 개수
+    MAX_ALTERNATIVES = 5
+
+    # cdist 한 번에 계산할 최대 셀 수 (float64 기준 약 32MB)
+    CDIST_MAX_CELLS = 4_000_000
+
+    # n-gram 필터 상한을 적용할 수 있는 메트릭 (공백 없는 문자열 기준 Indel ratio,
+    # 토큰이 하나뿐이므로 token_set_ratio도 ratio와 같음)
+    PREFILTER_METHODS = ("ratio", "token_sort_ratio", "token_set_ratio")
+
+    # 문자 수 상한만 적용할 수 있는 메트릭
+    PARTIAL_METHODS = ("partial_ratio",)
+
+    # 일괄 경로에서 필터/전체 cdist 비용 비교에 사용할 파일 수
+    PREFILTER_SAMPLE_SIZE = 16
+
     def __init__(
         self,
         threshold: float = 0.85,
-        method: str = "token_sort_ratio"
+        method: str = "token_sort_ratio",
+        prefilter: bool = True,
+        cache: Optional["MatchCache"] = None,
     ):
         """FuzzyMatcher 초기화
 
@@ -49,10 +111,33 @@ class FuzzyMatcher:
             threshold: 유사도 임계값 (0.0 - 1.0, 기본값: 0.85)
             method: 매칭 알고리즘
                    ("ratio", "partial_ratio", "token_sort_ratio", "token_set_ratio")
+            prefilter: 점수 상한으로 유사도 후보를 미리 거를지 여부
+                       (대안 하한 미만 점수는 계산하지 않으므로, 대안이 없는
+                       매칭 실패 결과의 score는 정확한 최고점이 아닐 수 있음)
+            cache: 유사도 단계 결과 캐시 (None이면 사용 안함)
         """
         self.threshold = threshold
         self.method = method
+        self.cache = cache
         self._use_rapidfuzz = RAPIDFUZZ_AVAILABLE
+        self._use_vectorized = RAPIDFUZZ_AVAILABLE and NUMPY_AVAILABLE
+        self.prune_stats = PruneStats()
+
+        # difflib 폴백과 알 수 없는 메트릭(token_sort_ratio로 대체)은 Indel 상한 적용
+        self._partial_bound = RAPIDFUZZ_AVAILABLE and method in self.PARTIAL_METHODS
+        indel_bound = (
+            not RAPIDFUZZ_AVAILABLE
+            or method in self.PREFILTER_METHODS
+            or method not in self.SCORERS
+        )
+        self._use_prefilter = prefilter and NUMPY_AVAILABLE and (indel_bound or self._partial_bound)
+        self._use_length_window = prefilter and not NUMPY_AVAILABLE and indel_bound
+
+    def _get_scorer(self):
+        """설정된 메트릭의 rapidfuzz 스코어러 반환"""
+        if self.method in self.SCORERS:
+            return getattr(fuzz, self.method)
+        return fuzz.token_sort_ratio
 
     def _get_similarity(self, s1: str, s2: str) -> float:
         """두 문자열의 유사도 계산
@@ -68,16 +153,7 @@ class FuzzyMatcher:
             return 0.0
 
         if self._use_rapidfuzz:
-            if self.method == "ratio":
-                return fuzz.ratio(s1, s2) / 100.0
-            elif self.method == "partial_ratio":
-                return fuzz.partial_ratio(s1, s2) / 100.0
-            elif self.method == "token_sort_ratio":
-                return fuzz.token_sort_ratio(s1, s2) / 100.0
-            elif self.method == "token_set_ratio":
-                return fuzz.token_set_ratio(s1, s2) / 100.0
-            else:
-                return fuzz.token_sort_ratio(s1, s2) / 100.0
+            return self._get_scorer()(s1, s2) / 100.0
         else:
             # difflib 폴백
             return SequenceMatcher(None, s1, s2).ratio()
@@ -85,8 +161,9 @@ class FuzzyMatcher:
     def find_best_match(
         self,
         filename: str,
-        candidates: Dict[str, int],  # {normalized_title: row_num}
-        original_titles: Optional[Dict[str, str]] = None  # {normalized: original}
+        candidates: Optional[Dict[str, int]] = None,  # {normalized_title: row_num}
+        original_titles: Optional[Dict[str, str]] = None,  # {normalized: original}
+        index: Optional[CandidateIndex] = None,
     ) -> MatchResult:
         """파일명에 가장 적합한 제목 찾기
 
@@ -99,87 +176,408 @@ class FuzzyMatcher:
             filename: NAS 파일명 (확장자 제외)
             candidates: {정규화된 제목: 행 번호} 딕셔너리
             original_titles: {정규화된 제목: 원본 제목} 딕셔너리 (선택)
+            index: 미리 생성한 CandidateIndex (있으면 candidates 대신 사용)
 
         Returns:
             MatchResult: 매칭 결과
         """
-        original_titles = original_titles or {}
+        index = self._resolve_index(candidates, original_titles, index)
+
+        result, norm_aggressive = self._match_by_keys(filename, index)
+        if result:
+            return result
+        query = index.scoring_key(norm_aggressive)
+
+        cached = self._cache_get(index, [query]).get(query)
+        if cached is not None:
+            return replace(cached, original_filename=filename)
+
+        # 4단계: 유사도 매칭
+        best_score = 0.0
+        best_index = -1
+        alternatives: List[Tuple[int, float]] = []  # [(entry 인덱스, 점수), ...]
+        alternative_floor = self.threshold * self.ALTERNATIVE_RATIO
+
+        if self._use_prefilter:
+            entry_ids = self._prefilter(index, query, alternative_floor).tolist()
+        elif self._use_length_window:
+            entry_ids = index.length_window(len(query), alternative_floor) if query else []
+        else:
+            entry_ids = range(len(index.entries))
+        self._count_pruned(len(index.entries), len(entry_ids))
+
+        for i in entry_ids:
+            score = self._get_similarity(query, index.entries[i][3])
+
+            if score > best_score:
+                best_score = score
+                best_index = i
+
+            # 임계값의 90% 이상인 대안 추적
+            if score >= alternative_floor:
+                alternatives.append((i, score))
+
+        # 유사도 순 정렬
+        alternatives.sort(key=lambda x: x[1], reverse=True)
+
+        result = self._build_fuzzy_result(filename, index, best_score, best_index, alternatives)
+        self._cache_put(index, {query: result})
+        return result
+
+    def batch_find_matches(
+        self,
+        filenames: List[str],
+        candidates: Optional[Dict[str, int]] = None,
+        original_titles: Optional[Dict[str, str]] = None,
+        index: Optional[CandidateIndex] = None,
+        vectorized: Optional[bool] = None,
+    ) -> List[MatchResult]:
+        """여러 파일명에 대한 매칭 수행
+
+        정확/정규화 단계에서 매칭되지 않은 파일들은 벡터화 엔진이 사용 가능하면
+        process.cdist로 한 번에 점수를 계산합니다. 이 경우 대안 하한
+        (threshold * 0.9) 미만의 점수는 계산이 생략되므로, 대안이 하나도 없는
+        매칭 실패 결과의 score는 0.0으로 보고됩니다.
+
+        Args:
+            filenames: 파일명 목록
+            candidates: {정규화된 제목: 행 번호} 딕셔너리
+            original_titles: {정규화된 제목: 원본 제목} 딕셔너리 (선택)
+            index: 미리 생성한 CandidateIndex (없으면 한 번 생성하여 재사용)
+            vectorized: cdist 엔진 사용 여부 (None이면 사용 가능할 때 자동 사용)
+
+        Returns:
+            List[MatchResult]: 각 파일명에 대한 매칭 결과
+        """
+        index = self._resolve_index(candidates, original_titles, index)
+
+        if vectorized is None:
+            vectorized = self._use_vectorized
+        if not vectorized or not self._use_vectorized:
+            return [
+                self.find_best_match(filename, index=index)
+                for filename in filenames
+            ]
+
+        results: List[Optional[MatchResult]] = []
+        pending: List[Tuple[int, str]] = []  # [(결과 위치, 점수 계산 키), ...]
+
+        for filename in filenames:
+            result, norm_aggressive = self._match_by_keys(filename, index)
+            if result is None:
+                pending.append((len(results), index.scoring_key(norm_aggressive)))
+            results.append(result)
+
+        cached = self._cache_get(index, [query for _, query in pending])
+        misses = []
+        for pos, query in pending:
+            if query in cached:
+                results[pos] = replace(cached[query], original_filename=filenames[pos])
+            else:
+                misses.append((pos, query))
+
+        if misses:
+            queries = [query for _, query in misses]
+            fuzzy_results = self._batch_fuzzy_stage(
+                [filenames[pos] for pos, _ in misses], queries, index
+            )
+            for (pos, _), result in zip(misses, fuzzy_results):
+                results[pos] = result
+            self._cache_put(index, dict(zip(queries, fuzzy_results)))
+
+        return results
+
+    def _resolve_index(
+        self,
+        candidates: Optional[Dict[str, int]],
+        original_titles: Optional[Dict[str, str]],
+        index: Optional[CandidateIndex],
+    ) -> CandidateIndex:
+        """인자로 받은 인덱스 반환 또는 후보 딕셔너리로 새로 생성"""
+        if index is not None:
+            return index
+        if candidates is None:
+            raise ValueError("candidates 또는 index 중 하나는 필요합니다")
+        return CandidateIndex(candidates, original_titles)
+
+    def _prefilter(self, index: CandidateIndex, query: str, cutoff: float) -> "np.ndarray":
+        """점수 상한이 cutoff 이상인 entry 인덱스 (메트릭에 맞는 NGramIndex 필터)"""
+        if self._partial_bound:
+            return index.ngram_index.partial_candidates(query, cutoff)
+        return index.ngram_index.candidates(query, cutoff)
+
+    def _count_pruned(self, pairs: int, scored: int):
+        """점수 상한 필터 통계 누적"""
+        self.prune_stats.pruned += pairs - scored
+        self.prune_stats.scored += scored
+
+    @property
+    def _cache_method(self) -> str:
+        """캐시 키의 메트릭 (difflib 폴백은 점수가 다르므로 구분)"""
+        return self.method if self._use_rapidfuzz else f"difflib:{self.method}"
+
+    def _cache_get(self, index: CandidateIndex, queries: List[str]) -> Dict[str, MatchResult]:
+        """캐시된 유사도 단계 결과 조회 (캐시가 없으면 빈 딕셔너리)"""
+        if self.cache is None or not queries:
+            return {}
+        return self.cache.get_many(index.fingerprint, self.threshold, self._cache_method, queries)
+
+    def _cache_put(self, index: CandidateIndex, results: Dict[str, MatchResult]):
+        """유사도 단계 결과를 캐시에 저장"""
+        if self.cache is not None and results:
+            self.cache.put_many(index.fingerprint, self.threshold, self._cache_method, results)
+
+    def _match_by_keys(
+        self,
+        filename: str,
+        index: CandidateIndex,
+    ) -> Tuple[Optional[MatchResult], str]:
+        """정확 일치 및 정규화 일치 단계 (해시 조회)
 
+        Args:
+            filename: NAS 파일명 (확장자 제외)
+            index: 후보 인덱스
+
+        Returns:
+            Tuple[Optional[MatchResult], str]: (매칭 결과 또는 None, 공격적 정규화 파일명)
+        """
         # 1단계: 기본 정규화 후 정확히 일치
         norm_basic = FilenameNormalizer.normalize_basic(filename)
-        if norm_basic in candidates:
+        if norm_basic in index.candidates:
             return MatchResult(
                 matched=True,
                 score=1.0,
                 match_type="exact",
                 original_filename=filename,
-                matched_title=original_titles.get(norm_basic, norm_basic),
-                matched_row=candidates[norm_basic],
-            )
+                matched_title=index.get_original(norm_basic),
+                matched_row=index.candidates[norm_basic],
+            ), ""
 
         # 2단계: 표준 정규화 후 일치 (특수문자 제거)
         norm_standard = FilenameNormalizer.normalize_standard(filename)
-        for title_norm, row in candidates.items():
-            title_standard = FilenameNormalizer.normalize_standard(
-                original_titles.get(title_norm, title_norm)
-            )
-            if title_standard == norm_standard:
-                return MatchResult(
-                    matched=True,
-                    score=0.95,
-                    match_type="normalized",
-                    original_filename=filename,
-                    matched_title=original_titles.get(title_norm, title_norm),
-                    matched_row=row,
-                )
+        if norm_standard in index.standard:
+            title_norm, row = index.standard[norm_standard]
+            return MatchResult(
+                matched=True,
+                score=0.95,
+                match_type="normalized",
+                original_filename=filename,
+                matched_title=index.get_original(title_norm),
+                matched_row=row,
+            ), ""
 
         # 3단계: 공격적 정규화 후 일치 (복사본 패턴 제거)
         norm_aggressive = FilenameNormalizer.normalize_aggressive(filename)
-        for title_norm, row in candidates.items():
-            title_aggressive = FilenameNormalizer.normalize_aggressive(
-                original_titles.get(title_norm, title_norm)
+        if norm_aggressive in index.aggressive:
+            title_norm, row = index.aggressive[norm_aggressive]
+            return MatchResult(
+                matched=True,
+                score=0.90,
+                match_type="normalized_aggressive",
+                original_filename=filename,
+                matched_title=index.get_original(title_norm),
+                matched_row=row,
+            ), ""
+
+        return None, norm_aggressive
+
+    def _batch_fuzzy_stage(
+        self,
+        filenames: List[str],
+        queries: List[str],
+        index: CandidateIndex,
+    ) -> List[MatchResult]:
+        """유사도 단계를 cdist 점수 행렬로 일괄 계산
+
+        score_cutoff(대안 하한) 미만 셀은 0으로 채워집니다. n-gram 필터가
+        전체 cdist보다 저렴하다고 판단되면 파일별로 후보만 점수를 계산합니다.
+
+        Args:
+            filenames: 원본 파일명 목록
+            queries: 점수 계산 키 목록 (filenames와 같은 순서)
+            index: 후보 인덱스
+
+        Returns:
+            List[MatchResult]: 각 파일명의 유사도 매칭 결과
+        """
+        if not index.entries:
+            return [
+                self._build_fuzzy_result(filename, index, 0.0, -1, [])
+                for filename in filenames
+            ]
+
+        choices = [entry[3] for entry in index.entries]
+        empty_choices = np.array([not choice for choice in choices])
+        alternative_floor = self.threshold * self.ALTERNATIVE_RATIO
+        chunk_size = max(1, self.CDIST_MAX_CELLS // len(choices))
+
+        use_prefilter = self._use_prefilter and self._prefilter_pays_off(
+            queries[:self.PREFILTER_SAMPLE_SIZE], choices, index
+        )
+
+        results: List[MatchResult] = []
+
+        for start in range(0, len(queries), chunk_size):
+            chunk = queries[start:start + chunk_size]
+            chunk_filenames = filenames[start:start + chunk_size]
+
+            if use_prefilter:
+                for filename, query in zip(chunk_filenames, chunk):
+                    ids = self._prefilter(index, query, alternative_floor)
+                    self._count_pruned(len(choices), ids.size)
+                    hits = np.empty(0, dtype=np.int64)
+                    hit_scores = np.empty(0, dtype=np.float64)
+                    if ids.size:
+                        scores = process.cdist(
+                            [query],
+                            [choices[i] for i in ids],
+                            scorer=self._get_scorer(),
+                            score_cutoff=alternative_floor * 100.0,
+                            dtype=np.float64,
+                            workers=-1,
+                        )[0] / 100.0
+                        keep = scores >= alternative_floor
+                        hits, hit_scores = ids[keep], scores[keep]
+                    results.append(self._select_result(filename, index, hits, hit_scores))
+                continue
+
+            scores = process.cdist(
+                chunk,
+                choices,
+                scorer=self._get_scorer(),
+                score_cutoff=alternative_floor * 100.0,
+                dtype=np.float64,
+                workers=-1,
             )
-            if title_aggressive == norm_aggressive:
-                return MatchResult(
-                    matched=True,
-                    score=0.90,
-                    match_type="normalized_aggressive",
-                    original_filename=filename,
-                    matched_title=original_titles.get(title_norm, title_norm),
-                    matched_row=row,
+            scores /= 100.0
+            self._count_pruned(scores.size, scores.size)
+            # _get_similarity와 동일하게 빈 문자열은 0점
+            scores[:, empty_choices] = 0.0
+
+            for row_pos, query in enumerate(chunk):
+                if not query:
+                    results.append(self._build_fuzzy_result(chunk_filenames[row_pos], index, 0.0, -1, []))
+                    continue
+
+                row_scores = scores[row_pos]
+                hits = np.flatnonzero(row_scores >= alternative_floor)
+                results.append(
+                    self._select_result(chunk_filenames[row_pos], index, hits, row_scores[hits])
                 )
 
-        # 4단계: 유사도 매칭
-        best_score = 0.0
-        best_match: Optional[Tuple[str, int]] = None
-        alternatives: List[Tuple[str, float, int]] = []
+        return results
 
-        for title_norm, row in candidates.items():
-            original_title = original_titles.get(title_norm, title_norm)
-            title_aggressive = FilenameNormalizer.normalize_aggressive(original_title)
+    def _prefilter_pays_off(
+        self,
+        sample: List[str],
+        choices: List[str],
+        index: CandidateIndex,
+    ) -> bool:
+        """표본 파일로 n-gram 필터 경로와 전체 cdist 경로의 비용 비교
 
-            score = self._get_similarity(norm_aggressive, title_aggressive)
+        필터 비용은 단일 스레드, cdist는 멀티코어이므로 실행 환경에 따라
+        유리한 경로가 달라집니다. 두 경로의 결과는 동일합니다.
 
-            if score > best_score:
-                best_score = score
-                best_match = (title_norm, row)
+        Args:
+            sample: 점수 계산 키 표본
+            choices: 공격적 정규화 제목 목록
+            index: 후보 인덱스
 
-            # 임계값의 90% 이상인 대안 추적
-            if score >= self.threshold * 0.9:
-                alternatives.append((original_title, score, row))
+        Returns:
+            bool: 필터 경로가 더 빠를 것으로 예상되면 True
+        """
+        alternative_floor = self.threshold * self.ALTERNATIVE_RATIO
+
+        started = time.perf_counter()
+        passed = sum(self._prefilter(index, query, alternative_floor).size for query in sample)
+        filter_time = time.perf_counter() - started
+
+        started = time.perf_counter()
+        process.cdist(
+            sample,
+            choices,
+            scorer=self._get_scorer(),
+            score_cutoff=alternative_floor * 100.0,
+            dtype=np.float64,
+            workers=-1,
+        )
+        cdist_time = time.perf_counter() - started
 
-        # 유사도 순 정렬
-        alternatives.sort(key=lambda x: x[1], reverse=True)
+        density = passed / (len(sample) * len(choices))
+        return filter_time + density * cdist_time < cdist_time
 
-        if best_score >= self.threshold and best_match:
+    def _select_result(
+        self,
+        filename: str,
+        index: CandidateIndex,
+        hits: "np.ndarray",
+        hit_scores: "np.ndarray",
+    ) -> MatchResult:
+        """대안 하한 이상 후보에서 최고 매칭과 상위 대안 선택
+
+        argpartition으로 상위 N개 경계 점수를 구하고, 경계 동점은
+        시트 순서가 앞선 제목으로 채웁니다 (순차 경로와 동일).
+
+        Args:
+            filename: 원본 파일명
+            index: 후보 인덱스
+            hits: 대안 하한 이상인 entry 인덱스 (오름차순)
+            hit_scores: hits와 같은 순서의 점수
+
+        Returns:
+            MatchResult: 매칭 결과
+        """
+        if hits.size > self.MAX_ALTERNATIVES:
+            top = np.argpartition(-hit_scores, self.MAX_ALTERNATIVES - 1)
+            kth_score = hit_scores[top[:self.MAX_ALTERNATIVES]].min()
+            above = hit_scores > kth_score
+            tied = np.flatnonzero(hit_scores == kth_score)[:self.MAX_ALTERNATIVES - int(above.sum())]
+            keep = np.flatnonzero(above).tolist() + tied.tolist()
+            hits, hit_scores = hits[keep], hit_scores[keep]
+
+        alternatives = sorted(
+            ((int(i), float(score)) for i, score in zip(hits, hit_scores)),
+            key=lambda x: (-x[1], x[0]),
+        )
+
+        best_index, best_score = alternatives[0] if alternatives else (-1, 0.0)
+        return self._build_fuzzy_result(filename, index, best_score, best_index, alternatives)
+
+    def _build_fuzzy_result(
+        self,
+        filename: str,
+        index: CandidateIndex,
+        best_score: float,
+        best_index: int,
+        alternatives: List[Tuple[int, float]],
+    ) -> MatchResult:
+        """유사도 단계 결과를 MatchResult로 변환
+
+        Args:
+            filename: 원본 파일명
+            index: 후보 인덱스
+            best_score: 최고 점수
+            best_index: 최고 점수 제목의 entry 인덱스 (-1이면 없음)
+            alternatives: 점수 내림차순 [(entry 인덱스, 점수), ...]
+
+        Returns:
+            MatchResult: 매칭 결과
+        """
+        top_alternatives = [
+            (index.entries[i][2], score, index.entries[i][1])
+            for i, score in alternatives[:self.MAX_ALTERNATIVES]  # 상위 5개 대안
+        ]
+
+        if best_score >= self.threshold and best_index >= 0:
+            title_norm, row, _, _ = index.entries[best_index]
             return MatchResult(
                 matched=True,
                 score=best_score,
                 match_type="fuzzy",
                 original_filename=filename,
-                matched_title=original_titles.get(best_match[0], best_match[0]),
-                matched_row=best_match[1],
-                alternatives=alternatives[:5],  # 상위 5개 대안
+                matched_title=index.get_original(title_norm),
+                matched_row=row,
+                alternatives=top_alternatives,
             )
 
         return MatchResult(
@@ -189,31 +587,15 @@ class FuzzyMatcher:
             original_filename=filename,
             matched_title="",
             matched_row=-1,
-            alternatives=alternatives[:5],
+            alternatives=top_alternatives,
         )
 
-    def batch_find_matches(
-        self,
-        filenames: List[str],
-        candidates: Dict[str, int],
-        original_titles: Optional[Dict[str, str]] = None
-    ) -> List[MatchResult]:
-        """여러 파일명에 대한 매칭 수행
-
-        Args:
-            filenames: 파일명 목록
-            candidates: {정규화된 제목: 행 번호} 딕셔너리
-            original_titles: {정규화된 제목: 원본 제목} 딕셔너리 (선택)
-
-        Returns:
-            List[MatchResult]: 각 파일명에 대한 매칭 결과
-        """
-        return [
-            self.find_best_match(filename, candidates, original_titles)
-            for filename in filenames
-        ]
-
     @property
     def using_rapidfuzz(self) -> bool:
         """rapidfuzz 사용 여부"""
         return self._use_rapidfuzz
+
+    @property
+    def using_vectorized(self) -> bool:
+        """cdist 일괄 매칭 엔진 사용 가능 여부"""
+        return self._use_vectorized
@@ -0,0 +1,204 @@
+"""유사도 매칭 캐시 모듈
+
+FuzzyMatcher 유사도 단계의 결과(매칭 실패와 대안 목록 포함)를 SQLite 파일에
+저장합니다. 키는 (제목 집합 지문, 임계값, 메트릭, 점수 계산 키)이므로
+제목이 추가/수정/이동되거나 임계값, 메트릭이 바뀌면 이전 결과는 조회되지 않습니다.
+"""
+
+import json
+import logging
+import sqlite3
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from .fuzzy_matcher import MatchResult
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class MatchCacheStats:
+    """캐시 조회 통계"""
+
+    hits: int = 0
+    misses: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def __str__(self) -> str:
+        return f"매칭 캐시: 적중 {self.hits}건, 미스 {self.misses}건 ({self.hit_rate:.0%})"
+
+
+class MatchCache:
+    """SQLite 유사도 매칭 캐시
+
+    (제목 집합 지문, 임계값, 메트릭) 조합을 세대로 관리하고, 최근에 쓴
+    MAX_GENERATIONS개 세대만 남기고 오래된 세대의 결과는 삭제합니다.
+    """
+
+    # 보관할 세대 수 (증분 동기화의 변경 행 인덱스도 별도 세대가 됨)
+    MAX_GENERATIONS = 8
+
+    # 한 번의 SELECT에 넣을 최대 키 수 (SQLite 변수 한도 이내)
+    QUERY_CHUNK = 500
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS generations (
+            fingerprint TEXT NOT NULL,
+            threshold REAL NOT NULL,
+            method TEXT NOT NULL,
+            used_at REAL NOT NULL,
+            PRIMARY KEY (fingerprint, threshold, method)
+        );
+        CREATE TABLE IF NOT EXISTS matches (
+            fingerprint TEXT NOT NULL,
+            threshold REAL NOT NULL,
+            method TEXT NOT NULL,
+            query TEXT NOT NULL,
+            matched INTEGER NOT NULL,
+            score REAL NOT NULL,
+            match_type TEXT NOT NULL,
+            matched_title TEXT NOT NULL,
+            matched_row INTEGER NOT NULL,
+            alternatives TEXT NOT NULL,
+            PRIMARY KEY (fingerprint, threshold, method, query)
+        );
+    """
+
+    def __init__(self, path: str):
+        """MatchCache 초기화
+
+        Args:
+            path: SQLite 파일 경로
+        """
+        self.path = Path(path)
+        self.stats = MatchCacheStats()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._touched: set = set()  # 이번 실행에서 사용 시각을 갱신한 세대
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(str(self.path))
+            self._conn.executescript(self.SCHEMA)
+        return self._conn
+
+    def close(self):
+        """연결 닫기"""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def get_many(
+        self,
+        fingerprint: str,
+        threshold: float,
+        method: str,
+        queries: Iterable[str],
+    ) -> Dict[str, MatchResult]:
+        """저장된 유사도 단계 결과 조회
+
+        Args:
+            fingerprint: 제목 집합 지문 (CandidateIndex.fingerprint)
+            threshold: 유사도 임계값
+            method: 매칭 메트릭
+            queries: 점수 계산 키 목록 (CandidateIndex.scoring_key)
+
+        Returns:
+            Dict[str, MatchResult]: {점수 계산 키: 결과} (original_filename은 비어 있음)
+        """
+        generation = (fingerprint, threshold, method)
+        queries = list(dict.fromkeys(queries))
+        found: Dict[str, MatchResult] = {}
+        if not queries:
+            return found
+
+        try:
+            conn = self._connection()
+            if generation not in self._touched:
+                with conn:
+                    self._touch(conn, generation)
+            for start in range(0, len(queries), self.QUERY_CHUNK):
+                chunk = queries[start:start + self.QUERY_CHUNK]
+                rows = conn.execute(
+                    "SELECT query, matched, score, match_type, matched_title, matched_row, alternatives"
+                    " FROM matches WHERE fingerprint = ? AND threshold = ? AND method = ?"
+                    f" AND query IN ({', '.join('?' * len(chunk))})",
+                    (*generation, *chunk),
+                ).fetchall()
+                for query, matched, score, match_type, title, row, alternatives in rows:
+                    found[query] = MatchResult(
+                        matched=bool(matched),
+                        score=score,
+                        match_type=match_type,
+                        original_filename="",
+                        matched_title=title,
+                        matched_row=row,
+                        alternatives=[tuple(alt) for alt in json.loads(alternatives)],
+                    )
+        except sqlite3.Error as e:
+            logger.warning(f"매칭 캐시 조회 실패: {e}")
+            found = {}
+
+        self.stats.hits += len(found)
+        self.stats.misses += len(queries) - len(found)
+        return found
+
+    def put_many(
+        self,
+        fingerprint: str,
+        threshold: float,
+        method: str,
+        results: Dict[str, MatchResult],
+    ):
+        """유사도 단계 결과 저장
+
+        Args:
+            fingerprint: 제목 집합 지문 (CandidateIndex.fingerprint)
+            threshold: 유사도 임계값
+            method: 매칭 메트릭
+            results: {점수 계산 키: 결과}
+        """
+        generation = (fingerprint, threshold, method)
+        rows: List[Tuple] = [
+            (
+                *generation,
+                query,
+                int(result.matched),
+                result.score,
+                result.match_type,
+                result.matched_title,
+                result.matched_row,
+                json.dumps(result.alternatives, ensure_ascii=False),
+            )
+            for query, result in results.items()
+        ]
+
+        try:
+            conn = self._connection()
+            with conn:
+                if generation not in self._touched:
+                    self._touch(conn, generation)
+                conn.executemany(
+                    "INSERT OR REPLACE INTO matches VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    rows,
+                )
+        except sqlite3.Error as e:
+            logger.warning(f"매칭 캐시 저장 실패: {e}")
+
+    def _touch(self, conn: sqlite3.Connection, generation: Tuple[str, float, str]):
+        """세대 사용 시각 갱신 및 오래된 세대 삭제"""
+        conn.execute("INSERT OR REPLACE INTO generations VALUES (?, ?, ?, ?)", (*generation, time.time()))
+        stale = conn.execute(
+            "SELECT fingerprint, threshold, method FROM generations ORDER BY used_at DESC LIMIT -1 OFFSET ?",
+            (self.MAX_GENERATIONS,),
+        ).fetchall()
+        for old in stale:
+            conn.execute("DELETE FROM matches WHERE fingerprint = ? AND threshold = ? AND method = ?", old)
+            conn.execute("DELETE FROM generations WHERE fingerprint = ? AND threshold = ? AND method = ?", old)
+        self._touched.add(generation)
@@ -0,0 +1,434 @@
+"""미디어 헤더 탐색 모듈
+
+MP4/MOV(moov/mvhd/tkhd 박스)와 MKV/WebM(EBML Segment Info/Tracks)의 헤더만 읽어
+재생 시간, 해상도, 트랙 수, 비디오 코덱을 구합니다. ffprobe를 실행하지 않고
+박스/요소 헤더를 따라가며 필요한 부분만 읽으므로 파일당 수 KB의 I/O로 끝납니다.
+"""
+
+import json
+import logging
+import os
+import struct
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from .content_fingerprint import read_at
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class MediaInfo:
+    """미디어 헤더 정보"""
+
+    container: str  # "mp4" 또는 "matroska"
+    duration: Optional[float] = None  # 재생 시간 (초, 헤더에 없으면 None)
+    width: int = 0  # 비디오 트랙 너비 (픽셀)
+    height: int = 0  # 비디오 트랙 높이 (픽셀)
+    tracks: int = 0  # 트랙 수
+    video_codec: str = ""  # 비디오 코덱 (MP4 샘플 엔트리 / Matroska CodecID)
+
+    @property
+    def resolution(self) -> str:
+        return f"{self.width}x{self.height}" if self.width and self.height else ""
+
+
+@dataclass
+class MediaProbeStats:
+    """미디어 헤더 탐색 통계"""
+
+    cached: int = 0  # 캐시에서 가져온 파일 수
+    probed: int = 0  # 헤더를 읽은 파일 수
+    unsupported: int = 0  # 지원하지 않는 형식 또는 읽기 실패 파일 수
+    bytes_read: int = 0  # 읽은 바이트 합계
+
+    def __str__(self) -> str:
+        return (
+            f"미디어 헤더: 탐색 {self.probed}개 ({self.bytes_read / 1024:.1f} KB 읽음), "
+            f"캐시 {self.cached}개, 미지원/실패 {self.unsupported}개"
+        )
+
+
+class _Reader:
+    """위치 지정 읽기 + 읽은 바이트 수 집계"""
+
+    def __init__(self, fd: int, size: int):
+        self.fd = fd
+        self.size = size
+        self.bytes_read = 0
+
+    def read(self, offset: int, length: int) -> bytes:
+        data = read_at(self.fd, offset, max(0, min(length, self.size - offset)))
+        self.bytes_read += len(data)
+        return data
+
+
+class MediaProbe:
+    """MP4/MKV/WebM 헤더 탐색기
+
+    결과는 (경로, 크기, 수정 시간)이 같을 때만 재사용하며, cache_path가 주어지면
+    JSON 파일에 저장하여 다음 실행에서도 재사용합니다. 지원하지 않는 형식이나
+    손상된 헤더는 None으로 기록합니다 (다시 읽지 않음).
+    """
+
+    VERSION = 1
+
+    # 박스/요소 헤더를 따라갈 최대 횟수 (손상 파일 보호)
+    MAX_ELEMENTS = 4096
+
+    # 통째로 읽을 헤더 요소 최대 크기 (mvhd/tkhd/hdlr, Matroska Info/Tracks)
+    MAX_ELEMENT_READ = 256 * 1024
+
+    # MP4: 재귀할 컨테이너 박스
+    _MP4_CONTAINERS = {b"moov", b"trak", b"mdia", b"minf", b"stbl"}
+
+    # Matroska 요소 ID
+    _EBML = 0x1A45DFA3
+    _SEGMENT = 0x18538067
+    _INFO = 0x1549A966
+    _TRACKS = 0x1654AE6B
+    _CLUSTER = 0x1F43B675
+    _TIMECODE_SCALE = 0x2AD7B1
+    _DURATION = 0x4489
+    _TRACK_ENTRY = 0xAE
+    _TRACK_TYPE = 0x83
+    _CODEC_ID = 0x86
+    _VIDEO = 0xE0
+    _PIXEL_WIDTH = 0xB0
+    _PIXEL_HEIGHT = 0xBA
+
+    def __init__(self, cache_path: Optional[str] = None, workers: int = 4):
+        """MediaProbe 초기화
+
+        Args:
+            cache_path: 탐색 결과 캐시 파일 경로 (None이면 실행 중 메모리에만 보관)
+            workers: 동시에 읽을 스레드 수
+        """
+        self.cache_path = Path(cache_path) if cache_path else None
+        self.workers = max(1, workers)
+        self.stats = MediaProbeStats()
+        self._entries: Optional[Dict[str, Tuple[int, float, Optional[MediaInfo]]]] = None
+        self._dirty = False
+
+    def probe(self, path: str, size: int, mtime: float) -> Optional[MediaInfo]:
+        """파일 한 개의 헤더 정보
+
+        Args:
+            path: 파일 경로
+            size: 스캔 시 파일 크기 (bytes)
+            mtime: 스캔 시 수정 시간 (epoch 초)
+
+        Returns:
+            Optional[MediaInfo]: 헤더 정보 (지원하지 않는 형식이면 None)
+        """
+        return self.probe_many([(path, size, mtime)]).get(path)
+
+    def probe_many(self, files: List[Tuple[str, int, float]]) -> Dict[str, Optional[MediaInfo]]:
+        """여러 파일의 헤더 정보 (캐시에 없는 파일만 스레드 풀에서 읽음)
+
+        Args:
+            files: [(경로, 크기, 수정 시간), ...]
+
+        Returns:
+            Dict[str, Optional[MediaInfo]]: {경로: 헤더 정보 또는 None}
+        """
+        entries = self._load()
+        result: Dict[str, Optional[MediaInfo]] = {}
+        pending: List[Tuple[str, int, float]] = []
+
+        for path, size, mtime in dict.fromkeys(files):
+            cached = entries.get(path)
+            if cached is not None and cached[0] == size and cached[1] == mtime:
+                result[path] = cached[2]
+                self.stats.cached += 1
+            else:
+                pending.append((path, size, mtime))
+
+        if not pending:
+            return result
+
+        with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="media-probe") as pool:
+            probed = list(pool.map(lambda item: self._probe_file(item[0], item[1]), pending))
+
+        for (path, size, mtime), (info, bytes_read, readable) in zip(pending, probed):
+            result[path] = info
+            self.stats.bytes_read += bytes_read
+            if info is None:
+                self.stats.unsupported += 1
+            else:
+                self.stats.probed += 1
+            if readable:
+                entries[path] = (size, mtime, info)
+                self._dirty = True
+
+        return result
+
+    def _probe_file(self, path: str, size: int) -> Tuple[Optional[MediaInfo], int, bool]:
+        """헤더 탐색 (스레드 풀에서 실행)
+
+        Returns:
+            Tuple[Optional[MediaInfo], int, bool]: (헤더 정보, 읽은 바이트 수, 읽기 성공 여부)
+        """
+        try:
+            fd = os.open(path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+        except OSError as e:
+            logger.warning(f"미디어 헤더 읽기 실패: {path} - {e}")
+            return None, 0, False
+
+        reader = _Reader(fd, size)
+        try:
+            head = reader.read(0, 12)
+            if head[:4] == self._EBML.to_bytes(4, "big"):
+                info = self._probe_matroska(reader)
+            elif head[4:8] in (b"ftyp", b"moov", b"mdat", b"free", b"wide", b"skip"):
+                info = self._probe_mp4(reader)
+            else:
+                info = None
+        except OSError as e:
+            logger.warning(f"미디어 헤더 읽기 실패: {path} - {e}")
+            return None, reader.bytes_read, False
+        except (ValueError, IndexError, struct.error) as e:
+            logger.debug(f"미디어 헤더 해석 실패: {path} - {e}")
+            info = None
+        finally:
+            os.close(fd)
+
+        return info, reader.bytes_read, True
+
+    # ------------------------------------------------------------------
+    # MP4 / MOV
+    # ------------------------------------------------------------------
+
+    def _mp4_boxes(self, reader: _Reader, start: int, end: int) -> Iterator[Tuple[bytes, int, int]]:
+        """[start, end) 구간의 박스 (유형, 내용 시작, 박스 끝) - 헤더만 읽음"""
+        offset = start
+        for _ in range(self.MAX_ELEMENTS):
+            if offset + 8 > end:
+                return
+            header = reader.read(offset, 16)
+            if len(header) < 8:
+                return
+            box_size, box_type = struct.unpack(">I4s", header[:8])
+            header_size = 8
+            if box_size == 1:
+                if len(header) < 16:
+                    return
+                box_size = struct.unpack(">Q", header[8:16])[0]
+                header_size = 16
+            elif box_size == 0:
+                box_size = end - offset  # 파일/부모 끝까지
+            if box_size < header_size:
+                raise ValueError(f"잘못된 박스 크기: {box_type!r}")
+            yield box_type, offset + header_size, min(offset + box_size, end)
+            offset += box_size
+
+    def _probe_mp4(self, reader: _Reader) -> Optional[MediaInfo]:
+        """moov/mvhd에서 재생 시간, trak/tkhd에서 해상도, stsd에서 코덱"""
+        moov = next(
+            ((start, end) for box_type, start, end in self._mp4_boxes(reader, 0, reader.size) if box_type == b"moov"),
+            None,
+        )
+        if moov is None:
+            return None
+
+        info = MediaInfo(container="mp4")
+        for box_type, start, end in self._mp4_boxes(reader, *moov):
+            if box_type == b"mvhd":
+                data = reader.read(start, min(end - start, 32))
+                if data[0] == 1:
+                    timescale, duration = struct.unpack(">IQ", data[20:32])
+                    unknown = duration == 0xFFFFFFFFFFFFFFFF
+                else:
+                    timescale, duration = struct.unpack(">II", data[12:20])
+                    unknown = duration == 0xFFFFFFFF
+                if timescale and duration and not unknown:
+                    info.duration = duration / timescale
+            elif box_type == b"trak":
+                info.tracks += 1
+                self._probe_mp4_track(reader, start, end, info)
+
+        return info
+
+    def _probe_mp4_track(self, reader: _Reader, start: int, end: int, info: MediaInfo):
+        """trak 박스에서 비디오 트랙의 해상도와 코덱"""
+        width = height = 0
+        handler = b""
+        codec = ""
+
+        stack = [(start, end)]
+        while stack:
+            for box_type, box_start, box_end in self._mp4_boxes(reader, *stack.pop()):
+                if box_type in self._MP4_CONTAINERS:
+                    stack.append((box_start, box_end))
+                elif box_type == b"tkhd":
+                    data = reader.read(box_start, min(box_end - box_start, self.MAX_ELEMENT_READ))
+                    # 너비/높이는 tkhd 마지막 8바이트 (16.16 고정소수)
+                    width, height = (value >> 16 for value in struct.unpack(">II", data[-8:]))
+                elif box_type == b"hdlr":
+                    handler = reader.read(box_start + 8, 4)
+                elif box_type == b"stsd":
+                    # 첫 샘플 엔트리의 유형이 코덱 (avc1, hvc1, vp09, av01 등)
+                    codec = reader.read(box_start + 12, 4).decode("latin-1").strip()
+
+        if handler == b"vide" and not info.width:
+            info.width, info.height, info.video_codec = width, height, codec
+
+    # ------------------------------------------------------------------
+    # Matroska / WebM
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _vint(data: bytes, pos: int, keep_marker: bool) -> Tuple[int, int]:
+        """EBML 가변 길이 정수 (값, 길이) - 크기 값이 모두 1이면 -1 (알 수 없음)"""
+        first = data[pos]
+        length = 1
+        while length <= 8 and not first & (0x80 >> (length - 1)):
+            length += 1
+        if length > 8 or pos + length > len(data):
+            raise ValueError("잘못된 EBML 정수")
+        value = first if keep_marker else first & (0xFF >> length)
+        for byte in data[pos + 1:pos + length]:
+            value = (value << 8) | byte
+        if not keep_marker and value == (1 << (7 * length)) - 1:
+            value = -1
+        return value, length
+
+    def _ebml_header(self, reader: _Reader, offset: int) -> Tuple[int, int, int]:
+        """파일의 offset 위치 요소 헤더 (ID, 내용 시작, 내용 크기)"""
+        data = reader.read(offset, 12)
+        element_id, id_length = self._vint(data, 0, keep_marker=True)
+        size, size_length = self._vint(data, id_length, keep_marker=False)
+        return element_id, offset + id_length + size_length, size
+
+    def _ebml_children(self, data: bytes, start: int, end: int) -> Iterator[Tuple[int, int, int]]:
+        """메모리 내 [start, end) 구간의 자식 요소 (ID, 내용 시작, 내용 끝)"""
+        pos = start
+        while pos < end:
+            element_id, id_length = self._vint(data, pos, keep_marker=True)
+            size, size_length = self._vint(data, pos + id_length, keep_marker=False)
+            content = pos + id_length + size_length
+            content_end = end if size < 0 else min(content + size, end)
+            yield element_id, content, content_end
+            pos = content_end
+
+    def _probe_matroska(self, reader: _Reader) -> Optional[MediaInfo]:
+        """Segment의 Info(재생 시간)와 Tracks(트랙 수, 해상도, 코덱)"""
+        element_id, content, size = self._ebml_header(reader, 0)
+        if element_id != self._EBML or size < 0:
+            return None
+        element_id, segment_start, size = self._ebml_header(reader, content + size)
+        if element_id != self._SEGMENT:
+            return None
+        segment_end = reader.size if size < 0 else min(segment_start + size, reader.size)
+
+        info = MediaInfo(container="matroska")
+        found_info = found_tracks = False
+        offset = segment_start
+        for _ in range(self.MAX_ELEMENTS):
+            if offset >= segment_end or (found_info and found_tracks):
+                break
+            element_id, content, size = self._ebml_header(reader, offset)
+            if size < 0 or element_id == self._CLUSTER:
+                break  # 크기를 모르는 요소는 건너뛸 수 없음 / 첫 Cluster부터는 미디어 데이터
+            if element_id == self._INFO:
+                self._parse_matroska_info(reader.read(content, min(size, self.MAX_ELEMENT_READ)), info)
+                found_info = True
+            elif element_id == self._TRACKS:
+                self._parse_matroska_tracks(reader.read(content, min(size, self.MAX_ELEMENT_READ)), info)
+                found_tracks = True
+            offset = content + size
+
+        return info if found_info or found_tracks else None
+
+    def _parse_matroska_info(self, data: bytes, info: MediaInfo):
+        scale = 1_000_000  # TimecodeScale 기본값 (ns)
+        duration = None
+        for element_id, start, end in self._ebml_children(data, 0, len(data)):
+            if element_id == self._TIMECODE_SCALE:
+                scale = int.from_bytes(data[start:end], "big")
+            elif element_id == self._DURATION:
+                duration = struct.unpack(">f" if end - start == 4 else ">d", data[start:end])[0]
+        if duration:
+            info.duration = duration * scale / 1e9
+
+    def _parse_matroska_tracks(self, data: bytes, info: MediaInfo):
+        for element_id, start, end in self._ebml_children(data, 0, len(data)):
+            if element_id != self._TRACK_ENTRY:
+                continue
+            info.tracks += 1
+            track_type = 0
+            codec = ""
+            width = height = 0
+            for child_id, child_start, child_end in self._ebml_children(data, start, end):
+                value = data[child_start:child_end]
+                if child_id == self._TRACK_TYPE:
+                    track_type = int.from_bytes(value, "big")
+                elif child_id == self._CODEC_ID:
+                    codec = value.decode("ascii", "replace").rstrip("\x00")
+                elif child_id == self._VIDEO:
+                    for video_id, video_start, video_end in self._ebml_children(data, child_start, child_end):
+                        if video_id == self._PIXEL_WIDTH:
+                            width = int.from_bytes(data[video_start:video_end], "big")
+                        elif video_id == self._PIXEL_HEIGHT:
+                            height = int.from_bytes(data[video_start:video_end], "big")
+            if track_type == 1 and not info.width:
+                info.width, info.height, info.video_codec = width, height, codec
+
+    # ------------------------------------------------------------------
+    # 캐시
+    # ------------------------------------------------------------------
+
+    def _load(self) -> Dict[str, Tuple[int, float, Optional[MediaInfo]]]:
+        """캐시 파일 로드 (처음 한 번만, 버전이 다르면 빈 캐시)"""
+        if self._entries is not None:
+            return self._entries
+
+        self._entries = {}
+        if self.cache_path is None or not self.cache_path.exists():
+            return self._entries
+
+        try:
+            with open(self.cache_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (json.JSONDecodeError, OSError) as e:
+            logger.warning(f"미디어 헤더 캐시 로드 실패: {e}")
+            return self._entries
+
+        if data.get("version") != self.VERSION:
+            logger.info("미디어 헤더 캐시 버전이 달라 사용하지 않습니다.")
+            return self._entries
+
+        try:
+            self._entries = {
+                path: (int(size), float(mtime), MediaInfo(**info) if info is not None else None)
+                for path, (size, mtime, info) in data.get("entries", {}).items()
+            }
+        except (TypeError, ValueError) as e:
+            logger.warning(f"미디어 헤더 캐시 형식 오류: {e}")
+            self._entries = {}
+        return self._entries
+
+    def save(self):
+        """캐시 저장 (바뀐 내용이 있을 때만, 임시 파일에 쓴 뒤 교체)"""
+        if self.cache_path is None or not self._dirty:
+            return
+
+        data = {
+            "version": self.VERSION,
+            "entries": {
+                path: [size, mtime, asdict(info) if info is not None else None]
+                for path, (size, mtime, info) in self._entries.items()
+            },
+        }
+
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.cache_path.with_name(self.cache_path.name + ".tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False)
+            os.replace(tmp_path, self.cache_path)
+            self._dirty = False
+        except OSError as e:
+            logger.warning(f"미디어 헤더 캐시 저장 실패: {e}")
@@ -0,0 +1,237 @@
+"""N-gram 역색인 모듈
+
+유사도 점수를 계산하기 전에 임계값에 도달할 수 없는 후보를 걸러냅니다.
+"""
+
+import math
+from collections import Counter
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+
+class NGramIndex:
+    """문자 n-gram 역색인
+
+    공격적 정규화 문자열(공백 없음)을 대상으로 하며, Indel 기반 ratio
+    (rapidfuzz ratio / 공백 없는 문자열의 token_sort_ratio)가 cutoff에 도달할
+    가능성이 있는 후보만 반환합니다. 걸러내는 조건은 모두 점수의 상한에서
+    유도되므로 cutoff 이상인 후보는 절대 누락되지 않습니다.
+
+    q-gram 보조정리:
+    ratio = 2 * LCS / (la + lb) >= cutoff 이면 LCS >= L = ceil(cutoff * (la + lb) / 2).
+    a에서 삭제되는 문자(da = la - L)는 q-gram을 최대 q개, b 문자가 삽입되는
+    위치(최대 db = lb - L)는 q - 1개를 깨뜨리므로 공유 q-gram 수는
+    (la - q + 1) - q * da - (q - 1) * db 이상입니다 (a, b를 바꾼 식도 동일).
+
+    후보 선정 순서:
+    1. 길이 창: 2 * min(la, lb) / (la + lb) >= cutoff 인 길이만 (정렬된 길이에서 이분 탐색)
+    2. n-gram 접두 필터 (기본 3-gram): 필요한 공유 수가 양수이면, 쿼리 n-gram 중
+       가장 드문 (전체 - 필요 수 + 1)개에 대한 포스팅만 조회 (높은 임계값에서 선택적)
+    3. 문자 단위(q=1) 조건: 공유 문자 수 >= L (낮은 임계값에서도 효과적)
+
+    partial_ratio용 후보는 partial_candidates로 별도 조회합니다 (문자 수 상한만 적용).
+    """
+
+    def __init__(self, strings: List[str], gram_size: int = 3):
+        """NGramIndex 초기화
+
+        Args:
+            strings: 색인할 문자열 목록 (목록 순서가 후보 ID)
+            gram_size: 역색인 n-gram 길이 (기본: 3)
+        """
+        self.gram_size = gram_size
+        self.size = len(strings)
+        self.lengths = np.array([len(s) for s in strings], dtype=np.int64)
+
+        # 길이순 정렬 (길이 창 이분 탐색용)
+        self._by_length = np.argsort(self.lengths, kind="stable")
+        self._sorted_lengths = self.lengths[self._by_length]
+        self._max_length = int(self._sorted_lengths[-1]) if self.size else 0
+
+        # 문자 단위 개수 행렬 (행: 후보, 열: 문자)
+        self._alphabet: Dict[str, int] = {}
+        for s in strings:
+            for ch in s:
+                self._alphabet.setdefault(ch, len(self._alphabet))
+
+        # 개수를 잘라내면 상한이 깨지므로 최대 개수에 맞는 dtype 사용
+        max_count = max((max(Counter(s).values()) for s in strings if s), default=0)
+        count_dtype = np.uint8 if max_count <= np.iinfo(np.uint8).max else np.int32
+        self._max_char_count = int(np.iinfo(count_dtype).max)
+        self._char_counts = np.zeros((self.size, max(1, len(self._alphabet))), dtype=count_dtype)
+        for i, s in enumerate(strings):
+            for ch, count in Counter(s).items():
+                self._char_counts[i, self._alphabet[ch]] = count
+
+        # n-gram 포스팅 {gram: (후보 ID 배열, 개수 배열)}
+        postings: Dict[str, Tuple[List[int], List[int]]] = {}
+        for i, s in enumerate(strings):
+            for gram, count in self._grams(s).items():
+                ids, counts = postings.setdefault(gram, ([], []))
+                ids.append(i)
+                counts.append(count)
+
+        self._postings: Dict[str, Tuple[np.ndarray, np.ndarray]] = {
+            gram: (np.array(ids, dtype=np.int64), np.array(counts, dtype=np.int64))
+            for gram, (ids, counts) in postings.items()
+        }
+
+        # {(쿼리 길이, cutoff): 길이별 조건} - 같은 길이의 쿼리가 반복되므로 재사용
+        self._bounds_cache: Dict[Tuple[int, float], Tuple[int, int, np.ndarray, np.ndarray, int]] = {}
+
+    def _grams(self, text: str) -> Counter:
+        """문자열의 n-gram 다중집합"""
+        q = self.gram_size
+        return Counter(text[i:i + q] for i in range(len(text) - q + 1))
+
+    def candidates(self, query: str, cutoff: float, within: Optional[np.ndarray] = None) -> np.ndarray:
+        """cutoff 이상 점수가 가능한 후보 ID 반환
+
+        Args:
+            query: 공격적 정규화 문자열
+            cutoff: 점수 하한 (0.0 - 1.0)
+            within: 이 ID들 중에서만 찾기 (오름차순, 중복 없음, None이면 전체)
+
+        Returns:
+            np.ndarray: 후보 ID 배열 (오름차순)
+        """
+        if self.size == 0 or not query:
+            return np.empty(0, dtype=np.int64)
+
+        la = len(query)
+
+        # 1. 길이 창
+        min_length, max_length, min_lcs, feasible, min_need = self._bounds(la, cutoff)
+        lo = np.searchsorted(self._sorted_lengths, min_length, side="left")
+        hi = np.searchsorted(self._sorted_lengths, max_length, side="right")
+        if lo >= hi:
+            return np.empty(0, dtype=np.int64)
+
+        ids = None
+        window = hi - lo
+        if within is not None:
+            ids = within[feasible[self.lengths[within]]]
+            window = ids.size
+            if window == 0:
+                return ids
+
+        # 2. n-gram 접두 필터: 드문 n-gram부터, 남은 등장 횟수가
+        #    필요 수보다 작아질 때까지 포스팅 조회
+        if min_need > 0:
+            query_grams = self._grams(query)
+            remaining = sum(query_grams.values()) - min_need + 1
+            probed: List[np.ndarray] = []
+            probed_size = 0
+            for gram, count in sorted(
+                query_grams.items(),
+                key=lambda item: self._postings[item[0]][0].size if item[0] in self._postings else 0,
+            ):
+                posting = self._postings.get(gram)
+                if posting is not None:
+                    probed.append(posting[0])
+                    probed_size += posting[0].size
+                remaining -= count
+                if remaining <= 0:
+                    break
+
+            # 조회할 포스팅이 길이 창보다 크면 선택성이 없으므로 생략
+            if probed_size <= window:
+                if not probed:
+                    return np.empty(0, dtype=np.int64)
+                marked = np.zeros(self.size, dtype=bool)
+                for posting_ids in probed:
+                    marked[posting_ids] = True
+                ids = np.flatnonzero(marked) if ids is None else ids[marked[ids]]
+
+        if ids is None:
+            ids = np.sort(self._by_length[lo:hi])
+
+        ids = ids[feasible[self.lengths[ids]]]
+        if ids.size == 0:
+            return ids
+
+        # 3. 문자 단위 조건: 공유 문자 수 >= 최소 LCS
+        overlap = self._char_overlap(query, ids)
+        return ids[overlap >= min_lcs[self.lengths[ids]]]
+
+    def partial_candidates(self, query: str, cutoff: float) -> np.ndarray:
+        """partial_ratio가 cutoff 이상일 수 있는 후보 ID 반환
+
+        partial_ratio는 짧은 쪽(길이 ls)을 긴 쪽의 부분 문자열과 비교하므로
+        길이 차이에 따른 상한은 없지만, 공유 문자 수 ov에 대해
+        partial_ratio <= 2 * ov / (ls + ov) 이므로 ov >= cutoff * ls / (2 - cutoff)
+        인 후보만 남깁니다.
+
+        Args:
+            query: 공격적 정규화 문자열
+            cutoff: 점수 하한 (0.0 - 1.0)
+
+        Returns:
+            np.ndarray: 후보 ID 배열 (오름차순)
+        """
+        if self.size == 0 or not query:
+            return np.empty(0, dtype=np.int64)
+
+        ids = np.arange(self.size, dtype=np.int64)
+        if cutoff > 0:
+            ids = ids[self.lengths > 0]  # 빈 문자열은 0점
+
+        shorter = np.minimum(self.lengths[ids], len(query))
+        need = np.ceil(cutoff * shorter / (2.0 - cutoff) - 1e-9)
+        return ids[self._char_overlap(query, ids) >= need]
+
+    def _char_overlap(self, query: str, ids: np.ndarray) -> np.ndarray:
+        """쿼리와 각 후보의 공유 문자 수 (문자 다중집합 교집합 크기)"""
+        query_counts = np.zeros(self._char_counts.shape[1], dtype=self._char_counts.dtype)
+        for ch, count in Counter(query).items():
+            col = self._alphabet.get(ch)
+            if col is not None:
+                query_counts[col] = min(count, self._max_char_count)
+
+        return np.minimum(self._char_counts[ids], query_counts).sum(axis=1, dtype=np.int64)
+
+    def _bounds(self, la: int, cutoff: float) -> Tuple[int, int, np.ndarray, np.ndarray, int]:
+        """쿼리 길이별 길이 창과 후보 길이별 최소 LCS / 가능 여부 / 최소 n-gram 공유 수
+
+        Args:
+            la: 쿼리 길이
+            cutoff: 점수 하한
+
+        Returns:
+            (최소 길이, 최대 길이, 길이별 최소 LCS, 길이별 가능 여부, 최소 공유 n-gram 수)
+        """
+        key = (la, cutoff)
+        cached = self._bounds_cache.get(key)
+        if cached is not None:
+            return cached
+
+        if cutoff > 0:
+            min_length = math.ceil(la * cutoff / (2.0 - cutoff) - 1e-9)
+            max_length = math.floor(la * (2.0 - cutoff) / cutoff + 1e-9)
+        else:
+            min_length, max_length = 0, self._max_length
+
+        # 길이별 최소 LCS와 n-gram 필요 공유 수 (부동소수 오차는 후보를 남기는 쪽으로)
+        lb = np.arange(self._max_length + 1, dtype=np.int64)
+        min_lcs = np.ceil(cutoff * (la + lb) / 2.0 - 1e-9).astype(np.int64)
+        da = la - min_lcs
+        db = lb - min_lcs
+        feasible = (da >= 0) & (db >= 0)
+        feasible[:min_length] = False
+        feasible[max_length + 1:] = False
+
+        q = self.gram_size
+        need = np.maximum(
+            (la - q + 1) - q * da - (q - 1) * db,
+            (lb - q + 1) - q * db - (q - 1) * da,
+        )
+        min_need = int(need[feasible].min()) if feasible.any() else 0
+
+        bounds = (min_length, max_length, min_lcs, feasible, min_need)
+        self._bounds_cache[key] = bounds
+        return bounds
+
+    def __len__(self) -> int:
+        return self.size
+
@@ -5,7 +5,28 @@
 
 import re
 import unicodedata
-from typing import Tuple
+from functools import lru_cache
+from typing import Dict, Tuple
+
+# 유니코드 공백 문자(str.isspace, 정규식 \s와 동일)는 모두 U+3000 이하
+_MAX_SPACE_CODEPOINT = 0x3000
+
+
+def _deletion_table(char_class: str) -> Dict[int, None]:
+    """문자 클래스 정규식과 공백 문자를 모두 지우는 str.translate 표
+
+    Args:
+        char_class: 한 글자에 매치하는 문자 클래스 정규식
+
+    Returns:
+        Dict[int, None]: {코드포인트: None}
+    """
+    pattern = re.compile(char_class)
+    return {
+        code: None
+        for code in range(_MAX_SPACE_CODEPOINT + 1)
+        if chr(code).isspace() or pattern.fullmatch(chr(code))
+    }
 
 
 class FilenameNormalizer:
@@ -34,8 +55,35 @@ class FilenameNormalizer:
     # 제거할 특수문자 (공백 제외)
     SPECIAL_CHARS = r'[-_!@#$%^&*()+=\[\]{};:\'",.<>/?\\|`~]'
 
-    @classmethod
-    def normalize_basic(cls, text: str) -> str:
+    # 표준/공격적 정규화 LRU 캐시 크기 (기본 정규화는 캐시 조회보다 계산이 빠름)
+    CACHE_SIZE = 1 << 17
+
+    # 미리 컴파일한 패턴
+    # 복사본 패턴은 순서대로 적용해야 결과가 같으므로 (예: "a (1)_2" -> "a (1)")
+    # 하나의 교대 패턴으로 합치지 않고, 끝 글자로 적용 여부를 먼저 거름
+    _COPY_RES = [re.compile(p, re.IGNORECASE) for p in COPY_PATTERNS]
+    _COPY_TAIL_CHARS = frozenset(")]yY")  # 복사본 패턴의 끝 글자 (숫자 제외)
+    _YOUTUBE_ID_RE = re.compile(YOUTUBE_ID_PATTERN)
+    _FORMAT_CODE_RE = re.compile(FORMAT_CODE_PATTERN)
+    _CHANNEL_RES = [
+        re.compile(p, re.IGNORECASE)
+        for p in (
+            r'\s*@\s*Hustler\s*Casino\s*Live\s*$',
+            r'\s*@\s*HustlerCasinoLive\s*$',
+            r'\s*@\s*[A-Za-z0-9_]+\s*$',  # 일반 채널명
+        )
+    ]
+    # 특수문자와 공백을 한 번에 지우는 표 (ASCII 문자열은 bytes.translate 사용)
+    _DELETE_TABLE = _deletion_table(SPECIAL_CHARS)
+    _DELETE_ASCII = bytes(code for code in _DELETE_TABLE if code < 128)
+
+    @staticmethod
+    def _tail(text: str) -> str:
+        """패턴 끝의 $가 매치하는 위치 바로 앞 글자 (마지막 줄바꿈 하나는 건너뜀)"""
+        return text[-2:-1] if text.endswith("\n") else text[-1:]
+
+    @staticmethod
+    def normalize_basic(text: str) -> str:
         """기본 정규화: 소문자 + 공백 제거
 
         현재 시스템에서 사용하는 정규화 방식입니다.
@@ -60,14 +108,17 @@ class FilenameNormalizer:
         Returns:
             YouTube ID가 제거된 문자열
         """
-        # YouTube ID 패턴 제거
-        text = re.sub(cls.YOUTUBE_ID_PATTERN, '', text)
-        # 포맷 코드 제거 (.f399 등)
-        text = re.sub(cls.FORMAT_CODE_PATTERN, '', text)
+        # YouTube ID 패턴 제거 (]로 끝날 때만)
+        if cls._tail(text) == "]":
+            text = cls._YOUTUBE_ID_RE.sub('', text)
+        # 포맷 코드 제거 (.f399 등, 숫자로 끝날 때만)
+        if cls._tail(text).isdecimal():
+            text = cls._FORMAT_CODE_RE.sub('', text)
         return text.strip()
 
-    @classmethod
-    def normalize_standard(cls, text: str) -> str:
+    @staticmethod
+    @lru_cache(maxsize=CACHE_SIZE)
+    def normalize_standard(text: str) -> str:
         """표준 정규화: 소문자 + 모든 특수문자 및 공백 제거
 
         특수문자 차이로 인한 매칭 실패를 방지합니다.
@@ -80,17 +131,19 @@ class FilenameNormalizer:
             정규화된 문자열
         """
         # YouTube ID 및 포맷 코드 먼저 제거
-        text = cls.remove_youtube_id(text)
+        text = FilenameNormalizer.remove_youtube_id(text)
         # Unicode 정규화 (NFD -> NFC)
         text = unicodedata.normalize('NFKC', text)
-        # 모든 특수문자 제거
-        text = re.sub(cls.SPECIAL_CHARS, '', text)
-        # 모든 공백 제거
-        text = re.sub(r'\s+', '', text)
-        return text.lower().strip()
-
-    @classmethod
-    def normalize_aggressive(cls, text: str) -> str:
+        # 모든 특수문자와 공백 제거
+        if text.isascii():
+            text = text.encode("ascii").translate(None, FilenameNormalizer._DELETE_ASCII).decode("ascii")
+        else:
+            text = text.translate(FilenameNormalizer._DELETE_TABLE)
+        return text.lower()
+
+    @staticmethod
+    @lru_cache(maxsize=CACHE_SIZE)
+    def normalize_aggressive(text: str) -> str:
         """공격적 정규화: 복사본 패턴도 제거
 
         (1), _copy 등의 복사본 접미사를 제거하여
@@ -102,11 +155,29 @@ class FilenameNormalizer:
         Returns:
             정규화된 문자열
         """
-        # 먼저 복사본 패턴 제거
-        for pattern in cls.COPY_PATTERNS:
-            text = re.sub(pattern, '', text, flags=re.IGNORECASE)
-        # 그 다음 표준 정규화 적용
-        return cls.normalize_standard(text)
+        # 먼저 복사본 패턴 제거, 그 다음 표준 정규화 적용
+        return FilenameNormalizer.normalize_standard(FilenameNormalizer._remove_copy_patterns(text))
+
+    @classmethod
+    def _remove_copy_patterns(cls, text: str) -> str:
+        """복사본 패턴을 순서대로 제거 (끝 글자상 해당 패턴이 없으면 그대로 반환)"""
+        if not cls._may_have_copy_suffix(text):
+            return text
+        for pattern in cls._COPY_RES:
+            text = pattern.sub('', text)
+        return text
+
+    @classmethod
+    def _may_have_copy_suffix(cls, text: str) -> bool:
+        """복사본 패턴이 매치할 수 있는 끝 글자인지 여부"""
+        tail = cls._tail(text)
+        return tail in cls._COPY_TAIL_CHARS or tail.isdecimal()
+
+    @classmethod
+    def cache_clear(cls):
+        """정규화 수준별 LRU 캐시 비우기"""
+        for func in (cls.normalize_standard, cls.normalize_aggressive):
+            func.cache_clear()
 
     @classmethod
     def extract_core_title(cls, text: str) -> Tuple[str, str]:
@@ -121,9 +192,11 @@ class FilenameNormalizer:
             Tuple[str, str]: (핵심 제목, 제거된 접미사)
         """
         suffix = ""
+        if not cls._may_have_copy_suffix(text):
+            return text.strip(), suffix
 
-        for pattern in cls.COPY_PATTERNS:
-            match = re.search(pattern, text, flags=re.IGNORECASE)
+        for pattern in cls._COPY_RES:
+            match = pattern.search(text)
             if match:
                 suffix = match.group()
                 text = text[:match.start()]
@@ -144,14 +217,8 @@ class FilenameNormalizer:
             채널명이 제거된 문자열
         """
         # @로 시작하는 채널명 패턴
-        patterns = [
-            r'\s*@\s*Hustler\s*Casino\s*Live\s*$',
-            r'\s*@\s*HustlerCasinoLive\s*$',
-            r'\s*@\s*[A-Za-z0-9_]+\s*$',  # 일반 채널명
-        ]
-
-        for pattern in patterns:
-            text = re.sub(pattern, '', text, flags=re.IGNORECASE)
+        for pattern in cls._CHANNEL_RES:
+            text = pattern.sub('', text)
 
         return text.strip()
 
@@ -160,6 +227,7 @@ class FilenameNormalizer:
         """모든 정규화 버전 반환
 
         디버깅 및 분석용으로 모든 정규화 버전을 반환합니다.
+        복사본 패턴이 없으면 공격적 정규화는 표준 정규화 결과를 그대로 씁니다.
 
         Args:
             text: 원본 텍스트
@@ -168,12 +236,15 @@ class FilenameNormalizer:
             dict: 각 정규화 수준별 결과
         """
         core_title, suffix = cls.extract_core_title(text)
+        standard = cls.normalize_standard(text)
+        without_copy = cls._remove_copy_patterns(text)
+        aggressive = standard if without_copy is text else cls.normalize_standard(without_copy)
 
         return {
             "original": text,
             "basic": cls.normalize_basic(text),
-            "standard": cls.normalize_standard(text),
-            "aggressive": cls.normalize_aggressive(text),
+            "standard": standard,
+            "aggressive": aggressive,
             "no_channel": cls.remove_channel_suffix(text),
             "core_title": core_title,
             "suffix": suffix,
@@ -0,0 +1,232 @@
+"""중복 파일 격리 모듈
+
+삭제 대신 같은 볼륨의 <NAS 루트>/.quarantine/<실행 ID>/ 아래로 원래 상대 경로를
+유지한 채 os.rename으로 옮깁니다 (데이터 복사 없음). 보관 기간이 지난 실행 폴더는
+purge로 영구 삭제하고, 그 전에는 감사 로그를 따라 원래 경로로 복원할 수 있습니다.
+"""
+
+import logging
+import os
+import shutil
+import threading
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import TYPE_CHECKING, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    from .deletion_audit import DeletionAuditLog
+
+logger = logging.getLogger(__name__)
+
+# NAS 루트 아래 격리 폴더 이름 (NASClient.SKIP_DIRS에도 포함)
+QUARANTINE_DIR = ".quarantine"
+
+# 실행 ID 형식 (시작 시각 + 프로세스 ID)
+RUN_ID_FORMAT = "%Y%m%d-%H%M%S"
+
+
+@dataclass
+class PurgeResult:
+    """격리 폴더 정리 결과"""
+
+    runs: int = 0  # 삭제한 실행 폴더 수
+    files: int = 0  # 삭제한 파일 수
+    bytes_freed: int = 0  # 해제된 바이트
+    purged: List[Tuple[str, int, int]] = field(default_factory=list)  # [(실행 폴더 경로, 파일 수, 바이트)]
+    errors: List[Tuple[str, str]] = field(default_factory=list)  # [(경로, 에러)]
+
+    def __str__(self) -> str:
+        return (
+            f"격리 폴더 정리: 실행 {self.runs}개, 파일 {self.files}개 "
+            f"({self.bytes_freed / (1024 ** 3):.2f} GB), 실패 {len(self.errors)}개"
+        )
+
+
+@dataclass
+class RestoreResult:
+    """격리 파일 복원 결과"""
+
+    restored: List[str] = field(default_factory=list)  # 복원한 원래 경로
+    skipped: List[Tuple[str, str]] = field(default_factory=list)  # [(원래 경로, 이유)]
+    errors: List[Tuple[str, str]] = field(default_factory=list)  # [(원래 경로, 에러)]
+
+
+class Quarantine:
+    """같은 볼륨 격리 폴더
+
+    os.rename은 같은 파일 시스템 안에서만 원자적이므로 격리 폴더는 NAS 루트
+    아래에 둡니다. 실행 ID는 시작 시각으로 시작하므로 보관 기간은 실행 ID에서
+    계산하고, 형식이 다른 폴더는 건드리지 않습니다.
+    """
+
+    def __init__(self, root_folder: str, retention_days: float = 14.0):
+        """Quarantine 초기화
+
+        Args:
+            root_folder: NAS 루트 폴더 (격리 폴더는 root_folder/.quarantine)
+            retention_days: 격리 파일 보관 기간 (일)
+        """
+        self.root_folder = Path(root_folder)
+        self.path = self.root_folder / QUARANTINE_DIR
+        self.retention_days = retention_days
+        self.last_purge: Optional[PurgeResult] = None  # purge_in_background 결과
+
+    @staticmethod
+    def new_run_id(now: Optional[datetime] = None) -> str:
+        """새 실행 ID (예: 20241220-031500-4242)"""
+        return f"{(now or datetime.now()).strftime(RUN_ID_FORMAT)}-{os.getpid()}"
+
+    @staticmethod
+    def run_started(run_id: str) -> Optional[datetime]:
+        """실행 ID의 시작 시각 (형식이 다르면 None)"""
+        try:
+            return datetime.strptime(run_id[:15], RUN_ID_FORMAT)
+        except ValueError:
+            return None
+
+    def target_for(self, run_id: str, full_path: str) -> Path:
+        """파일의 격리 경로 (NAS 루트 기준 상대 경로 유지)
+
+        Raises:
+            ValueError: NAS 루트 밖의 파일
+        """
+        relative = os.path.relpath(os.path.abspath(full_path), os.path.abspath(self.root_folder))
+        if relative.startswith(os.pardir) or os.path.isabs(relative):
+            raise ValueError(f"NAS 폴더 밖의 파일입니다: {full_path}")
+        return self.path / run_id / relative
+
+    def move(self, full_path: str, run_id: str) -> str:
+        """파일을 격리 폴더로 이동 (os.rename, 같은 볼륨)
+
+        Args:
+            full_path: 파일 전체 경로
+            run_id: 실행 ID
+
+        Returns:
+            str: 격리 경로
+
+        Raises:
+            ValueError: NAS 루트 밖의 파일
+            OSError: 이동 실패 (이미 같은 격리 경로가 있으면 FileExistsError)
+        """
+        target = self.target_for(run_id, full_path)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        if target.exists():
+            raise FileExistsError(f"격리 경로에 이미 파일이 있습니다: {target}")
+        os.rename(full_path, target)
+        return str(target)
+
+    def runs(self) -> List[str]:
+        """격리 폴더의 실행 ID 목록 (오래된 순)"""
+        try:
+            names = [entry.name for entry in os.scandir(self.path) if entry.is_dir(follow_symlinks=False)]
+        except FileNotFoundError:
+            return []
+        return sorted(name for name in names if self.run_started(name) is not None)
+
+    def expired_runs(self, now: Optional[datetime] = None) -> List[str]:
+        """보관 기간이 지난 실행 ID 목록"""
+        cutoff = (now or datetime.now()) - timedelta(days=self.retention_days)
+        return [run_id for run_id in self.runs() if self.run_started(run_id) < cutoff]
+
+    def purge(self, now: Optional[datetime] = None) -> PurgeResult:
+        """보관 기간이 지난 실행 폴더 영구 삭제
+
+        Args:
+            now: 기준 시각 (None이면 현재)
+
+        Returns:
+            PurgeResult: 정리 결과
+        """
+        result = PurgeResult()
+
+        for run_id in self.expired_runs(now):
+            run_path = self.path / run_id
+            files, size = 0, 0
+            for directory, _, names in os.walk(run_path):
+                for name in names:
+                    try:
+                        size += os.lstat(os.path.join(directory, name)).st_size
+                        files += 1
+                    except OSError:
+                        pass
+
+            try:
+                shutil.rmtree(run_path)
+            except OSError as e:
+                result.errors.append((str(run_path), str(e)))
+                logger.warning(f"격리 폴더 삭제 실패: {run_path} - {e}")
+                continue
+
+            result.runs += 1
+            result.files += files
+            result.bytes_freed += size
+            result.purged.append((str(run_path), files, size))
+            logger.info(f"격리 폴더 삭제: {run_id} (파일 {files}개, {size / (1024 ** 2):.1f} MB)")
+
+        return result
+
+    def purge_in_background(self, now: Optional[datetime] = None) -> threading.Thread:
+        """purge를 별도 스레드에서 시작 (join 후 결과는 last_purge)
+
+        감사 로그는 스레드 안전하지 않으므로 join 후 호출한 쪽에서
+        DuplicateCleaner.log_purge로 기록합니다.
+
+        Returns:
+            threading.Thread: 시작된 스레드
+        """
+        def run():
+            try:
+                self.last_purge = self.purge(now)
+            except OSError as e:
+                logger.warning(f"격리 폴더 정리 실패: {e}")
+
+        thread = threading.Thread(target=run, name="quarantine-purge")
+        thread.start()
+        return thread
+
+    def restore(self, audit: "DeletionAuditLog", run_id: str) -> RestoreResult:
+        """감사 로그의 QUARANTINE 기록을 따라 실행 한 번의 격리 파일을 원래 경로로 복원
+
+        원래 경로에 이미 파일이 있거나 격리 파일이 없으면(이미 복원 / purge됨) 건너뜁니다.
+
+        Args:
+            audit: 감사 로그
+            run_id: 복원할 실행 ID
+
+        Returns:
+            RestoreResult: 복원 결과
+        """
+        result = RestoreResult()
+        run_path = os.path.abspath(self.path / run_id) + os.sep
+
+        entries = [
+            e for e in audit.iter_entries()
+            if e.action == "QUARANTINE" and not e.dry_run
+            and os.path.abspath(e.target_path).startswith(run_path)
+        ]
+
+        for entry in entries:
+            if not os.path.exists(entry.target_path):
+                result.skipped.append((entry.full_path, "격리 파일 없음 (이미 복원 또는 삭제됨)"))
+                continue
+            if os.path.exists(entry.full_path):
+                result.skipped.append((entry.full_path, "원래 경로에 파일이 있음"))
+                continue
+
+            try:
+                os.makedirs(os.path.dirname(entry.full_path), exist_ok=True)
+                os.rename(entry.target_path, entry.full_path)
+            except OSError as e:
+                logger.error(f"복원 실패: {entry.full_path} - {e}")
+                audit.log_error(entry.filename, entry.full_path, f"복원 실패: {e}")
+                result.errors.append((entry.full_path, str(e)))
+                continue
+
+            audit.log_restore(entry.filename, entry.full_path, entry.size, entry.mtime, entry.target_path)
+            result.restored.append(entry.full_path)
+            logger.info(f"복원 완료: {entry.full_path}")
+
+        audit.flush()
+        return result
@@ -4,13 +4,20 @@ NAS 폴더의 파일 목록을 스캔하고 관리합니다.
 """
 
 import logging
-from dataclasses import dataclass
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Tuple
+from typing import Callable, Dict, List, Optional, Set, Tuple, TypeVar
+
+from .nas_manifest import DirectoryRecord, ScanManifest
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
 
 @dataclass
 class FileInfo:
@@ -25,23 +32,106 @@ class FileInfo:
     full_path: str = ""  # 전체 경로
 
 
+@dataclass
+class ScanDiff:
+    """이전 스캔(매니페스트) 대비 변경 내역"""
+
+    added: List[FileInfo] = field(default_factory=list)
+    removed: List[FileInfo] = field(default_factory=list)
+    modified: List[FileInfo] = field(default_factory=list)  # 크기 또는 수정 시간 변경
+
+    @property
+    def total(self) -> int:
+        """변경된 파일 수"""
+        return len(self.added) + len(self.removed) + len(self.modified)
+
+    def __str__(self) -> str:
+        return f"추가 {len(self.added)}개, 삭제 {len(self.removed)}개, 변경 {len(self.modified)}개"
+
+
+@dataclass
+class ScanSnapshot:
+    """NAS 스캔 스냅샷
+
+    한 번의 스캔 결과를 보관하며 NASClient의 조회 메서드들이 공유합니다.
+    """
+
+    video_only: bool
+    recursive: bool
+    files: Dict[str, FileInfo] = field(default_factory=dict)  # {전체 경로: FileInfo} (스캔 순서)
+    scanned_at: float = field(default_factory=time.monotonic)
+    diff: Optional[ScanDiff] = None  # 매니페스트 대비 변경 내역 (증분 스캔 시)
+
+    @property
+    def age(self) -> float:
+        """스캔 후 경과 시간 (초)"""
+        return time.monotonic() - self.scanned_at
+
+    def file_list(self) -> List[FileInfo]:
+        """파일 정보 목록 (스캔 순서)"""
+        return list(self.files.values())
+
+    def discard(self, full_path: str) -> Optional[FileInfo]:
+        """파일 제거 (삭제된 파일 반영)
+
+        Args:
+            full_path: 파일 전체 경로
+
+        Returns:
+            제거된 FileInfo 또는 None
+        """
+        removed = self.files.pop(full_path, None)
+        if removed is None:
+            removed = self.files.pop(os.path.normpath(full_path), None)
+        return removed
+
+    def __len__(self) -> int:
+        return len(self.files)
+
+
 class NASClient:
     """NAS 파일 시스템 클라이언트
 
     NAS 폴더의 파일 목록을 스캔하고 파일 정보를 제공합니다.
+    첫 조회 시 스캔한 스냅샷을 모든 조회 메서드가 공유하며,
+    invalidate() 또는 cache_ttl 경과 후 다시 스캔합니다.
+
+    manifest_path를 지정하면 비디오 파일 재귀 스캔은 증분 스캔이 됩니다.
+    폴더 mtime이 매니페스트와 같으면 목록 조회 없이 기록을 재사용하므로
+    같은 이름으로 덮어쓴 파일의 크기/시간 변경은 폴더 mtime이 바뀔 때까지
+    반영되지 않습니다 (scan(full=True)로 전체 스캔).
     """
 
+    # 폴더 mtime이 스캔 시각에서 이 시간 이내면 같은 시각 안의 추가 변경을
+    # 놓칠 수 있으므로 기록하지 않고 다음 스캔에서 다시 조회
+    RACY_MTIME_WINDOW = 2.0
+
     # 지원하는 비디오 확장자
     VIDEO_EXTENSIONS = {".mp4", ".mkv", ".avi", ".mov", ".wmv", ".flv", ".webm"}
 
-    def __init__(self, folder_path: str):
+    # 스캔하지 않는 폴더 (DuplicateCleaner quarantine 모드의 격리 폴더)
+    SKIP_DIRS = {".quarantine"}
+
+    def __init__(
+        self,
+        folder_path: str,
+        cache_ttl: Optional[float] = None,
+        manifest_path: Optional[str] = None,
+        scan_workers: int = 1,
+    ):
         """NASClient 초기화
 
         Args:
             folder_path: NAS 폴더 경로
+            cache_ttl: 스캔 스냅샷 유효 시간 (초, None이면 invalidate() 전까지 유지)
+            manifest_path: 증분 스캔 매니페스트 파일 경로 (None이면 항상 전체 스캔)
+            scan_workers: 폴더 목록을 동시에 조회할 스레드 수 (1이면 순차 탐색)
         """
         self.folder_path = Path(folder_path)
-        self._files_cache: Optional[List[FileInfo]] = None
+        self.cache_ttl = cache_ttl
+        self.manifest_path = manifest_path
+        self.scan_workers = max(1, scan_workers)
+        self._snapshots: Dict[Tuple[bool, bool], ScanSnapshot] = {}  # {(video_only, recursive): 스냅샷}
 
     def is_accessible(self) -> bool:
         """NAS 폴더 접근 가능 여부 확인
@@ -55,64 +145,374 @@ class NASClient:
             logger.error(f"NAS 폴더 접근 실패: {e}")
             return False
 
-    def get_files(self, video_only: bool = True, recursive: bool = True) -> List[FileInfo]:
-        """폴더 내 파일 목록 반환
+    def scan(
+        self,
+        video_only: bool = True,
+        recursive: bool = True,
+        refresh: bool = False,
+        full: bool = False,
+    ) -> ScanSnapshot:
+        """스캔 스냅샷 반환 (유효한 스냅샷이 없으면 스캔)
 
         Args:
-            video_only: True면 비디오 파일만 반환
+            video_only: True면 비디오 파일만 포함
             recursive: True면 하위 폴더도 재귀적으로 검색
+            refresh: True면 스냅샷을 무시하고 다시 스캔
+            full: True면 매니페스트가 있어도 모든 폴더를 다시 조회
 
         Returns:
-            List[FileInfo]: 파일 정보 목록
+            ScanSnapshot: 스캔 스냅샷
+
+        Raises:
+            OSError: NAS 폴더 접근 불가
         """
+        key = (video_only, recursive)
+        snapshot = self._snapshots.get(key)
+        if snapshot is not None and not (refresh or full) and not self._is_expired(snapshot):
+            return snapshot
+
         if not self.is_accessible():
             raise OSError(f"NAS 폴더에 접근할 수 없습니다: {self.folder_path}")
 
+        snapshot = ScanSnapshot(video_only=video_only, recursive=recursive)
+        if self.manifest_path and video_only and recursive:
+            dir_results = self._scan_incremental(snapshot, full)
+        else:
+            dir_results = self._walk(lambda d, s: self._scan_directory(d, s, video_only), recursive)
+
+        for dir_files in dir_results:
+            for info in dir_files:
+                snapshot.files[info.full_path] = info
+        self._snapshots[key] = snapshot
+
+        logger.info(f"NAS 폴더에서 {len(snapshot)}개 파일 발견 (하위 폴더 포함: {recursive})")
+        if snapshot.diff is not None:
+            logger.info(f"이전 스캔 대비: {snapshot.diff}")
+        return snapshot
+
+    def _scan_incremental(self, snapshot: ScanSnapshot, full: bool = False) -> List[List[FileInfo]]:
+        """매니페스트를 이용한 증분 스캔
+
+        모든 폴더를 stat하되, mtime이 기록과 같은 폴더는 목록 조회와 파일 stat을
+        생략하고 기록을 재사용합니다. 목록을 다시 조회한 폴더는 기록과 비교하여
+        snapshot.diff에 추가/삭제/변경 파일을 모읍니다.
+
+        Args:
+            snapshot: 채울 스냅샷 (diff 설정)
+            full: True면 모든 폴더 목록을 다시 조회 (변경 내역은 계산)
+
+        Returns:
+            List[List[FileInfo]]: 폴더별 파일 목록 (방문 순서)
+        """
+        manifest = ScanManifest(self.manifest_path, str(self.folder_path), video_only=True)
+        previous = manifest.load()
+        current: Dict[str, DirectoryRecord] = {}
+        diff = ScanDiff()
+        racy_after_ns = time.time_ns() - int(self.RACY_MTIME_WINDOW * 1e9)
+
+        def scan_directory(directory: str, subfolder: str):
+            mtime_ns = os.stat(directory).st_mtime_ns
+            old = previous.get(subfolder)
+
+            if not full and old is not None and old.mtime_ns == mtime_ns:
+                current[subfolder] = old
+                return (
+                    self._files_from_record(directory, subfolder, old),
+                    [self._subdir(directory, subfolder, name) for name in old.subdirs],
+                )
+
+            files, subdirs = self._scan_directory(directory, subfolder, video_only=True)
+            current[subfolder] = DirectoryRecord(
+                mtime_ns=mtime_ns if mtime_ns < racy_after_ns else None,
+                files={f.name: (f.size, f.mtime.timestamp()) for f in files},
+                subdirs=[os.path.basename(path) for path, _ in subdirs],
+            )
+
+            if previous:
+                old_files = old.files if old is not None else {}
+                for f in files:
+                    entry = old_files.get(f.name)
+                    if entry is None:
+                        diff.added.append(f)
+                    elif entry != (f.size, f.mtime.timestamp()):
+                        diff.modified.append(f)
+                new_names = {f.name for f in files}
+                if old is not None:
+                    diff.removed.extend(
+                        f for f in self._files_from_record(directory, subfolder, old)
+                        if f.name not in new_names
+                    )
+            return files, subdirs
+
+        dir_results = self._walk(scan_directory)
+
+        # 사라진 폴더의 파일은 모두 삭제로 처리
+        root = str(self.folder_path)
+        for subfolder, old in previous.items():
+            if subfolder not in current:
+                directory = os.path.join(root, *subfolder.split("/")) if subfolder else root
+                diff.removed.extend(self._files_from_record(directory, subfolder, old))
+
+        if previous:
+            # 병렬 탐색에서는 완료 순서대로 쌓이므로 경로순으로 고정
+            for changed in (diff.added, diff.removed, diff.modified):
+                changed.sort(key=lambda f: f.full_path)
+            snapshot.diff = diff
+
+        try:
+            manifest.save(current)
+        except OSError as e:
+            logger.warning(f"스캔 매니페스트 저장 실패: {e}")
+
+        return dir_results
+
+    def _files_from_record(self, directory: str, subfolder: str, record: DirectoryRecord) -> List[FileInfo]:
+        """매니페스트 기록으로 FileInfo 목록 생성 (stat 없음)"""
         files = []
+        for name, (size, mtime) in record.files.items():
+            stem, suffix = self._split_name(name)
+            files.append(
+                FileInfo(
+                    name=name,
+                    stem=stem,
+                    suffix=suffix,
+                    size=size,
+                    mtime=datetime.fromtimestamp(mtime),
+                    subfolder=subfolder,
+                    full_path=os.path.join(directory, name),
+                )
+            )
+        return files
 
-        # 재귀적 검색 또는 현재 폴더만
-        if recursive:
-            paths = self.folder_path.rglob("*")
-        else:
-            paths = self.folder_path.iterdir()
+    @staticmethod
+    def _subdir(directory: str, subfolder: str, name: str) -> Tuple[str, str]:
+        """(하위 폴더 경로, 하위 폴더 상대 경로)"""
+        return os.path.join(directory, name), f"{subfolder}/{name}" if subfolder else name
+
+    def _is_expired(self, snapshot: ScanSnapshot) -> bool:
+        """스냅샷 TTL 경과 여부"""
+        return self.cache_ttl is not None and snapshot.age > self.cache_ttl
+
+    def invalidate(self):
+        """스캔 스냅샷 폐기 (다음 조회 시 다시 스캔)"""
+        self._snapshots.clear()
+
+    def get_files(
+        self,
+        video_only: bool = True,
+        recursive: bool = True,
+        refresh: bool = False,
+        full: bool = False,
+    ) -> List[FileInfo]:
+        """폴더 내 파일 목록 반환
+
+        Args:
+            video_only: True면 비디오 파일만 반환
+            recursive: True면 하위 폴더도 재귀적으로 검색
+            refresh: True면 스냅샷을 무시하고 다시 스캔
+            full: True면 매니페스트가 있어도 모든 폴더를 다시 조회
 
-        for path in paths:
-            if not path.is_file():
+        Returns:
+            List[FileInfo]: 파일 정보 목록
+        """
+        return self.scan(video_only=video_only, recursive=recursive, refresh=refresh, full=full).file_list()
+
+    def _walk(
+        self,
+        scan_directory: Callable[[str, str], Tuple[T, List[Tuple[str, str]]]],
+        recursive: bool = True,
+    ) -> List[T]:
+        """루트부터 깊이 우선으로 폴더별 스캔 함수 실행
+
+        폴더의 결과 다음에 하위 폴더 순서대로 방문합니다.
+        하위 폴더 목록 조회 실패는 경고 후 건너뛰고, 루트 실패는 그대로 발생시킵니다.
+        scan_workers가 2 이상이면 폴더를 스레드 풀에서 동시에 조회하되
+        결과는 순차 탐색과 같은 순서로 돌려줍니다.
+
+        Args:
+            scan_directory: (폴더 경로, 상대 경로) -> (결과, 하위 폴더 목록)
+            recursive: True면 하위 폴더도 방문
+
+        Returns:
+            List: 폴더별 결과 (방문 순서)
+        """
+        if recursive and self.scan_workers > 1:
+            return self._walk_parallel(scan_directory)
+
+        results: List[T] = []
+
+        pending: List[Tuple[str, str]] = [(str(self.folder_path), "")]
+        while pending:
+            directory, subfolder = pending.pop()
+            try:
+                result, subdirs = scan_directory(directory, subfolder)
+            except (OSError, PermissionError) as e:
+                if not subfolder:
+                    raise
+                logger.warning(f"폴더 스캔 실패: {directory} - {e}")
                 continue
 
-            # 비디오 파일만 필터링
-            if video_only and path.suffix.lower() not in self.VIDEO_EXTENSIONS:
+            results.append(result)
+            if recursive:
+                pending.extend(reversed(subdirs))
+
+        return results
+
+    def _walk_parallel(
+        self,
+        scan_directory: Callable[[str, str], Tuple[T, List[Tuple[str, str]]]],
+    ) -> List[T]:
+        """스레드 풀로 폴더를 동시에 조회 (결과 순서는 _walk 순차 탐색과 동일)
+
+        조회가 끝난 폴더의 하위 폴더를 바로 작업으로 넣어 풀을 채우고,
+        모든 조회가 끝나면 폴더 트리를 깊이 우선으로 따라가며 결과를 정렬합니다.
+
+        Args:
+            scan_directory: (폴더 경로, 상대 경로) -> (결과, 하위 폴더 목록)
+
+        Returns:
+            List: 폴더별 결과 (방문 순서)
+        """
+        results: Dict[str, T] = {}
+        children: Dict[str, List[str]] = {}
+
+        with ThreadPoolExecutor(max_workers=self.scan_workers) as pool:
+            root = (str(self.folder_path), "")
+            running = {pool.submit(scan_directory, *root): root}
+            while running:
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    directory, subfolder = running.pop(future)
+                    try:
+                        result, subdirs = future.result()
+                    except (OSError, PermissionError) as e:
+                        if not subfolder:
+                            raise
+                        logger.warning(f"폴더 스캔 실패: {directory} - {e}")
+                        continue
+
+                    results[subfolder] = result
+                    children[subfolder] = [relative for _, relative in subdirs]
+                    for subdir in subdirs:
+                        running[pool.submit(scan_directory, *subdir)] = subdir
+
+        ordered: List[T] = []
+        pending = [""]
+        while pending:
+            subfolder = pending.pop()
+            if subfolder not in results:
                 continue
+            ordered.append(results[subfolder])
+            pending.extend(reversed(children[subfolder]))
 
-            try:
-                stat = path.stat()
+        return ordered
+
+    def _scan_directory(
+        self,
+        directory: str,
+        subfolder: str = "",
+        video_only: bool = True,
+    ) -> Tuple[List[FileInfo], List[Tuple[str, str]]]:
+        """폴더 한 개 스캔 (하위 폴더는 내려가지 않음)
+
+        os.scandir의 DirEntry에 캐시된 종류 정보로 파일/폴더를 구분하고,
+        확장자로 먼저 거른 뒤 남은 파일만 한 번씩 stat합니다.
+        폴더 심볼릭 링크는 따라가지 않습니다 (rglob과 동일).
+
+        Args:
+            directory: 스캔할 폴더 경로
+            subfolder: NAS 루트 기준 상대 경로 (예: "2024", 루트는 "")
+            video_only: True면 비디오 파일만 반환
+
+        Returns:
+            (파일 정보 목록, [(하위 폴더 경로, 하위 폴더 상대 경로), ...])
+
+        Raises:
+            OSError: 폴더 목록 조회 실패
+        """
+        files: List[FileInfo] = []
+        subdirs: List[Tuple[str, str]] = []
+
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                name = entry.name
 
-                # 서브폴더 추출
                 try:
-                    relative = path.relative_to(self.folder_path)
-                    subfolder = relative.parent.as_posix()
-                    if subfolder == ".":
-                        subfolder = ""
-                except ValueError:
-                    subfolder = ""
+                    if entry.is_dir(follow_symlinks=False):
+                        if name not in self.SKIP_DIRS:
+                            subdirs.append(self._subdir(directory, subfolder, name))
+                        continue
+
+                    stem, suffix = self._split_name(name)
+
+                    # 비디오 파일만 필터링 (stat 전에 이름으로)
+                    if video_only and suffix.lower() not in self.VIDEO_EXTENSIONS:
+                        continue
+
+                    if not entry.is_file():
+                        continue
+
+                    stat = entry.stat()
+                except (OSError, PermissionError) as e:
+                    logger.warning(f"파일 정보 읽기 실패: {entry.path} - {e}")
+                    continue
 
                 files.append(
                     FileInfo(
-                        name=path.name,
-                        stem=path.stem,
-                        suffix=path.suffix,
+                        name=name,
+                        stem=stem,
+                        suffix=suffix,
                         size=stat.st_size,
                         mtime=datetime.fromtimestamp(stat.st_mtime),
                         subfolder=subfolder,
-                        full_path=str(path),
+                        full_path=entry.path,
                     )
                 )
-            except (OSError, PermissionError) as e:
-                logger.warning(f"파일 정보 읽기 실패: {path} - {e}")
-                continue
 
-        logger.info(f"NAS 폴더에서 {len(files)}개 파일 발견 (하위 폴더 포함: {recursive})")
-        return files
+        return files, subdirs
+
+    def _count_directory(
+        self,
+        directory: str,
+        subfolder: str = "",
+        video_only: bool = True,
+    ) -> Tuple[int, List[Tuple[str, str]]]:
+        """폴더 한 개의 파일 수 (stat 없이 DirEntry 종류 정보만 사용)
+
+        Args:
+            directory: 스캔할 폴더 경로
+            subfolder: NAS 루트 기준 상대 경로
+            video_only: True면 비디오 파일만 카운트
+
+        Returns:
+            (파일 수, [(하위 폴더 경로, 하위 폴더 상대 경로), ...])
+        """
+        count = 0
+        subdirs: List[Tuple[str, str]] = []
+
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in self.SKIP_DIRS:
+                            subdirs.append(self._subdir(directory, subfolder, entry.name))
+                        continue
+                    if video_only and self._split_name(entry.name)[1].lower() not in self.VIDEO_EXTENSIONS:
+                        continue
+                    if entry.is_file():
+                        count += 1
+                except (OSError, PermissionError) as e:
+                    logger.warning(f"파일 정보 읽기 실패: {entry.path} - {e}")
+
+        return count, subdirs
+
+    @staticmethod
+    def _split_name(name: str) -> Tuple[str, str]:
+        """파일명을 (stem, suffix)로 분리 (Path.stem / Path.suffix와 동일 규칙)"""
+        i = name.rfind(".")
+        if 0 < i < len(name) - 1:
+            return name[:i], name[i:]
+        return name, ""
 
     def get_file_stems(self, video_only: bool = True) -> Set[str]:
         """확장자 제외 파일명 집합 반환
@@ -146,16 +546,21 @@ class NASClient:
 
         return result
 
-    def get_files_with_dates(self, video_only: bool = True) -> Dict[str, Tuple[str, datetime, str, str]]:
+    def get_files_with_dates(
+        self,
+        video_only: bool = True,
+        snapshot: Optional[ScanSnapshot] = None,
+    ) -> Dict[str, Tuple[str, datetime, str, str]]:
         """정규화된 파일명과 수정 날짜, 서브폴더, 전체 경로 매핑 반환
 
         Args:
             video_only: True면 비디오 파일만 포함
+            snapshot: 사용할 스캔 스냅샷 (None이면 scan(), 있으면 video_only 무시)
 
         Returns:
             Dict[str, Tuple[str, datetime, str, str]]: {정규화된_파일명: (원본_파일명, 수정일시, 서브폴더, 전체경로)}
         """
-        files = self.get_files(video_only=video_only)
+        files = snapshot.file_list() if snapshot is not None else self.get_files(video_only=video_only)
         result = {}
 
         for f in files:
@@ -184,24 +589,38 @@ class NASClient:
     def get_file_count(self, video_only: bool = True) -> int:
         """파일 개수 반환
 
+        유효한 스냅샷이 있으면 그대로 사용하고, 없으면 stat 없이 폴더 목록만으로 셉니다.
+
         Args:
             video_only: True면 비디오 파일만 카운트
 
         Returns:
             int: 파일 개수
         """
-        return len(self.get_files(video_only=video_only))
+        snapshot = self._snapshots.get((video_only, True))
+        if snapshot is not None and not self._is_expired(snapshot):
+            return len(snapshot)
+
+        if not self.is_accessible():
+            raise OSError(f"NAS 폴더에 접근할 수 없습니다: {self.folder_path}")
+
+        return sum(self._walk(lambda d, s: self._count_directory(d, s, video_only)))
 
-    def get_file_sizes(self, video_only: bool = True) -> Dict[str, int]:
+    def get_file_sizes(
+        self,
+        video_only: bool = True,
+        snapshot: Optional[ScanSnapshot] = None,
+    ) -> Dict[str, int]:
         """파일 크기 매핑 반환
 
         Args:
             video_only: True면 비디오 파일만 포함
+            snapshot: 사용할 스캔 스냅샷 (None이면 scan(), 있으면 video_only 무시)
 
         Returns:
             Dict[str, int]: {파일명(확장자 제외): 크기(bytes)}
         """
-        files = self.get_files(video_only=video_only)
+        files = snapshot.file_list() if snapshot is not None else self.get_files(video_only=video_only)
         return {f.stem: f.size for f in files}
 
     def get_full_file_info(self, video_only: bool = True) -> Dict[str, FileInfo]:
@@ -229,8 +648,6 @@ class NASClient:
             PermissionError: 권한 부족
             OSError: 파일 시스템 오류
         """
-        import os
-
         path = Path(file_path)
 
         if not path.exists():
@@ -244,6 +661,9 @@ class NASClient:
         try:
             os.remove(file_path)
             logger.info(f"파일 삭제 완료: {file_path}")
+
+            # 스캔 스냅샷에도 반영
+            self.discard(file_path)
             return True
         except PermissionError as e:
             logger.error(f"삭제 권한 오류: {file_path} - {e}")
@@ -252,6 +672,15 @@ class NASClient:
             logger.error(f"파일 삭제 실패: {file_path} - {e}")
             raise
 
+    def discard(self, file_path: str):
+        """NAS 밖으로 옮긴 파일을 스캔 스냅샷에서 제거
+
+        Args:
+            file_path: 파일 전체 경로
+        """
+        for snapshot in self._snapshots.values():
+            snapshot.discard(file_path)
+
     def get_file_info_by_path(self, file_path: str) -> Optional[FileInfo]:
         """경로로 파일 정보 조회
 
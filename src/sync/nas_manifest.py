@@ -0,0 +1,105 @@
+"""NAS 스캔 매니페스트 모듈
+
+폴더별 mtime과 파일별 (크기, 수정 시간)을 저장하여
+다음 스캔에서 바뀌지 않은 폴더의 목록 조회를 건너뛸 수 있게 합니다.
+"""
+
+import json
+import logging
+import os
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class DirectoryRecord:
+    """폴더 한 개의 스캔 기록"""
+
+    mtime_ns: Optional[int]  # 폴더 mtime (None이면 다음 스캔에서 반드시 다시 조회)
+    files: Dict[str, Tuple[int, float]] = field(default_factory=dict)  # {파일명: (크기, 수정 시간)}
+    subdirs: List[str] = field(default_factory=list)  # 하위 폴더 이름
+
+
+class ScanManifest:
+    """NAS 스캔 매니페스트 파일
+
+    {상대 경로: DirectoryRecord} 형태로 저장합니다 (루트는 "").
+    루트 경로나 스캔 옵션이 다르면 기록을 사용하지 않습니다.
+    """
+
+    VERSION = 1
+
+    def __init__(self, path: str, root: str, video_only: bool = True):
+        """ScanManifest 초기화
+
+        Args:
+            path: 매니페스트 파일 경로
+            root: NAS 루트 폴더 경로
+            video_only: 비디오 파일만 기록했는지 여부
+        """
+        self.path = Path(path)
+        self.root = root
+        self.video_only = video_only
+
+    def load(self) -> Dict[str, DirectoryRecord]:
+        """저장된 폴더 기록 로드
+
+        Returns:
+            Dict[str, DirectoryRecord]: {상대 경로: 기록} (없거나 맞지 않으면 빈 딕셔너리)
+        """
+        if not self.path.exists():
+            return {}
+
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (json.JSONDecodeError, OSError) as e:
+            logger.warning(f"스캔 매니페스트 로드 실패, 전체 스캔: {e}")
+            return {}
+
+        if (
+            data.get("version") != self.VERSION
+            or data.get("root") != self.root
+            or data.get("video_only") != self.video_only
+        ):
+            logger.info("스캔 매니페스트가 현재 설정과 달라 전체 스캔합니다.")
+            return {}
+
+        directories = {}
+        for subfolder, record in data.get("directories", {}).items():
+            directories[subfolder] = DirectoryRecord(
+                mtime_ns=record.get("mtime_ns"),
+                files={name: (size, mtime) for name, (size, mtime) in record.get("files", {}).items()},
+                subdirs=list(record.get("subdirs", [])),
+            )
+        return directories
+
+    def save(self, directories: Dict[str, DirectoryRecord]):
+        """폴더 기록 저장 (임시 파일에 쓴 뒤 교체)
+
+        Args:
+            directories: {상대 경로: 기록}
+        """
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        data = {
+            "version": self.VERSION,
+            "root": self.root,
+            "video_only": self.video_only,
+            "directories": {
+                subfolder: {
+                    "mtime_ns": record.mtime_ns,
+                    "files": {name: list(entry) for name, entry in record.files.items()},
+                    "subdirs": record.subdirs,
+                }
+                for subfolder, record in directories.items()
+            },
+        }
+
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False)
+        os.replace(tmp_path, self.path)
@@ -6,6 +6,7 @@ NAS 폴더의 파일 목록을 Google Sheets와 동기화합니다.
 import logging
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import date
 from typing import Dict, List, Optional, Set, Tuple
@@ -13,7 +14,17 @@ from typing import Dict, List, Optional, Set, Tuple
 from .nas_client import NASClient
 from .sheets_client import SheetsClient, SheetsClientError
 from .sync_config import SyncConfig
-from .matching import FilenameNormalizer, FuzzyMatcher, MatchResult, DuplicateDetector, DuplicateGroup
+from .sync_state import FileMatchRecord, SyncState, SyncStateFile
+from .matching import (
+    CandidateIndex,
+    CommonAffixes,
+    DuplicateDetector,
+    DuplicateGroup,
+    FilenameNormalizer,
+    FuzzyMatcher,
+    MatchCache,
+    MatchResult,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -38,6 +49,17 @@ class SyncResult:
     duplicate_groups: List[DuplicateGroup] = field(default_factory=list)
     duplicates_marked: int = 0  # 중복으로 표시된 파일 수
 
+    # Sheets API 호출 통계
+    api_requests: int = 0  # 보낸 요청 수 (재시도 포함)
+    api_wait_time: float = 0.0  # 호출 한도/429 대기 시간 합계 (초)
+
+    # 증분 매칭 통계
+    skipped_pairs: int = 0  # 지난 결과를 재사용하여 비교하지 않은 (파일, 제목) 쌍 수
+    match_cache_hits: int = 0  # 유사도 매칭 캐시 적중 수
+    match_cache_misses: int = 0  # 유사도 매칭 캐시 미스 수 (실제로 점수를 계산한 파일)
+    pruned_pairs: int = 0  # 점수 상한 필터로 계산을 생략한 (파일, 제목) 쌍 수
+    scored_pairs: int = 0  # 유사도 점수를 계산한 (파일, 제목) 쌍 수
+
     def __str__(self) -> str:
         """결과 요약 문자열"""
         match_detail = ""
@@ -61,7 +83,10 @@ class SyncResult:
             f"  - 이미 체크됨: {self.already_checked}건\n"
             f"  - 매칭 실패: {self.not_matched}건"
             f"{duplicate_detail}\n"
-            f"  - 에러: {self.errors}건"
+            f"  - 에러: {self.errors}건\n"
+            f"  - 건너뛴 비교: {self.skipped_pairs}쌍\n"
+            f"  - 점수 상한 필터: 제외 {self.pruned_pairs}쌍, 계산 {self.scored_pairs}쌍\n"
+            f"  - API 요청: {self.api_requests}회 (대기 {self.api_wait_time:.1f}초)"
         )
 
 
@@ -136,7 +161,12 @@ class NASSheetsSync:
     def _init_clients(self):
         """클라이언트 초기화"""
         if self.nas is None:
-            self.nas = NASClient(self.config.nas_folder)
+            self.nas = NASClient(
+                self.config.nas_folder,
+                cache_ttl=self.config.nas_cache_ttl or None,
+                manifest_path=self.config.nas_manifest_path or None,
+                scan_workers=self.config.nas_scan_workers,
+            )
         if self.sheets is None:
             self.sheets = SheetsClient(self.config)
 
@@ -152,6 +182,7 @@ class NASSheetsSync:
         """
         result = SyncResult()
         today = date.today().strftime(self.config.date_format)
+        dry_run = dry_run or self.config.sheet_offline  # 오프라인은 미러만 있으므로 쓰기 불가
 
         print("=" * 60)
         print("NAS-Google Sheets 동기화 시작")
@@ -173,41 +204,63 @@ class NASSheetsSync:
             result.errors = 1
             return result
 
-        # 2. NAS 파일 목록 수집
-        print("[1/3] NAS 파일 목록 수집 중...")
-        try:
-            if not self.nas.is_accessible():
-                raise OSError(f"NAS 폴더에 접근할 수 없습니다: {self.config.nas_folder}")
-
-            # 파일명과 수정 날짜를 함께 가져옴
-            nas_files = self.nas.get_files_with_dates()
-            print(f"  -> {len(nas_files)}개 파일 발견")
-        except Exception as e:
-            logger.error(f"NAS 파일 수집 실패: {e}")
-            print(f"\n[ERROR] NAS 파일 수집 실패: {e}")
-            result.errors = 1
-            return result
-
-        # 3. Google Sheets 데이터 로드
-        print("\n[2/3] Google Sheets 데이터 로드 중...")
+        # 2~4. NAS 파일 수집과 시트 로드는 서로 독립적이므로 병렬로 실행
+        # (시트는 별도 스레드에서 로드하고, 중복 감지는 NAS 수집이 끝나는 즉시 시작)
+        pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="sheet-load")
         try:
-            sheet_data = self.sheets.get_title_column()
-            print(f"  -> {len(sheet_data)}개 행 로드 완료")
-        except SheetsClientError as e:
-            logger.error(f"시트 데이터 로드 실패: {e}")
-            print(f"\n[ERROR] 시트 데이터 로드 실패: {e}")
-            result.errors = 1
-            return result
-
-        # 4. 중복 감지 (선택적)
-        duplicates_to_mark: Set[str] = set()
-        if self.config.duplicate_detection:
+            # Title, P:T 현재 값, 행 수를 한 번에 로드
+            sheet_future = pool.submit(self.sheets.load_sheet)
+
+            # 2. NAS 파일 목록 수집
+            print("[1/3] NAS 파일 목록 수집 중... (시트 로드와 병렬)")
+            try:
+                if not self.nas.is_accessible():
+                    raise OSError(f"NAS 폴더에 접근할 수 없습니다: {self.config.nas_folder}")
+
+                # 한 번의 스캔 스냅샷에서 파일명/수정 날짜, 변경 내역, 크기를 모두 가져옴
+                # (cache_ttl이 지나도 같은 실행 안에서 다시 스캔하지 않음)
+                snapshot = self.nas.scan()
+                nas_files = self.nas.get_files_with_dates(snapshot=snapshot)
+                print(f"  -> {len(nas_files)}개 파일 발견")
+                if snapshot.diff is not None:
+                    print(f"  -> 이전 스캔 대비: {snapshot.diff}")
+            except Exception as e:
+                logger.error(f"NAS 파일 수집 실패: {e}")
+                print(f"\n[ERROR] NAS 파일 수집 실패: {e}")
+                result.errors = 1
+                return result
+
+            # 4. 중복 감지 (선택적) - 시트 로드를 기다리지 않음
+            duplicates_to_mark: Set[str] = set()
+            detector = None
+            if self.config.duplicate_detection:
+                detector = DuplicateDetector(
+                    threshold=self.config.duplicate_threshold,
+                    strip_affixes=self.config.strip_common_affixes,
+                )
+                result.duplicate_groups = detector.find_duplicates(nas_files)
+                for group in result.duplicate_groups:
+                    duplicates_to_mark.update(group.duplicates_to_mark)
+
+            # 3. Google Sheets 데이터 로드 결과 대기
+            print("\n[2/3] Google Sheets 데이터 로드 중...")
+            try:
+                sheet_model = sheet_future.result()
+                sheet_data = sheet_model.titles
+                source = " (Title은 로컬 미러)" if sheet_model.from_mirror else ""
+                print(f"  -> {len(sheet_data)}개 행 로드 완료{source}")
+            except SheetsClientError as e:
+                logger.error(f"시트 데이터 로드 실패: {e}")
+                print(f"\n[ERROR] 시트 데이터 로드 실패: {e}")
+                result.errors = 1
+                return result
+        finally:
+            # NAS 수집이 실패해도 시트 로드 완료를 기다리지 않음
+            pool.shutdown(wait=False, cancel_futures=True)
+
+        if detector is not None:
             print("\n[3/5] 중복 파일 감지 중...")
-            detector = DuplicateDetector(threshold=self.config.duplicate_threshold)
-            result.duplicate_groups = detector.find_duplicates(nas_files)
-
             if result.duplicate_groups:
-                duplicates_to_mark = detector.get_duplicates_to_mark(nas_files)
                 print(f"  -> {len(result.duplicate_groups)}개 중복 그룹 발견")
                 print(f"  -> {len(duplicates_to_mark)}개 파일 중복으로 표시 예정")
 
@@ -215,6 +268,7 @@ class NASSheetsSync:
                     print(detector.generate_report(result.duplicate_groups))
             else:
                 print("  -> 중복 파일 없음")
+            print(f"  -> {detector.prune_stats}")
 
         # 5. 매칭 및 업데이트
         step_num = "4/5" if self.config.duplicate_detection else "3/3"
@@ -229,44 +283,119 @@ class NASSheetsSync:
             sheet_title_to_row[normalized] = row_num
             original_titles[normalized] = title
 
+        # 제목/파일명 대부분에 붙는 공통 접사(채널명 등)는 유사도 계산에서 제외
+        affixes = CommonAffixes()
+        if self.config.fuzzy_enabled and self.config.strip_common_affixes:
+            affixes = CommonAffixes.learn(
+                [FilenameNormalizer.normalize_aggressive(title) for _, title in sheet_data]
+                + [FilenameNormalizer.normalize_aggressive(original) for original, _, _, _ in nas_files.values()]
+            )
+            if affixes:
+                print(f"  -> {affixes}")
+
         # 유사도 매처 초기화 (설정에 따라)
         matcher = None
+        candidate_index = None
         if self.config.fuzzy_enabled:
             matcher = FuzzyMatcher(
                 threshold=self.config.similarity_threshold,
-                method=self.config.fuzzy_method
+                method=self.config.fuzzy_method,
+                cache=MatchCache(self.config.match_cache_path) if self.config.match_cache_path else None,
             )
+            # 제목 정규화 키는 한 번만 계산하여 모든 파일에 재사용
+            candidate_index = CandidateIndex(sheet_title_to_row, original_titles, affixes=affixes)
+
+        # 지난 동기화 상태 (증분 모드에서만 재사용)
+        state_file = self._sync_state_file(affixes)
+        previous_state = state_file.load() if state_file and self.config.incremental_sync else None
+        current_titles: Dict[int, str] = dict(sheet_data)
+        scanned_files = snapshot.files
+        file_stats: Dict[str, Tuple[int, float]] = {}  # {정규화된 파일명: (크기, 수정 시간)}
+        for normalized_filename, (_, file_mtime, _, full_path) in nas_files.items():
+            info = scanned_files.get(full_path)
+            file_stats[normalized_filename] = (info.size if info else -1, file_mtime.timestamp())
 
         # 매칭 수행
         updates_to_apply = []
         fuzzy_match_details = []  # 유사도 매칭 상세 정보
         filename_to_row: Dict[str, int] = {}  # 파일명 -> 행 번호 매핑 (중복 표시용)
 
-        progress = ProgressMonitor(len(nas_files), "매칭 중")
+        # 기본 정규화로 정확히 일치 시도, 나머지는 한 번에 유사도 매칭
+        match_results: Dict[str, Optional[MatchResult]] = {}
+        pending_filenames: List[str] = []
+        reused_records: Dict[str, FileMatchRecord] = {}  # 크기/수정 시간과 매칭 행 제목이 그대로인 파일
 
-        for i, (normalized_filename, (original_filename, file_mtime, subfolder, full_path)) in enumerate(nas_files.items()):
-            progress.update(i + 1)
-
-            match_result: Optional[MatchResult] = None
-
-            # 기본 정규화로 정확히 일치 시도
+        for normalized_filename, (original_filename, _, _, _) in nas_files.items():
             if normalized_filename in sheet_title_to_row:
-                row_num = sheet_title_to_row[normalized_filename]
-                match_result = MatchResult(
+                match_results[normalized_filename] = MatchResult(
                     matched=True,
                     score=1.0,
                     match_type="exact",
                     original_filename=original_filename,
                     matched_title=original_titles.get(normalized_filename, ""),
-                    matched_row=row_num,
+                    matched_row=sheet_title_to_row[normalized_filename],
                 )
             elif matcher:
-                # 유사도 매칭 시도
-                match_result = matcher.find_best_match(
-                    original_filename,
-                    sheet_title_to_row,
-                    original_titles
+                record = previous_state and previous_state.reusable(
+                    normalized_filename, original_filename, *file_stats[normalized_filename], current_titles
                 )
+                if record:
+                    reused_records[normalized_filename] = record
+                else:
+                    pending_filenames.append(normalized_filename)
+
+        if pending_filenames:
+            batch_results = matcher.batch_find_matches(
+                [nas_files[n][0] for n in pending_filenames],
+                index=candidate_index,
+            )
+            match_results.update(zip(pending_filenames, batch_results))
+
+        if reused_records:
+            # 재사용 파일은 새 행/수정된 행하고만 다시 비교
+            changed_rows = previous_state.changed_rows(current_titles)
+            rechecked: List[Optional[MatchResult]] = [None] * len(reused_records)
+            if changed_rows:
+                changed_index = CandidateIndex(
+                    {n: row for n, row in sheet_title_to_row.items() if row in changed_rows},
+                    original_titles,
+                    affixes=affixes,
+                )
+                rechecked = matcher.batch_find_matches(
+                    [record.filename for record in reused_records.values()],
+                    index=changed_index,
+                )
+            for (normalized_filename, record), new_result in zip(reused_records.items(), rechecked):
+                match_results[normalized_filename] = self._better_match(self._record_to_result(record), new_result)
+
+            result.skipped_pairs = len(reused_records) * (len(current_titles) - len(changed_rows))
+            print(
+                f"  -> 증분 매칭: {len(reused_records)}개 파일 재사용, {len(pending_filenames)}개 파일 전체 매칭, "
+                f"변경된 행 {len(changed_rows)}개 (건너뛴 비교 {result.skipped_pairs}쌍)"
+            )
+
+        if state_file:
+            self._save_sync_state(state_file, current_titles, nas_files, file_stats, match_results)
+
+        if matcher:
+            result.pruned_pairs = matcher.prune_stats.pruned
+            result.scored_pairs = matcher.prune_stats.scored
+            if result.pruned_pairs or result.scored_pairs:
+                print(f"  -> {matcher.prune_stats}")
+
+        if matcher and matcher.cache:
+            result.match_cache_hits = matcher.cache.stats.hits
+            result.match_cache_misses = matcher.cache.stats.misses
+            if result.match_cache_hits or result.match_cache_misses:
+                print(f"  -> {matcher.cache.stats}")
+            matcher.cache.close()
+
+        progress = ProgressMonitor(len(nas_files), "매칭 중")
+
+        for i, (normalized_filename, (original_filename, file_mtime, subfolder, full_path)) in enumerate(nas_files.items()):
+            progress.update(i + 1)
+
+            match_result = match_results.get(normalized_filename)
 
             if match_result and match_result.matched:
                 file_date = file_mtime.strftime(self.config.date_format)
@@ -305,83 +434,64 @@ class NASSheetsSync:
             for fm in fuzzy_match_details[:10]:
                 print(f"  '{fm.original_filename[:40]}...' -> '{fm.matched_title[:40]}...' ({fm.score:.1%})")
 
-        # 5. 업데이트 적용
-        if updates_to_apply:
-            print(f"\n{len(updates_to_apply)}개 행 업데이트 준비...")
+        # 로드한 P:T 값과 비교하여 값이 바뀌는 행만 쓰기
+        # (같은 행에 여러 파일이 매칭되면 기존처럼 마지막 값이 남음)
+        updates_to_apply = list({u["row"]: u for u in updates_to_apply}.values())
+        changed = [
+            u for u in updates_to_apply
+            if sheet_model.state(u["row"]).sync_values != self.sheets.format_row(u)
+        ]
+        result.already_checked = len(updates_to_apply) - len(changed)
+        updates_to_apply = changed
+        if result.already_checked:
+            print(f"\n{result.already_checked}개 행은 이미 최신 상태 (업데이트 생략)")
+
+        # 중복 파일명 -> 행 번호 매핑 (이미 T열이 체크된 행은 쓰지 않음)
+        duplicate_rows = [filename_to_row[f] for f in duplicates_to_mark if f in filename_to_row]
+        rows_to_mark = [row for row in duplicate_rows if not sheet_model.state(row).is_duplicate]
+
+        # 5. 업데이트 적용 (P:S 업데이트와 T열 중복 표시를 같은 요청으로)
+        if updates_to_apply or rows_to_mark:
+            print(f"\n{len(updates_to_apply)}개 행 업데이트, {len(rows_to_mark)}개 행 중복 표시 준비...")
 
             if dry_run:
                 result.matched = len(updates_to_apply)
-                print(f"[DRY-RUN] {len(updates_to_apply)}개 행 업데이트 예정 (실제 업데이트 없음)")
+                result.duplicates_marked = len(duplicate_rows)
+                print(
+                    f"[DRY-RUN] {len(updates_to_apply)}개 행 업데이트, "
+                    f"{len(duplicate_rows)}개 파일 중복 표시 예정 (실제 업데이트 없음)"
+                )
             else:
                 try:
-                    # 배치 업데이트 (50개씩 나누어 처리)
-                    batch_size = 50
-                    total_batches = (len(updates_to_apply) + batch_size - 1) // batch_size
-
-                    for batch_num in range(total_batches):
-                        start_idx = batch_num * batch_size
-                        end_idx = min(start_idx + batch_size, len(updates_to_apply))
-                        batch = updates_to_apply[start_idx:end_idx]
-
-                        # 업데이트 데이터 준비 (filename 제거, subfolder와 full_path 포함)
-                        batch_data = [
-                            {
-                                "row": u["row"],
-                                "checkbox": u["checkbox"],
-                                "date": u["date"],
-                                "subfolder": u["subfolder"],
-                                "full_path": u["full_path"],
-                            }
-                            for u in batch
-                        ]
-
-                        self.sheets.batch_update(batch_data)
-                        result.matched += len(batch)
-                        print(f"  배치 {batch_num + 1}/{total_batches} 완료 ({len(batch)}개)")
-
+                    self.sheets.batch_write(updates_to_apply, rows_to_mark)
+                    result.matched = len(updates_to_apply)
+                    result.duplicates_marked = len(duplicate_rows)
+                    print(f"  -> {len(updates_to_apply)}개 행 업데이트 완료")
+                    if duplicate_rows:
+                        already_marked = len(duplicate_rows) - len(rows_to_mark)
+                        print(
+                            f"  -> {len(duplicate_rows)}개 파일 중복으로 표시 완료"
+                            + (f" ({already_marked}개는 이미 표시됨)" if already_marked else "")
+                        )
                 except SheetsClientError as e:
                     logger.error(f"업데이트 실패: {e}")
                     print(f"\n[ERROR] 업데이트 실패: {e}")
                     result.errors += 1
-
-        # 6. 중복 표시 업데이트 (T열)
-        if duplicates_to_mark and not dry_run:
-            step_num = "5/5" if self.config.duplicate_detection else ""
-            if step_num:
-                print(f"\n[{step_num}] 중복 파일 표시 중...")
-
-            # 중복 파일명 -> 행 번호 매핑
-            duplicate_rows = []
-            for dup_filename in duplicates_to_mark:
-                if dup_filename in filename_to_row:
-                    duplicate_rows.append(filename_to_row[dup_filename])
-
-            if duplicate_rows:
-                try:
-                    # 배치 업데이트 (50개씩)
-                    batch_size = 50
-                    for i in range(0, len(duplicate_rows), batch_size):
-                        batch = duplicate_rows[i:i + batch_size]
-                        self.sheets.batch_update_duplicate_column(batch, value=True)
-
-                    result.duplicates_marked = len(duplicate_rows)
-                    print(f"  -> {len(duplicate_rows)}개 파일 중복으로 표시 완료")
-                except SheetsClientError as e:
-                    logger.error(f"중복 표시 업데이트 실패: {e}")
-                    print(f"\n[ERROR] 중복 표시 업데이트 실패: {e}")
-                    result.errors += 1
-        elif duplicates_to_mark and dry_run:
-            # 중복 파일명 -> 행 번호 매핑
-            duplicate_rows = [filename_to_row[f] for f in duplicates_to_mark if f in filename_to_row]
+        elif duplicate_rows:
+            # 모두 이미 표시되어 있음
             result.duplicates_marked = len(duplicate_rows)
-            print(f"[DRY-RUN] {len(duplicate_rows)}개 파일 중복 표시 예정 (실제 업데이트 없음)")
 
         # 7. 결과 출력
+        api_stats = self.sheets.rate_limiter.stats
+        result.api_requests = api_stats.requests
+        result.api_wait_time = api_stats.total_wait_time
+
         print()
         print("=" * 60)
         print("동기화 완료!")
         print("=" * 60)
         print(f"  - 매칭 성공 (업데이트): {result.matched}건")
+        print(f"  - 이미 최신 상태: {result.already_checked}건")
         if result.exact_matches or result.normalized_matches or result.fuzzy_matches:
             print(f"    - 정확 일치: {result.exact_matches}건")
             print(f"    - 정규화 일치: {result.normalized_matches}건")
@@ -391,6 +501,11 @@ class NASSheetsSync:
             print(f"  - 중복 그룹: {len(result.duplicate_groups)}개")
             print(f"  - 중복 표시: {result.duplicates_marked}건")
         print(f"  - 에러: {result.errors}건")
+        if result.skipped_pairs:
+            print(f"  - 증분 매칭으로 건너뛴 비교: {result.skipped_pairs}쌍")
+        if result.pruned_pairs:
+            print(f"  - 점수 상한 필터로 건너뛴 비교: {result.pruned_pairs}쌍 (계산 {result.scored_pairs}쌍)")
+        print(f"  - {api_stats}")
         print("=" * 60)
 
         # 매칭 실패 파일 목록 출력 (verbose 모드)
@@ -403,6 +518,98 @@ class NASSheetsSync:
 
         return result
 
+    # 같은 파일의 매칭 결과 비교 시 단계 우선순위 (높을수록 우선)
+    MATCH_TYPE_RANK = {"exact": 4, "normalized": 3, "normalized_aggressive": 2, "fuzzy": 1}
+
+    def _sync_state_file(self, affixes: CommonAffixes) -> Optional[SyncStateFile]:
+        """증분 동기화 상태 파일 (설정이 비어 있으면 None)
+
+        매칭 결과에 영향을 주는 설정(학습한 공통 접사 포함)이 바뀌면 저장된 상태는 무시됩니다.
+
+        Args:
+            affixes: 이번 실행에서 유사도 계산 전에 제거하는 공통 접사
+        """
+        if not self.config.sync_state_path:
+            return None
+        return SyncStateFile(
+            self.config.sync_state_path,
+            settings={
+                "spreadsheet_id": self.config.spreadsheet_id,
+                "sheet_name": self.config.sheet_name,
+                "title_column": self.config.title_column,
+                "fuzzy_enabled": self.config.fuzzy_enabled,
+                "similarity_threshold": self.config.similarity_threshold,
+                "fuzzy_method": self.config.fuzzy_method,
+                "affixes": [affixes.prefixes, affixes.suffixes],
+            },
+        )
+
+    @staticmethod
+    def _record_to_result(record: FileMatchRecord) -> MatchResult:
+        """저장된 매칭 결과를 MatchResult로 변환 (대안 목록은 저장하지 않음)"""
+        return MatchResult(
+            matched=record.matched,
+            score=record.score,
+            match_type=record.match_type,
+            original_filename=record.filename,
+            matched_title=record.title,
+            matched_row=record.row,
+        )
+
+    @classmethod
+    def _better_match(cls, cached: MatchResult, new: Optional[MatchResult]) -> MatchResult:
+        """재사용한 결과와 변경된 행 대상 재매칭 결과 중 나은 쪽
+
+        매칭 단계가 높은 쪽, 같으면 점수가 높은 쪽을 택하고 동점이면 기존 결과를 유지합니다.
+        """
+        if new is None or not new.matched:
+            return cached
+        if not cached.matched:
+            return new
+
+        def rank(result: MatchResult) -> Tuple[int, float]:
+            return cls.MATCH_TYPE_RANK.get(result.match_type, 0), result.score
+
+        return new if rank(new) > rank(cached) else cached
+
+    def _save_sync_state(
+        self,
+        state_file: SyncStateFile,
+        titles: Dict[int, str],
+        nas_files: Dict[str, Tuple],
+        file_stats: Dict[str, Tuple[int, float]],
+        match_results: Dict[str, Optional[MatchResult]],
+    ):
+        """이번 실행의 매칭 결과를 다음 증분 실행을 위해 저장
+
+        Args:
+            state_file: 상태 파일
+            titles: 현재 {행 번호: 제목}
+            nas_files: NASClient.get_files_with_dates()의 반환값
+            file_stats: {정규화된 파일명: (크기, 수정 시간)}
+            match_results: {정규화된 파일명: 매칭 결과}
+        """
+        state = SyncState(titles=titles)
+        for normalized_filename, match_result in match_results.items():
+            if match_result is None:
+                continue
+            size, mtime = file_stats[normalized_filename]
+            row = match_result.matched_row if match_result.matched else -1
+            state.files[normalized_filename] = FileMatchRecord(
+                filename=nas_files[normalized_filename][0],
+                size=size,
+                mtime=mtime,
+                row=row,
+                match_type=match_result.match_type,
+                score=match_result.score,
+                title=titles.get(row, ""),
+            )
+
+        try:
+            state_file.save(state)
+        except OSError as e:
+            logger.warning(f"동기화 상태 저장 실패: {e}")
+
     def get_status(self) -> Dict:
         """현재 상태 정보 반환
 
@@ -410,10 +617,14 @@ class NASSheetsSync:
             Dict: 상태 정보
         """
         self._init_clients()
+        sheet_model = self.sheets.load_sheet()
 
         return {
             "nas_accessible": self.nas.is_accessible(),
             "nas_file_count": self.nas.get_file_count() if self.nas.is_accessible() else 0,
-            "sheet_row_count": self.sheets.get_row_count(),
+            "sheet_row_count": sheet_model.row_count,
+            "sheet_title_count": len(sheet_model.titles),
+            "sheet_checked_count": sheet_model.checked_count,
+            "sheet_duplicate_count": sheet_model.duplicate_count,
             "config": str(self.config),
         }
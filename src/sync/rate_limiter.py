@@ -0,0 +1,212 @@
+"""Google Sheets API 호출 한도 관리 모듈
+
+토큰 버킷으로 유저/프로젝트 분당 한도를 모델링하여 한도를 넘길 호출만
+대기시킵니다. 버킷은 프로세스 전체에서 공유되므로 여러 SheetsClient가
+같은 한도를 나눠 씁니다.
+"""
+
+import threading
+import time
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from typing import Callable, Dict, List, Optional, Tuple
+
+
+class TokenBucket:
+    """분당 한도를 지키는 토큰 버킷
+
+    버스트 용량 burst만큼 즉시 사용할 수 있고, 나머지는 (quota - burst) / 60초
+    속도로 채워집니다. 어떤 60초 구간에서도 burst + (quota - burst) = quota
+    이하로만 호출되므로 Google의 분 단위 한도를 넘지 않습니다.
+    """
+
+    def __init__(
+        self,
+        quota_per_minute: int,
+        burst: int = 10,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """TokenBucket 초기화
+
+        Args:
+            quota_per_minute: 분당 최대 요청 수
+            burst: 즉시 사용 가능한 최대 토큰 수 (quota_per_minute - 1 이하로 제한)
+            clock: 단조 증가 시계 (테스트용)
+
+        Raises:
+            ValueError: quota_per_minute가 2 미만 (버스트 뒤 보충 속도가 0이 됨)
+        """
+        if quota_per_minute < 2:
+            raise ValueError(f"분당 요청 한도는 2 이상이어야 합니다: {quota_per_minute}")
+
+        self.quota_per_minute = quota_per_minute
+        self.capacity = max(1, min(burst, quota_per_minute - 1))
+        self.refill_rate = (quota_per_minute - self.capacity) / 60.0  # 초당 토큰
+        self._clock = clock
+        self._tokens = float(self.capacity)
+        self._updated = clock()
+        self._blocked_until = 0.0
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float):
+        """경과 시간만큼 토큰 보충 (잠금 안에서 호출)"""
+        elapsed = now - self._updated
+        if elapsed > 0:
+            self._tokens = min(self.capacity, self._tokens + elapsed * self.refill_rate)
+            self._updated = now
+
+    def reserve(self) -> float:
+        """토큰 한 개 예약
+
+        토큰이 모자라면 빚으로 예약하고, 토큰이 생길 때까지의 시간을 반환합니다.
+        호출자는 반환된 시간만큼 기다린 뒤 요청을 보내야 합니다.
+
+        Returns:
+            float: 대기해야 할 시간 (초, 0이면 즉시)
+        """
+        with self._lock:
+            now = self._clock()
+            self._refill(now)
+            self._tokens -= 1
+            wait = -self._tokens / self.refill_rate if self._tokens < 0 else 0.0
+            return max(wait, self._blocked_until - now)
+
+    def block_for(self, seconds: float):
+        """Retry-After 등으로 지정된 시간 동안 모든 예약을 지연
+
+        Args:
+            seconds: 지연 시간 (초)
+        """
+        with self._lock:
+            now = self._clock()
+            self._refill(now)
+            self._blocked_until = max(self._blocked_until, now + seconds)
+            self._tokens = min(self._tokens, 0.0)  # 재개 후 버스트로 다시 429를 받지 않도록
+
+
+@dataclass
+class RateLimitStats:
+    """호출 한도 대기 통계"""
+
+    requests: int = 0  # 보낸 요청 수 (재시도 포함)
+    throttled: int = 0  # 한도 때문에 대기한 요청 수
+    wait_time: float = 0.0  # 한도 대기 시간 합계 (초)
+    retries: int = 0  # 429 응답으로 재시도한 횟수
+    retry_wait_time: float = 0.0  # 429 응답 후 대기 시간 합계 (초)
+
+    @property
+    def total_wait_time(self) -> float:
+        """전체 대기 시간 (초)"""
+        return self.wait_time + self.retry_wait_time
+
+    def __str__(self) -> str:
+        return (
+            f"API 요청 {self.requests}회, 한도 대기 {self.throttled}회 ({self.wait_time:.1f}초), "
+            f"429 재시도 {self.retries}회 ({self.retry_wait_time:.1f}초)"
+        )
+
+
+class RateLimiter:
+    """여러 토큰 버킷을 함께 적용하는 호출 한도 관리자
+
+    모든 버킷에서 토큰을 예약한 뒤 가장 긴 대기 시간만큼 기다립니다.
+    대기 통계는 RateLimiter 인스턴스별로 집계합니다.
+    """
+
+    def __init__(
+        self,
+        buckets: List[TokenBucket],
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        """RateLimiter 초기화
+
+        Args:
+            buckets: 적용할 토큰 버킷 목록 (공유 가능)
+            sleep: 대기 함수 (테스트용)
+        """
+        self.buckets = buckets
+        self.stats = RateLimitStats()
+        self._sleep = sleep
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """요청 한 건을 보낼 수 있을 때까지 대기
+
+        Returns:
+            float: 대기한 시간 (초)
+        """
+        wait = max((bucket.reserve() for bucket in self.buckets), default=0.0)
+        with self._lock:
+            self.stats.requests += 1
+            if wait > 0:
+                self.stats.throttled += 1
+                self.stats.wait_time += wait
+        if wait > 0:
+            self._sleep(wait)
+        return wait
+
+    def backoff(self, seconds: float):
+        """429 응답 후 대기 (공유 버킷 전체에 적용)
+
+        다른 클라이언트도 같은 시간 동안 요청을 멈추도록 버킷을 막고 대기합니다.
+
+        Args:
+            seconds: 대기 시간 (초, Retry-After 또는 지수 백오프)
+        """
+        for bucket in self.buckets:
+            bucket.block_for(seconds)
+        with self._lock:
+            self.stats.retries += 1
+            self.stats.retry_wait_time += seconds
+        self._sleep(seconds)
+
+
+_shared_lock = threading.Lock()
+_shared_buckets: Dict[Tuple[str, int, int], TokenBucket] = {}
+
+
+def shared_bucket(scope: str, quota_per_minute: int, burst: int = 10) -> TokenBucket:
+    """프로세스 전체에서 공유하는 토큰 버킷 반환
+
+    같은 (scope, 한도, 버스트)에 대해서는 항상 같은 버킷을 돌려줍니다.
+
+    Args:
+        scope: 한도 범위 이름 (예: "user:<인증 파일>", "project")
+        quota_per_minute: 분당 최대 요청 수
+        burst: 즉시 사용 가능한 최대 토큰 수
+
+    Returns:
+        TokenBucket: 공유 버킷
+    """
+    key = (scope, quota_per_minute, burst)
+    with _shared_lock:
+        bucket = _shared_buckets.get(key)
+        if bucket is None:
+            bucket = TokenBucket(quota_per_minute, burst)
+            _shared_buckets[key] = bucket
+        return bucket
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Retry-After 헤더 값을 초 단위로 변환
+
+    Args:
+        value: 헤더 값 (초 또는 HTTP 날짜)
+
+    Returns:
+        Optional[float]: 대기 시간 (초), 해석할 수 없으면 None
+    """
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at is None:
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
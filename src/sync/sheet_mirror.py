@@ -0,0 +1,157 @@
+"""시트 로컬 미러 모듈
+
+시트의 Title 열과 P:T 열 값을 SQLite 파일에 (스프레드시트 ID, 시트 이름)별로
+저장 당시의 Drive 파일 버전과 함께 저장합니다. SheetsClient는 파일 버전이
+같으면 시트를 다시 내려받지 않고 미러에서 제공합니다.
+"""
+
+import logging
+import sqlite3
+import time
+from contextlib import closing
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+from .sheet_model import RowState, SheetModel
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class MirrorEntry:
+    """미러에 저장된 시트 한 장"""
+
+    model: SheetModel
+    title_column: str  # 저장 당시 Title 열
+    refreshed_at: float  # 마지막 전체 로드 시각 (epoch 초)
+    version: str = ""  # 저장 당시 Drive 파일 버전 (모르면 "")
+
+    @property
+    def age(self) -> float:
+        """마지막 전체 로드 이후 경과 시간 (초)"""
+        return time.time() - self.refreshed_at
+
+
+class SheetMirror:
+    """SQLite 시트 미러"""
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS sheets (
+            spreadsheet_id TEXT NOT NULL,
+            sheet_name TEXT NOT NULL,
+            title_column TEXT NOT NULL,
+            row_count INTEGER NOT NULL,
+            refreshed_at REAL NOT NULL,
+            version TEXT NOT NULL DEFAULT '',
+            PRIMARY KEY (spreadsheet_id, sheet_name)
+        );
+        CREATE TABLE IF NOT EXISTS rows (
+            spreadsheet_id TEXT NOT NULL,
+            sheet_name TEXT NOT NULL,
+            row INTEGER NOT NULL,
+            title TEXT,
+            checkbox TEXT NOT NULL DEFAULT '',
+            date TEXT NOT NULL DEFAULT '',
+            subfolder TEXT NOT NULL DEFAULT '',
+            link TEXT NOT NULL DEFAULT '',
+            duplicate TEXT NOT NULL DEFAULT '',
+            PRIMARY KEY (spreadsheet_id, sheet_name, row)
+        );
+    """
+
+    def __init__(self, path: str):
+        """SheetMirror 초기화
+
+        Args:
+            path: SQLite 파일 경로
+        """
+        self.path = Path(path)
+
+    def _connect(self) -> sqlite3.Connection:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(self.path))
+        conn.executescript(self.SCHEMA)
+        columns = {row[1] for row in conn.execute("PRAGMA table_info(sheets)")}
+        if "version" not in columns:  # 버전 열이 없던 미러 (다음 로드에서 전체 로드)
+            conn.execute("ALTER TABLE sheets ADD COLUMN version TEXT NOT NULL DEFAULT ''")
+        return conn
+
+    def load(self, spreadsheet_id: str, sheet_name: str) -> Optional[MirrorEntry]:
+        """미러된 시트 로드
+
+        Args:
+            spreadsheet_id: 스프레드시트 ID
+            sheet_name: 시트 이름
+
+        Returns:
+            Optional[MirrorEntry]: 미러 (없거나 읽을 수 없으면 None)
+        """
+        if not self.path.exists():
+            return None
+
+        try:
+            with closing(self._connect()) as conn:
+                sheet = conn.execute(
+                    "SELECT title_column, row_count, refreshed_at, version FROM sheets"
+                    " WHERE spreadsheet_id = ? AND sheet_name = ?",
+                    (spreadsheet_id, sheet_name),
+                ).fetchone()
+                if sheet is None:
+                    return None
+
+                rows = conn.execute(
+                    "SELECT row, title, checkbox, date, subfolder, link, duplicate FROM rows"
+                    " WHERE spreadsheet_id = ? AND sheet_name = ? ORDER BY row",
+                    (spreadsheet_id, sheet_name),
+                ).fetchall()
+        except sqlite3.Error as e:
+            logger.warning(f"시트 미러 로드 실패: {e}")
+            return None
+
+        title_column, row_count, refreshed_at, version = sheet
+        model = SheetModel(row_count=row_count)
+        for row, title, *state in rows:
+            if title:
+                model.titles.append((row, title))
+            if any(state):
+                model.states[row] = RowState(*state)
+
+        return MirrorEntry(model=model, title_column=title_column, refreshed_at=refreshed_at, version=version)
+
+    def save(
+        self,
+        spreadsheet_id: str,
+        sheet_name: str,
+        model: SheetModel,
+        title_column: str,
+        version: str = "",
+        refreshed_at: Optional[float] = None,
+    ):
+        """시트 모델 저장 (기존 내용 교체)
+
+        Args:
+            spreadsheet_id: 스프레드시트 ID
+            sheet_name: 시트 이름
+            model: 저장할 시트 모델
+            title_column: Title 열
+            version: 데이터를 읽기 전에 확인한 Drive 파일 버전
+            refreshed_at: 마지막 전체 로드 시각 (None이면 지금)
+        """
+        key = (spreadsheet_id, sheet_name)
+        titles = dict(model.titles)
+        rows: List[Tuple] = []
+        for row in sorted(set(titles) | set(model.states)):
+            state = model.state(row)
+            rows.append((*key, row, titles.get(row), *state.sync_values, state.duplicate))
+
+        try:
+            with closing(self._connect()) as conn, conn:
+                conn.execute("DELETE FROM rows WHERE spreadsheet_id = ? AND sheet_name = ?", key)
+                conn.executemany("INSERT INTO rows VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", rows)
+                conn.execute(
+                    "INSERT OR REPLACE INTO sheets VALUES (?, ?, ?, ?, ?, ?)",
+                    (*key, title_column, model.row_count, refreshed_at or time.time(), version),
+                )
+        except sqlite3.Error as e:
+            logger.warning(f"시트 미러 저장 실패: {e}")
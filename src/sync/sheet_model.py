@@ -0,0 +1,75 @@
+"""시트 메모리 모델 모듈
+
+values.batchGet으로 읽은 Title 열, P:T 열 상태, 행 수를
+동기화와 상태 조회에서 함께 쓰는 형태로 보관합니다.
+"""
+
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Tuple
+
+
+@dataclass(frozen=True)
+class RowState:
+    """한 행의 P:T 열 현재 값
+
+    FORMULA 렌더링으로 읽은 값을 쓰기 값과 같은 문자열 형태로 정규화합니다
+    (체크박스 "TRUE"/"FALSE", S열은 HYPERLINK 수식, 빈 셀은 "").
+    """
+
+    checkbox: str = ""  # P열
+    date: str = ""  # Q열
+    subfolder: str = ""  # R열
+    link: str = ""  # S열
+    duplicate: str = ""  # T열
+
+    @property
+    def sync_values(self) -> List[str]:
+        """동기화가 쓰는 P, Q, R, S 열 값"""
+        return [self.checkbox, self.date, self.subfolder, self.link]
+
+    @property
+    def is_checked(self) -> bool:
+        """P열이 체크되어 있는지 여부"""
+        return self.checkbox == "TRUE"
+
+    @property
+    def is_duplicate(self) -> bool:
+        """T열이 체크되어 있는지 여부"""
+        return self.duplicate == "TRUE"
+
+
+def cell_text(value: Any) -> str:
+    """API 응답 셀 값을 쓰기 값과 비교할 수 있는 문자열로 변환"""
+    if value is None:
+        return ""
+    if isinstance(value, bool):
+        return "TRUE" if value else "FALSE"
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return str(value)
+
+
+@dataclass
+class SheetModel:
+    """시트 한 장의 동기화 관련 데이터"""
+
+    titles: List[Tuple[int, str]] = field(default_factory=list)  # [(행 번호, 제목)] (빈 제목 제외)
+    states: Dict[int, RowState] = field(default_factory=dict)  # {행 번호: P:T 값} (빈 행 제외)
+    row_count: int = 0  # 마지막으로 값이 있는 행 번호 (A열~Title 열 기준, 헤더 포함)
+    from_mirror: bool = False  # Title을 로컬 미러에서 가져왔는지 여부
+    loaded_at: float = field(default_factory=time.monotonic)
+
+    def state(self, row: int) -> RowState:
+        """행의 P:T 값 (값이 없으면 빈 RowState)"""
+        return self.states.get(row, RowState())
+
+    @property
+    def checked_count(self) -> int:
+        """P열이 체크된 행 수"""
+        return sum(1 for state in self.states.values() if state.is_checked)
+
+    @property
+    def duplicate_count(self) -> int:
+        """T열이 체크된 행 수"""
+        return sum(1 for state in self.states.values() if state.is_duplicate)
@@ -1,19 +1,23 @@
 """Google Sheets API 클라이언트
 
 Service Account 인증을 사용하여 Google Sheets API와 통신합니다.
-Rate Limit 대응을 위한 Exponential Backoff를 구현합니다.
+프로세스 공유 토큰 버킷으로 호출 한도를 지키고, 429 응답에는
+Retry-After 또는 Exponential Backoff로 대응합니다.
 """
 
 import logging
 import random
-import time
 from typing import Any, Dict, List, Optional, Tuple
 
 from google.oauth2 import service_account
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
 
+from .rate_limiter import RateLimiter, parse_retry_after, shared_bucket
+from .sheet_mirror import MirrorEntry, SheetMirror
+from .sheet_model import RowState, SheetModel, cell_text
 from .sync_config import SyncConfig
+from .write_planner import WritePlanner, column_index, column_letters
 
 logger = logging.getLogger(__name__)
 
@@ -39,15 +43,21 @@ class SheetsRateLimitError(SheetsClientError):
 class SheetsClient:
     """Google Sheets API 클라이언트
 
-    Service Account 인증을 사용하며, Rate Limit 대응을 위한
-    Exponential Backoff를 구현합니다.
+    Service Account 인증을 사용하며, 호출 한도를 넘길 요청만 대기시키고
+    429 응답에는 Exponential Backoff로 재시도합니다.
 
     API 한도 (Google 공식 문서 기준):
     - 읽기: 60회/분/유저, 300회/분/프로젝트
     - 쓰기: 60회/분/유저, 300회/분/프로젝트
+
+    유저 버킷(인증 파일별)과 프로젝트 버킷은 같은 프로세스의 모든
+    SheetsClient가 공유합니다.
     """
 
-    SCOPES = ["https://www.googleapis.com/auth/spreadsheets"]
+    SCOPES = [
+        "https://www.googleapis.com/auth/spreadsheets",
+        "https://www.googleapis.com/auth/drive.metadata.readonly",  # 미러 검증용 파일 버전
+    ]
 
     def __init__(self, config: SyncConfig):
         """SheetsClient 초기화
@@ -56,10 +66,17 @@ class SheetsClient:
             config: 동기화 설정
         """
         self.config = config
-        self.api_delay = config.api_delay
         self.max_retries = config.max_retries
+        self.rate_limiter = RateLimiter([
+            shared_bucket(f"user:{config.credentials_path}", config.api_user_quota, config.api_burst),
+            shared_bucket("project", config.api_project_quota, config.api_burst),
+        ])
         self._service = None
-        self._connect()
+        self._drive = None
+        self._model: Optional[SheetModel] = None
+        self.mirror = SheetMirror(config.sheet_mirror_path) if config.sheet_mirror_path else None
+        if not config.sheet_offline:
+            self._connect()
 
     def _connect(self):
         """Google Sheets API 연결"""
@@ -68,6 +85,7 @@ class SheetsClient:
                 self.config.credentials_path, scopes=self.SCOPES
             )
             self._service = build("sheets", "v4", credentials=creds)
+            self._drive = build("drive", "v3", credentials=creds)
             logger.info("Google Sheets API 연결 성공")
         except FileNotFoundError:
             raise SheetsAuthError(
@@ -77,9 +95,11 @@ class SheetsClient:
             raise SheetsAuthError(f"Google Sheets API 인증 실패: {e}")
 
     def _with_retry(self, func, *args, **kwargs) -> Any:
-        """API 호출 래퍼: Exponential Backoff 적용
+        """API 호출 래퍼: 호출 한도 대기 및 Exponential Backoff 적용
 
-        Google 권장 알고리즘: min((2^n + random_ms), max_backoff)
+        요청마다 토큰 버킷에서 토큰을 받고(한도 이내면 대기 없음),
+        429 응답에는 Retry-After 헤더를, 없으면 Google 권장 알고리즘
+        min((2^n + random_ms), max_backoff)을 따라 대기 후 재시도합니다.
 
         Args:
             func: 호출할 함수
@@ -91,17 +111,22 @@ class SheetsClient:
         Raises:
             SheetsRateLimitError: 최대 재시도 횟수 초과
         """
+        if self.config.sheet_offline:
+            raise SheetsClientError("오프라인 모드에서는 Sheets API를 호출할 수 없습니다.")
+
         max_backoff = 64
 
         for attempt in range(self.max_retries):
+            self.rate_limiter.acquire()
             try:
-                time.sleep(self.api_delay)
                 return func(*args, **kwargs)
             except HttpError as e:
                 if e.resp.status == 429:  # Rate limit exceeded
-                    wait_time = min((2**attempt) + random.uniform(0, 1), max_backoff)
+                    wait_time = parse_retry_after(e.resp.get("retry-after"))
+                    if wait_time is None:
+                        wait_time = min((2**attempt) + random.uniform(0, 1), max_backoff)
                     logger.warning(f"Rate limit 초과. {wait_time:.1f}초 후 재시도 ({attempt + 1}/{self.max_retries})")
-                    time.sleep(wait_time)
+                    self.rate_limiter.backoff(wait_time)
                 elif e.resp.status == 403:
                     raise SheetsAuthError(f"권한 거부: {e}")
                 else:
@@ -109,33 +134,182 @@ class SheetsClient:
 
         raise SheetsRateLimitError(f"최대 재시도 횟수({self.max_retries}) 초과")
 
-    def get_title_column(self) -> List[Tuple[int, str]]:
-        """Title 열(B열) 데이터 가져오기
+    def load_sheet(self, refresh: bool = False) -> SheetModel:
+        """Title 열, P:T 열, 행 수 로드
+
+        로컬 미러가 있으면 Drive 파일 버전(version)을 미러 저장 당시 버전과
+        비교합니다. 버전은 시트 내용이 바뀔 때마다(다른 사용자의 편집, 이
+        프로그램의 P:T 쓰기 포함) 증가하므로, 같으면 Title과 P:T 모두 미러에서
+        가져오고 Sheets API는 호출하지 않습니다. 버전이 다르거나 확인할 수
+        없거나 미러가 오래되었으면 전체를 다시 읽어 미러를 갱신합니다.
+        Title과 P:T는 렌더 옵션이 달라 values.batchGet을 따로 요청합니다.
+        오프라인 모드는 미러만 씁니다.
+
+        Args:
+            refresh: True면 미러를 무시하고 전체 로드
 
         Returns:
-            List[Tuple[int, str]]: [(행 번호, 제목), ...]
+            SheetModel: 시트 모델
+
+        Raises:
+            SheetsClientError: 오프라인 모드인데 미러가 없는 경우
         """
-        range_name = f"{self.config.sheet_name}!{self.config.title_column}:{self.config.title_column}"
+        entry = None
+        if self.mirror is not None:
+            entry = self.mirror.load(self.config.spreadsheet_id, self.config.sheet_name)
+
+        if self.config.sheet_offline:
+            if entry is None:
+                raise SheetsClientError(f"오프라인 모드: 시트 미러가 없습니다 ({self.config.sheet_mirror_path})")
+            entry.model.from_mirror = True
+            self._model = entry.model
+            logger.info(f"시트 미러에서 {len(entry.model.titles)}개 Title 로드 (오프라인)")
+            return entry.model
+
+        # 데이터보다 먼저 버전을 읽어야 그 사이의 편집이 다음 실행에서 감지됨
+        version = self._sheet_version() if self.mirror is not None else ""
+
+        model = None
+        if entry is not None and not refresh and self._mirror_usable(entry, version):
+            model = self._load_from_mirror(entry)
+
+        if model is None:
+            model = self._load_full()
+            if self.mirror is not None:
+                self.mirror.save(
+                    self.config.spreadsheet_id,
+                    self.config.sheet_name,
+                    model,
+                    self.config.title_column,
+                    version=version,
+                )
+
+        self._model = model
+        return model
+
+    def _mirror_usable(self, entry: MirrorEntry, version: str) -> bool:
+        """미러를 그대로 쓸 수 있는지 여부 (설정/Title 열/파일 버전/경과 시간)"""
+        if self.config.sheet_mirror_validation != "version":
+            return False
+        if entry.title_column != self.config.title_column:
+            return False
+        if not version or entry.version != version:
+            logger.info("시트가 미러 저장 이후 변경되어 전체 로드합니다.")
+            return False
+        max_age = self.config.sheet_mirror_max_age
+        if max_age and entry.age > max_age:
+            logger.info(f"시트 미러가 {entry.age / 3600:.1f}시간 지나 전체 로드합니다.")
+            return False
+        return True
+
+    def _sheet_version(self) -> str:
+        """Drive 파일 버전 (확인할 수 없으면 "")
+
+        Drive API가 꺼져 있거나 권한이 없으면 경고만 남기고 전체 로드합니다.
+        """
+        if self.config.sheet_mirror_validation != "version" or self._drive is None:
+            return ""
+
+        try:
+            result = self._with_retry(
+                self._drive.files()
+                .get(fileId=self.config.spreadsheet_id, fields="version", supportsAllDrives=True)
+                .execute
+            )
+        except SheetsClientError as e:
+            logger.warning(f"시트 파일 버전 확인 실패, 전체 로드합니다: {e}")
+            return ""
+        return str(result.get("version", ""))
+
+    def _load_from_mirror(self, entry: MirrorEntry) -> SheetModel:
+        """버전이 같은 미러의 Title과 P:T 값으로 시트 모델 생성"""
+        model = SheetModel(
+            titles=list(entry.model.titles),
+            states=dict(entry.model.states),
+            row_count=entry.model.row_count,
+            from_mirror=True,
+        )
+        logger.info(f"시트 미러에서 {len(model.titles)}개 Title, {len(model.states)}개 행 상태 로드 (버전 {entry.version})")
+        return model
+
+    def _load_full(self) -> SheetModel:
+        """Title 열, P:T 열, 행 수를 values.batchGet으로 읽기
+
+        A열~Title 열은 표시 값으로, P:T 열은 수식 그대로 요청합니다 (렌더 옵션이
+        달라 batchGet 두 번).
+
+        Returns:
+            SheetModel: 시트 모델
+        """
+        sheet = self.config.sheet_name
+        title_index = column_index(self.config.title_column)
+
+        title_ranges = self._batch_get([f"{sheet}!A:{column_letters(max(title_index, 0))}"])
+        state_ranges = self._batch_get(
+            [f"{sheet}!{self.config.checkbox_column}:{self.config.duplicate_column}"], formulas=True
+        )
+        title_values = title_ranges[0].get("values", []) if title_ranges else []
+        state_values = state_ranges[0].get("values", []) if state_ranges else []
+
+        model = SheetModel(row_count=len(title_values), states=self._parse_states(state_values))
+
+        # 데이터 시작 행부터 처리 (헤더 제외)
+        for i, row in enumerate(title_values, start=1):
+            if i < self.config.data_start_row:
+                continue
+            if len(row) > title_index and row[title_index] not in ("", None):  # 빈 셀 제외
+                model.titles.append((i, cell_text(row[title_index])))
+
+        logger.info(f"시트에서 {len(model.titles)}개 Title, {len(model.states)}개 행 상태 로드 완료")
+        return model
+
+    def _batch_get(self, ranges: List[str], formulas: bool = False) -> List[Dict[str, Any]]:
+        """values.batchGet 호출
 
+        기본은 화면에 보이는 값(FORMATTED_VALUE)이라 수식으로 만든 Title도 표시
+        문자열로 매칭됩니다. formulas=True(P:T 열)면 수식은 수식 그대로(FORMULA),
+        날짜는 표시 문자열(FORMATTED_STRING)로 받아 batch_update가 쓰는 값과
+        직접 비교할 수 있게 합니다.
+
+        Args:
+            ranges: A1 표기 범위 목록
+            formulas: True면 수식 그대로 받기
+        """
+        options = {"valueRenderOption": "FORMULA", "dateTimeRenderOption": "FORMATTED_STRING"} if formulas else {}
         result = self._with_retry(
             self._service.spreadsheets()
             .values()
-            .get(spreadsheetId=self.config.spreadsheet_id, range=range_name)
+            .batchGet(spreadsheetId=self.config.spreadsheet_id, ranges=ranges, **options)
             .execute
         )
+        return result.get("valueRanges", [])
 
-        values = result.get("values", [])
-        data = []
-
-        # 데이터 시작 행부터 처리 (헤더 제외)
+    def _parse_states(self, values: List[List[Any]]) -> Dict[int, RowState]:
+        """P:T 열 값 (1행부터) -> {행 번호: RowState} (데이터 시작 행부터, 빈 행 제외)"""
+        states = {}
         for i, row in enumerate(values, start=1):
-            if i < self.config.data_start_row:
-                continue
-            if row and row[0]:  # 빈 셀 제외
-                data.append((i, row[0]))
+            if i >= self.config.data_start_row and row:
+                states[i] = RowState(*(cell_text(value) for value in row[:5]))
+        return states
+
+    @property
+    def model(self) -> SheetModel:
+        """시트 모델 (없거나 쓰기 이후면 다시 로드)"""
+        if self._model is None:
+            return self.load_sheet()
+        return self._model
 
-        logger.info(f"시트에서 {len(data)}개 Title 로드 완료")
-        return data
+    def invalidate(self):
+        """시트 모델 무효화 (다음 조회에서 다시 로드)"""
+        self._model = None
+
+    def get_title_column(self) -> List[Tuple[int, str]]:
+        """Title 열(B열) 데이터 가져오기
+
+        Returns:
+            List[Tuple[int, str]]: [(행 번호, 제목), ...]
+        """
+        return list(self.model.titles)
 
     def get_current_values(self, rows: List[int]) -> Dict[int, Tuple[bool, str]]:
         """지정된 행들의 현재 P열, Q열 값 가져오기
@@ -146,34 +320,43 @@ class SheetsClient:
         Returns:
             Dict[int, Tuple[bool, str]]: {행 번호: (체크박스 값, 날짜 값)}
         """
-        if not rows:
-            return {}
+        model = self.model
+        return {row: (model.state(row).is_checked, model.state(row).date) for row in rows}
 
-        # P열과 Q열 범위
-        min_row = min(rows)
-        max_row = max(rows)
-        range_name = (
-            f"{self.config.sheet_name}!"
-            f"{self.config.checkbox_column}{min_row}:{self.config.date_column}{max_row}"
-        )
+    def get_row_states(self) -> Dict[int, RowState]:
+        """P:T 열 현재 값
 
-        result = self._with_retry(
-            self._service.spreadsheets()
-            .values()
-            .get(spreadsheetId=self.config.spreadsheet_id, range=range_name)
-            .execute
-        )
+        Returns:
+            Dict[int, RowState]: {행 번호: 현재 값} (값이 하나도 없는 행은 제외)
+        """
+        return dict(self.model.states)
 
-        values = result.get("values", [])
-        data = {}
+    @staticmethod
+    def format_row(update: Dict[str, Any]) -> List[str]:
+        """업데이트 항목을 P, Q, R, S 열 쓰기 값으로 변환
 
-        for i, row in enumerate(values, start=min_row):
-            if i in rows:
-                checkbox = row[0].upper() == "TRUE" if row else False
-                date_val = row[1] if len(row) > 1 else ""
-                data[i] = (checkbox, date_val)
+        Args:
+            update: {"checkbox": bool, "date": str, "subfolder": str, "full_path": str}
 
-        return data
+        Returns:
+            List[str]: [체크박스, 날짜, 서브폴더, 하이퍼링크 수식]
+        """
+        # S열 하이퍼링크 수식 생성
+        full_path = update.get("full_path", "")
+        if full_path:
+            # Windows 경로를 file:/// URL로 변환
+            file_url = "file:///" + full_path.replace("\\", "/")
+            hyperlink = f'=HYPERLINK("{file_url}", "열기")'
+        else:
+            hyperlink = ""
+
+        # P, Q, R, S 순서로 4개 값
+        return [
+            str(update["checkbox"]).upper(),  # P열: 체크박스
+            update["date"],                    # Q열: 날짜
+            update.get("subfolder", ""),       # R열: 서브폴더
+            hyperlink,                         # S열: NAS 링크
+        ]
 
     def update_row(self, row: int, checkbox_value: bool, date_value: str) -> None:
         """단일 행의 P열(체크박스)과 Q열(날짜) 업데이트
@@ -201,6 +384,7 @@ class SheetsClient:
             )
             .execute
         )
+        self.invalidate()
 
     def batch_update(self, updates: List[Dict[str, Any]]) -> int:
         """여러 행 일괄 업데이트 (P, Q, R, S 열)
@@ -214,47 +398,7 @@ class SheetsClient:
         if not updates:
             return 0
 
-        data = []
-        for update in updates:
-            row = update["row"]
-            # P:S 범위 (P, Q, R, S = 4개 열)
-            range_name = (
-                f"{self.config.sheet_name}!"
-                f"{self.config.checkbox_column}{row}:{self.config.path_column}{row}"
-            )
-
-            # S열 하이퍼링크 수식 생성
-            full_path = update.get("full_path", "")
-            if full_path:
-                # Windows 경로를 file:/// URL로 변환
-                file_url = "file:///" + full_path.replace("\\", "/")
-                hyperlink = f'=HYPERLINK("{file_url}", "열기")'
-            else:
-                hyperlink = ""
-
-            # P, Q, R, S 순서로 4개 값
-            data.append(
-                {
-                    "range": range_name,
-                    "values": [[
-                        str(update["checkbox"]).upper(),  # P열: 체크박스
-                        update["date"],                    # Q열: 날짜
-                        update.get("subfolder", ""),       # R열: 서브폴더
-                        hyperlink                          # S열: NAS 링크
-                    ]],
-                }
-            )
-
-        body = {"valueInputOption": "USER_ENTERED", "data": data}
-
-        result = self._with_retry(
-            self._service.spreadsheets()
-            .values()
-            .batchUpdate(spreadsheetId=self.config.spreadsheet_id, body=body)
-            .execute
-        )
-
-        updated_cells = result.get("totalUpdatedCells", 0)
+        updated_cells = self.batch_write(updates)
         logger.info(f"{len(updates)}개 행 업데이트 완료 ({updated_cells}개 셀)")
         return updated_cells
 
@@ -271,28 +415,63 @@ class SheetsClient:
         if not rows:
             return 0
 
-        data = []
-        for row in rows:
-            range_name = (
-                f"{self.config.sheet_name}!"
-                f"{self.config.duplicate_column}{row}"
-            )
-            data.append({
-                "range": range_name,
-                "values": [[str(value).upper()]]
-            })
+        updated_cells = self.batch_write(duplicate_rows=rows, duplicate_value=value)
+        logger.info(f"중복 컬럼({self.config.duplicate_column}열) {len(rows)}개 행 업데이트 완료")
+        return updated_cells
 
-        body = {"valueInputOption": "USER_ENTERED", "data": data}
+    def batch_write(
+        self,
+        updates: Optional[List[Dict[str, Any]]] = None,
+        duplicate_rows: Optional[List[int]] = None,
+        duplicate_value: bool = True,
+    ) -> int:
+        """P:S 행 업데이트와 T열 중복 표시를 한 번에 쓰기
 
-        result = self._with_retry(
-            self._service.spreadsheets()
-            .values()
-            .batchUpdate(spreadsheetId=self.config.spreadsheet_id, body=body)
-            .execute
-        )
+        인접한 행/열을 범위 블록으로 합치고, 요청 크기 한도 안에서
+        가능한 한 적은 values.batchUpdate 요청으로 보냅니다.
 
-        updated_cells = result.get("totalUpdatedCells", 0)
-        logger.info(f"중복 컬럼({self.config.duplicate_column}열) {len(rows)}개 행 업데이트 완료")
+        Args:
+            updates: P:S 업데이트 목록 (batch_update와 같은 형식)
+            duplicate_rows: T열에 표시할 행 번호 목록
+            duplicate_value: T열 체크박스 값
+
+        Returns:
+            int: 업데이트된 셀 수
+        """
+        planner = WritePlanner(self.config.sheet_name)
+        for update in updates or []:
+            planner.add_row(update["row"], self.config.checkbox_column, self.format_row(update))
+        for row in duplicate_rows or []:
+            planner.add_row(row, self.config.duplicate_column, [str(duplicate_value).upper()])
+
+        return self.apply_plan(planner)
+
+    def apply_plan(self, planner: WritePlanner) -> int:
+        """쓰기 계획 실행
+
+        Args:
+            planner: 쓸 셀이 담긴 WritePlanner
+
+        Returns:
+            int: 업데이트된 셀 수
+        """
+        requests = planner.requests()
+        updated_cells = 0
+
+        for data in requests:
+            body = {"valueInputOption": "USER_ENTERED", "data": data}
+            result = self._with_retry(
+                self._service.spreadsheets()
+                .values()
+                .batchUpdate(spreadsheetId=self.config.spreadsheet_id, body=body)
+                .execute
+            )
+            updated_cells += result.get("totalUpdatedCells", 0)
+
+        if requests:
+            self.invalidate()
+            ranges = sum(len(data) for data in requests)
+            logger.info(f"{len(planner)}개 셀을 {ranges}개 범위, {len(requests)}회 요청으로 업데이트")
         return updated_cells
 
     def reset_duplicate_column(self, start_row: int = 2, end_row: int = None) -> int:
@@ -330,6 +509,7 @@ class SheetsClient:
             )
             .execute
         )
+        self.invalidate()
 
         logger.info(f"중복 컬럼({self.config.duplicate_column}열) {num_rows}개 행 초기화 완료")
         return num_rows
@@ -338,19 +518,9 @@ class SheetsClient:
         """시트의 총 행 수 반환
 
         Returns:
-            int: 총 행 수
+            int: 총 행 수 (A열~Title 열 중 값이 있는 마지막 행)
         """
-        range_name = f"{self.config.sheet_name}!A:A"
-
-        result = self._with_retry(
-            self._service.spreadsheets()
-            .values()
-            .get(spreadsheetId=self.config.spreadsheet_id, range=range_name)
-            .execute
-        )
-
-        values = result.get("values", [])
-        return len(values)
+        return self.model.row_count
 
     def reset_all_rows(self, start_row: int = 2, end_row: int = None) -> int:
         """모든 행의 P열(체크박스)을 FALSE로, Q, R, S열을 비우기
@@ -389,6 +559,7 @@ class SheetsClient:
             )
             .execute
         )
+        self.invalidate()
 
         logger.info(f"{num_rows}개 행 초기화 완료 (P열=FALSE, Q,R,S열=빈값)")
         return num_rows
@@ -19,11 +19,18 @@ class SyncConfig:
 
     # NAS 설정
     nas_folder: str = field(default="X:\\GGP Footage\\HCL Clips")
+    nas_cache_ttl: float = field(default=0.0)  # 스캔 스냅샷 유효 시간 (초, 0 = 무효화 전까지 유지)
+    nas_manifest_path: str = field(default="logs/nas_manifest.json")  # 증분 스캔 매니페스트 (빈 값 = 전체 스캔)
+    nas_scan_workers: int = field(default=4)  # 폴더 동시 조회 스레드 수 (1 = 순차 탐색)
 
     # Google Sheets 설정
     credentials_path: str = field(default="D:\\AI\\claude01\\json\\service_account_key.json")
     spreadsheet_id: str = field(default="1h27Ha7pR-iYK_Gik8F4FfSvsk4s89sxk49CsU3XP_m4")
     sheet_name: str = field(default="HCL_Clips")
+    sheet_mirror_path: str = field(default="logs/sheet_mirror.db")  # 로컬 시트 미러 (빈 값 = 사용 안함)
+    sheet_mirror_validation: str = field(default="version")  # version: Drive 파일 버전 비교, full: 항상 전체 로드
+    sheet_mirror_max_age: float = field(default=86400.0)  # 이 시간(초)이 지나면 전체 로드 (0 = 제한 없음)
+    sheet_offline: bool = field(default=False)  # True면 API 없이 미러만 사용 (dry-run 전용)
 
     # 열 매핑
     title_column: str = field(default="B")
@@ -37,13 +44,21 @@ class SyncConfig:
     date_format: str = field(default="%Y-%m-%d")
 
     # API 설정
-    api_delay: float = field(default=1.2)
+    api_user_quota: int = field(default=60)  # 분당 요청 한도 (유저)
+    api_project_quota: int = field(default=300)  # 분당 요청 한도 (프로젝트)
+    api_burst: int = field(default=10)  # 대기 없이 연속으로 보낼 수 있는 요청 수
     max_retries: int = field(default=5)
 
     # 유사도 매칭 설정
     fuzzy_enabled: bool = field(default=True)
     similarity_threshold: float = field(default=0.85)
     fuzzy_method: str = field(default="token_sort_ratio")
+    match_cache_path: str = field(default="logs/match_cache.db")  # 유사도 매칭 결과 캐시 (빈 값 = 사용 안함)
+    strip_common_affixes: bool = field(default=True)  # 유사도 계산 전 공통 접두사/접미사(채널명 등) 제거
+
+    # 증분 동기화 설정
+    incremental_sync: bool = field(default=True)  # 바뀌지 않은 파일은 지난 매칭 결과 재사용
+    sync_state_path: str = field(default="logs/sync_state.json")  # 증분 동기화 상태 (빈 값 = 사용 안함)
 
     # 중복 감지 설정
     duplicate_detection: bool = field(default=True)
@@ -56,6 +71,14 @@ class SyncConfig:
     cleanup_size_variance: float = field(default=0.10)  # 크기 차이 10%
     cleanup_audit_log: str = field(default="logs/deletion_audit.json")
     cleanup_require_confirmation: bool = field(default=True)  # 확인 필요
+    cleanup_content_fingerprint: bool = field(default=False)  # 크기 범위 대신 내용 지문으로 검증 (opt-in)
+    cleanup_fingerprint_cache: str = field(default="logs/fingerprint_cache.json")  # 내용 지문 캐시 (빈 값 = 사용 안함)
+    cleanup_fingerprint_workers: int = field(default=4)  # 표본 블록/미디어 헤더를 동시에 읽을 스레드 수
+    cleanup_duration_tolerance: Optional[float] = field(default=None)  # 재생 시간 허용 차이 (초, None = 비교 안함)
+    cleanup_media_probe_cache: str = field(default="logs/media_probe_cache.json")  # 미디어 헤더 캐시 (빈 값 = 사용 안함)
+    cleanup_size_window: bool = field(default=False)  # 삭제될 수 있는 크기 범위 안의 파일끼리만 파일명 비교 (그룹 결과가 달라짐)
+    cleanup_dedupe_mode: str = field(default="delete")  # 중복 정리 방식 (delete / quarantine / hardlink / reflink)
+    cleanup_quarantine_retention_days: float = field(default=14.0)  # 격리 파일 보관 기간 (일)
 
     def __post_init__(self):
         """환경변수와 config.ini에서 설정 로드"""
@@ -80,6 +103,12 @@ class SyncConfig:
         # NAS 설정
         if "NAS_FOLDER" in section:
             self.nas_folder = section["NAS_FOLDER"]
+        if "NAS_CACHE_TTL" in section:
+            self.nas_cache_ttl = float(section["NAS_CACHE_TTL"])
+        if "NAS_MANIFEST" in section:
+            self.nas_manifest_path = section["NAS_MANIFEST"].strip()
+        if "NAS_SCAN_WORKERS" in section:
+            self.nas_scan_workers = int(section["NAS_SCAN_WORKERS"])
 
         # Google Sheets 설정
         if "CREDENTIALS_PATH" in section:
@@ -88,6 +117,12 @@ class SyncConfig:
             self.spreadsheet_id = section["SPREADSHEET_ID"]
         if "SHEET_NAME" in section:
             self.sheet_name = section["SHEET_NAME"]
+        if "SHEET_MIRROR" in section:
+            self.sheet_mirror_path = section["SHEET_MIRROR"].strip()
+        if "SHEET_MIRROR_VALIDATION" in section:
+            self.sheet_mirror_validation = section["SHEET_MIRROR_VALIDATION"].strip().lower()
+        if "SHEET_MIRROR_MAX_AGE" in section:
+            self.sheet_mirror_max_age = float(section["SHEET_MIRROR_MAX_AGE"])
 
         # 열 매핑
         if "TITLE_COLUMN" in section:
@@ -109,8 +144,12 @@ class SyncConfig:
             self.date_format = section["DATE_FORMAT"].replace("%%", "%")
 
         # API 설정
-        if "API_DELAY" in section:
-            self.api_delay = float(section["API_DELAY"])
+        if "API_USER_QUOTA" in section:
+            self.api_user_quota = int(section["API_USER_QUOTA"])
+        if "API_PROJECT_QUOTA" in section:
+            self.api_project_quota = int(section["API_PROJECT_QUOTA"])
+        if "API_BURST" in section:
+            self.api_burst = int(section["API_BURST"])
         if "MAX_RETRIES" in section:
             self.max_retries = int(section["MAX_RETRIES"])
 
@@ -121,6 +160,16 @@ class SyncConfig:
             self.similarity_threshold = float(section["SIMILARITY_THRESHOLD"])
         if "FUZZY_METHOD" in section:
             self.fuzzy_method = section["FUZZY_METHOD"]
+        if "MATCH_CACHE" in section:
+            self.match_cache_path = section["MATCH_CACHE"].strip()
+        if "STRIP_COMMON_AFFIXES" in section:
+            self.strip_common_affixes = section["STRIP_COMMON_AFFIXES"].lower() in ("true", "1", "yes")
+
+        # 증분 동기화 설정
+        if "INCREMENTAL_SYNC" in section:
+            self.incremental_sync = section["INCREMENTAL_SYNC"].lower() in ("true", "1", "yes")
+        if "SYNC_STATE" in section:
+            self.sync_state_path = section["SYNC_STATE"].strip()
 
         # 중복 감지 설정
         if "DUPLICATE_DETECTION" in section:
@@ -143,6 +192,23 @@ class SyncConfig:
                 self.cleanup_audit_log = cleanup["CLEANUP_AUDIT_LOG"]
             if "CLEANUP_REQUIRE_CONFIRMATION" in cleanup:
                 self.cleanup_require_confirmation = cleanup["CLEANUP_REQUIRE_CONFIRMATION"].lower() in ("true", "1", "yes")
+            if "CLEANUP_CONTENT_FINGERPRINT" in cleanup:
+                self.cleanup_content_fingerprint = cleanup["CLEANUP_CONTENT_FINGERPRINT"].lower() in ("true", "1", "yes")
+            if "CLEANUP_FINGERPRINT_CACHE" in cleanup:
+                self.cleanup_fingerprint_cache = cleanup["CLEANUP_FINGERPRINT_CACHE"]
+            if "CLEANUP_FINGERPRINT_WORKERS" in cleanup:
+                self.cleanup_fingerprint_workers = int(cleanup["CLEANUP_FINGERPRINT_WORKERS"])
+            if "CLEANUP_DURATION_TOLERANCE" in cleanup:
+                tolerance = cleanup["CLEANUP_DURATION_TOLERANCE"].strip()
+                self.cleanup_duration_tolerance = float(tolerance) if tolerance else None
+            if "CLEANUP_MEDIA_PROBE_CACHE" in cleanup:
+                self.cleanup_media_probe_cache = cleanup["CLEANUP_MEDIA_PROBE_CACHE"]
+            if "CLEANUP_SIZE_WINDOW" in cleanup:
+                self.cleanup_size_window = cleanup["CLEANUP_SIZE_WINDOW"].lower() in ("true", "1", "yes")
+            if "CLEANUP_DEDUPE_MODE" in cleanup:
+                self.cleanup_dedupe_mode = cleanup["CLEANUP_DEDUPE_MODE"].strip().lower()
+            if "CLEANUP_QUARANTINE_RETENTION_DAYS" in cleanup:
+                self.cleanup_quarantine_retention_days = float(cleanup["CLEANUP_QUARANTINE_RETENTION_DAYS"])
 
     def _load_from_env(self):
         """환경변수에서 설정 로드 (최우선)"""
@@ -181,12 +247,28 @@ class SyncConfig:
         if not self.nas_folder:
             errors.append("NAS_FOLDER가 설정되지 않았습니다.")
 
-        # 인증 파일 경로 확인
-        if not self.credentials_path:
+        # 인증 파일 경로 확인 (오프라인 모드는 미러만 사용)
+        if self.sheet_offline:
+            if not self.sheet_mirror_path:
+                errors.append("오프라인 모드에는 SHEET_MIRROR 설정이 필요합니다.")
+        elif not self.credentials_path:
             errors.append("CREDENTIALS_PATH가 설정되지 않았습니다.")
         elif not Path(self.credentials_path).exists():
             errors.append(f"인증 파일이 존재하지 않습니다: {self.credentials_path}")
 
+        # 토큰 버킷은 버스트 1개 + 보충 속도가 필요하므로 분당 2회 이상
+        for key, quota in (("API_USER_QUOTA", self.api_user_quota), ("API_PROJECT_QUOTA", self.api_project_quota)):
+            if quota < 2:
+                errors.append(f"{key}는 2 이상이어야 합니다: {quota}")
+
+        if self.sheet_mirror_validation not in ("version", "full"):
+            errors.append(f"SHEET_MIRROR_VALIDATION은 version 또는 full이어야 합니다: {self.sheet_mirror_validation}")
+
+        if self.cleanup_dedupe_mode not in ("delete", "quarantine", "hardlink", "reflink"):
+            errors.append(
+                f"CLEANUP_DEDUPE_MODE는 delete, quarantine, hardlink, reflink 중 하나여야 합니다: {self.cleanup_dedupe_mode}"
+            )
+
         # Spreadsheet ID 확인
         if not self.spreadsheet_id:
             errors.append("SPREADSHEET_ID가 설정되지 않았습니다.")
@@ -0,0 +1,141 @@
+"""증분 동기화 상태 모듈
+
+지난 동기화의 파일별 매칭 결과(행 번호, 매칭 유형, 점수)와 파일 크기/수정 시간,
+그리고 당시 시트 Title 열을 저장합니다. 다음 실행은 바뀌지 않은 파일의 매칭을
+재사용하고, 새 파일/변경된 파일과 새 행/수정된 행 사이의 쌍만 다시 비교합니다.
+"""
+
+import json
+import logging
+import os
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class FileMatchRecord:
+    """파일 한 개의 지난 매칭 결과"""
+
+    filename: str  # 원본 파일명 (확장자 제외)
+    size: int  # 파일 크기 (bytes)
+    mtime: float  # 수정 시간 (epoch 초)
+    row: int = -1  # 매칭된 행 번호 (-1이면 매칭 실패)
+    match_type: str = "none"  # "exact", "normalized", "normalized_aggressive", "fuzzy", "none"
+    score: float = 0.0
+    title: str = ""  # 매칭 당시 행의 제목
+
+    @property
+    def matched(self) -> bool:
+        return self.row >= 0
+
+
+@dataclass
+class SyncState:
+    """지난 동기화 상태"""
+
+    titles: Dict[int, str] = field(default_factory=dict)  # {행 번호: 제목}
+    files: Dict[str, FileMatchRecord] = field(default_factory=dict)  # {정규화된 파일명: 매칭 결과}
+
+    def changed_rows(self, titles: Dict[int, str]) -> Set[int]:
+        """지난 실행 이후 새로 생기거나 제목이 바뀐 행
+
+        Args:
+            titles: 현재 {행 번호: 제목}
+
+        Returns:
+            Set[int]: 다시 비교해야 할 행 번호
+        """
+        return {row for row, title in titles.items() if self.titles.get(row) != title}
+
+    def reusable(self, key: str, filename: str, size: int, mtime: float, titles: Dict[int, str]) -> Optional[FileMatchRecord]:
+        """재사용할 수 있는 지난 매칭 결과
+
+        파일명, 크기, 수정 시간이 같고, 매칭된 행의 제목이 그대로일 때만 재사용합니다.
+
+        Args:
+            key: 정규화된 파일명
+            filename: 원본 파일명
+            size: 현재 파일 크기
+            mtime: 현재 수정 시간 (epoch 초)
+            titles: 현재 {행 번호: 제목}
+
+        Returns:
+            Optional[FileMatchRecord]: 재사용할 결과 (없으면 None)
+        """
+        record = self.files.get(key)
+        if record is None or (record.filename, record.size, record.mtime) != (filename, size, mtime):
+            return None
+        if record.matched and titles.get(record.row) != record.title:
+            return None
+        return record
+
+
+class SyncStateFile:
+    """증분 동기화 상태 파일
+
+    시트, 매칭 설정이 저장 당시와 다르면 상태를 사용하지 않습니다.
+    """
+
+    VERSION = 1
+
+    def __init__(self, path: str, settings: Dict[str, Any]):
+        """SyncStateFile 초기화
+
+        Args:
+            path: 상태 파일 경로
+            settings: 매칭 결과에 영향을 주는 설정 (스프레드시트, 시트, 임계값 등)
+        """
+        self.path = Path(path)
+        self.settings = settings
+
+    def load(self) -> Optional[SyncState]:
+        """저장된 상태 로드
+
+        Returns:
+            Optional[SyncState]: 상태 (없거나 설정이 다르면 None)
+        """
+        if not self.path.exists():
+            return None
+
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (json.JSONDecodeError, OSError) as e:
+            logger.warning(f"동기화 상태 로드 실패, 전체 매칭: {e}")
+            return None
+
+        if data.get("version") != self.VERSION or data.get("settings") != self.settings:
+            logger.info("동기화 상태가 현재 설정과 달라 전체 매칭합니다.")
+            return None
+
+        try:
+            return SyncState(
+                titles={int(row): title for row, title in data.get("titles", {}).items()},
+                files={key: FileMatchRecord(**record) for key, record in data.get("files", {}).items()},
+            )
+        except (TypeError, ValueError) as e:
+            logger.warning(f"동기화 상태 형식 오류, 전체 매칭: {e}")
+            return None
+
+    def save(self, state: SyncState):
+        """상태 저장 (임시 파일에 쓴 뒤 교체)
+
+        Args:
+            state: 저장할 상태
+        """
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        data = {
+            "version": self.VERSION,
+            "settings": self.settings,
+            "titles": {str(row): title for row, title in state.titles.items()},
+            "files": {key: asdict(record) for key, record in state.files.items()},
+        }
+
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False)
+        os.replace(tmp_path, self.path)
@@ -0,0 +1,177 @@
+"""Sheets 쓰기 계획 모듈
+
+셀 단위 쓰기를 모아 같은 행의 인접한 열은 가로로, 같은 열 구간의 연속된
+행은 세로로 합쳐 사각형 범위로 만들고, 요청 크기 한도 안에서 최대한 많은
+범위를 한 번의 values.batchUpdate 요청에 담습니다.
+"""
+
+import json
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Tuple
+
+
+def column_index(letters: str) -> int:
+    """열 문자를 0부터 시작하는 열 번호로 변환 (A -> 0, T -> 19, AA -> 26)"""
+    index = 0
+    for ch in letters.upper():
+        index = index * 26 + (ord(ch) - ord("A") + 1)
+    return index - 1
+
+
+def column_letters(index: int) -> str:
+    """0부터 시작하는 열 번호를 열 문자로 변환 (column_index의 역)"""
+    letters = ""
+    index += 1
+    while index:
+        index, rem = divmod(index - 1, 26)
+        letters = chr(ord("A") + rem) + letters
+    return letters
+
+
+@dataclass
+class RangeBlock:
+    """연속된 행/열로 이루어진 쓰기 범위"""
+
+    start_row: int
+    start_col: int
+    values: List[List[Any]] = field(default_factory=list)  # 행별 값 (모두 같은 길이)
+
+    @property
+    def end_row(self) -> int:
+        return self.start_row + len(self.values) - 1
+
+    @property
+    def end_col(self) -> int:
+        return self.start_col + len(self.values[0]) - 1
+
+    def a1(self, sheet_name: str) -> str:
+        """A1 표기 범위 (예: HCL_Clips!P2:S40)"""
+        return (
+            f"{sheet_name}!"
+            f"{column_letters(self.start_col)}{self.start_row}:"
+            f"{column_letters(self.end_col)}{self.end_row}"
+        )
+
+
+class WritePlanner:
+    """셀 쓰기를 범위 블록과 batchUpdate 요청 단위로 묶는 계획기"""
+
+    # values.batchUpdate 요청 본문 크기 한도 (Google 권장 2MB)
+    MAX_REQUEST_BYTES = 2 * 1024 * 1024
+
+    def __init__(self, sheet_name: str, max_request_bytes: int = MAX_REQUEST_BYTES):
+        """WritePlanner 초기화
+
+        Args:
+            sheet_name: 시트 이름
+            max_request_bytes: 요청 하나의 최대 본문 크기 (바이트)
+        """
+        self.sheet_name = sheet_name
+        self.max_request_bytes = max_request_bytes
+        self._cells: Dict[Tuple[int, int], Any] = {}  # {(행, 열 번호): 값}
+
+    def add_row(self, row: int, start_column: str, values: List[Any]):
+        """한 행의 연속된 열 값 추가 (같은 셀을 다시 쓰면 나중 값이 남음)
+
+        Args:
+            row: 행 번호
+            start_column: 시작 열 문자
+            values: 시작 열부터 오른쪽으로 쓸 값
+        """
+        start = column_index(start_column)
+        for offset, value in enumerate(values):
+            self._cells[(row, start + offset)] = value
+
+    def __len__(self) -> int:
+        """쓸 셀 수"""
+        return len(self._cells)
+
+    def blocks(self) -> List[RangeBlock]:
+        """셀을 사각형 범위 블록으로 병합
+
+        행마다 인접한 열을 한 구간으로 묶은 뒤, 같은 열 구간을 가진 연속된
+        행을 한 블록으로 합칩니다.
+
+        Returns:
+            List[RangeBlock]: (시작 행, 시작 열) 순서의 블록 목록
+        """
+        # 1. 행별 연속 열 구간
+        segments: Dict[Tuple[int, int], List[Tuple[int, List[Any]]]] = {}  # {(시작 열, 끝 열): [(행, 값)]}
+        row = start = prev = None
+        values: List[Any] = []
+        for r, c in sorted(self._cells):
+            if r == row and c == prev + 1:
+                values.append(self._cells[(r, c)])
+            else:
+                if row is not None:
+                    segments.setdefault((start, prev), []).append((row, values))
+                row, start, values = r, c, [self._cells[(r, c)]]
+            prev = c
+        if row is not None:
+            segments.setdefault((start, prev), []).append((row, values))
+
+        # 2. 같은 열 구간의 연속된 행 병합
+        blocks: List[RangeBlock] = []
+        for (start_col, _), rows in sorted(segments.items()):
+            block = None
+            for r, row_values in rows:
+                if block is not None and r == block.end_row + 1:
+                    block.values.append(row_values)
+                else:
+                    block = RangeBlock(start_row=r, start_col=start_col, values=[row_values])
+                    blocks.append(block)
+
+        blocks.sort(key=lambda b: (b.start_row, b.start_col))
+        return blocks
+
+    def requests(self) -> List[List[Dict[str, Any]]]:
+        """batchUpdate 요청별 ValueRange 목록
+
+        블록을 순서대로 담다가 본문 크기가 한도를 넘으면 새 요청을 시작합니다.
+        블록 하나가 한도보다 크면 행 단위로 나눕니다.
+
+        Returns:
+            List[List[Dict]]: [[{"range": A1, "values": [[...]]}, ...], ...]
+        """
+        batches: List[List[Dict[str, Any]]] = []
+        batch: List[Dict[str, Any]] = []
+        size = 0
+
+        for block in self._split_oversized(self.blocks()):
+            value_range = {"range": block.a1(self.sheet_name), "values": block.values}
+            range_size = self._size(value_range)
+            if batch and size + range_size > self.max_request_bytes:
+                batches.append(batch)
+                batch, size = [], 0
+            batch.append(value_range)
+            size += range_size
+
+        if batch:
+            batches.append(batch)
+        return batches
+
+    def _split_oversized(self, blocks: List[RangeBlock]) -> List[RangeBlock]:
+        """요청 크기 한도보다 큰 블록을 행 단위로 분할"""
+        result = []
+        for block in blocks:
+            if self._size({"range": block.a1(self.sheet_name), "values": block.values}) <= self.max_request_bytes:
+                result.append(block)
+                continue
+
+            part = RangeBlock(start_row=block.start_row, start_col=block.start_col)
+            size = 0
+            for offset, row_values in enumerate(block.values):
+                row_size = self._size(row_values)
+                if part.values and size + row_size > self.max_request_bytes:
+                    result.append(part)
+                    part = RangeBlock(start_row=block.start_row + offset, start_col=block.start_col)
+                    size = 0
+                part.values.append(row_values)
+                size += row_size
+            result.append(part)
+        return result
+
+    @staticmethod
+    def _size(value: Any) -> int:
+        """JSON 직렬화 크기 (바이트)"""
+        return len(json.dumps(value, ensure_ascii=False).encode("utf-8")) + 2
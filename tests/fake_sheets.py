@@ -0,0 +1,151 @@
+"""테스트용 가짜 Google Sheets 서비스
+
+spreadsheets().values()의 get / batchGet / update / batchUpdate 호출을
+메모리상의 격자에 적용하고 호출 내역을 기록합니다. Drive files().get은
+격자 내용이 바뀔 때마다 달라지는 파일 버전을 돌려줍니다.
+"""
+
+import re
+import zlib
+from typing import Any, Dict, List, Tuple
+
+from src.sync.rate_limiter import RateLimiter
+from src.sync.sheet_mirror import SheetMirror
+from src.sync.sheets_client import SheetsClient
+from src.sync.sync_config import SyncConfig
+from src.sync.write_planner import column_index
+
+
+def parse_range(a1: str) -> Tuple[str, int, int, int, int]:
+    """'시트!P2:T' 형식 범위 -> (시트, 시작 열, 시작 행, 끝 열, 끝 행)
+
+    행 번호가 없으면 시작 1 / 끝 0(끝까지)으로 반환합니다.
+    """
+    sheet, _, cells = a1.partition("!")
+    start, _, end = cells.partition(":")
+    end = end or start
+    m1 = re.match(r"([A-Z]+)(\d*)", start)
+    m2 = re.match(r"([A-Z]+)(\d*)", end)
+    return (
+        sheet,
+        column_index(m1.group(1)),
+        int(m1.group(2) or 1),
+        column_index(m2.group(1)),
+        int(m2.group(2) or 0),
+    )
+
+
+class _Request:
+    def __init__(self, func):
+        self.execute = func
+
+
+class FakeValues:
+    """spreadsheets().values() 대역"""
+
+    def __init__(self, grid: Dict[Tuple[int, int], Any]):
+        self.grid = grid
+        self.calls: List[Tuple[str, Dict[str, Any]]] = []
+
+    def _read(self, a1: str) -> Dict[str, Any]:
+        _, c1, r1, c2, r2 = parse_range(a1)
+        last_row = r2 or max((r for r, _ in self.grid), default=0)
+        rows = []
+        for r in range(r1, last_row + 1):
+            row = [self.grid.get((r, c), "") for c in range(c1, c2 + 1)]
+            while row and row[-1] == "":
+                row.pop()
+            rows.append(row)
+        while rows and not rows[-1]:
+            rows.pop()
+        return {"range": a1, "values": rows}
+
+    def _write(self, a1: str, values: List[List[Any]]) -> int:
+        _, c1, r1, _, _ = parse_range(a1)
+        cells = 0
+        for dr, row in enumerate(values):
+            for dc, value in enumerate(row):
+                self.grid[(r1 + dr, c1 + dc)] = _entered(value)
+                cells += 1
+        return cells
+
+    def get(self, spreadsheetId, range, **kwargs):
+        self.calls.append(("get", {"range": range, **kwargs}))
+        return _Request(lambda: self._read(range))
+
+    def batchGet(self, spreadsheetId, ranges, **kwargs):
+        self.calls.append(("batchGet", {"ranges": list(ranges), **kwargs}))
+        return _Request(lambda: {"valueRanges": [self._read(r) for r in ranges]})
+
+    def update(self, spreadsheetId, range, valueInputOption, body):
+        self.calls.append(("update", {"range": range, "body": body}))
+        return _Request(lambda: {"updatedCells": self._write(range, body["values"])})
+
+    def batchUpdate(self, spreadsheetId, body):
+        self.calls.append(("batchUpdate", {"body": body}))
+        return _Request(
+            lambda: {"totalUpdatedCells": sum(self._write(d["range"], d["values"]) for d in body["data"])}
+        )
+
+
+def _entered(value: Any) -> Any:
+    """USER_ENTERED 입력 해석 흉내 (TRUE/FALSE -> bool, 정수 -> int)"""
+    if value in ("TRUE", "FALSE"):
+        return value == "TRUE"
+    if isinstance(value, str) and value.isdigit():
+        return int(value)
+    return value
+
+
+class FakeService:
+    """build("sheets", "v4") 대역"""
+
+    def __init__(self, grid: Dict[Tuple[int, int], Any] = None):
+        self.values_api = FakeValues(grid if grid is not None else {})
+
+    def spreadsheets(self):
+        return self
+
+    def values(self):
+        return self.values_api
+
+
+class FakeDrive:
+    """build("drive", "v3") 대역 (files().get의 version만 지원)"""
+
+    def __init__(self, grid: Dict[Tuple[int, int], Any]):
+        self.grid = grid
+        self.calls: List[Dict[str, Any]] = []
+
+    def files(self):
+        return self
+
+    def get(self, fileId, fields, **kwargs):
+        self.calls.append({"fileId": fileId, "fields": fields, **kwargs})
+        return _Request(lambda: {"version": str(zlib.crc32(repr(sorted(self.grid.items())).encode()))})
+
+
+def make_client(
+    grid: Dict[Tuple[int, int], Any] = None,
+    config: SyncConfig = None,
+    mirror: SheetMirror = None,
+) -> SheetsClient:
+    """가짜 서비스를 쓰는 SheetsClient (인증/대기 없음, 기본은 미러 없음)"""
+    client = SheetsClient.__new__(SheetsClient)
+    client.config = config or SyncConfig()
+    client.max_retries = 1
+    client.rate_limiter = RateLimiter([])
+    client._service = FakeService(grid)
+    client._drive = FakeDrive(client._service.values_api.grid)
+    client._model = None
+    client.mirror = mirror
+    return client
+
+
+def titles_grid(titles: List[str], start_row: int = 2) -> Dict[Tuple[int, int], Any]:
+    """B열에 제목이 들어 있는 격자 (A열은 번호, 1행은 헤더)"""
+    grid = {(1, 0): "No", (1, 1): "Title"}
+    for i, title in enumerate(titles):
+        grid[(start_row + i, 0)] = i + 1
+        grid[(start_row + i, 1)] = title
+    return grid
@@ -3,13 +3,21 @@
 유사도 매칭, 정규화, 중복 감지 기능을 테스트합니다.
 """
 
+import os
+
 import pytest
-from datetime import datetime
+from datetime import datetime, timedelta
 
 from src.sync.matching import (
+    CandidateIndex,
+    CommonAffixes,
+    ContentFingerprinter,
     FilenameNormalizer,
     FuzzyMatcher,
+    MatchCache,
+    MediaProbe,
     MatchResult,
+    PruneStats,
     DuplicateDetector,
     DuplicateGroup,
     DuplicateCleaner,
@@ -42,6 +50,39 @@ class TestFilenameNormalizer:
         assert FilenameNormalizer.normalize_aggressive("Video-2") == "video"
         assert FilenameNormalizer.normalize_aggressive("Video (copy)") == "video"
 
+    @pytest.mark.parametrize("text, standard, aggressive, core", [
+        ("a (1)_2", "a12", "a1", ("a (1)", "_2")),
+        ("a_2 (1)", "a21", "a", ("a_2", " (1)")),
+        ("Video [dQw4w9WgXcQ].f399", "videodqw4w9wgxcq", "videodqw4w9wgxcq", ("Video [dQw4w9WgXcQ].f399", "")),
+        ("x.f399 [dQw4w9WgXcQ]", "x", "x", ("x.f399 [dQw4w9WgXcQ]", "")),
+        ("Test (copy)\n", "testcopy", "test", ("Test", " (copy)")),
+        ("Clip COPY", "clipcopy", "clip", ("Clip", " COPY")),
+        ("Clip_\u0663", "clip\u0663", "clip", ("Clip", "_\u0663")),
+        ("\uff26\uff55\uff4c\uff4c\u3000\uff37\uff49\uff44\uff54\uff48", "fullwidth", "fullwidth",
+         ("\uff26\uff55\uff4c\uff4c\u3000\uff37\uff49\uff44\uff54\uff48", "")),
+        ("Nbsp\xa0Title\u2009Here", "nbsptitlehere", "nbsptitlehere", ("Nbsp\xa0Title\u2009Here", "")),
+        ("Tab\tand\x1cSep", "tabandsep", "tabandsep", ("Tab\tand\x1cSep", "")),
+        ("Alan's (2) Hand -3", "alans2hand3", "alans2hand", ("Alan's (2) Hand", " -3")),
+        ("", "", "", ("", "")),
+    ])
+    def test_compiled_normalizer_semantics(self, text, standard, aggressive, core):
+        """미리 컴파일한 정규화가 패턴 순차 적용(기존 구현)과 같은 결과"""
+        assert FilenameNormalizer.normalize_standard(text) == standard
+        assert FilenameNormalizer.normalize_aggressive(text) == aggressive
+        assert FilenameNormalizer.extract_core_title(text) == core
+
+        all_levels = FilenameNormalizer.get_all_normalizations(text)
+        assert (all_levels["standard"], all_levels["aggressive"]) == (standard, aggressive)
+        assert (all_levels["core_title"], all_levels["suffix"]) == core
+
+    def test_delete_table_covers_all_whitespace(self):
+        """정규식 \\s가 매치하는 모든 유니코드 공백을 지움"""
+        import re
+        import sys
+
+        spaces = [c for c in range(sys.maxunicode + 1) if re.match(r"\s", chr(c))]
+        assert all(c in FilenameNormalizer._DELETE_TABLE for c in spaces)
+
     def test_extract_core_title(self):
         """핵심 제목 추출 테스트"""
         core, suffix = FilenameNormalizer.extract_core_title("Video (1)")
@@ -143,6 +184,370 @@ class TestFuzzyMatcher:
         assert isinstance(matcher.using_rapidfuzz, bool)
 
 
+class TestMatchCache:
+    """MatchCache 테스트"""
+
+    TITLES = [
+        "Nik Airball Hand 1 @HustlerCasinoLive",
+        "Massive Hero Call Against The Pro",
+        "Huge Pot With Aces",
+    ]
+    FILES = ["Massive Hero Call Agains The Pro", "Nik Airball Hand 1 HustlerCasino", "Something Else"]
+
+    @classmethod
+    def _index(cls, titles=None) -> CandidateIndex:
+        titles = titles or cls.TITLES
+        candidates = {FilenameNormalizer.normalize_basic(t): i + 2 for i, t in enumerate(titles)}
+        originals = {FilenameNormalizer.normalize_basic(t): t for t in titles}
+        return CandidateIndex(candidates, originals)
+
+    @staticmethod
+    def _count_scoring(matcher, monkeypatch):
+        calls = []
+        batch_fuzzy_stage = matcher._batch_fuzzy_stage
+        def counted(filenames, queries, index):
+            calls.append(list(filenames))
+            return batch_fuzzy_stage(filenames, queries, index)
+        monkeypatch.setattr(matcher, "_batch_fuzzy_stage", counted)
+        return calls
+
+    def test_repeated_run_does_no_scoring(self, tmp_path, monkeypatch):
+        """같은 제목/임계값이면 두 번째 실행은 점수 계산 없음"""
+        path = str(tmp_path / "cache.db")
+        first = FuzzyMatcher(threshold=0.85, cache=MatchCache(path))
+        expected = first.batch_find_matches(self.FILES, index=self._index())
+
+        second = FuzzyMatcher(threshold=0.85, cache=MatchCache(path))
+        calls = self._count_scoring(second, monkeypatch)
+        results = second.batch_find_matches(self.FILES, index=self._index())
+
+        assert calls == []
+        assert results == expected
+        assert second.cache.stats.hits == len(self.FILES)
+        assert second.cache.stats.misses == 0
+
+    def test_sequential_path_uses_cache(self, tmp_path):
+        """find_best_match도 캐시 결과를 사용 (원본 파일명은 호출 인자)"""
+        cache = MatchCache(str(tmp_path / "cache.db"))
+        matcher = FuzzyMatcher(threshold=0.85, cache=cache)
+        index = self._index()
+
+        first = matcher.find_best_match("Massive Hero Call Agains The Pro", index=index)
+        second = matcher.find_best_match("massive hero call agains the pro", index=index)
+
+        assert cache.stats.hits == 1
+        assert second.original_filename == "massive hero call agains the pro"
+        assert (second.matched_row, second.score, second.alternatives) == (
+            first.matched_row, first.score, first.alternatives
+        )
+
+    @pytest.mark.parametrize("threshold, titles", [
+        (0.80, None),
+        (0.85, TITLES + ["New Title Added"]),
+        (0.85, list(reversed(TITLES))),
+    ])
+    def test_invalidated_on_change(self, tmp_path, monkeypatch, threshold, titles):
+        """임계값이나 제목 집합(행 위치 포함)이 바뀌면 다시 계산"""
+        path = str(tmp_path / "cache.db")
+        FuzzyMatcher(threshold=0.85, cache=MatchCache(path)).batch_find_matches(self.FILES, index=self._index())
+
+        matcher = FuzzyMatcher(threshold=threshold, cache=MatchCache(path))
+        calls = self._count_scoring(matcher, monkeypatch)
+        matcher.batch_find_matches(self.FILES, index=self._index(titles))
+
+        assert len(calls) == 1
+        assert matcher.cache.stats.hits == 0
+
+    def test_old_generations_pruned(self, tmp_path, monkeypatch):
+        """최근 세대만 남기고 오래된 결과 삭제"""
+        monkeypatch.setattr(MatchCache, "MAX_GENERATIONS", 2)
+        path = str(tmp_path / "cache.db")
+        for threshold in (0.80, 0.85, 0.90):
+            cache = MatchCache(path)
+            FuzzyMatcher(threshold=threshold, cache=cache).batch_find_matches(self.FILES, index=self._index())
+            cache.close()
+
+        cache = MatchCache(path)
+        assert cache.get_many(self._index().fingerprint, 0.80, "token_sort_ratio", ["somethingelse"]) == {}
+        assert cache.get_many(self._index().fingerprint, 0.90, "token_sort_ratio", ["somethingelse"]) != {}
+
+
+class TestCommonAffixes:
+    """CommonAffixes 테스트"""
+
+    SUFFIX = " @HustlerCasinoLive"
+    WORDS = ["Bluff", "River", "Aces", "Kings", "Fold", "Call", "Raise", "Pot", "Turn", "Flop", "Night"]
+
+    @classmethod
+    def _corpus(cls, count: int = 60, with_suffix: float = 0.8):
+        titles = []
+        for i in range(count):
+            title = f"Clip Number {i} {cls.WORDS[i % len(cls.WORDS)]} {cls.WORDS[i * 7 % len(cls.WORDS)]}"
+            if i < count * with_suffix:
+                title += cls.SUFFIX
+            titles.append(title)
+        return titles
+
+    def test_learns_channel_suffix(self):
+        """대부분의 키에 붙은 채널명을 접미사로 학습"""
+        keys = [FilenameNormalizer.normalize_aggressive(t) for t in self._corpus()]
+
+        affixes = CommonAffixes.learn(keys)
+
+        assert affixes.suffixes == ["hustlercasinolive"]
+        assert affixes.prefixes == ["clipnumber"]
+        assert affixes.strip("clipnumber5riverflophustlercasinolive") == "5riverflop"
+
+    def test_small_corpus_learns_nothing(self):
+        """최소 코퍼스 크기 미만이면 학습하지 않음"""
+        keys = [FilenameNormalizer.normalize_aggressive(t) for t in self._corpus(count=10)]
+
+        assert not CommonAffixes.learn(keys)
+
+    def test_rare_suffix_not_learned(self):
+        """출현 비율이 낮은 접미사는 학습하지 않음"""
+        keys = [FilenameNormalizer.normalize_aggressive(t) for t in self._corpus(with_suffix=0.3)]
+
+        assert CommonAffixes.learn(keys).suffixes == []
+
+    def test_never_strips_to_empty(self):
+        """접사만으로 된 키는 그대로 유지"""
+        affixes = CommonAffixes(prefixes=["clip"], suffixes=["hustlercasinolive"])
+
+        assert affixes.strip("hustlercasinolive") == "hustlercasinolive"
+        assert affixes.strip("cliphustlercasinolive") == "clip"
+        assert affixes.strip("clip") == "clip"
+
+    def test_index_scores_without_affixes(self):
+        """접사를 제거하면 숫자만 다른 다른 클립이 유사도 매칭되지 않음"""
+        titles = {"bigpothand17": ("Big Pot Hand 17" + self.SUFFIX, 2)}
+        candidates = {FilenameNormalizer.normalize_basic(t): row for t, row in titles.values()}
+        originals = {FilenameNormalizer.normalize_basic(t): t for t, _ in titles.values()}
+        matcher = FuzzyMatcher(threshold=0.95)
+        filename = "Big Pot Hand 12" + self.SUFFIX
+
+        plain = matcher.find_best_match(filename, index=CandidateIndex(candidates, originals))
+        affixes = CommonAffixes(suffixes=["hustlercasinolive"])
+        stripped = matcher.find_best_match(filename, index=CandidateIndex(candidates, originals, affixes=affixes))
+
+        assert plain.matched
+        assert not stripped.matched
+
+    def test_detector_separates_numbered_clips(self):
+        """중복 감지도 공통 접사를 제거하여 숫자만 다른 클립을 구분"""
+        titles = self._corpus()
+        titles += ["Big Pot Hand 12" + self.SUFFIX, "Big Pot Hand 17" + self.SUFFIX]
+        base = datetime(2024, 1, 1)
+        files = {
+            FilenameNormalizer.normalize_basic(t): (t, base, "", f"/nas/{t}.mp4")
+            for t in titles
+        }
+
+        with_affixes = DuplicateDetector(threshold=0.95).find_duplicates(files)
+        without = DuplicateDetector(threshold=0.95, strip_affixes=False).find_duplicates(files)
+
+        def grouped(groups):
+            return {f[0] for g in groups for f in g.files}
+
+        assert "Big Pot Hand 12" + self.SUFFIX in grouped(without)
+        assert "Big Pot Hand 12" + self.SUFFIX not in grouped(with_affixes)
+
+
+class TestCandidateIndex:
+    """CandidateIndex 테스트"""
+
+    def _build(self):
+        titles = [
+            "Amazing Poker Hand",
+            "Poker-Hand-Review!",
+            "Poker Hand Review",
+            "Big Bluff (1)",
+        ]
+        candidates = {}
+        original_titles = {}
+        for row, title in enumerate(titles, start=2):
+            normalized = FilenameNormalizer.normalize_basic(title)
+            candidates[normalized] = row
+            original_titles[normalized] = title
+        return candidates, original_titles
+
+    def test_keys_keep_first_title(self):
+        """같은 정규화 키는 먼저 나온 제목 유지"""
+        candidates, original_titles = self._build()
+        index = CandidateIndex(candidates, original_titles)
+
+        assert len(index) == 4
+        assert index.standard["pokerhandreview"][1] == 3
+        assert index.aggressive["bigbluff"][1] == 5
+
+    def test_same_results_with_index(self):
+        """인덱스 사용 여부와 관계없이 동일한 결과"""
+        candidates, original_titles = self._build()
+        index = CandidateIndex(candidates, original_titles)
+        matcher = FuzzyMatcher(threshold=0.80)
+
+        filenames = ["Poker Hand Review", "Poker_Hand_Review", "Big Bluff", "Amazing Pokr Hand", "Unrelated"]
+        expected = [matcher.find_best_match(f, candidates, original_titles) for f in filenames]
+
+        assert [matcher.find_best_match(f, index=index) for f in filenames] == expected
+        assert matcher.batch_find_matches(filenames, index=index, vectorized=False) == expected
+        assert expected[1].match_type == "normalized"
+        assert expected[2].match_type == "normalized_aggressive"
+
+    def test_vectorized_batch_matches_sequential(self):
+        """cdist 일괄 매칭이 순차 매칭과 같은 결과인지 확인"""
+        matcher = FuzzyMatcher(threshold=0.60)
+        if not matcher.using_vectorized:
+            pytest.skip("rapidfuzz/numpy 미설치")
+
+        titles = [f"Nik Airball Hand {i} @HustlerCasinoLive" for i in range(12)]
+        titles += ["Wesley Is Getting SNEAKY With Pocket Aces", "Completely Different Clip"]
+        candidates = {FilenameNormalizer.normalize_basic(t): row for row, t in enumerate(titles, start=2)}
+        original_titles = {FilenameNormalizer.normalize_basic(t): t for t in titles}
+        index = CandidateIndex(candidates, original_titles)
+
+        filenames = [
+            "Nik Airball Hand 3 @HustlerCasinoLive",
+            "Nik Airbal Hand 7 @HustlerCasinoLive.f399",
+            "Wesley Is Getting SNEAKY With Pocket Ace",
+            "zzz",
+        ]
+        sequential = matcher.batch_find_matches(filenames, index=index, vectorized=False)
+        vectorized = matcher.batch_find_matches(filenames, index=index, vectorized=True)
+
+        for seq, vec in zip(sequential, vectorized):
+            assert vec.matched == seq.matched
+            assert vec.matched_row == seq.matched_row
+            assert vec.match_type == seq.match_type
+            assert vec.alternatives == seq.alternatives
+            if seq.alternatives:
+                assert vec.score == seq.score
+
+        # 동점 대안이 많아도 상위 5개만, 시트 순서대로
+        assert len(vectorized[1].alternatives) == 5
+
+    def test_requires_candidates_or_index(self):
+        """후보와 인덱스가 모두 없으면 에러"""
+        with pytest.raises(ValueError):
+            FuzzyMatcher().find_best_match("Test Video")
+
+
+class TestNGramIndex:
+    """NGramIndex 후보 필터 테스트"""
+
+    def _corpus(self):
+        import random
+
+        rng = random.Random(7)
+        words = ["poker", "hand", "bluff", "aces", "river", "allin", "hero", "call", "nik", "wesley"]
+        strings = []
+        for _ in range(300):
+            text = "".join(rng.choice(words) for _ in range(rng.randint(1, 6)))
+            # 일부 문자를 바꿔 근접 문자열 생성
+            chars = list(text)
+            for _ in range(rng.randint(0, 3)):
+                chars[rng.randrange(len(chars))] = rng.choice("abcdefghijklmnopqrstuvwxyz0123456789")
+            strings.append("".join(chars))
+        return strings + ["", "a", "aa"]
+
+    def test_recall_matches_brute_force(self):
+        """cutoff 이상인 후보는 하나도 누락되지 않음"""
+        pytest.importorskip("numpy")
+        from difflib import SequenceMatcher
+        from src.sync.matching.ngram_index import NGramIndex
+
+        strings = self._corpus()
+        index = NGramIndex(strings)
+        matcher = FuzzyMatcher()
+
+        for cutoff in (0.5, 0.765, 0.855, 0.95):
+            for query in strings[:40]:
+                found = set(index.candidates(query, cutoff).tolist())
+                for i, s in enumerate(strings):
+                    if not query or not s:
+                        continue
+                    if matcher.using_rapidfuzz:
+                        score = matcher._get_similarity(query, s)
+                    else:
+                        score = SequenceMatcher(None, query, s).ratio()
+                    if score >= cutoff:
+                        assert i in found, (query, s, cutoff)
+
+    def test_prefilter_keeps_results(self):
+        """필터 사용 여부와 관계없이 동일한 매칭 결과"""
+        pytest.importorskip("numpy")
+        strings = self._corpus()
+        candidates = {s: row for row, s in enumerate(strings, start=2) if s}
+        index = CandidateIndex(candidates)
+
+        for threshold in (0.6, 0.85, 0.95):
+            plain = FuzzyMatcher(threshold=threshold, prefilter=False)
+            pruned = FuzzyMatcher(threshold=threshold, prefilter=True)
+            for query in strings[40:80]:
+                expected = plain.find_best_match(query + "x", index=index)
+                actual = pruned.find_best_match(query + "x", index=index)
+                assert actual.matched == expected.matched
+                assert actual.matched_row == expected.matched_row
+                assert actual.match_type == expected.match_type
+                assert actual.alternatives == expected.alternatives
+
+    def test_partial_recall_matches_brute_force(self):
+        """partial_ratio 문자 수 상한도 cutoff 이상인 후보를 누락하지 않음"""
+        pytest.importorskip("numpy")
+        fuzz = pytest.importorskip("rapidfuzz").fuzz
+        from src.sync.matching.ngram_index import NGramIndex
+
+        strings = self._corpus()
+        index = NGramIndex(strings)
+
+        for cutoff in (0.5, 0.765, 0.855):
+            for query in strings[:40]:
+                found = set(index.partial_candidates(query, cutoff).tolist())
+                for i, s in enumerate(strings):
+                    if query and s and fuzz.partial_ratio(query, s) / 100.0 >= cutoff:
+                        assert i in found, (query, s, cutoff)
+
+    @pytest.mark.parametrize("method", ["ratio", "partial_ratio", "token_sort_ratio", "token_set_ratio"])
+    def test_prune_stats_and_results(self, method):
+        """메트릭별 상한 필터는 결과를 바꾸지 않고 제외/계산 쌍 수를 모두 셈"""
+        pytest.importorskip("numpy")
+        strings = self._corpus()
+        candidates = {s: row for row, s in enumerate(strings, start=2) if s}
+        index = CandidateIndex(candidates)
+        queries = [query + "x" for query in strings[40:80]]
+
+        plain = FuzzyMatcher(threshold=0.85, method=method, prefilter=False)
+        pruned = FuzzyMatcher(threshold=0.85, method=method, prefilter=True)
+        for query in queries:
+            expected = plain.find_best_match(query, index=index)
+            actual = pruned.find_best_match(query, index=index)
+            assert actual.matched_row == expected.matched_row
+            assert actual.alternatives == expected.alternatives
+
+        assert plain.prune_stats == PruneStats(pruned=0, scored=len(queries) * len(index))
+        assert pruned.prune_stats.pruned + pruned.prune_stats.scored == len(queries) * len(index)
+        if pruned.using_rapidfuzz:
+            assert pruned.prune_stats.pruned > 0
+
+    def test_length_window_without_numpy(self):
+        """NumPy 없는 경로의 길이 창도 같은 결과를 냄"""
+        strings = self._corpus()
+        candidates = {s: row for row, s in enumerate(strings, start=2) if s}
+        index = CandidateIndex(candidates)
+
+        plain = FuzzyMatcher(threshold=0.85, prefilter=False)
+        windowed = FuzzyMatcher(threshold=0.85, prefilter=False)
+        windowed._use_length_window = True
+        for query in strings[40:80]:
+            expected = plain.find_best_match(query + "x", index=index)
+            actual = windowed.find_best_match(query + "x", index=index)
+            assert actual.matched_row == expected.matched_row
+            assert actual.alternatives == expected.alternatives
+
+        assert windowed.prune_stats.pruned > 0
+        assert windowed.prune_stats.scored < plain.prune_stats.scored
+
+
 class TestDuplicateDetector:
     """DuplicateDetector 테스트"""
 
@@ -199,6 +604,77 @@ class TestDuplicateDetector:
         # 완전히 다른 파일들은 중복이 아님
         assert len(groups) == 0
 
+    def test_groups_match_pairwise_scan(self):
+        """후보 차단 후에도 모든 쌍을 비교한 결과와 동일한 그룹"""
+        detector = DuplicateDetector(threshold=0.90)
+
+        now = datetime.now()
+        names = [
+            "Nik Airball Hand 1 @HustlerCasinoLive",
+            "Big Bluff On The River",
+            "Nik Airball Hand 12 @HustlerCasinoLive",
+            "Big Bluff On The River (1)",
+            "Nik Airball Hand 1 @HustlerCasinoLive.f399",
+            "Big Bluff On The Rivers",
+            "Completely Different Clip",
+            "(1)",
+            "(2)",
+        ]
+        files = {f"file{i}": (name, now, "", f"/path/{i}.mp4") for i, name in enumerate(names)}
+
+        # 기준: 파일 순서대로 기준 파일이 남은 유사 파일을 가져감
+        cores = [FilenameNormalizer.normalize_aggressive(name) for name in names]
+        processed = set()
+        expected = []
+        for i in range(len(names)):
+            if i in processed:
+                continue
+            members = [(names[i], 1.0)]
+            for j in range(i + 1, len(names)):
+                score = detector.matcher._get_similarity(cores[i], cores[j])
+                if j not in processed and score >= detector.threshold:
+                    members.append((names[j], score))
+                    processed.add(j)
+            if len(members) > 1:
+                expected.append(members)
+
+        groups = detector.find_duplicates(files)
+
+        assert [list(zip([f[0] for f in g.files], g.similarity_scores)) for g in groups] == expected
+        assert [g.canonical_name for g in groups] == ["nikairballhand1hustlercasinolive", "bigbluffontheriver"]
+
+    @pytest.mark.parametrize("length_window", [False, True])
+    def test_prune_stats_cover_all_core_pairs(self, length_window):
+        """제외/계산한 핵심 제목 쌍 수의 합은 전체 쌍 수이며, 길이 창 경로도 같은 그룹"""
+        now = datetime.now()
+        names = [
+            "Big Bluff On The River",
+            "Big Bluff On The River (1)",
+            "Big Bluff On The Rivers",
+            "Short",
+            "A Much Longer Clip Title About Something Else Entirely",
+            "Hero Call",
+        ]
+        files = {f"file{i}": (name, now, "", f"/path/{i}.mp4") for i, name in enumerate(names)}
+
+        plain = DuplicateDetector(threshold=0.90)
+        plain.matcher._use_prefilter = False
+        plain.matcher._use_length_window = False
+        detector = DuplicateDetector(threshold=0.90)
+        if length_window:
+            detector.matcher._use_prefilter = False
+            detector.matcher._use_length_window = True
+
+        expected = plain.find_duplicates(files)
+        groups = detector.find_duplicates(files)
+
+        assert [g.files for g in groups] == [g.files for g in expected]
+        cores = len(set(FilenameNormalizer.normalize_aggressive(name) for name in names))
+        stats = detector.prune_stats
+        assert stats.pruned + stats.scored == cores * (cores - 1) // 2
+        assert plain.prune_stats.pruned == 0
+        assert stats.pruned > 0
+
     def test_generate_report(self):
         """보고서 생성 테스트"""
         detector = DuplicateDetector()
@@ -295,9 +771,10 @@ class TestRealWorldScenarios:
 class TestDuplicateCleaner:
     """DuplicateCleaner 테스트"""
 
-    def test_size_variance_within_threshold(self):
+    def test_size_variance_within_threshold(self, tmp_path):
         """10% 이내 크기 차이 테스트 - 삭제 대상"""
         cleaner = DuplicateCleaner(
+            audit_log_path=str(tmp_path / "audit.json"),
             similarity_threshold=0.85,
             size_variance_threshold=0.10,
         )
@@ -307,9 +784,10 @@ class TestDuplicateCleaner:
         assert is_valid is True
         assert variance == pytest.approx(0.0476, rel=0.01)
 
-    def test_size_variance_exceeds_threshold(self):
+    def test_size_variance_exceeds_threshold(self, tmp_path):
         """10% 초과 크기 차이 테스트 - 삭제 제외"""
         cleaner = DuplicateCleaner(
+            audit_log_path=str(tmp_path / "audit.json"),
             similarity_threshold=0.85,
             size_variance_threshold=0.10,
         )
@@ -319,9 +797,9 @@ class TestDuplicateCleaner:
         assert is_valid is False
         assert variance == pytest.approx(0.1667, rel=0.01)
 
-    def test_size_variance_zero_size(self):
+    def test_size_variance_zero_size(self, tmp_path):
         """크기가 0인 경우 테스트 - 삭제 제외"""
-        cleaner = DuplicateCleaner()
+        cleaner = DuplicateCleaner(audit_log_path=str(tmp_path / "audit.json"))
 
         # 크기 정보가 없는 경우 -> 삭제 제외
         is_valid, variance = cleaner.check_size_variance(0, 1_000_000_000)
@@ -331,9 +809,10 @@ class TestDuplicateCleaner:
         is_valid, variance = cleaner.check_size_variance(1_000_000_000, 0)
         assert is_valid is False
 
-    def test_find_cleanup_candidates(self):
+    def test_find_cleanup_candidates(self, tmp_path):
         """삭제 후보 찾기 테스트"""
         cleaner = DuplicateCleaner(
+            audit_log_path=str(tmp_path / "audit.json"),
             similarity_threshold=0.85,
             size_variance_threshold=0.10,
         )
@@ -356,9 +835,10 @@ class TestDuplicateCleaner:
         # 크기 차이가 10% 이내이므로 중복으로 감지되어야 함
         assert len(groups) >= 1
 
-    def test_find_cleanup_candidates_size_exceeds(self):
+    def test_find_cleanup_candidates_size_exceeds(self, tmp_path):
         """크기 차이가 큰 경우 삭제 제외 테스트"""
         cleaner = DuplicateCleaner(
+            audit_log_path=str(tmp_path / "audit.json"),
             similarity_threshold=0.85,
             size_variance_threshold=0.10,
         )
@@ -381,6 +861,65 @@ class TestDuplicateCleaner:
         # 크기 차이가 10% 초과이므로 삭제 대상이 아님
         assert len(candidates) == 0
 
+    @pytest.mark.parametrize("prefilter", [False, True])
+    def test_size_window_matches_full_scan(self, tmp_path, prefilter):
+        """크기순 윈도우: 그룹이 크기로 이어지지 않으면 삭제 후보가 전체 비교와 동일"""
+        base = datetime(2024, 1, 1)
+        names = [
+            ("Big Bluff On The River", 1_000_000_000),
+            ("Nik Airball Hero Call", 300_000_000),
+            ("Big Bluff On The River (1)", 1_020_000_000),
+            ("Nik Airball Hero Call (1)", 290_000_000),
+            ("Big Bluff On The River.f399", 980_000_000),
+            ("Completely Different Clip", 1_000_000_000),
+            ("Nik Airball Hero Call (2)", 295_000_000),
+            ("Completely Different Clip (1)", 0),  # 크기를 모르는 파일은 삭제도 유지도 안됨
+        ]
+        files = {
+            f"file{i}": (name, base + timedelta(days=i), "", f"/path/{name}.mp4")
+            for i, (name, _) in enumerate(names)
+        }
+        file_sizes = dict(names)
+
+        audit_log_path = str(tmp_path / "audit.json")
+        full = DuplicateCleaner(0.85, 0.10, audit_log_path)
+        window = DuplicateCleaner(0.85, 0.10, audit_log_path, size_window=True)
+        window.detector.matcher._use_prefilter = prefilter and window.detector.matcher._use_prefilter
+
+        expected, _ = full.find_cleanup_candidates(files, file_sizes)
+        candidates, _ = window.find_cleanup_candidates(files, file_sizes)
+
+        assert window.window_variance == 0.10
+        assert full.window_variance is None
+        assert sorted(c.filename for c in candidates) == sorted(c.filename for c in expected)
+        assert len(candidates) == 4
+
+    def test_size_window_splits_groups_by_size(self, tmp_path):
+        """크기가 다른 최신 파일이 유지 파일이 되어 모두 제외되던 그룹도 크기별로 나눔"""
+        files = {
+            "a": ("Test Video", datetime(2024, 1, 1), "", "/path/Test Video.mp4"),
+            "b": ("Test Video (1)", datetime(2024, 3, 1), "", "/path/Test Video (1).mp4"),
+            "c": ("Test Video (2)", datetime(2024, 2, 1), "", "/path/Test Video (2).mp4"),
+        }
+        file_sizes = {
+            "Test Video": 1_000_000_000,
+            "Test Video (1)": 400_000_000,  # 재인코딩 (최신)
+            "Test Video (2)": 1_010_000_000,
+        }
+
+        audit_log_path = str(tmp_path / "audit.json")
+        full = DuplicateCleaner(0.85, 0.10, audit_log_path)
+        window = DuplicateCleaner(0.85, 0.10, audit_log_path, size_window=True)
+
+        assert full.find_cleanup_candidates(files, file_sizes)[0] == []
+        candidates, groups = window.find_cleanup_candidates(files, file_sizes)
+        assert [c.filename for c in candidates] == ["Test Video"]
+        assert candidates[0].kept_file == "Test Video (2)"
+        assert [[f[0] for f in g.files] for g in groups] == [["Test Video", "Test Video (2)"]]
+
+        # 재생 시간 비교는 크기와 무관하게 통과할 수 있으므로 윈도우 미적용
+        assert DuplicateCleaner(audit_log_path=audit_log_path, size_window=True, duration_tolerance=1.0).window_variance is None
+
     def test_cleanup_result_gb_freed(self):
         """CleanupResult GB 계산 테스트"""
         result = CleanupResult(
@@ -390,9 +929,10 @@ class TestDuplicateCleaner:
 
         assert result.gb_freed == 4.19  # 4.5 / 1024**3 ≈ 4.19
 
-    def test_cleanup_dry_run(self):
+    def test_cleanup_dry_run(self, tmp_path):
         """Dry-run 모드 테스트"""
         cleaner = DuplicateCleaner(
+            audit_log_path=str(tmp_path / "audit.json"),
             similarity_threshold=0.85,
             size_variance_threshold=0.10,
         )
@@ -506,13 +1046,479 @@ class TestDeletionAuditLog:
             if os.path.exists(temp_path):
                 os.remove(temp_path)
 
+    def test_segment_rotation(self, tmp_path):
+        """세그먼트 단위 로테이션 및 세그먼트를 넘는 최근 항목 조회"""
+        log_path = tmp_path / "audit.json"
+
+        with DeletionAuditLog(log_path=str(log_path), max_entries=5, segment_entries=3, fsync_batch=2) as audit:
+            for i in range(10):
+                audit.log_skip(f"Video {i}", f"/path/{i}.mp4", 10, datetime.now(), "size")
+
+            recent = audit.get_recent_entries(limit=4)
+            stats = audit.get_statistics()
+
+        assert [e.filename for e in recent] == ["Video 9", "Video 8", "Video 7", "Video 6"]
+        # 오래된 세그먼트만 통째로 삭제되어 max_entries 이상 유지
+        assert 5 <= stats["total_entries"] < 5 + 3
+        assert stats["files_skipped"] == stats["total_entries"]
+        assert len(list(tmp_path.glob("audit.*.jsonl"))) == 3
+
+        # 새 인스턴스도 같은 내용을 읽고 이어서 기록
+        audit = DeletionAuditLog(log_path=str(log_path), max_entries=5, segment_entries=3)
+        audit.log_error("Video 10", "/path/10.mp4", "오류")
+        assert audit.get_recent_entries(limit=1)[0].action == "ERROR"
+        audit.close()
+
+    def test_migrates_legacy_json(self, tmp_path):
+        """기존 JSON 로그 자동 변환 및 CSV 내보내기"""
+        import csv
+        import json
+
+        log_path = tmp_path / "deletion_audit.json"
+        entry = {
+            "timestamp": "2025-01-01T00:00:00", "action": "DELETE", "filename": "Old",
+            "full_path": "/path/old.mp4", "size": 100, "mtime": "2024-12-31T00:00:00",
+            "reason": "duplicate of 'New'", "similarity_score": 0.97, "size_variance": 0.01,
+            "kept_file": "New", "dry_run": False,
+        }
+        log_path.write_text(json.dumps({"version": "1.0", "created": "2025-01-01T00:00:00", "entries": [entry]}))
+
+        audit = DeletionAuditLog(log_path=str(log_path))
+        stats = audit.get_statistics()
+
+        assert stats["files_deleted"] == 1
+        assert stats["total_bytes_freed"] == 100
+        assert stats["log_created"] == "2025-01-01T00:00:00"
+        assert not log_path.exists()
+        assert (tmp_path / "deletion_audit.json.migrated").exists()
+
+        csv_path = tmp_path / "audit.csv"
+        audit.export_csv(str(csv_path))
+        with open(csv_path, newline="", encoding="utf-8") as f:
+            rows = list(csv.DictReader(f))
+        assert [row["filename"] for row in rows] == ["Old"]
+
+    @pytest.mark.parametrize("migrated", [False, True])
+    def test_resumes_interrupted_migration(self, tmp_path, migrated):
+        """변환 중 중단되어도 다시 열면 항목이 빠지거나 중복되지 않음"""
+        import json
+
+        log_path = tmp_path / "deletion_audit.json"
+        entries = [
+            {
+                "timestamp": "2025-01-01T00:00:00", "action": "DELETE", "filename": f"Old {i}",
+                "full_path": f"/path/old{i}.mp4", "size": 100, "mtime": "2024-12-31T00:00:00",
+                "reason": "duplicate", "similarity_score": 0.97, "size_variance": 0.01, "kept_file": "New",
+            }
+            for i in range(3)
+        ]
+        log_path.write_text(json.dumps({"created": "2025-01-01T00:00:00", "entries": entries}))
+
+        # 세그먼트 기록 중(migrated=False) 또는 원본 이름 변경 직전(migrated=True)에 중단된 상태
+        segment = tmp_path / "deletion_audit.000001.jsonl"
+        written = entries if migrated else entries[:2]
+        segment.write_text("".join(json.dumps(e) + "\n" for e in written))
+        (tmp_path / "deletion_audit.meta.json").write_text(
+            json.dumps({"version": "2.0", "created": "2025-01-01T00:00:00", "migrated": migrated})
+        )
+
+        audit = DeletionAuditLog(log_path=str(log_path))
+        assert [e.filename for e in audit.iter_entries()] == ["Old 0", "Old 1", "Old 2"]
+        assert not log_path.exists()
+        assert (tmp_path / "deletion_audit.json.migrated").exists()
+        audit.close()
+
+
+@pytest.fixture
+def make_clip(tmp_path):
+    """NAS 파일 항목 팩토리
+
+    tmp_path/<서브폴더>/<이름>.mp4에 data를 쓰고 수정 시간을 mtime으로 맞춘 뒤
+    NASClient.get_files_with_dates() 값 형식 (원본 파일명, 수정 시간, 서브폴더, 경로)을 반환합니다.
+    """
+    def make(name, data, mtime, subfolder=""):
+        path = tmp_path / subfolder / f"{name}.mp4"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(data)
+        os.utime(path, (mtime.timestamp(), mtime.timestamp()))
+        return (name, mtime, subfolder, str(path))
+
+    return make
+
+
+def _file_sizes(files):
+    """{원본 파일명: 실제 파일 크기}"""
+    return {orig: os.path.getsize(path) for orig, _, _, path in files.values()}
+
+
+class TestContentFingerprinter:
+    """ContentFingerprinter 테스트"""
+
+    def _write(self, path, data: bytes):
+        path.write_bytes(data)
+        stat = path.stat()
+        return str(path), stat.st_size, stat.st_mtime
+
+    def test_sampled_blocks_and_cache(self, tmp_path):
+        """같은 내용은 같은 지문, 표본 블록이 다르면 다른 지문, 캐시는 크기/수정 시간 기준"""
+        import os
+
+        data = bytes(range(256)) * 4096  # 1 MB (표본 5블록 x 4 KB)
+        changed = bytearray(data)
+        changed[len(data) // 2] ^= 0xFF  # 가운데 표본 블록 안의 바이트
+
+        a = self._write(tmp_path / "a.mp4", data)
+        b = self._write(tmp_path / "b.mp4", data)
+        c = self._write(tmp_path / "c.mp4", bytes(changed))
+
+        cache_path = tmp_path / "fingerprints.json"
+        fingerprinter = ContentFingerprinter(cache_path=str(cache_path), block_size=4096)
+        fingerprints = fingerprinter.fingerprint_many([a, b, c, (str(tmp_path / "missing.mp4"), 10, 0.0)])
+        fingerprinter.save()
+
+        assert fingerprints[a[0]] == fingerprints[b[0]]
+        assert fingerprints[a[0]] != fingerprints[c[0]]
+        assert fingerprints[str(tmp_path / "missing.mp4")] is None
+        assert fingerprinter.stats.computed == 3
+        assert fingerprinter.stats.errors == 1
+        assert fingerprinter.stats.bytes_read == 3 * 5 * 4096
+
+        # 새 인스턴스는 캐시 사용, 수정 시간이 바뀐 파일만 다시 계산
+        os.utime(b[0], (b[2] + 10, b[2] + 10))
+        again = ContentFingerprinter(cache_path=str(cache_path), block_size=4096)
+        refreshed = again.fingerprint_many([a, (b[0], b[1], b[2] + 10), c])
+        assert refreshed[b[0]] == fingerprints[a[0]]
+        assert (again.stats.cached, again.stats.computed) == (2, 1)
+
+        # 표본 설정이 다르면 캐시를 사용하지 않음
+        other = ContentFingerprinter(cache_path=str(cache_path), block_size=8192)
+        other.fingerprint_many([a])
+        assert other.stats.computed == 1
+
+    def test_small_file_hashed_whole(self, tmp_path):
+        """표본 합계보다 작은 파일은 전체를 해시"""
+        data = b"x" * 10_000
+        changed = data[:-1] + b"y"
+        a = self._write(tmp_path / "a.mp4", data)
+        b = self._write(tmp_path / "b.mp4", changed)
+
+        fingerprinter = ContentFingerprinter(block_size=4096)
+        fingerprints = fingerprinter.fingerprint_many([a, b])
+
+        assert fingerprints[a[0]] != fingerprints[b[0]]
+        assert fingerprinter.stats.bytes_read == 2 * len(data)
+
+    def test_cleaner_confirms_and_rejects_by_content(self, tmp_path, make_clip):
+        """이름이 비슷해도 내용이 다르면 제외, 같으면 크기 범위와 무관하게 확인"""
+        clip = os.urandom(64 * 1024)
+        other_clip = os.urandom(64 * 1024)
+        newest, older = datetime(2024, 12, 20), datetime(2024, 1, 1)
+
+        files = {
+            "a": make_clip("Amazing Hero Call", clip, newest),
+            "a1": make_clip("Amazing Hero Call (1)", clip, older),
+            "b": make_clip("He Wins The Pot With Aces", clip[:1024], newest),
+            "b1": make_clip("She Wins The Pot With Aces", other_clip[:1024], older),
+            "b2": make_clip("He Wins The Pot With Aces (1)", other_clip[:2048], older),
+        }
+        file_sizes = _file_sizes(files)
+
+        fingerprinter = ContentFingerprinter(block_size=4096)
+        cleaner = DuplicateCleaner(
+            similarity_threshold=0.85,
+            size_variance_threshold=1.0,
+            audit_log_path=str(tmp_path / "audit.json"),
+            fingerprinter=fingerprinter,
+        )
+        candidates, groups = cleaner.find_cleanup_candidates(files, file_sizes)
+
+        assert len(groups) == 2
+        assert [c.filename for c in candidates] == ["Amazing Hero Call (1)"]
+        assert candidates[0].content_verified is True
+        # 크기가 다른 "(1)" 파일은 읽지 않음 (유지 파일 2개 + 같은 크기 2개)
+        assert fingerprinter.stats.computed == 4
+        assert "내용 일치" in cleaner.generate_preview(candidates, groups)
+
+
+class TestFileLinker:
+    """하드링크 / reflink 중복 정리 테스트"""
+
+    def test_hardlink_mode_verifies_full_content(self, tmp_path, make_clip):
+        """전체 해시가 같은 파일만 하드링크로 교체하고 감사 로그에 원본 경로 기록"""
+        clip = os.urandom(256 * 1024)
+        changed = bytearray(clip)
+        changed[100_000] ^= 0xFF  # 크기는 같고 한 바이트만 다름
+
+        files = {
+            "a": make_clip("Amazing Hero Call", clip, datetime(2024, 12, 20)),
+            "a1": make_clip("Amazing Hero Call (1)", clip, datetime(2024, 1, 1)),
+            "a2": make_clip("Amazing Hero Call (2)", bytes(changed), datetime(2024, 1, 2)),
+            "a3": make_clip("Amazing Hero Call (3)", clip + b"x", datetime(2024, 1, 3)),
+        }
+        file_sizes = _file_sizes(files)
+
+        def run():
+            cleaner = DuplicateCleaner(
+                similarity_threshold=0.85,
+                audit_log_path=str(tmp_path / "audit.json"),
+                dedupe_mode="hardlink",
+            )
+            return cleaner, cleaner.cleanup(files, file_sizes, dry_run=False)
+
+        cleaner, result = run()
+
+        # 크기가 다른 (3)은 후보에서 제외, 내용이 다른 (2)는 전체 해시로 제외
+        kept, linked, different = (files[key][3] for key in ("a", "a1", "a2"))
+        assert [c.filename for c in result.deleted_files] == ["Amazing Hero Call (1)"]
+        assert result.skipped_files[0][0] == "Amazing Hero Call (2)"
+        assert os.path.samefile(kept, linked)
+        assert not os.path.samefile(kept, different)
+        assert not [name for name in os.listdir(tmp_path) if name.endswith(".dedupe-tmp")]
+
+        entries = [e for e in cleaner.audit.iter_entries() if e.action == "HARDLINK"]
+        assert [(e.full_path, e.target_path) for e in entries] == [(linked, kept)]
+        assert cleaner.get_audit_statistics()["files_linked"] == 1
+
+        # 다시 실행하면 이미 같은 inode이므로 건너뜀
+        _, result = run()
+        assert result.files_deleted == 0
+        assert ("Amazing Hero Call (1)", "이미 링크됨") in result.skipped_files
+
+    def test_reflink_keeps_duplicate_on_failure(self, tmp_path):
+        """reflink는 임시 파일에 만든 뒤 교체하므로 실패해도 원래 파일 유지"""
+        import os
+        from src.sync.matching.file_linker import file_digest, link_duplicate
+
+        kept, duplicate = tmp_path / "kept.mp4", tmp_path / "dup.mp4"
+        kept.write_bytes(b"clip" * 1000)
+        duplicate.write_bytes(b"clip" * 1000)
+        os.utime(duplicate, (1_700_000_000, 1_700_000_000))
+
+        try:
+            link_duplicate(str(kept), str(duplicate), "reflink")
+        except OSError:
+            pass  # reflink를 지원하지 않는 파일 시스템
+        else:
+            assert os.path.getmtime(duplicate) == 1_700_000_000
+
+        assert file_digest(str(duplicate)) == file_digest(str(kept))
+        assert sorted(os.listdir(tmp_path)) == ["dup.mp4", "kept.mp4"]
+        with pytest.raises(ValueError):
+            DuplicateCleaner(dedupe_mode="symlink")
+
+
+    def test_config_rejects_unknown_dedupe_mode(self):
+        """설정 검사에서 지원하지 않는 정리 방식을 다른 설정 오류와 함께 보고"""
+        from src.sync.sync_config import SyncConfig
+
+        config = SyncConfig()
+        config.cleanup_dedupe_mode = "symlink"
+        with pytest.raises(ValueError, match="CLEANUP_DEDUPE_MODE는 delete, quarantine, hardlink, reflink 중 하나"):
+            config.validate()
+
+
+class TestQuarantine:
+    """격리 모드 테스트"""
+
+    def test_cleanup_quarantines_and_restores(self, tmp_path, make_clip):
+        """격리 폴더로 옮긴 파일을 감사 로그로 원래 경로에 복원"""
+        from src.sync.matching import Quarantine
+
+        nas = tmp_path
+        files = {
+            "a": make_clip("Amazing Hero Call", b"clip" * 256, datetime(2024, 12, 20), "2024"),
+            "a1": make_clip("Amazing Hero Call (1)", b"clip" * 256, datetime(2024, 1, 1), "2024"),
+        }
+        file_sizes = _file_sizes(files)
+        duplicate = files["a1"][3]
+
+        quarantine = Quarantine(str(nas), retention_days=7)
+        cleaner = DuplicateCleaner(
+            audit_log_path=str(tmp_path / "audit.json"),
+            dedupe_mode="quarantine",
+            quarantine=quarantine,
+        )
+        result = cleaner.cleanup(files, file_sizes, dry_run=False)
+
+        moved = nas / ".quarantine" / cleaner.run_id / "2024" / "Amazing Hero Call (1).mp4"
+        assert result.files_deleted == 1
+        assert not os.path.exists(duplicate) and moved.exists()
+        assert quarantine.runs() == [cleaner.run_id]
+        assert "격리" in cleaner.generate_preview(result.deleted_files, [])
+
+        restored = quarantine.restore(cleaner.audit, cleaner.run_id)
+
+        assert restored.restored == [duplicate]
+        assert os.path.exists(duplicate) and not moved.exists()
+        stats = cleaner.get_audit_statistics()
+        assert (stats["files_quarantined"], stats["files_restored"], stats["files_deleted"]) == (1, 1, 0)
+
+        # 이미 복원한 실행은 건너뜀
+        again = quarantine.restore(cleaner.audit, cleaner.run_id)
+        assert again.restored == [] and len(again.skipped) == 1
+
+        with pytest.raises(ValueError):
+            DuplicateCleaner(dedupe_mode="quarantine")
+
+    def test_purge_only_expired_runs(self, tmp_path):
+        """보관 기간이 지난 실행 폴더만 백그라운드에서 삭제 (형식이 다른 폴더는 유지)"""
+        from src.sync.matching import Quarantine
+
+        quarantine = Quarantine(str(tmp_path), retention_days=14)
+        now = datetime(2024, 12, 20, 3, 0)
+        old = Quarantine.new_run_id(now - timedelta(days=15))
+        recent = Quarantine.new_run_id(now - timedelta(days=1))
+        for run_id in (old, recent, "keep-me"):
+            clip = quarantine.path / run_id / "2024" / "clip.mp4"
+            clip.parent.mkdir(parents=True)
+            clip.write_bytes(b"x" * 100)
+
+        thread = quarantine.purge_in_background(now)
+        thread.join()
+
+        assert (quarantine.last_purge.runs, quarantine.last_purge.files, quarantine.last_purge.bytes_freed) == (1, 1, 100)
+        assert sorted(p.name for p in quarantine.path.iterdir()) == sorted([recent, "keep-me"])
+        assert quarantine.runs() == [recent]
+
+        # join 후 감사 로그에 실행 폴더별 PURGE 기록
+        cleaner = DuplicateCleaner(
+            audit_log_path=str(tmp_path / "audit.json"),
+            dedupe_mode="quarantine",
+            quarantine=quarantine,
+        )
+        cleaner.log_purge(quarantine.last_purge)
+        (entry,) = cleaner.audit.iter_entries()
+        assert (entry.action, entry.filename, entry.size) == ("PURGE", old, 100)
+        stats = cleaner.get_audit_statistics()
+        assert (stats["quarantine_runs_purged"], stats["quarantine_bytes_purged"]) == (1, 100)
+
+
+def _box(box_type: bytes, payload: bytes) -> bytes:
+    import struct
+
+    return struct.pack(">I4s", 8 + len(payload), box_type) + payload
+
+
+def _build_mp4(duration: int, timescale: int = 1000, width: int = 1920, height: int = 1080, mdat_size: int = 4096) -> bytes:
+    """ftyp + mdat(64비트 크기) + moov(mvhd, 비디오/오디오 trak) 순서의 최소 MP4"""
+    import struct
+
+    mvhd = _box(b"mvhd", bytes(12) + struct.pack(">II", timescale, duration) + bytes(80))
+
+    def trak(handler: bytes, codec: bytes, w: int, h: int) -> bytes:
+        tkhd = _box(b"tkhd", bytes(4 + 20 + 8 + 8 + 36) + struct.pack(">II", w << 16, h << 16))
+        hdlr = _box(b"hdlr", bytes(8) + handler + bytes(12) + b"\0")
+        stsd = _box(b"stsd", bytes(4) + struct.pack(">I", 1) + _box(codec, bytes(78)))
+        return _box(b"trak", tkhd + _box(b"mdia", hdlr + _box(b"minf", _box(b"stbl", stsd))))
+
+    moov = _box(b"moov", mvhd + trak(b"vide", b"avc1", width, height) + trak(b"soun", b"mp4a", 0, 0))
+    mdat = struct.pack(">I4sQ", 1, b"mdat", 16 + mdat_size) + bytes(mdat_size)
+    return _box(b"ftyp", b"isom" + bytes(4)) + mdat + moov
+
+
+def _build_webm(duration_ms: float, width: int = 1280, height: int = 720) -> bytes:
+    """EBML 헤더 + 크기 미상 Segment(Info, Tracks, Cluster)의 최소 WebM"""
+    import struct
+
+    def element(element_id: int, payload: bytes) -> bytes:
+        id_bytes = element_id.to_bytes((element_id.bit_length() + 7) // 8, "big")
+        return id_bytes + (0x0100000000000000 | len(payload)).to_bytes(8, "big") + payload
+
+    info = element(0x1549A966, element(0x2AD7B1, (1_000_000).to_bytes(3, "big")) + element(0x4489, struct.pack(">d", duration_ms)))
+    video = element(0xE0, element(0xB0, width.to_bytes(2, "big")) + element(0xBA, height.to_bytes(2, "big")))
+    tracks = element(0x1654AE6B, element(0xAE, element(0x83, b"\x01") + element(0x86, b"V_VP9") + video)
+                     + element(0xAE, element(0x83, b"\x02") + element(0x86, b"A_OPUS")))
+    cluster = element(0x1F43B675, bytes(8192))
+    segment = bytes.fromhex("18538067") + bytes.fromhex("01FFFFFFFFFFFFFF") + info + tracks + cluster
+    return element(0x1A45DFA3, element(0x4282, b"webm")) + segment
+
+
+class TestMediaProbe:
+    """MediaProbe 테스트"""
+
+    def _write(self, path, data: bytes):
+        path.write_bytes(data)
+        stat = path.stat()
+        return str(path), stat.st_size, stat.st_mtime
+
+    def test_mp4_and_webm_headers(self, tmp_path):
+        """MP4 moov/mvhd/tkhd와 WebM Info/Tracks에서 재생 시간, 해상도, 트랙 수, 코덱"""
+        mp4 = self._write(tmp_path / "a.mp4", _build_mp4(duration=95_500, mdat_size=200_000))
+        webm = self._write(tmp_path / "b.webm", _build_webm(12_345.0))
+        text = self._write(tmp_path / "c.mp4", b"not a video file at all")
+
+        probe = MediaProbe()
+        infos = probe.probe_many([mp4, webm, text])
+
+        assert infos[mp4[0]].container == "mp4"
+        assert infos[mp4[0]].duration == pytest.approx(95.5)
+        assert (infos[mp4[0]].resolution, infos[mp4[0]].tracks, infos[mp4[0]].video_codec) == ("1920x1080", 2, "avc1")
+
+        assert infos[webm[0]].container == "matroska"
+        assert infos[webm[0]].duration == pytest.approx(12.345)
+        assert (infos[webm[0]].resolution, infos[webm[0]].tracks, infos[webm[0]].video_codec) == ("1280x720", 2, "V_VP9")
+
+        assert infos[text[0]] is None
+        # mdat과 Cluster 내용은 읽지 않음
+        assert probe.stats.bytes_read < 4096
+        assert (probe.stats.probed, probe.stats.unsupported) == (2, 1)
+
+    def test_cache_by_size_and_mtime(self, tmp_path):
+        """캐시는 경로/크기/수정 시간 기준, 미지원 형식도 다시 읽지 않음"""
+        mp4 = self._write(tmp_path / "a.mp4", _build_mp4(duration=60_000))
+        text = self._write(tmp_path / "c.mp4", b"plain text")
+        cache_path = str(tmp_path / "media.json")
+
+        probe = MediaProbe(cache_path=cache_path)
+        probe.probe_many([mp4, text])
+        probe.save()
+
+        again = MediaProbe(cache_path=cache_path)
+        infos = again.probe_many([mp4, text, (mp4[0], mp4[1], mp4[2] + 1)])
+        assert infos[mp4[0]].duration == pytest.approx(60.0)
+        assert again.stats.cached == 2
+        assert again.stats.probed == 1  # 수정 시간이 바뀐 항목만 다시 읽음
+
+    def test_cleaner_duration_tolerance(self, tmp_path, make_clip):
+        """재생 시간이 같고 해상도/트랙 수도 같으면 크기 차이와 무관하게 삭제,
+        해상도가 다르면 크기 검증, 재생 시간이 다르면 제외, 모르면 크기 검증"""
+        newest, older = datetime(2024, 12, 20), datetime(2024, 1, 1)
+        hd_720 = _build_mp4(duration=95_000, width=1280, height=720, mdat_size=80_000)
+
+        files = {
+            "a": make_clip("Amazing Hero Call", _build_mp4(duration=95_000, mdat_size=100_000), newest),
+            "a1": make_clip("Amazing Hero Call (1)", _build_mp4(duration=95_400, mdat_size=80_000), older),
+            "a2": make_clip("Amazing Hero Call (2)", hd_720, older),
+            "b": make_clip("He Wins The Pot With Aces", _build_mp4(duration=30_000, mdat_size=50_000), newest),
+            "b1": make_clip("She Wins The Pot With Aces", _build_mp4(duration=41_000, mdat_size=50_100), older),
+            "c": make_clip("Big River Bluff", b"x" * 1000, newest),
+            "c1": make_clip("Big River Bluff (1)", b"y" * 1050, older),
+        }
+        file_sizes = _file_sizes(files)
+
+        cleaner = DuplicateCleaner(
+            similarity_threshold=0.85,
+            size_variance_threshold=0.10,
+            audit_log_path=str(tmp_path / "audit.json"),
+            duration_tolerance=1.0,
+        )
+        candidates, groups = cleaner.find_cleanup_candidates(files, file_sizes)
+
+        assert len(groups) == 3
+        by_name = {c.filename: c for c in candidates}
+        assert set(by_name) == {"Amazing Hero Call (1)", "Big River Bluff (1)"}
+        assert by_name["Amazing Hero Call (1)"].duration_delta == pytest.approx(0.4)
+        assert by_name["Amazing Hero Call (1)"].size_variance > 0.10
+        assert by_name["Big River Bluff (1)"].duration_delta is None
+
 
 class TestCleanerIntegration:
     """통합 테스트"""
 
-    def test_keeps_newest_file(self):
+    def test_keeps_newest_file(self, tmp_path):
         """최신 파일 유지 테스트"""
         cleaner = DuplicateCleaner(
+            audit_log_path=str(tmp_path / "audit.json"),
             similarity_threshold=0.85,
             size_variance_threshold=0.10,
         )
@@ -540,9 +1546,42 @@ class TestCleanerIntegration:
             # 오래된 파일이 삭제 대상
             assert "Test Video (1)" in deleted_names
 
-    def test_generate_preview(self):
+    def test_skips_file_overwritten_since_scan(self, tmp_path, monkeypatch, make_clip):
+        """증분 스캔이 놓친 덮어쓰기는 삭제 직전 다시 stat하여 삭제하지 않음"""
+        from src.sync.nas_client import NASClient
+
+        nas = tmp_path / "nas"
+        make_clip("Amazing Hero Call", b"x" * 1000, datetime(2024, 12, 20), "nas/2024")
+        make_clip("Amazing Hero Call (1)", b"x" * 1000, datetime(2024, 1, 1), "nas/2024")
+        client = NASClient(str(nas), manifest_path=str(tmp_path / "manifest.json"))
+        monkeypatch.setattr(client, "RACY_MTIME_WINDOW", -1e9)
+        client.scan()
+
+        # 같은 이름으로 덮어쓰기 (폴더 mtime은 그대로)
+        folder_mtime = os.stat(nas / "2024").st_mtime_ns
+        duplicate = nas / "2024" / "Amazing Hero Call (1).mp4"
+        duplicate.write_bytes(b"y" * 50_000)
+        os.utime(nas / "2024", ns=(folder_mtime, folder_mtime))
+
+        snapshot = client.scan(refresh=True)
+        assert client.get_file_sizes(snapshot=snapshot)["Amazing Hero Call (1)"] == 1000
+        assert client.get_file_sizes(snapshot=client.scan(full=True))["Amazing Hero Call (1)"] == 50_000
+
+        cleaner = DuplicateCleaner(audit_log_path=str(tmp_path / "audit.json"), nas_client=client)
+        result = cleaner.cleanup(
+            client.get_files_with_dates(snapshot=snapshot),
+            client.get_file_sizes(snapshot=snapshot),
+            dry_run=False,
+        )
+
+        assert duplicate.exists()
+        assert result.files_deleted == 0
+        assert result.skipped_files == [("Amazing Hero Call (1)", "크기/수정 시간 불일치 (스캔 이후 변경됨)")]
+        assert [e.action for e in cleaner.audit.iter_entries()] == ["SKIP"]
+
+    def test_generate_preview(self, tmp_path):
         """미리보기 생성 테스트"""
-        cleaner = DuplicateCleaner()
+        cleaner = DuplicateCleaner(audit_log_path=str(tmp_path / "audit.json"))
 
         now = datetime.now()
         candidates = [
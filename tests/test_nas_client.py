@@ -0,0 +1,374 @@
+"""NAS 클라이언트 테스트
+
+임시 폴더 트리로 NASClient 스캔 기능을 테스트합니다.
+"""
+
+import os
+from pathlib import Path
+
+import pytest
+
+from src.sync.nas_client import NASClient
+
+
+def _make_tree(root: Path):
+    """비디오/비디오 아닌 파일과 하위 폴더가 섞인 트리 생성"""
+    files = {
+        "Root Clip.mp4": 10,
+        "notes.txt": 5,
+        "2024/Big Hand.MKV": 20,
+        "2024/Big Hand (1).mp4": 21,
+        "2024/thumb.jpg": 3,
+        "2024/01/Deep Clip.webm": 30,
+        "2025/.hidden.mp4": 1,
+        "2025/noext": 2,
+    }
+    for relative, size in files.items():
+        path = root / relative
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(b"x" * size)
+    # 확장자가 비디오인 폴더는 파일로 취급하지 않음
+    (root / "2025" / "folder.mp4").mkdir()
+    return files
+
+
+def _rglob_reference(root: Path, video_only: bool = True):
+    """기존 rglob 기반 스캔 결과 (비교용)"""
+    result = set()
+    for path in root.rglob("*"):
+        if not path.is_file():
+            continue
+        if video_only and path.suffix.lower() not in NASClient.VIDEO_EXTENSIONS:
+            continue
+        subfolder = path.relative_to(root).parent.as_posix()
+        result.add((path.name, path.stem, path.suffix, path.stat().st_size,
+                    "" if subfolder == "." else subfolder, str(path)))
+    return result
+
+
+class TestNASClientScan:
+    """NASClient.get_files 테스트"""
+
+    @pytest.mark.parametrize("video_only", [True, False])
+    def test_matches_rglob(self, tmp_path, video_only):
+        """os.scandir 스캔 결과가 rglob 스캔과 동일"""
+        _make_tree(tmp_path)
+        client = NASClient(str(tmp_path))
+
+        files = client.get_files(video_only=video_only)
+        scanned = {(f.name, f.stem, f.suffix, f.size, f.subfolder, f.full_path) for f in files}
+
+        assert len(files) == len(scanned)
+        assert scanned == _rglob_reference(tmp_path, video_only)
+
+    def test_non_recursive(self, tmp_path):
+        """recursive=False면 루트 폴더만"""
+        _make_tree(tmp_path)
+        files = NASClient(str(tmp_path)).get_files(recursive=False)
+
+        assert [f.name for f in files] == ["Root Clip.mp4"]
+
+    @pytest.mark.parametrize("scan_workers", [1, 4])
+    def test_skips_quarantine_dir(self, tmp_path, scan_workers):
+        """격리 폴더(.quarantine)의 파일은 스캔하지 않음"""
+        _make_tree(tmp_path)
+        quarantined = tmp_path / ".quarantine" / "20240101-000000-1" / "2024" / "Big Hand (2).mp4"
+        quarantined.parent.mkdir(parents=True)
+        quarantined.write_bytes(b"x" * 21)
+        client = NASClient(str(tmp_path), scan_workers=scan_workers)
+
+        files = client.get_files()
+
+        assert str(quarantined) not in {f.full_path for f in files}
+        assert len(files) == client.get_file_count() == 5
+
+    def test_stats_only_videos_once(self, tmp_path, monkeypatch):
+        """비디오 파일만, 파일당 한 번씩 stat"""
+        _make_tree(tmp_path)
+        client = NASClient(str(tmp_path))
+        stat_calls = []
+
+        real_scandir = os.scandir
+
+        class CountingEntry:
+            def __init__(self, entry):
+                self._entry = entry
+                self.name = entry.name
+                self.path = entry.path
+
+            def is_dir(self, follow_symlinks=True):
+                return self._entry.is_dir(follow_symlinks=follow_symlinks)
+
+            def is_file(self, follow_symlinks=True):
+                return self._entry.is_file(follow_symlinks=follow_symlinks)
+
+            def stat(self, follow_symlinks=True):
+                stat_calls.append(self.name)
+                return self._entry.stat(follow_symlinks=follow_symlinks)
+
+        class CountingScandir:
+            def __init__(self, path):
+                self._it = real_scandir(path)
+
+            def __enter__(self):
+                return (CountingEntry(entry) for entry in self._it)
+
+            def __exit__(self, *exc):
+                self._it.close()
+
+        monkeypatch.setattr("src.sync.nas_client.os.scandir", CountingScandir)
+
+        files = client.get_files()
+
+        assert sorted(stat_calls) == sorted(f.name for f in files)
+        assert len(files) == 5
+
+    @pytest.mark.parametrize("video_only", [True, False])
+    def test_parallel_matches_sequential(self, tmp_path, video_only):
+        """병렬 탐색도 순차 탐색과 같은 목록을 같은 순서로 반환"""
+        _make_tree(tmp_path)
+        for year in range(2018, 2022):
+            for month in range(1, 4):
+                folder = tmp_path / str(year) / f"{month:02d}"
+                folder.mkdir(parents=True)
+                for i in range(3):
+                    (folder / f"Clip {year} {month} {i}.mp4").write_bytes(b"x" * i)
+
+        sequential = NASClient(str(tmp_path)).get_files(video_only=video_only)
+        parallel = NASClient(str(tmp_path), scan_workers=4).get_files(video_only=video_only)
+
+        assert [f.full_path for f in parallel] == [f.full_path for f in sequential]
+        assert NASClient(str(tmp_path), scan_workers=4).get_file_count() == len(
+            NASClient(str(tmp_path)).get_files()
+        )
+
+    def test_parallel_skips_failed_subfolder(self, tmp_path, monkeypatch):
+        """병렬 탐색에서 하위 폴더 조회 실패는 건너뜀"""
+        _make_tree(tmp_path)
+        client = NASClient(str(tmp_path), scan_workers=3)
+        real_scan = client._scan_directory
+
+        def failing(directory, subfolder="", video_only=True):
+            if subfolder == "2024":
+                raise PermissionError("denied")
+            return real_scan(directory, subfolder, video_only)
+
+        monkeypatch.setattr(client, "_scan_directory", failing)
+
+        assert [f.name for f in client.get_files()] == ["Root Clip.mp4", ".hidden.mp4"]
+
+    def test_inaccessible_folder(self, tmp_path):
+        """접근 불가 폴더는 OSError"""
+        with pytest.raises(OSError):
+            NASClient(str(tmp_path / "missing")).get_files()
+
+
+class TestScanSnapshot:
+    """스캔 스냅샷 공유 테스트"""
+
+    def _count_scans(self, client, monkeypatch):
+        calls = []
+        real_scan = client._scan_directory
+
+        def counting(*args, **kwargs):
+            calls.append(args[0])
+            return real_scan(*args, **kwargs)
+
+        monkeypatch.setattr(client, "_scan_directory", counting)
+        return calls
+
+    def test_accessors_share_one_scan(self, tmp_path, monkeypatch):
+        """여러 조회 메서드가 한 번의 스캔을 공유"""
+        _make_tree(tmp_path)
+        client = NASClient(str(tmp_path))
+        calls = self._count_scans(client, monkeypatch)
+
+        files = client.get_files_with_dates()
+        sizes = client.get_file_sizes()
+        info = client.get_full_file_info()
+        count = client.get_file_count()
+        folders = len(calls)
+
+        assert len(files) == len(info) == count == 5
+        assert sizes["Big Hand"] == 20
+        assert folders == len({c for c in calls})  # 폴더당 한 번
+
+        client.invalidate()
+        client.get_files()
+        assert len(calls) == 2 * folders
+
+    def test_ttl_expires(self, tmp_path, monkeypatch):
+        """TTL 경과 후 다시 스캔"""
+        _make_tree(tmp_path)
+        client = NASClient(str(tmp_path), cache_ttl=60)
+        calls = self._count_scans(client, monkeypatch)
+
+        client.get_files()
+        client.get_files()
+        folders = len(calls)
+
+        client.scan().scanned_at -= 120
+        client.get_files()
+        assert len(calls) == 2 * folders
+
+    def test_delete_updates_snapshot(self, tmp_path, monkeypatch):
+        """delete_file은 스냅샷에서도 제거"""
+        _make_tree(tmp_path)
+        client = NASClient(str(tmp_path))
+        target = next(f for f in client.get_files() if f.name == "Big Hand (1).mp4")
+        calls = self._count_scans(client, monkeypatch)
+
+        assert client.delete_file(target.full_path) is True
+
+        assert "Big Hand (1)" not in client.get_file_sizes()
+        assert client.get_file_count() == 4
+        assert calls == []
+
+    def test_count_without_snapshot(self, tmp_path):
+        """스냅샷이 없으면 stat 없이 개수만"""
+        _make_tree(tmp_path)
+        client = NASClient(str(tmp_path))
+
+        assert client.get_file_count() == 5
+        assert client.get_file_count(video_only=False) == 8
+        assert client._snapshots == {}
+
+
+class TestIncrementalScan:
+    """매니페스트 기반 증분 스캔 테스트"""
+
+    def _client(self, root: Path, manifest: Path, monkeypatch, workers: int = 1):
+        client = NASClient(str(root), manifest_path=str(manifest), scan_workers=workers)
+        # 방금 만든 폴더도 기록되도록 mtime 경계 비활성화
+        monkeypatch.setattr(client, "RACY_MTIME_WINDOW", -1e9)
+        calls = []
+        real_scan = client._scan_directory
+
+        def counting(*args, **kwargs):
+            calls.append(args[1])
+            return real_scan(*args, **kwargs)
+
+        monkeypatch.setattr(client, "_scan_directory", counting)
+        return client, calls
+
+    def test_first_scan_has_no_diff(self, tmp_path, monkeypatch):
+        """매니페스트가 없으면 전체 스캔, diff 없음"""
+        root = tmp_path / "nas"
+        _make_tree(root)
+        client, _ = self._client(root, tmp_path / "manifest.json", monkeypatch)
+
+        snapshot = client.scan()
+
+        assert snapshot.diff is None
+        assert len(snapshot) == 5
+        assert (tmp_path / "manifest.json").exists()
+
+    def test_unchanged_tree_skips_listing(self, tmp_path, monkeypatch):
+        """바뀌지 않은 폴더는 목록 조회 없이 동일 결과"""
+        root = tmp_path / "nas"
+        _make_tree(root)
+        manifest = tmp_path / "manifest.json"
+        first = {(f.name, f.size, f.subfolder, f.full_path, f.mtime)
+                 for f in self._client(root, manifest, monkeypatch)[0].get_files()}
+
+        client, calls = self._client(root, manifest, monkeypatch)
+        snapshot = client.scan()
+
+        assert calls == []
+        assert snapshot.diff.total == 0
+        assert {(f.name, f.size, f.subfolder, f.full_path, f.mtime) for f in snapshot.file_list()} == first
+
+    def test_reports_added_removed_modified(self, tmp_path, monkeypatch):
+        """변경된 폴더만 다시 조회하고 차이를 보고"""
+        root = tmp_path / "nas"
+        _make_tree(root)
+        manifest = tmp_path / "manifest.json"
+        self._client(root, manifest, monkeypatch)[0].scan()
+
+        (root / "2024" / "New Clip.mp4").write_bytes(b"n")
+        (root / "2024" / "Big Hand.MKV").unlink()
+        (root / "2024" / "Big Hand (1).mp4").write_bytes(b"y" * 99)
+        (root / "2026").mkdir()
+        (root / "2026" / "Fresh.mp4").write_bytes(b"f")
+        os.utime(root / "2024", ns=(1, 10**18))  # 파일 교체만으로 mtime이 같은 경우 대비
+
+        client, calls = self._client(root, manifest, monkeypatch)
+        snapshot = client.scan()
+        diff = snapshot.diff
+
+        assert sorted(f.name for f in diff.added) == ["Fresh.mp4", "New Clip.mp4"]
+        assert [f.name for f in diff.removed] == ["Big Hand.MKV"]
+        assert [f.name for f in diff.modified] == ["Big Hand (1).mp4"]
+        assert sorted(calls) == ["", "2024", "2026"]
+        assert {(f.name, f.size, f.subfolder, f.full_path) for f in snapshot.file_list()} == {
+            (name, size, sub, path) for name, _, _, size, sub, path in _rglob_reference(root)
+        }
+
+    def test_parallel_incremental(self, tmp_path, monkeypatch):
+        """병렬 증분 스캔도 같은 결과와 변경 내역"""
+        root = tmp_path / "nas"
+        _make_tree(root)
+        manifest = tmp_path / "manifest.json"
+        expected = [f.full_path for f in NASClient(str(root)).get_files()]
+        self._client(root, manifest, monkeypatch, workers=4)[0].scan()
+
+        (root / "2024" / "01" / "Another.mp4").write_bytes(b"a")
+        (root / "Root Extra.mp4").write_bytes(b"b")
+        os.utime(root / "2024" / "01", ns=(1, 10**18))
+        os.utime(root, ns=(1, 10**18))
+
+        snapshot = self._client(root, manifest, monkeypatch, workers=4)[0].scan()
+
+        assert [f.name for f in snapshot.diff.added] == ["Another.mp4", "Root Extra.mp4"]
+        assert [f.full_path for f in snapshot.file_list()] == [
+            f.full_path for f in NASClient(str(root)).get_files()
+        ]
+        assert len(snapshot) == len(expected) + 2
+
+    def test_removed_directory(self, tmp_path, monkeypatch):
+        """사라진 폴더의 파일은 삭제로 보고"""
+        root = tmp_path / "nas"
+        _make_tree(root)
+        manifest = tmp_path / "manifest.json"
+        self._client(root, manifest, monkeypatch)[0].scan()
+
+        (root / "2024" / "01" / "Deep Clip.webm").unlink()
+        (root / "2024" / "01").rmdir()
+
+        snapshot = self._client(root, manifest, monkeypatch)[0].scan()
+
+        assert [f.full_path for f in snapshot.diff.removed] == [str(root / "2024" / "01" / "Deep Clip.webm")]
+        assert len(snapshot) == 4
+
+    def test_manifest_for_other_root_ignored(self, tmp_path, monkeypatch):
+        """다른 루트의 매니페스트는 사용하지 않음"""
+        manifest = tmp_path / "manifest.json"
+        other = tmp_path / "other"
+        _make_tree(other)
+        self._client(other, manifest, monkeypatch)[0].scan()
+
+        root = tmp_path / "nas"
+        _make_tree(root)
+        client, calls = self._client(root, manifest, monkeypatch)
+        snapshot = client.scan()
+
+        assert snapshot.diff is None
+        assert len(calls) == 5
+        assert all(f.full_path.startswith(str(root)) for f in snapshot.file_list())
+
+    def test_full_rescans_every_folder(self, tmp_path, monkeypatch):
+        """full=True면 모든 폴더를 다시 조회"""
+        root = tmp_path / "nas"
+        _make_tree(root)
+        manifest = tmp_path / "manifest.json"
+        self._client(root, manifest, monkeypatch)[0].scan()
+
+        client, calls = self._client(root, manifest, monkeypatch)
+        snapshot = client.scan(full=True)
+
+        assert len(calls) == 5
+        assert snapshot.diff.total == 0
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,303 @@
+"""NAS-Sheets 동기화 테스트
+
+임시 NAS 폴더와 가짜 Sheets 서비스로 NASSheetsSync.sync 흐름을 테스트합니다.
+"""
+
+import os
+import threading
+
+import pytest
+
+from fake_sheets import make_client, titles_grid
+from src.sync.matching import DuplicateDetector, FuzzyMatcher
+from src.sync.nas_sheets_sync import NASSheetsSync
+from src.sync.sheets_client import SheetsClientError
+from src.sync.sync_config import SyncConfig
+
+TITLES = [
+    "Nik Airball Hand 1 @HustlerCasinoLive",
+    "Big Bluff On The River",
+    "Huge Pot With Aces",
+    "Not On NAS Yet",
+]
+
+
+@pytest.fixture
+def sync_env(tmp_path):
+    """제목 3개에 해당하는 NAS 파일과 가짜 시트"""
+    nas = tmp_path / "nas"
+    (nas / "2025").mkdir(parents=True)
+    for title in TITLES[:3]:
+        (nas / "2025" / f"{title}.mp4").write_bytes(b"x")
+
+    config = SyncConfig()
+    config.nas_folder = str(nas)
+    config.nas_manifest_path = ""
+    config.duplicate_detection = False
+    config.sync_state_path = str(tmp_path / "sync_state.json")
+    config.match_cache_path = str(tmp_path / "match_cache.db")
+
+    def make_sync(grid):
+        sync = NASSheetsSync(config)
+        sync.sheets = make_client(grid, config)
+        return sync
+
+    return make_sync
+
+
+def _written_rows(sync):
+    rows = []
+    for kind, call in sync.sheets._service.values_api.calls:
+        if kind == "batchUpdate":
+            rows.extend(d["range"] for d in call["body"]["data"])
+    return rows
+
+
+class TestDiffAwareWrites:
+    """현재 값과 비교하여 바뀐 행만 쓰는지 테스트"""
+
+    def test_second_run_writes_nothing(self, sync_env):
+        """두 번째 실행은 모든 행이 이미 최신"""
+        grid = titles_grid(TITLES)
+        first = sync_env(grid)
+        result = first.sync()
+        assert result.matched == 3
+        assert result.already_checked == 0
+
+        second = sync_env(grid)
+        result = second.sync()
+
+        assert result.matched == 0
+        assert result.already_checked == 3
+        assert _written_rows(second) == []
+        assert [kind for kind, _ in second.sheets._service.values_api.calls] == ["batchGet", "batchGet"]
+
+    def test_only_changed_row_written(self, sync_env):
+        """값이 다른 행만 다시 씀"""
+        grid = titles_grid(TITLES)
+        sync_env(grid).sync()
+        grid[(3, 16)] = "1999-01-01"  # Big Bluff 행의 날짜 변경
+
+        sync = sync_env(grid)
+        result = sync.sync()
+
+        assert result.matched == 1
+        assert result.already_checked == 2
+        assert _written_rows(sync) == [f"{sync.config.sheet_name}!P3:S3"]
+
+    def test_dry_run_reports_pending_changes(self, sync_env):
+        """dry-run도 바뀔 행 수만 보고"""
+        grid = titles_grid(TITLES)
+        sync_env(grid).sync()
+        grid[(2, 15)] = False
+
+        result = sync_env(grid).sync(dry_run=True)
+
+        assert result.matched == 1
+        assert result.already_checked == 2
+
+
+class TestWritePlanning:
+    """업데이트와 중복 표시를 한 번의 요청으로 보내는지 테스트"""
+
+    def test_full_sync_in_one_request(self, sync_env, tmp_path):
+        """P:S 업데이트와 T열 중복 표시가 같은 batchUpdate에 병합"""
+        (tmp_path / "nas" / "2025" / "Big Bluff On The River (1).mp4").write_bytes(b"x")
+        grid = titles_grid(TITLES)
+        sync = sync_env(grid)
+        sync.config.duplicate_detection = True
+
+        result = sync.sync()
+
+        batch_updates = [c for kind, c in sync.sheets._service.values_api.calls if kind == "batchUpdate"]
+        assert len(batch_updates) == 1
+        ranges = [d["range"] for d in batch_updates[0]["body"]["data"]]
+        assert any(r.endswith("T3") for r in ranges)
+        assert grid[(3, 19)] is True
+        assert result.duplicates_marked >= 1
+
+
+class TestConcurrentLoad:
+    """NAS 수집과 시트 로드 병렬 실행 테스트"""
+
+    def test_sheet_loads_during_nas_scan(self, sync_env):
+        """NAS 스캔이 끝나기 전에 시트 로드가 시작됨"""
+        sync = sync_env(titles_grid(TITLES))
+        sync._init_clients()
+        sheet_started = threading.Event()
+
+        load_sheet = sync.sheets.load_sheet
+        def tracked_load(*args, **kwargs):
+            sheet_started.set()
+            return load_sheet(*args, **kwargs)
+        sync.sheets.load_sheet = tracked_load
+
+        scan = sync.nas.scan
+        scans = []
+        def slow_scan(*args, **kwargs):
+            assert sheet_started.wait(timeout=5), "시트 로드가 NAS 스캔과 병렬로 시작되지 않음"
+            scans.append(args)
+            return scan(*args, **kwargs)
+        sync.nas.scan = slow_scan
+
+        result = sync.sync()
+
+        assert result.errors == 0
+        assert result.matched == 3
+        assert len(scans) == 1  # 파일 목록, 변경 내역, 크기를 한 스냅샷에서 가져옴
+
+    def test_duplicates_detected_once(self, sync_env, tmp_path, monkeypatch):
+        """중복 감지는 시트를 기다리지 않고 한 번만 실행"""
+        (tmp_path / "nas" / "2025" / "Big Bluff On The River (1).mp4").write_bytes(b"x")
+        sync = sync_env(titles_grid(TITLES))
+        sync.config.duplicate_detection = True
+        sheet_released = threading.Event()
+
+        load_sheet = sync.sheets.load_sheet
+        def blocked_load(*args, **kwargs):
+            assert sheet_released.wait(timeout=5)
+            return load_sheet(*args, **kwargs)
+        sync.sheets.load_sheet = blocked_load
+
+        calls = []
+        find_duplicates = DuplicateDetector.find_duplicates
+        def counted(detector, files):
+            calls.append(sheet_released.is_set())
+            sheet_released.set()
+            return find_duplicates(detector, files)
+        monkeypatch.setattr(DuplicateDetector, "find_duplicates", counted)
+
+        result = sync.sync()
+
+        assert calls == [False]
+        assert result.duplicates_marked >= 1
+
+    def test_sheet_error_reported(self, sync_env):
+        """시트 로드 실패는 기존처럼 에러 1건으로 보고"""
+        sync = sync_env(titles_grid(TITLES))
+
+        def failing_load(*args, **kwargs):
+            raise SheetsClientError("boom")
+        sync.sheets.load_sheet = failing_load
+
+        result = sync.sync()
+
+        assert result.errors == 1
+        assert result.matched == 0
+
+    def test_nas_error_reported(self, sync_env, tmp_path):
+        """NAS 접근 실패는 기존처럼 에러 1건으로 보고"""
+        sync = sync_env(titles_grid(TITLES))
+        sync.config.nas_folder = str(tmp_path / "missing")
+
+        result = sync.sync()
+
+        assert result.errors == 1
+
+
+class TestIncrementalSync:
+    """지난 매칭 결과를 재사용하는 증분 동기화 테스트"""
+
+    FUZZY_TITLE = "Massive Hero Call Against The Pro"
+    FUZZY_FILE = "Massive Hero Call Agains The Pro"
+    UNMATCHED_FILE = "Totally Different Clip"
+
+    @pytest.fixture
+    def env(self, sync_env, tmp_path):
+        folder = tmp_path / "nas" / "2025"
+        (folder / f"{self.FUZZY_FILE}.mp4").write_bytes(b"x")
+        (folder / f"{self.UNMATCHED_FILE}.mp4").write_bytes(b"x")
+        grid = titles_grid(TITLES + [self.FUZZY_TITLE])
+        sync_env(grid).sync()
+        return sync_env, grid, folder
+
+    @staticmethod
+    def _count_matching(monkeypatch):
+        calls = []
+        batch_find_matches = FuzzyMatcher.batch_find_matches
+        def counted(matcher, filenames, *args, **kwargs):
+            calls.append(list(filenames))
+            return batch_find_matches(matcher, filenames, *args, **kwargs)
+        monkeypatch.setattr(FuzzyMatcher, "batch_find_matches", counted)
+        return calls
+
+    def test_unchanged_run_skips_all_pairs(self, env, monkeypatch):
+        """파일과 제목이 그대로면 유사도 매칭을 하지 않음"""
+        make_sync, grid, _ = env
+        calls = self._count_matching(monkeypatch)
+
+        result = make_sync(grid).sync()
+
+        assert calls == []
+        assert result.fuzzy_matches == 1
+        assert result.not_matched == 1
+        assert result.skipped_pairs == 2 * 5
+
+    def test_new_row_rechecked_against_cached_files(self, env, monkeypatch):
+        """새 행은 재사용 파일과만 비교하여 매칭"""
+        make_sync, grid, _ = env
+        grid[(7, 0)] = 6
+        grid[(7, 1)] = self.UNMATCHED_FILE + "!"
+        calls = self._count_matching(monkeypatch)
+
+        result = make_sync(grid).sync()
+
+        assert sorted(calls[0]) == sorted([self.FUZZY_FILE, self.UNMATCHED_FILE])
+        assert result.normalized_matches == 1
+        assert result.not_matched == 0
+        assert result.skipped_pairs == 2 * 5
+        assert grid[(7, 15)] is True
+
+    def test_modified_file_rematched(self, env, monkeypatch):
+        """크기나 수정 시간이 바뀐 파일은 전체 매칭"""
+        make_sync, grid, folder = env
+        path = folder / f"{self.UNMATCHED_FILE}.mp4"
+        os.utime(path, (1_600_000_000, 1_600_000_000))
+        calls = self._count_matching(monkeypatch)
+
+        result = make_sync(grid).sync()
+
+        assert calls == [[self.UNMATCHED_FILE]]
+        assert result.skipped_pairs == 1 * 5
+
+    def test_edited_matched_row_rematched(self, env, monkeypatch):
+        """매칭됐던 행의 제목이 바뀌면 그 파일은 전체 매칭"""
+        make_sync, grid, _ = env
+        grid[(6, 1)] = "Completely Unrelated Title"
+        calls = self._count_matching(monkeypatch)
+
+        result = make_sync(grid).sync()
+
+        assert [self.FUZZY_FILE] in calls
+        assert result.fuzzy_matches == 0
+
+    def test_full_mode_ignores_state(self, env, monkeypatch):
+        """증분 모드를 끄면 모든 파일을 매칭"""
+        make_sync, grid, _ = env
+        sync = make_sync(grid)
+        sync.config.incremental_sync = False
+        calls = self._count_matching(monkeypatch)
+
+        result = sync.sync()
+
+        assert sorted(calls[0]) == sorted([self.FUZZY_FILE, self.UNMATCHED_FILE])
+        assert result.skipped_pairs == 0
+        assert result.fuzzy_matches == 1
+
+
+    def test_full_mode_served_from_match_cache(self, env, monkeypatch):
+        """전체 매칭이어도 제목이 그대로면 유사도 점수는 캐시에서"""
+        make_sync, grid, _ = env
+        sync = make_sync(grid)
+        sync.config.incremental_sync = False
+        monkeypatch.setattr(FuzzyMatcher, "_batch_fuzzy_stage", lambda *args: pytest.fail("점수 계산 발생"))
+
+        result = sync.sync()
+
+        assert result.match_cache_hits == 2
+        assert result.match_cache_misses == 0
+        assert result.fuzzy_matches == 1
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,164 @@
+"""Sheets API 호출 한도 관리 테스트
+
+가짜 시계로 토큰 버킷 대기 시간과 429 재시도 동작을 테스트합니다.
+"""
+
+import httplib2
+import pytest
+from googleapiclient.errors import HttpError
+
+from src.sync.rate_limiter import RateLimiter, TokenBucket, parse_retry_after, shared_bucket
+from src.sync.sheets_client import SheetsClient, SheetsRateLimitError
+from src.sync.sync_config import SyncConfig
+
+
+class FakeClock:
+    """sleep하면 시간이 흐르는 가짜 시계"""
+
+    def __init__(self):
+        self.now = 1000.0
+        self.sleeps = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class TestTokenBucket:
+    """TokenBucket 테스트"""
+
+    def test_burst_without_wait(self):
+        """버스트 이내 요청은 대기 없음"""
+        clock = FakeClock()
+        bucket = TokenBucket(60, burst=10, clock=clock)
+
+        assert [bucket.reserve() for _ in range(10)] == [0.0] * 10
+        assert bucket.reserve() == pytest.approx(60 / 50)
+
+    def test_never_exceeds_quota_per_minute(self):
+        """어떤 60초 구간에서도 분당 한도 이하"""
+        clock = FakeClock()
+        limiter = RateLimiter([TokenBucket(60, burst=10, clock=clock)], sleep=clock.sleep)
+
+        sent = []
+        for _ in range(200):
+            limiter.acquire()
+            sent.append(clock.now)
+
+        for i, start in enumerate(sent):
+            in_window = sum(1 for t in sent[i:] if t < start + 60)
+            assert in_window <= 60
+
+    def test_block_for_delays_reservations(self):
+        """block_for 동안은 토큰이 있어도 대기"""
+        clock = FakeClock()
+        bucket = TokenBucket(300, burst=10, clock=clock)
+
+        bucket.block_for(5)
+
+        assert bucket.reserve() == pytest.approx(5)
+
+    def test_rejects_quota_below_two(self):
+        """분당 한도 1은 보충 속도가 0이 되므로 버킷과 설정 검사 모두 거부"""
+        with pytest.raises(ValueError):
+            TokenBucket(1, burst=10)
+
+        config = SyncConfig()
+        config.api_user_quota = 1
+        with pytest.raises(ValueError, match="API_USER_QUOTA는 2 이상"):
+            config.validate()
+
+    def test_shared_bucket_is_shared(self):
+        """같은 범위는 같은 버킷"""
+        assert shared_bucket("test-scope", 60, 10) is shared_bucket("test-scope", 60, 10)
+        assert shared_bucket("test-scope", 60, 10) is not shared_bucket("other-scope", 60, 10)
+
+
+class TestRateLimiter:
+    """RateLimiter 테스트"""
+
+    def test_waits_for_slowest_bucket(self):
+        """여러 버킷 중 가장 긴 대기 시간을 적용하고 통계에 기록"""
+        clock = FakeClock()
+        user = TokenBucket(60, burst=2, clock=clock)
+        project = TokenBucket(300, burst=10, clock=clock)
+        limiter = RateLimiter([user, project], sleep=clock.sleep)
+
+        for _ in range(3):
+            limiter.acquire()
+
+        assert clock.sleeps == [pytest.approx(60 / 58)]
+        assert limiter.stats.requests == 3
+        assert limiter.stats.throttled == 1
+        assert limiter.stats.wait_time == pytest.approx(60 / 58)
+
+    def test_parse_retry_after(self):
+        """Retry-After 초/날짜 형식"""
+        assert parse_retry_after("7") == 7.0
+        assert parse_retry_after(None) is None
+        assert parse_retry_after("garbage") is None
+        assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+
+
+class TestSheetsClientRetry:
+    """SheetsClient._with_retry 테스트"""
+
+    def _client(self, clock: FakeClock, max_retries: int = 3) -> SheetsClient:
+        client = SheetsClient.__new__(SheetsClient)
+        client.config = SyncConfig()
+        client.max_retries = max_retries
+        client.rate_limiter = RateLimiter([TokenBucket(60, burst=10, clock=clock)], sleep=clock.sleep)
+        return client
+
+    @staticmethod
+    def _rate_limited(retry_after=None) -> HttpError:
+        headers = {"status": "429"}
+        if retry_after is not None:
+            headers["retry-after"] = retry_after
+        return HttpError(httplib2.Response(headers), b"rate limited")
+
+    def test_no_fixed_sleep(self):
+        """한도 이내 호출은 전혀 대기하지 않음"""
+        clock = FakeClock()
+        client = self._client(clock)
+
+        for _ in range(5):
+            assert client._with_retry(lambda: "ok") == "ok"
+
+        assert clock.sleeps == []
+        assert client.rate_limiter.stats.requests == 5
+
+    def test_honors_retry_after(self):
+        """429 응답의 Retry-After만큼 대기 후 재시도"""
+        clock = FakeClock()
+        client = self._client(clock)
+        responses = [self._rate_limited("4"), "ok"]
+
+        def call():
+            response = responses.pop(0)
+            if isinstance(response, Exception):
+                raise response
+            return response
+
+        assert client._with_retry(call) == "ok"
+        assert clock.sleeps[0] == 4.0
+        assert client.rate_limiter.stats.retries == 1
+        assert client.rate_limiter.stats.retry_wait_time == 4.0
+
+    def test_gives_up_after_max_retries(self):
+        """최대 재시도 초과 시 SheetsRateLimitError"""
+        clock = FakeClock()
+        client = self._client(clock, max_retries=2)
+
+        def call():
+            raise self._rate_limited("1")
+
+        with pytest.raises(SheetsRateLimitError):
+            client._with_retry(call)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,153 @@
+"""시트 로컬 미러 테스트
+
+가짜 Sheets 서비스와 임시 SQLite 파일로 미러 검증과 오프라인 로드를 테스트합니다.
+"""
+
+import pytest
+
+from fake_sheets import make_client, titles_grid
+from src.sync.sheet_mirror import SheetMirror
+from src.sync.sheets_client import SheetsClientError
+from src.sync.sync_config import SyncConfig
+
+TITLES = [f"Hand {i} @HustlerCasinoLive" for i in range(60)]
+
+
+@pytest.fixture
+def env(tmp_path):
+    """미러 파일과 시트 격자"""
+    config = SyncConfig()
+    config.sheet_mirror_path = str(tmp_path / "mirror.db")
+    config.sheet_mirror_validation = "version"
+    config.sheet_mirror_max_age = 0
+    config.sheet_offline = False
+    grid = titles_grid(TITLES)
+    grid[(5, 15)] = True
+
+    def client():
+        return make_client(grid, config, mirror=SheetMirror(config.sheet_mirror_path))
+
+    return config, grid, client
+
+
+def _batch_gets(client):
+    return [call["ranges"] for kind, call in client._service.values_api.calls if kind == "batchGet"]
+
+
+class TestSheetMirror:
+    """미러 검증 테스트"""
+
+    def test_first_load_is_full(self, env):
+        """미러가 없으면 전체 로드 후 저장"""
+        config, _, client = env
+        model = client().load_sheet()
+
+        assert not model.from_mirror
+        assert len(model.titles) == 60
+        assert SheetMirror(config.sheet_mirror_path).load(config.spreadsheet_id, config.sheet_name) is not None
+
+    def test_unchanged_sheet_served_from_mirror(self, env):
+        """파일 버전이 같으면 Sheets API 호출 없이 미러 제공"""
+        config, grid, client = env
+        first = client().load_sheet()
+
+        second_client = client()
+        model = second_client.load_sheet()
+
+        assert _batch_gets(second_client) == []
+        assert [call["fields"] for call in second_client._drive.calls] == ["version"]
+        assert model.from_mirror
+        assert model.titles == first.titles
+        assert model.row_count == first.row_count
+        assert model.state(5).is_checked
+
+    @pytest.mark.parametrize("change", ["edit_middle", "append", "delete_last", "state"])
+    def test_changed_sheet_falls_back(self, env, change):
+        """어느 행이 바뀌어도(표본 밖의 중간 행, 행 추가/삭제, P:T 값) 전체 로드"""
+        config, grid, client = env
+        client().load_sheet()
+        if change == "edit_middle":
+            grid[(33, 1)] = "Renamed"
+        elif change == "append":
+            grid[(62, 1)] = "New Hand"
+        elif change == "delete_last":
+            del grid[(61, 1)]
+            del grid[(61, 0)]
+        else:
+            grid[(6, 15)] = True
+
+        second_client = client()
+        model = second_client.load_sheet()
+
+        assert len(_batch_gets(second_client)) == 2
+        assert not model.from_mirror
+        assert model.titles == [(r, grid[(r, 1)]) for r in range(2, 70) if grid.get((r, 1))]
+        assert model.state(6).is_checked == (change == "state")
+
+        # 전체 로드 후에는 새 버전으로 다시 미러 사용
+        assert client().load_sheet().from_mirror
+
+    def test_unknown_version_falls_back(self, env):
+        """Drive 버전을 확인할 수 없으면 전체 로드"""
+        config, _, client = env
+        client().load_sheet()
+
+        second_client = client()
+        second_client._drive = None
+        model = second_client.load_sheet()
+
+        assert not model.from_mirror
+        assert len(_batch_gets(second_client)) == 2
+
+    def test_max_age_forces_full_load(self, env):
+        """미러가 오래되면 전체 로드"""
+        config, _, client = env
+        client().load_sheet()
+        config.sheet_mirror_max_age = 60
+        mirror = SheetMirror(config.sheet_mirror_path)
+        entry = mirror.load(config.spreadsheet_id, config.sheet_name)
+        mirror.save(
+            config.spreadsheet_id, config.sheet_name, entry.model, "B",
+            version=entry.version, refreshed_at=entry.refreshed_at - 120,
+        )
+
+        assert not client().load_sheet().from_mirror
+
+    def test_full_validation_mode(self, env):
+        """SHEET_MIRROR_VALIDATION = full이면 항상 전체 로드"""
+        config, _, client = env
+        client().load_sheet()
+        config.sheet_mirror_validation = "full"
+
+        assert not client().load_sheet().from_mirror
+
+
+class TestOffline:
+    """오프라인 모드 테스트"""
+
+    def test_offline_serves_mirror(self, env):
+        """오프라인 모드는 API 없이 미러 제공, 쓰기는 거부"""
+        config, _, client = env
+        expected = client().load_sheet()
+        config.sheet_offline = True
+
+        offline = client()
+        model = offline.load_sheet()
+
+        assert offline._service.values_api.calls == []
+        assert model.titles == expected.titles
+        assert model.state(5).is_checked
+        with pytest.raises(SheetsClientError):
+            offline.batch_write(duplicate_rows=[2])
+
+    def test_offline_without_mirror(self, env, tmp_path):
+        """미러가 없으면 오류"""
+        config, _, client = env
+        config.sheet_offline = True
+
+        with pytest.raises(SheetsClientError):
+            client().load_sheet()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,71 @@
+"""Sheets 클라이언트 테스트
+
+가짜 Sheets 서비스로 SheetsClient의 읽기/쓰기 요청을 테스트합니다.
+"""
+
+import pytest
+
+from fake_sheets import make_client, titles_grid
+from src.sync.sheet_model import RowState
+
+
+class TestSheetModel:
+    """load_sheet / 시트 모델 테스트"""
+
+    def _grid(self):
+        grid = titles_grid(["A", "B", "", "D"])
+        grid[(2, 15)] = True
+        grid[(2, 16)] = "2025-01-02"
+        grid[(2, 17)] = 2024
+        grid[(2, 18)] = '=HYPERLINK("file:///X:/a.mp4", "열기")'
+        grid[(3, 19)] = True
+        return grid
+
+    def test_title_formatted_states_formula(self):
+        """Title은 표시 값, P:T는 수식 그대로 (batchGet 두 번으로 로드)"""
+        client = make_client(self._grid())
+
+        model = client.load_sheet()
+
+        calls = client._service.values_api.calls
+        assert [kind for kind, _ in calls] == ["batchGet", "batchGet"]
+        titles, states = (call for _, call in calls)
+        assert titles["ranges"] == ["HCL_Clips!A:B"]
+        assert "valueRenderOption" not in titles  # 기본값 FORMATTED_VALUE
+        assert states["ranges"] == ["HCL_Clips!P:T"]
+        assert states["valueRenderOption"] == "FORMULA"
+        assert states["dateTimeRenderOption"] == "FORMATTED_STRING"
+        assert model.titles == [(2, "A"), (3, "B"), (5, "D")]
+        assert model.row_count == 5
+        assert model.state(2) == RowState("TRUE", "2025-01-02", "2024", '=HYPERLINK("file:///X:/a.mp4", "열기")')
+        assert model.state(3).is_duplicate
+        assert model.state(4) == RowState()
+        assert model.checked_count == 1
+
+    def test_read_paths_share_model(self):
+        """모든 조회 메서드가 같은 로드를 공유하고 쓰기 후 다시 로드"""
+        client = make_client(self._grid())
+
+        assert client.get_title_column() == [(2, "A"), (3, "B"), (5, "D")]
+        assert client.get_row_count() == 5
+        assert client.get_current_values([2, 4]) == {2: (True, "2025-01-02"), 4: (False, "")}
+        assert client.get_row_states()[3].is_duplicate
+        assert len(client._service.values_api.calls) == 2
+
+        client.reset_duplicate_column()
+
+        assert not client.get_row_states().get(3, RowState()).is_duplicate
+        assert [kind for kind, _ in client._service.values_api.calls] == ["batchGet", "batchGet", "update", "batchGet", "batchGet"]
+
+    def test_written_row_reads_back_equal(self):
+        """batch_update로 쓴 값은 다시 읽으면 format_row와 같음"""
+        client = make_client(titles_grid(["A", "B"]))
+        update = {"row": 3, "checkbox": True, "date": "2025-03-04", "subfolder": "2025", "full_path": "X:\\HCL\\b.mp4"}
+
+        client.batch_update([update])
+
+        assert client.get_row_states()[3].sync_values == client.format_row(update)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,77 @@
+"""증분 동기화 상태 테스트"""
+
+import pytest
+
+from src.sync.sync_state import FileMatchRecord, SyncState, SyncStateFile
+
+SETTINGS = {"sheet_name": "HCL_Clips", "similarity_threshold": 0.85}
+
+
+def _state() -> SyncState:
+    return SyncState(
+        titles={2: "Big Bluff", 3: "Huge Pot"},
+        files={
+            "bigbluff(1)": FileMatchRecord("Big Bluff (1)", 100, 1.5, row=2, match_type="normalized_aggressive", score=0.9, title="Big Bluff"),
+            "other": FileMatchRecord("Other", 50, 2.0),
+        },
+    )
+
+
+class TestSyncStateFile:
+    """SyncStateFile 저장/로드 테스트"""
+
+    def test_round_trip(self, tmp_path):
+        """저장한 상태를 그대로 로드"""
+        state_file = SyncStateFile(str(tmp_path / "state.json"), SETTINGS)
+        state_file.save(_state())
+
+        assert state_file.load() == _state()
+
+    def test_settings_change_discards_state(self, tmp_path):
+        """매칭 설정이 바뀌면 상태를 사용하지 않음"""
+        SyncStateFile(str(tmp_path / "state.json"), SETTINGS).save(_state())
+
+        changed = SyncStateFile(str(tmp_path / "state.json"), {**SETTINGS, "similarity_threshold": 0.9})
+
+        assert changed.load() is None
+
+    def test_corrupt_file(self, tmp_path):
+        """깨진 파일은 무시"""
+        path = tmp_path / "state.json"
+        path.write_text("{", encoding="utf-8")
+
+        assert SyncStateFile(str(path), SETTINGS).load() is None
+
+
+class TestSyncState:
+    """재사용 판단 테스트"""
+
+    def test_changed_rows(self):
+        """새 행과 제목이 바뀐 행만 반환"""
+        titles = {2: "Big Bluff", 3: "Huge Pot Edited", 4: "New Row"}
+
+        assert _state().changed_rows(titles) == {3, 4}
+
+    def test_reusable_when_unchanged(self):
+        """크기/수정 시간/매칭 행 제목이 그대로면 재사용"""
+        record = _state().reusable("bigbluff(1)", "Big Bluff (1)", 100, 1.5, {2: "Big Bluff"})
+
+        assert record is not None and record.row == 2
+
+    @pytest.mark.parametrize("size, mtime, titles", [
+        (101, 1.5, {2: "Big Bluff"}),
+        (100, 2.5, {2: "Big Bluff"}),
+        (100, 1.5, {2: "Big Bluff Edited"}),
+        (100, 1.5, {}),
+    ])
+    def test_not_reusable_when_changed(self, size, mtime, titles):
+        """파일이 바뀌었거나 매칭 행 제목이 바뀌면 재사용 안함"""
+        assert _state().reusable("bigbluff(1)", "Big Bluff (1)", size, mtime, titles) is None
+
+    def test_unmatched_reusable_regardless_of_titles(self):
+        """매칭 실패 결과는 행 변경과 무관하게 재사용 (새 행과만 다시 비교)"""
+        assert _state().reusable("other", "Other", 50, 2.0, {}) is not None
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
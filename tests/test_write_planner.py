@@ -0,0 +1,78 @@
+"""Sheets 쓰기 계획 테스트
+
+WritePlanner의 범위 병합과 요청 분할을 테스트합니다.
+"""
+
+import pytest
+
+from src.sync.write_planner import WritePlanner, column_index, column_letters
+
+
+class TestColumns:
+    """열 문자 변환 테스트"""
+
+    @pytest.mark.parametrize("letters,index", [("A", 0), ("P", 15), ("T", 19), ("Z", 25), ("AA", 26), ("AZ", 51)])
+    def test_round_trip(self, letters, index):
+        assert column_index(letters) == index
+        assert column_letters(index) == letters
+
+
+class TestWritePlanner:
+    """WritePlanner 테스트"""
+
+    def test_contiguous_rows_merge(self):
+        """연속된 행은 한 범위, 끊긴 행은 새 범위"""
+        planner = WritePlanner("S")
+        for row in (2, 3, 4, 7, 8):
+            planner.add_row(row, "P", [f"p{row}", f"q{row}"])
+
+        (batch,) = planner.requests()
+
+        assert [r["range"] for r in batch] == ["S!P2:Q4", "S!P7:Q8"]
+        assert batch[0]["values"] == [["p2", "q2"], ["p3", "q3"], ["p4", "q4"]]
+
+    def test_adjacent_columns_merge_per_row(self):
+        """같은 행의 P:S와 T는 P:T 한 범위로 합침"""
+        planner = WritePlanner("S")
+        planner.add_row(2, "P", ["TRUE", "d", "r", "s"])
+        planner.add_row(2, "T", ["TRUE"])
+        planner.add_row(3, "P", ["TRUE", "d", "r", "s"])
+        planner.add_row(5, "T", ["TRUE"])
+        planner.add_row(6, "T", ["TRUE"])
+
+        (batch,) = planner.requests()
+
+        assert [r["range"] for r in batch] == ["S!P2:T2", "S!P3:S3", "S!T5:T6"]
+
+    def test_later_value_wins(self):
+        """같은 셀을 다시 쓰면 나중 값"""
+        planner = WritePlanner("S")
+        planner.add_row(2, "P", ["a"])
+        planner.add_row(2, "P", ["b"])
+
+        assert planner.requests() == [[{"range": "S!P2:P2", "values": [["b"]]}]]
+
+    def test_splits_by_request_size(self):
+        """요청 크기 한도를 넘으면 요청과 범위를 나눔"""
+        planner = WritePlanner("S", max_request_bytes=200)
+        for row in range(2, 22):
+            planner.add_row(row, "P", ["x" * 20])
+
+        batches = planner.requests()
+
+        assert len(batches) > 1
+        written = [
+            (value_range["range"], row)
+            for batch in batches
+            for value_range in batch
+            for row in value_range["values"]
+        ]
+        assert len(written) == 20
+        assert all(WritePlanner._size(batch) <= 200 + 50 for batch in batches)
+
+    def test_empty(self):
+        assert WritePlanner("S").requests() == []
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])